@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 import json
 import sys
+from collections.abc import Iterable
+from pathlib import Path
 
-from shine2mqtt.protocol.frame.header.header import MBAPHeader
+from shine2mqtt.protocol.frame.capturer import CaptureReader
+from shine2mqtt.protocol.frame.capturer.binary import CAPTURE_FILE_SUFFIX
+from shine2mqtt.protocol.frame.header.header import FunctionCode, MBAPHeader
 
 
 def load_capture_file(file_path: str) -> tuple[list[bytes], list[MBAPHeader], list[bytes]]:
@@ -16,10 +20,18 @@ def load_capture_file(file_path: str) -> tuple[list[bytes], list[MBAPHeader], li
     return frames, headers, payloads
 
 
-def display_capture(
-    frames: list[bytes], headers: list[MBAPHeader], payloads: list[bytes], message_type: str
-) -> None:
-    for i, (frame, header, payload) in enumerate(zip(frames, headers, payloads, strict=True)):
+def display_binary_capture(file_path: str, message_type: str) -> None:
+    # Only the frames of the requested type are read from the (memory mapped) capture file
+    function_code = FunctionCode[message_type.upper()]
+    with CaptureReader.open(Path(file_path)) as reader:
+        captured = reader.frames(function_codes={function_code})
+        display_capture(
+            ((frame.frame, frame.header, frame.payload) for frame in captured), message_type
+        )
+
+
+def display_capture(captured: Iterable[tuple[bytes, MBAPHeader, bytes]], message_type: str) -> None:
+    for i, (frame, header, payload) in enumerate(captured):
         print(f"Frame {i}: {frame}\n")
 
         print(f"Header {i}: {header}\n")
@@ -56,13 +68,18 @@ def display_message_payload(payload: bytes, message_type: str) -> None:
 def main():
     if len(sys.argv) < 2:
         print("Usage: uv run analyze_captures.py <json_file>")
+        print(f"       uv run analyze_captures.py <{CAPTURE_FILE_SUFFIX} file> <message_type>")
         sys.exit(1)
 
+    if sys.argv[1].endswith(CAPTURE_FILE_SUFFIX):
+        display_binary_capture(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "data")
+        return
+
     message_type = sys.argv[1].split("/")[-1].split("_message.json")[0]
     print(message_type)
 
     frames, headers, payloads = load_capture_file(sys.argv[1])
-    display_capture(frames, headers, payloads, message_type)
+    display_capture(zip(frames, headers, payloads, strict=True), message_type)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+import argparse
+import random
+import timeit
+
+from shine2mqtt.protocol.frame.crc.backend import (
+    CRC16_BACKENDS,
+    CRC16_INITIAL_VALUE,
+    TableCRC16Backend,
+    select_crc16_backend,
+)
+
+
+def verify(samples: list[bytes]) -> None:
+    reference = TableCRC16Backend()
+    for backend_type in CRC16_BACKENDS:
+        backend = backend_type()
+        for sample in samples:
+            expected = reference.update(CRC16_INITIAL_VALUE, sample)
+            actual = backend.update(CRC16_INITIAL_VALUE, sample)
+            if actual != expected:
+                raise SystemExit(
+                    f"{backend.name}: crc mismatch for {len(sample)} bytes "
+                    f"(0x{actual:04x} != 0x{expected:04x})"
+                )
+    print(f"All backends match the reference table for {len(samples)} samples")
+
+
+def benchmark(size: int, number: int) -> None:
+    data = random.randbytes(size)
+    for backend_type in CRC16_BACKENDS:
+        backend = backend_type()
+        elapsed = timeit.timeit(
+            lambda backend=backend: backend.update(CRC16_INITIAL_VALUE, data), number=number
+        )
+        print(f"{backend.name:>14}: {elapsed / number * 1e6:8.2f} µs per {size} byte frame")
+
+    print(f"Selected backend: {select_crc16_backend().name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify and benchmark the CRC16 backends")
+    parser.add_argument("--size", type=int, default=585, help="Frame size in bytes")
+    parser.add_argument("--number", type=int, default=2000, help="Iterations per backend")
+    args = parser.parse_args()
+
+    samples = [random.randbytes(length) for length in range(0, 1100, 7)]
+    verify(samples)
+    benchmark(args.size, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import argparse
+import time
+import tracemalloc
+
+from shine2mqtt.adapters.mqtt.config import MqttConfig
+from shine2mqtt.adapters.mqtt.mapper import MqttEventMapper
+from shine2mqtt.domain.models.inverter import InverterState
+from shine2mqtt.protocol.messages.data.data import GrowattDataMessage
+from shine2mqtt.protocol.messages.data.decoder import DataRequestDecoder
+from shine2mqtt.protocol.session.mapper import MessageEventMapper
+from shine2mqtt.util.logger import logger
+from tests.utils.loader import CapturedFrameLoader
+
+
+def run_pipeline(count: int) -> float:
+    _, headers, payloads = CapturedFrameLoader.load("data_message")
+    decoder = DataRequestDecoder()
+    event_mapper = MessageEventMapper()
+    mqtt_mapper = MqttEventMapper(MqttConfig())
+
+    start = time.perf_counter()
+    for i in range(count):
+        message = decoder.decode(headers[0], payloads[i % len(payloads)])
+        event = event_mapper.map_data_message_to_inverter_state_updated_event(message)
+        mqtt_mapper.map_inverter_state(event)
+    return time.perf_counter() - start
+
+
+def measure_retained_size(count: int) -> int:
+    """Bytes held by `count` live messages plus their events, as seen by tracemalloc."""
+    _, headers, payloads = CapturedFrameLoader.load("data_message")
+    decoder = DataRequestDecoder()
+    event_mapper = MessageEventMapper()
+
+    tracemalloc.start()
+    snapshot_before = tracemalloc.get_traced_memory()[0]
+    retained = []
+    for i in range(count):
+        message = decoder.decode(headers[0], payloads[i % len(payloads)])
+        retained.append(
+            (message, event_mapper.map_data_message_to_inverter_state_updated_event(message))
+        )
+    size = tracemalloc.get_traced_memory()[0] - snapshot_before
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure decode -> domain event -> MQTT mapping throughput and memory"
+    )
+    parser.add_argument("--events", type=int, default=10_000, help="Number of data frames")
+    parser.add_argument("--target", type=int, default=10_000, help="Target events per second")
+    args = parser.parse_args()
+
+    # The MQTT mapper warns about unmapped fields, keep that out of the measurement
+    logger.remove()
+
+    for cls in (GrowattDataMessage, InverterState):
+        print(f"{cls.__name__}: slots={hasattr(cls, '__slots__')}")
+
+    elapsed = run_pipeline(args.events)
+    rate = args.events / elapsed
+    print(
+        f"{args.events} events in {elapsed:.3f}s -> {rate:,.0f} events/s ({elapsed / args.events * 1e6:.1f} µs/event)"
+    )
+
+    size = measure_retained_size(args.events)
+    print(f"Retained memory: {size / args.events:.0f} bytes per message + event")
+
+    if rate < args.target:
+        raise SystemExit(f"Throughput {rate:,.0f} events/s is below the {args.target:,} target")
+
+
+if __name__ == "__main__":
+    main()
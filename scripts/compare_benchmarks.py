@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+import json
+import sys
+from pathlib import Path
+
+# Relative throughput drop (and latency increase) that counts as a regression
+THRESHOLD = 0.10
+
+
+def load(path: Path) -> dict[str, dict]:
+    report = json.loads(path.read_text())
+    return {result["stage"]: result for result in report["results"]}
+
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: uv run compare_benchmarks.py <baseline.json> <current.json>")
+        sys.exit(1)
+
+    baseline = load(Path(sys.argv[1]))
+    current = load(Path(sys.argv[2]))
+
+    regressions = []
+    print(f"{'stage':<28} {'baseline ops/s':>15} {'current ops/s':>15} {'change':>8} {'p99':>8}")
+    for stage, result in current.items():
+        if stage not in baseline:
+            print(f"{stage:<28} {'-':>15} {result['ops_per_sec']:>15,.0f}")
+            continue
+
+        before = baseline[stage]
+        throughput = result["ops_per_sec"] / before["ops_per_sec"] - 1
+        p99 = result["latency_ns"]["p99"] / before["latency_ns"]["p99"] - 1
+        print(
+            f"{stage:<28} {before['ops_per_sec']:>15,.0f} {result['ops_per_sec']:>15,.0f} "
+            f"{throughput:>+8.1%} {p99:>+8.1%}"
+        )
+        if throughput < -THRESHOLD or p99 > THRESHOLD:
+            regressions.append(stage)
+
+    if regressions:
+        print(f"\nRegressed more than {THRESHOLD:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+
+from shine2mqtt.protocol.frame.capturer import BinaryCaptureConverter
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: uv run convert_captures.py <output_dir> <capture_file>...")
+        sys.exit(1)
+
+    output_dir = Path(sys.argv[1])
+    paths = sorted(Path(path) for path in sys.argv[2:])
+
+    count = BinaryCaptureConverter.to_json(paths, output_dir)
+    print(f"Converted {count} frames from {len(paths)} files to {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
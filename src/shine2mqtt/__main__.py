@@ -1,44 +1,77 @@
 import asyncio
+import sys
+from pathlib import Path
 
 from shine2mqtt.infrastructure.client.client import SimulatedClient
 from shine2mqtt.infrastructure.client.transport import TCPTransport
 from shine2mqtt.main.app import Application
+from shine2mqtt.main.bench.config import BenchConfig
+from shine2mqtt.main.bench.suite import BenchSuite, format_result
 from shine2mqtt.main.cli.converter import CliArgDictConverter
 from shine2mqtt.main.cli.parser import CliArgParser
 from shine2mqtt.main.config.config import ApplicationConfig
 from shine2mqtt.main.config.file import ConfigFileLoader
 from shine2mqtt.main.logger import LoggerConfigurator
+from shine2mqtt.main.replay.harness import ReplayHarness, format_report
 from shine2mqtt.protocol.frame.factory import FrameFactory
 from shine2mqtt.protocol.simulator.config import SimulatedClientConfig
 from shine2mqtt.protocol.simulator.factory import ClientProtocolSessionFactory
+from shine2mqtt.protocol.simulator.fleet import SimulatedFleet
 from shine2mqtt.protocol.simulator.generator import FrameGenerator
-from shine2mqtt.protocol.simulator.handler import ClientMessageHandler
-from shine2mqtt.util.clock import MonotonicClockService
+from shine2mqtt.util.clock import ClockService, create_clock
+from shine2mqtt.util.event_loop import create_loop_factory
 from shine2mqtt.util.logger import logger
 
 
-async def run_simulated_datalogger(config: SimulatedClientConfig) -> None:
-    transport = TCPTransport()
-
+async def run_simulated_datalogger(config: SimulatedClientConfig, clock: ClockService) -> None:
     encoder = FrameFactory.encoder()
     decoder = FrameFactory.client_decoder()
-    clock = MonotonicClockService()
 
-    generator = FrameGenerator(encoder=encoder)
-    message_handler = ClientMessageHandler(generator=generator)
+    generator = FrameGenerator(encoder=encoder, clock=clock, solar=config.solar)
     session_factory = ClientProtocolSessionFactory(
         decoder=decoder,
         config=config,
         clock=clock,
         generator=generator,
-        message_handler=message_handler,
     )
-    datalogger = SimulatedClient(transport, session_factory, config)
-    await datalogger.run()
+
+    if config.loggers > 1:
+        fleet = SimulatedFleet(session_factory, config, clock)
+        await fleet.run()
+    else:
+        datalogger = SimulatedClient(TCPTransport(), session_factory, config)
+        await datalogger.run()
+
+
+def run_benchmarks(config: BenchConfig) -> None:
+    # Keep log output (e.g. warnings per unmapped field) out of the measurements
+    logger.disable("shine2mqtt")
+    try:
+        report = BenchSuite(config).run(
+            on_result=lambda result: print(format_result(result), file=sys.stderr)
+        )
+    finally:
+        logger.enable("shine2mqtt")
+
+    write_results(report.to_json(), config.output)
+
+
+async def run_replay(config: ApplicationConfig, clock: ClockService) -> None:
+    report = await ReplayHarness(config, clock=clock).run()
+    print(format_report(report), file=sys.stderr)
+    write_results(report.to_json(), config.replay.output)
 
 
-async def run_application(config: ApplicationConfig) -> None:
-    app = Application(config=config)
+def write_results(results: str, output: Path | None) -> None:
+    if output == Path("-"):
+        print(results)
+    elif output is not None:
+        output.write_text(results)
+        logger.info(f"Results written to {output}")
+
+
+async def run_application(config: ApplicationConfig, clock: ClockService) -> None:
+    app = Application(config=config, clock=clock)
     await app.run()
 
 
@@ -55,18 +88,18 @@ def setup_logging(config: ApplicationConfig) -> None:
     LoggerConfigurator.setup(log_level=config.log_level, color=config.log_color)
 
 
-async def main():
+async def main(config: ApplicationConfig, clock: ClockService):
     try:
-        config = load_config()
-
-        setup_logging(config)
-
         logger.info(f"Loaded configuration: {config}")
 
-        if config.simulated_client.enabled:
-            await run_simulated_datalogger(config.simulated_client)
+        if config.bench.enabled:
+            run_benchmarks(config.bench)
+        elif config.replay.enabled:
+            await run_replay(config, clock)
+        elif config.simulated_client.enabled:
+            await run_simulated_datalogger(config.simulated_client, clock)
         else:
-            await run_application(config)
+            await run_application(config, clock)
 
     except asyncio.CancelledError:
         logger.info("Shutting down gracefully")
@@ -74,8 +107,17 @@ async def main():
 
 
 def run():
+    config = load_config()
+
+    setup_logging(config)
+
+    # Timers of both the simulator and the server follow the clock of the event loop
+    clock = create_clock(config.clock)
+    if config.clock.virtual:
+        logger.info(f"Running on a virtual clock: {config.clock}")
+
     try:
-        asyncio.run(main())
+        asyncio.run(main(config, clock), loop_factory=create_loop_factory(clock))
     except KeyboardInterrupt:
         logger.warning("Application stopped by CTRL+C (Interrupted by user)")
 
@@ -1,3 +1,5 @@
+from dataclasses import asdict
+
 from fastapi import FastAPI, Response
 from fastapi.responses import RedirectResponse
 
@@ -6,6 +8,7 @@ from shine2mqtt.adapters.api.inverter.router import router as inverter_router
 from shine2mqtt.app.handlers.read_register import ReadRegisterHandler
 from shine2mqtt.app.handlers.send_raw_frame import SendRawFrameHandler
 from shine2mqtt.app.handlers.write_register import WriteRegisterHandler
+from shine2mqtt.domain.events.bus import DomainEventBus
 from shine2mqtt.domain.interfaces.registry import SessionRegistry
 
 
@@ -14,6 +17,7 @@ def create_app(
     read_handler: ReadRegisterHandler,
     write_handler: WriteRegisterHandler,
     send_raw_frame_handler: SendRawFrameHandler,
+    event_bus: DomainEventBus | None = None,
 ) -> FastAPI:
     app = FastAPI()
 
@@ -24,6 +28,13 @@ def create_app(
     app.include_router(datalogger_router)
     app.include_router(inverter_router)
 
+    if event_bus is not None:
+
+        @app.get("/events/metrics", tags=["events"])
+        async def get_event_metrics() -> dict:
+            """Domain event bus throughput, queue depths and dropped events per consumer."""
+            return asdict(event_bus.metrics())
+
     @app.post("/coffee", status_code=418, tags=["coffee"])
     async def brew_coffee() -> Response:
         """Attempt to brew coffee with a teapot (RFC 2324)."""
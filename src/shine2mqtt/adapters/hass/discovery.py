@@ -1,7 +1,9 @@
+from collections.abc import Collection
 from typing import Any
 
 from shine2mqtt import HOME_PAGE, __version__
 from shine2mqtt.adapters.hass.config import HassDiscoveryConfig
+from shine2mqtt.adapters.hass.map import SensorMap
 from shine2mqtt.domain.models.datalogger import DataLogger
 
 
@@ -15,12 +17,27 @@ class HassDiscoveryPayloadBuilder:
     def __init__(
         self,
         config: HassDiscoveryConfig,
-        datalogger_sensor_map: dict[str, dict[str, str]],
-        inverter_sensor_map: dict[str, dict[str, str]],
+        datalogger_sensor_map: SensorMap,
+        inverter_sensor_map: SensorMap,
+        inverter_state_sensors: Collection[str] = (),
     ) -> None:
         self._config = config
         self._datalogger_sensor_map = datalogger_sensor_map
         self._inverter_sensor_map = inverter_sensor_map
+        # Inverter sensors read from the aggregated {base_topic}/inverter/state JSON document
+        self._inverter_state_sensors = inverter_state_sensors
+
+        # Components and topics only depend on the config, payloads share them per device
+        self._datalogger_components = self._build_components(datalogger_sensor_map, "datalogger")
+        self._inverter_components = self._build_components(
+            inverter_sensor_map, "inverter", inverter_state_sensors
+        )
+        self._datalogger_discovery_topic = self._build_device_discovery_topic(
+            config.datalogger.device_id
+        )
+        self._inverter_discovery_topic = self._build_device_discovery_topic(
+            config.inverter.device_id
+        )
 
     def build_datalogger_discovery_message(
         self,
@@ -40,13 +57,9 @@ class HassDiscoveryPayloadBuilder:
                 "connections": [["ip", datalogger.ip_address], ["mac", datalogger.mac_address]],
             },
             "origin": self.DISCOVERY_ORIGIN,
-            "components": {},
+            "components": self._datalogger_components,
         }
 
-        discovery_payload["components"] = self._build_components(
-            self._datalogger_sensor_map, "datalogger"
-        )
-
         return discovery_payload
 
     def build_inverter_discovery_message(
@@ -64,28 +77,34 @@ class HassDiscoveryPayloadBuilder:
                 "via_device": self._config.datalogger.device_id,
             },
             "origin": self.DISCOVERY_ORIGIN,
-            "components": {},
+            "components": self._inverter_components,
         }
 
-        discovery_payload["components"] = self._build_components(
-            self._inverter_sensor_map, "inverter"
-        )
-
         return discovery_payload
 
     def _build_components(
-        self, sensor_map: dict[str, dict[str, str]], base_sub_topic: str
+        self,
+        sensor_map: SensorMap,
+        base_sub_topic: str,
+        state_sensors: Collection[str] = (),
     ) -> dict[str, Any]:
         components = {}
 
         for entity_id, sensor_config in sensor_map.items():
+            if entity_id in state_sensors:
+                value_template = f"{{{{ value_json.{entity_id} }}}}"
+                state_topic = f"{self._config.base_topic}/{base_sub_topic}/state"
+            else:
+                value_template = "{{ value_json.value }}"
+                state_topic = f"{self._config.base_topic}/{base_sub_topic}/sensor/{entity_id}"
+
             component = {
                 "platform": "sensor",
                 "name": sensor_config["name"],
                 "icon": sensor_config["icon"],
-                "value_template": "{{ value_json.value }}",
+                "value_template": value_template,
                 "unique_id": f"{entity_id}",
-                "state_topic": f"{self._config.base_topic}/{base_sub_topic}/sensor/{entity_id}",
+                "state_topic": state_topic,
             }
 
             if "device_class" in sensor_config:
@@ -102,10 +121,10 @@ class HassDiscoveryPayloadBuilder:
         return components
 
     def build_inverter_discovery_topic(self) -> str:
-        return self._build_device_discovery_topic(self._config.inverter.device_id)
+        return self._inverter_discovery_topic
 
     def build_datalogger_discovery_topic(self) -> str:
-        return self._build_device_discovery_topic(self._config.datalogger.device_id)
+        return self._datalogger_discovery_topic
 
     def _build_device_discovery_topic(self, device_id: str) -> str:
         topic = f"{self._config.prefix_topic}/device/{device_id}/config"
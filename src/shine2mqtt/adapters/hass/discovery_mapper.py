@@ -5,42 +5,70 @@ from shine2mqtt.adapters.mqtt.message import MqttMessage
 from shine2mqtt.domain.events.events import DataloggerAnnouncedEvent
 from shine2mqtt.util.logger import logger
 
+type DiscoveryIdentity = tuple[str, ...]
+
 
 class HassDiscoveryMapper:
     def __init__(self, discovery: HassDiscoveryPayloadBuilder, enabled: bool):
         self._payload_builder = discovery
         self._enabled = enabled
         self._announced: set[str] = set()
+        # datalogger serial -> (identity, serialized inverter payload, serialized datalogger payload)
+        self._payloads: dict[str, tuple[DiscoveryIdentity, str, str]] = {}
 
     def get_discovery_messages(self, event: DataloggerAnnouncedEvent) -> list[MqttMessage]:
-        if not self._enabled or event.datalogger_serial in self._announced:
+        if not self._enabled:
             return []
 
-        logger.info(f"Building HASS discovery messages for datalogger '{event.datalogger_serial}'")
-        self._announced.add(event.datalogger_serial)
+        serial = event.datalogger_serial
+        identity = self._get_identity(event)
+        cached = self._payloads.get(serial)
+
+        if cached is None or cached[0] != identity:
+            logger.info(f"Building HASS discovery messages for datalogger '{serial}'")
+            cached = (identity, *self._serialize_payloads(event))
+            self._payloads[serial] = cached
+            self._announced.discard(serial)
+
+        if serial in self._announced:
+            return []
+        self._announced.add(serial)
 
+        _, inverter_payload, datalogger_payload = cached
         return [
-            self._build_inverter_discovery(event),
-            self._build_datalogger_discovery(event),
+            self._build_discovery_message(
+                self._payload_builder.build_inverter_discovery_topic(), inverter_payload
+            ),
+            self._build_discovery_message(
+                self._payload_builder.build_datalogger_discovery_topic(), datalogger_payload
+            ),
         ]
 
-    def _build_inverter_discovery(self, event: DataloggerAnnouncedEvent) -> MqttMessage:
-        payload = self._payload_builder.build_inverter_discovery_message(
+    def reset_announced(self) -> None:
+        """Publish the cached discovery payloads again on the next announce."""
+        self._announced.clear()
+
+    def _get_identity(self, event: DataloggerAnnouncedEvent) -> DiscoveryIdentity:
+        datalogger = event.datalogger
+        return (
+            datalogger.serial,
+            datalogger.sw_version,
+            datalogger.hw_version,
+            datalogger.ip_address,
+            datalogger.mac_address,
+            event.inverter.serial,
+            event.inverter.fw_version,
+        )
+
+    def _serialize_payloads(self, event: DataloggerAnnouncedEvent) -> tuple[str, str]:
+        inverter_payload = self._payload_builder.build_inverter_discovery_message(
             inverter_fw_version=event.inverter.fw_version,
             inverter_serial=event.inverter.serial,
         )
-        return MqttMessage(
-            topic=self._payload_builder.build_inverter_discovery_topic(),
-            payload=json.dumps(payload),
-            qos=1,
-            retain=True,
+        datalogger_payload = self._payload_builder.build_datalogger_discovery_message(
+            event.datalogger
         )
+        return json.dumps(inverter_payload), json.dumps(datalogger_payload)
 
-    def _build_datalogger_discovery(self, event: DataloggerAnnouncedEvent) -> MqttMessage:
-        payload = self._payload_builder.build_datalogger_discovery_message(event.datalogger)
-        return MqttMessage(
-            topic=self._payload_builder.build_datalogger_discovery_topic(),
-            payload=json.dumps(payload),
-            qos=1,
-            retain=True,
-        )
+    def _build_discovery_message(self, topic: str, payload: str) -> MqttMessage:
+        return MqttMessage(topic=topic, payload=payload, qos=1, retain=True)
@@ -1,3 +1,5 @@
+from typing import NotRequired, TypedDict
+
 POWER_DC_ICON = "mdi:solar-power"
 CURRENT_DC_ICON = "mdi:current-dc"
 VOLTAGE_DC_ICON = "mdi:gauge"
@@ -15,7 +17,22 @@ ENERGY_ICON = "mdi:meter-electric-outline"
 HASS_CONTROLS_MAP = {}
 
 
-INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
+class SensorConfig(TypedDict):
+    entity_id: str
+    name: str
+    icon: str
+    device_class: NotRequired[str]
+    unit_of_measurement: NotRequired[str]
+    entity_category: NotRequired[str]
+    device: NotRequired[str]
+    # Minimum absolute change before a new value is published (changes_only publishing)
+    deadband: NotRequired[float]
+
+
+type SensorMap = dict[str, SensorConfig]
+
+
+INVERTER_STATE_SENSORS: SensorMap = {
     "power_dc": {
         "entity_id": "power_dc",
         "name": "Power DC",
@@ -30,6 +47,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
         "device_class": "voltage",
         "unit_of_measurement": "V",
         "icon": VOLTAGE_DC_ICON,
+        "deadband": 1.0,
     },
     "current_dc_1": {
         "entity_id": "current_dc_1",
@@ -51,6 +69,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
         "device_class": "voltage",
         "unit_of_measurement": "V",
         "icon": VOLTAGE_DC_ICON,
+        "deadband": 1.0,
     },
     "current_dc_2": {
         "entity_id": "current_dc_2",
@@ -79,6 +98,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
         "device_class": "frequency",
         "unit_of_measurement": "Hz",
         "icon": FREQUENCY_AC_ICON,
+        "deadband": 0.05,
     },
     "voltage_ac_1": {
         "entity_id": "voltage_ac_1",
@@ -86,6 +106,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
         "device_class": "voltage",
         "unit_of_measurement": "V",
         "icon": VOLTAGE_AC_ICON,
+        "deadband": 1.0,
     },
     "current_ac_1": {
         "entity_id": "current_ac_1",
@@ -107,6 +128,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
         "device_class": "voltage",
         "unit_of_measurement": "V",
         "icon": VOLTAGE_AC_ICON,
+        "deadband": 1.0,
     },
     "voltage_ac_l2_l3": {
         "entity_id": "voltage_ac_l2_l3",
@@ -114,6 +136,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
         "device_class": "voltage",
         "unit_of_measurement": "V",
         "icon": VOLTAGE_AC_ICON,
+        "deadband": 1.0,
     },
     "voltage_ac_l3_l1": {
         "entity_id": "voltage_ac_l3_l1",
@@ -121,6 +144,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
         "device_class": "voltage",
         "unit_of_measurement": "V",
         "icon": VOLTAGE_AC_ICON,
+        "deadband": 1.0,
     },
     "energy_ac_today": {
         "entity_id": "energy_ac_today",
@@ -173,7 +197,7 @@ INVERTER_STATE_SENSORS: dict[str, dict[str, str]] = {
     },
 }
 
-INVERTER_ATTRIBUTE_SENSORS: dict[str, dict[str, str]] = {
+INVERTER_ATTRIBUTE_SENSORS: SensorMap = {
     # "datalogger_serial": {
     #     "entity_id": "datalogger_serial",
     #     "entity_category": "diagnostic",
@@ -200,7 +224,7 @@ INVERTER_ATTRIBUTE_SENSORS: dict[str, dict[str, str]] = {
     },
 }
 
-INVERTER_SETTINGS_SENSORS: dict[str, dict[str, str]] = {
+INVERTER_SETTINGS_SENSORS: SensorMap = {
     "active_power_ac_max": {
         "entity_id": "active_power_ac_max",
         "entity_category": "diagnostic",
@@ -278,13 +302,13 @@ INVERTER_SETTINGS_SENSORS: dict[str, dict[str, str]] = {
     },
 }
 
-INVERTER_SENSOR_MAP: dict[str, dict[str, str]] = {
+INVERTER_SENSOR_MAP: SensorMap = {
     **INVERTER_ATTRIBUTE_SENSORS,
     **INVERTER_SETTINGS_SENSORS,
     **INVERTER_STATE_SENSORS,
 }
 
-DATALOGGER_SENSOR_MAP: dict[str, dict[str, str]] = {
+DATALOGGER_SENSOR_MAP: SensorMap = {
     "update_interval": {
         "entity_id": "update_interval",
         "entity_category": "diagnostic",
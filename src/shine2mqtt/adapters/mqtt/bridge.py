@@ -1,5 +1,4 @@
 import asyncio
-from dataclasses import asdict
 
 import aiomqtt
 
@@ -31,18 +30,14 @@ class MqttBridge:
                 async with self._client.connect() as client:
                     logger.info("Connected to MQTT broker")
                     try:
-                        await client.publish(
-                            **asdict(self._event_mapper.map_availability(online=True))
-                        )
+                        await self._publish_availability(client, online=True)
                         await asyncio.gather(
                             self._publisher.run(client),
                             self._subscriber.run(client),
                         )
                     except asyncio.CancelledError:
                         await self._publisher.flush(client)
-                        await client.publish(
-                            **asdict(self._event_mapper.map_availability(online=False))
-                        )
+                        await self._publish_availability(client, online=False)
                         raise
             except aiomqtt.MqttError as error:
                 logger.error(
@@ -50,3 +45,13 @@ class MqttBridge:
                     f"Reconnecting in {self._RECONNECT_INTERVAL} seconds..."
                 )
                 await asyncio.sleep(self._RECONNECT_INTERVAL)
+
+    async def _publish_availability(self, client: aiomqtt.Client, online: bool) -> None:
+        message = self._event_mapper.map_availability(online=online)
+        await client.publish(
+            message.topic,
+            message.payload,
+            qos=message.qos,
+            retain=message.retain,
+            timeout=message.timeout,
+        )
@@ -8,7 +8,12 @@ from shine2mqtt.util.logger import logger
 
 
 class MqttClient:
-    def __init__(self, config: MqttServerConfig, will_message: MqttMessage | None = None):
+    def __init__(
+        self,
+        config: MqttServerConfig,
+        will_message: MqttMessage | None = None,
+        max_inflight_messages: int | None = None,
+    ):
         will = (
             Will(
                 topic=will_message.topic,
@@ -29,6 +34,7 @@ class MqttClient:
             "protocol": ProtocolVersion.V5,
             "logger": logger,
             "will": will,
+            "max_inflight_messages": max_inflight_messages,
         }
 
     def connect(self) -> Client:
@@ -1,3 +1,5 @@
+from enum import StrEnum
+
 from pydantic import BaseModel, Field
 
 from shine2mqtt.adapters.hass.config import HassDiscoveryConfig
@@ -11,8 +13,30 @@ class MqttServerConfig(BaseModel):
     password: str | None = Field(default=None, repr=False)
 
 
+class MqttPublishConfig(BaseModel):
+    # Number of publishes awaited concurrently (QoS 1 publishes wait for their PUBACK)
+    max_in_flight: int = Field(default=32, ge=1)
+    # Number of messages waiting for an in-flight slot before the publisher blocks
+    max_pending: int = Field(default=1024, ge=1)
+    # Replace a waiting message with a newer one for the same topic
+    coalesce: bool = True
+    # Only publish inverter values that changed by more than their sensor deadband
+    changes_only: bool = False
+    # Seconds after which an unchanged value is published again (changes_only only)
+    max_age: int = Field(default=300, ge=1)
+
+
+class PublishMode(StrEnum):
+    # One message per sensor on {base_topic}/{device}/sensor/{entity_id}
+    PER_SENSOR = "per_sensor"
+    # Inverter state as one JSON document on {base_topic}/inverter/state
+    AGGREGATED = "aggregated"
+
+
 class MqttConfig(BaseModel):
     base_topic: str = "solar"
     availability_topic: str = "solar/state"
+    publish_mode: PublishMode = PublishMode.PER_SENSOR
     server: MqttServerConfig = Field(default_factory=MqttServerConfig)
+    publish: MqttPublishConfig = Field(default_factory=MqttPublishConfig)
     discovery: HassDiscoveryConfig = Field(default_factory=HassDiscoveryConfig)
@@ -0,0 +1,73 @@
+from collections.abc import Iterable
+from typing import Any
+
+from shine2mqtt.adapters.hass.map import SensorMap
+from shine2mqtt.util.clock import ClockService
+
+
+class DeltaPublishFilter:
+    """Drops sensor values that did not change since they were last published.
+
+    A value is published when it differs from the last published value by more than the
+    sensor's ``deadband`` (exact comparison without one), when it was never published, or when
+    the last publish is older than ``max_age`` seconds. The cache is kept per datalogger.
+    """
+
+    def __init__(self, sensor_map: SensorMap, max_age: float, clock: ClockService):
+        self._deadbands = {
+            field: sensor["deadband"]
+            for field, sensor in sensor_map.items()
+            if "deadband" in sensor
+        }
+        self._max_age = max_age
+        self._clock = clock
+        # datalogger serial -> field -> (last published value, published at)
+        self._published: dict[str, dict[str, tuple[Any, float]]] = {}
+
+    def changed_fields(
+        self, datalogger_serial: str, fields: Iterable[tuple[str, Any]]
+    ) -> list[tuple[str, Any]]:
+        now = self._clock.now()
+        published = self._published.setdefault(datalogger_serial, {})
+
+        changed = []
+        for field, value in fields:
+            if self._should_publish(published.get(field), field, value, now):
+                published[field] = (value, now)
+                changed.append((field, value))
+        return changed
+
+    def any_changed(self, datalogger_serial: str, fields: Iterable[tuple[str, Any]]) -> bool:
+        """Check whether any field should be published, if so all fields count as published."""
+        now = self._clock.now()
+        published = self._published.setdefault(datalogger_serial, {})
+
+        fields = list(fields)
+        if not any(self._should_publish(published.get(f), f, v, now) for f, v in fields):
+            return False
+
+        for field, value in fields:
+            published[field] = (value, now)
+        return True
+
+    def reset(self, datalogger_serial: str | None = None) -> None:
+        if datalogger_serial is None:
+            self._published.clear()
+        else:
+            self._published.pop(datalogger_serial, None)
+
+    def _should_publish(
+        self, last: tuple[Any, float] | None, field: str, value: Any, now: float
+    ) -> bool:
+        if last is None:
+            return True
+
+        last_value, published_at = last
+        if now - published_at >= self._max_age:
+            return True
+
+        deadband = self._deadbands.get(field)
+        if deadband is not None and isinstance(value, int | float):
+            return abs(value - last_value) > deadband
+
+        return value != last_value
@@ -1,22 +1,44 @@
 import json
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict
 from typing import Any
 
 from shine2mqtt.adapters.hass.map import (
     DATALOGGER_SENSOR_MAP,
     INVERTER_SENSOR_MAP,
+    SensorConfig,
+    SensorMap,
 )
-from shine2mqtt.adapters.mqtt.config import MqttConfig
+from shine2mqtt.adapters.mqtt.config import MqttConfig, PublishMode
+from shine2mqtt.adapters.mqtt.delta import DeltaPublishFilter
 from shine2mqtt.adapters.mqtt.message import MqttMessage
-from shine2mqtt.domain.events.events import DataloggerAnnouncedEvent, InverterStateUpdatedEvent
+from shine2mqtt.domain.events.events import (
+    DataloggerAnnouncedEvent,
+    InverterBacklogDrainedEvent,
+    InverterHistoryRecordedEvent,
+    InverterStateUpdatedEvent,
+)
 from shine2mqtt.domain.models.inverter import Inverter
 from shine2mqtt.util.logger import logger
 
 
 class MqttEventMapper:
-    def __init__(self, config: MqttConfig):
+    def __init__(self, config: MqttConfig, delta_filter: DeltaPublishFilter | None = None):
         self._base_topic = config.base_topic
         self._availability_topic = config.availability_topic
+        self._publish_mode = config.publish_mode
+        self._delta_filter = delta_filter
+
+        self._inverter_state_topic = f"{self._base_topic}/inverter/state"
+        self._inverter_history_topic = f"{self._base_topic}/inverter/history"
+        self._datalogger_backlog_topic = f"{self._base_topic}/datalogger/backlog"
+        self._inverter_topics = self._build_sensor_topics(INVERTER_SENSOR_MAP, "inverter")
+        self._datalogger_topics = self._build_sensor_topics(DATALOGGER_SENSOR_MAP, "datalogger")
+
+    def reset_published(self) -> None:
+        """Forget published values, e.g. after a reconnect, so the next state is sent in full."""
+        if self._delta_filter is not None:
+            self._delta_filter.reset()
 
     def map_availability(self, online: bool) -> MqttMessage:
         return MqttMessage(
@@ -27,17 +49,67 @@ class MqttEventMapper:
         )
 
     def map_inverter_state(self, event: InverterStateUpdatedEvent) -> list[MqttMessage]:
-        return self._build_mqtt_messages(asdict(event.state), INVERTER_SENSOR_MAP, "inverter")
+        fields: Iterable[tuple[str, Any]] = event.state.iter_fields()
+        delta_filter = self._delta_filter
+
+        if self._publish_mode is PublishMode.AGGREGATED:
+            if delta_filter is not None:
+                fields = list(fields)
+                if not delta_filter.any_changed(event.datalogger_serial, fields):
+                    return []
+            return [
+                self._build_aggregated_mqtt_message(
+                    fields, INVERTER_SENSOR_MAP, self._inverter_state_topic
+                )
+            ]
+
+        if delta_filter is not None:
+            fields = delta_filter.changed_fields(event.datalogger_serial, fields)
+        return self._build_mqtt_messages(fields, self._inverter_topics)
+
+    def map_inverter_history(self, event: InverterHistoryRecordedEvent) -> list[MqttMessage]:
+        # Historic readings never touch the live sensor topics, every reading is kept
+        return [
+            MqttMessage(
+                topic=self._inverter_history_topic,
+                payload=json.dumps(
+                    {
+                        "timestamp": reading.timestamp.isoformat(),
+                        **self._build_state_document(
+                            reading.state.iter_fields(), INVERTER_SENSOR_MAP
+                        ),
+                    }
+                ),
+                qos=1,
+                coalesce=False,
+            )
+            for reading in event.readings
+        ]
+
+    def map_backlog_drained(self, event: InverterBacklogDrainedEvent) -> MqttMessage:
+        rate = event.readings / event.duration if event.duration > 0 else float(event.readings)
+        payload = {
+            "readings": event.readings,
+            "duration": round(event.duration, 3),
+            "rate": round(rate, 1),
+            "timestamp": event.timestamp.isoformat(),
+        }
+        return MqttMessage(
+            topic=self._datalogger_backlog_topic, payload=json.dumps(payload), qos=1, retain=True
+        )
 
     def map_datalogger_announced(self, event: DataloggerAnnouncedEvent) -> list[MqttMessage]:
+        if self._delta_filter is not None:
+            self._delta_filter.reset(event.datalogger_serial)
+
         inverter_fields = self._flatten_inverter_announce_fields(event.inverter)
         datalogger_fields = asdict(event.datalogger)
         return [
             *self._build_mqtt_messages(
-                datalogger_fields, DATALOGGER_SENSOR_MAP, "datalogger", qos=1, retain=True
+                datalogger_fields.items(), self._datalogger_topics, qos=1, retain=True
             ),
             *self._build_mqtt_messages(
-                inverter_fields, INVERTER_SENSOR_MAP, "inverter", qos=1, retain=True
+                inverter_fields.items(), self._inverter_topics, qos=1, retain=True
             ),
         ]
 
@@ -49,21 +121,57 @@ class MqttEventMapper:
             **asdict(inverter.settings),
         }
 
+    def _build_sensor_topics(self, sensor_map: SensorMap, device: str) -> dict[str, str]:
+        return {
+            field: f"{self._base_topic}/{device}/sensor/{sensor['entity_id']}"
+            for field, sensor in sensor_map.items()
+        }
+
     def _build_mqtt_messages(
         self,
-        fields: dict[str, Any],
-        sensor_map: dict[str, dict[str, str]],
-        device: str,
+        fields: Iterable[tuple[str, Any]],
+        sensor_topics: dict[str, str],
         qos: int = 0,
         retain: bool = False,
     ) -> list[MqttMessage]:
         messages = []
-        for field, value in fields.items():
-            if field not in sensor_map:
+        for field, value in fields:
+            topic = sensor_topics.get(field)
+            if topic is None:
                 logger.warning(f"No sensor mapping for '{field}', skipping MQTT publish")
                 continue
-            sensor = sensor_map[field]
-            topic = f"{self._base_topic}/{device}/sensor/{sensor['entity_id']}"
             payload = json.dumps({"value": value})
             messages.append(MqttMessage(topic=topic, payload=payload, qos=qos, retain=retain))
         return messages
+
+    def _build_aggregated_mqtt_message(
+        self,
+        fields: Iterable[tuple[str, Any]],
+        sensor_map: SensorMap,
+        topic: str,
+        qos: int = 0,
+        retain: bool = False,
+    ) -> MqttMessage:
+        return MqttMessage(
+            topic=topic,
+            payload=json.dumps(self._build_state_document(fields, sensor_map)),
+            qos=qos,
+            retain=retain,
+        )
+
+    def _build_state_document(
+        self, fields: Iterable[tuple[str, Any]], sensor_map: SensorMap
+    ) -> dict[str, Any]:
+        return {
+            sensor["entity_id"]: value
+            for sensor, value in self._iter_mapped_fields(fields, sensor_map)
+        }
+
+    def _iter_mapped_fields(
+        self, fields: Iterable[tuple[str, Any]], sensor_map: SensorMap
+    ) -> Iterator[tuple[SensorConfig, Any]]:
+        for field, value in fields:
+            if field not in sensor_map:
+                logger.warning(f"No sensor mapping for '{field}', skipping MQTT publish")
+                continue
+            yield sensor_map[field], value
@@ -8,3 +8,5 @@ class MqttMessage:
     qos: int = 0
     retain: bool = False
     timeout: int | None = None
+    # Whether a newer message for the same topic may replace this one while it is waiting
+    coalesce: bool = True
@@ -0,0 +1,112 @@
+import asyncio
+import itertools
+from collections.abc import Hashable
+
+import aiomqtt
+
+from shine2mqtt.adapters.mqtt.config import MqttPublishConfig
+from shine2mqtt.adapters.mqtt.message import MqttMessage
+from shine2mqtt.util.logger import logger
+
+
+class MqttPublishPipeline:
+    """Publishes messages concurrently within a bounded in-flight window.
+
+    Messages waiting for a free slot are kept per topic when coalescing is enabled, so a newer
+    value replaces an older one that has not been sent yet. Publishes are started in submission
+    order, which keeps the order per topic on the wire. A failed publish is raised from the next
+    call to ``publish`` or ``flush``.
+    """
+
+    def __init__(self, client: aiomqtt.Client, config: MqttPublishConfig):
+        self._client = client
+        self._max_in_flight = config.max_in_flight
+        self._max_pending = config.max_pending
+        self._coalesce = config.coalesce
+
+        self._pending: dict[Hashable, MqttMessage] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._sequence = itertools.count()
+        self._error: BaseException | None = None
+        self._progress = asyncio.Event()
+
+        self.published = 0
+        self.coalesced = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def publish(self, message: MqttMessage) -> None:
+        self._raise_if_failed()
+
+        key = message.topic if self._coalesce and message.coalesce else next(self._sequence)
+        if key in self._pending:
+            self._pending[key] = message
+            self.coalesced += 1
+            return
+
+        while len(self._pending) >= self._max_pending:
+            await self._wait_for_progress()
+
+        self._pending[key] = message
+        self._start_pending()
+
+    async def flush(self) -> None:
+        self._raise_if_failed()
+        while self._pending or self._in_flight:
+            await self._wait_for_progress()
+
+    def close(self) -> None:
+        self._pending.clear()
+        for task in self._in_flight:
+            task.cancel()
+
+    def _start_pending(self) -> None:
+        while self._pending and len(self._in_flight) < self._max_in_flight:
+            key = next(iter(self._pending))
+            message = self._pending.pop(key)
+
+            task = asyncio.create_task(self._publish(message))
+            self._in_flight.add(task)
+            task.add_done_callback(self._on_publish_done)
+
+    async def _publish(self, message: MqttMessage) -> None:
+        logger.info(f"→ Publishing MQTT message to '{message.topic}'")
+        await self._client.publish(
+            message.topic,
+            message.payload,
+            qos=message.qos,
+            retain=message.retain,
+            timeout=message.timeout,
+        )
+
+    def _on_publish_done(self, task: asyncio.Task[None]) -> None:
+        self._in_flight.discard(task)
+
+        if not task.cancelled():
+            if (error := task.exception()) is not None:
+                if self._error is None:
+                    self._error = error
+            else:
+                self.published += 1
+
+        if self._error is None:
+            self._start_pending()
+
+        self._progress.set()
+
+    async def _wait_for_progress(self) -> None:
+        self._progress.clear()
+        await self._progress.wait()
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            self.close()
+            raise error
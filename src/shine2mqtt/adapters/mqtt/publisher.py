@@ -1,51 +1,74 @@
 import asyncio
-from dataclasses import asdict
 
 import aiomqtt
 
 from shine2mqtt.adapters.hass.discovery_mapper import HassDiscoveryMapper
+from shine2mqtt.adapters.mqtt.config import MqttPublishConfig
 from shine2mqtt.adapters.mqtt.mapper import MqttEventMapper
 from shine2mqtt.adapters.mqtt.message import MqttMessage
+from shine2mqtt.adapters.mqtt.pipeline import MqttPublishPipeline
+from shine2mqtt.domain.events.bus import DomainEventSubscription
 from shine2mqtt.domain.events.events import (
     DataloggerAnnouncedEvent,
     DomainEvent,
+    InverterBacklogDrainedEvent,
+    InverterHistoryRecordedEvent,
     InverterStateUpdatedEvent,
 )
 from shine2mqtt.util.logger import logger
 
 
 class MqttPublisher:
+    _FLUSH_PUBLISH_TIMEOUT = 0.5
+    _FLUSH_TIMEOUT = 2.0
+
     def __init__(
         self,
-        domain_events: asyncio.Queue[DomainEvent],
+        domain_events: DomainEventSubscription,
         mapper: MqttEventMapper,
         discovery: HassDiscoveryMapper,
+        config: MqttPublishConfig | None = None,
     ):
         self._domain_events = domain_events
         self._event_mapper = mapper
         self._discovery_mapper = discovery
+        self._config = config or MqttPublishConfig()
+        self._pipeline: MqttPublishPipeline | None = None
 
     async def run(self, client: aiomqtt.Client) -> None:
-        while True:
-            event = await self._domain_events.get()
-            logger.info(
-                f"Processing incoming {type(event).__name__} from '{event.datalogger_serial}' datalogger"
-            )
+        self._pipeline = MqttPublishPipeline(client, self._config)
+        self._event_mapper.reset_published()
+        self._discovery_mapper.reset_announced()
+        try:
+            while True:
+                event = await self._domain_events.get()
+                logger.info(
+                    f"Processing incoming {type(event).__name__} from '{event.datalogger_serial}' datalogger"
+                )
 
-            for message in self._map_event_to_message(event):
-                logger.info(f"→ Publishing MQTT message to '{message.topic}'")
-                await client.publish(**asdict(message))
+                for message in self._map_event_to_message(event):
+                    await self._pipeline.publish(message)
+        except Exception:
+            # On cancellation the pipeline is kept so flush() can finish the in-flight messages
+            self._pipeline.close()
+            raise
 
     async def flush(self, client: aiomqtt.Client) -> None:
         logger.info("MQTT bridge shutting down, flushing Event → MQTT queue")
-        while not self._domain_events.empty():
-            event = self._domain_events.get_nowait()
-            try:
+        pipeline = self._pipeline or MqttPublishPipeline(client, self._config)
+        try:
+            while not self._domain_events.empty():
+                event = self._domain_events.get_nowait()
                 for message in self._map_event_to_message(event):
-                    logger.info(f"→ Publishing MQTT message to '{message.topic}'")
-                    await client.publish(**asdict(message), timeout=0.5)
-            except Exception as e:
-                logger.warning(f"Failed to publish message during flush: {e}")
+                    message.timeout = self._FLUSH_PUBLISH_TIMEOUT
+                    await pipeline.publish(message)
+
+            await asyncio.wait_for(pipeline.flush(), timeout=self._FLUSH_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Failed to publish message during flush: {e}")
+        finally:
+            pipeline.close()
+            self._pipeline = None
 
     def _map_event_to_message(self, event: DomainEvent) -> list[MqttMessage]:
         match event:
@@ -55,6 +78,10 @@ class MqttPublisher:
                 return discovery_messages + sensor_update_messages
             case InverterStateUpdatedEvent():
                 return self._event_mapper.map_inverter_state(event)
+            case InverterHistoryRecordedEvent():
+                return self._event_mapper.map_inverter_history(event)
+            case InverterBacklogDrainedEvent():
+                return [self._event_mapper.map_backlog_drained(event)]
             case _:
                 logger.debug(f"No handler for event type {type(event)}")
                 return []
@@ -0,0 +1,255 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from shine2mqtt.domain.events.events import (
+    DomainEvent,
+    InverterHistoryRecordedEvent,
+    InverterStateUpdatedEvent,
+)
+
+
+class OverflowPolicy(StrEnum):
+    # Drop the oldest pending event of the datalogger
+    DROP_OLDEST = "drop_oldest"
+    # Drop the oldest pending state update of the datalogger, other events are kept
+    COALESCE_LATEST = "coalesce_latest"
+    # Wait for the consumer up to block_timeout, then drop the oldest pending event
+    BLOCK = "block"
+
+
+@dataclass(frozen=True, slots=True)
+class EventBusConfig:
+    # Maximum number of pending events per datalogger and consumer
+    max_pending: int = 100
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    # Seconds a session waits for a full consumer with the block policy
+    block_timeout: float = 1.0
+    # Seconds a session waits for a full consumer before history goes over max_pending,
+    # whatever the policy
+    history_timeout: float = 1.0
+    # Maximum number of history events per consumer over max_pending, newer ones are lost
+    max_pending_history: int = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionMetrics:
+    name: str
+    depth: int
+    delivered: int
+    dropped: int
+    coalesced: int
+    history_dropped: int
+
+
+@dataclass(frozen=True, slots=True)
+class EventBusMetrics:
+    published: int
+    blocked: int
+    block_timeouts: int
+    subscriptions: list[SubscriptionMetrics] = field(default_factory=list)
+
+
+class DomainEventSubscription:
+    """Pending events of one consumer, partitioned per datalogger.
+
+    Events of a datalogger are delivered in order, partitions take turns so one busy datalogger
+    can not starve the others. With ``coalesce_state`` a datalogger has at most one pending
+    state update: a newer one replaces it at the end of the partition, other events keep their
+    order. History is never dropped to make room, the datalogger will not send it again. A
+    partition full of history takes more, up to ``max_pending_history`` over the limit in total.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_pending: int,
+        overflow: OverflowPolicy,
+        coalesce_state: bool = False,
+        max_pending_history: int = 1000,
+    ):
+        self.name = name
+        self._max_pending = max_pending
+        self._max_pending_history = max_pending_history
+        self._overflow = overflow
+        self._coalesce_state = coalesce_state
+
+        self._partitions: dict[str, deque[DomainEvent]] = {}
+        # datalogger serials with pending events in delivery order
+        self._ready: deque[str] = deque()
+        self._size = 0
+        # History events over max_pending in all partitions
+        self._history_overflow = 0
+        self._not_empty = asyncio.Event()
+        self._space = asyncio.Event()
+
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.history_dropped = 0
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    async def get(self) -> DomainEvent:
+        while not self._ready:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._pop()
+
+    def get_nowait(self) -> DomainEvent:
+        if not self._ready:
+            raise asyncio.QueueEmpty
+        return self._pop()
+
+    def put(self, event: DomainEvent) -> bool:
+        """Add the event, False when it is history that did not fit."""
+        serial = event.datalogger_serial
+        partition = self._partitions.get(serial)
+        if partition is None:
+            partition = self._partitions[serial] = deque()
+            self._ready.append(serial)
+
+        if self._coalesce_state and isinstance(event, InverterStateUpdatedEvent):
+            self._remove_pending_state(partition)
+
+        if len(partition) >= self._max_pending and not self._make_room(partition):
+            # Only history is pending, it is kept
+            if not isinstance(event, InverterHistoryRecordedEvent):
+                self.dropped += 1
+                return True
+            if self._history_overflow >= self._max_pending_history:
+                self.history_dropped += 1
+                return False
+            self._history_overflow += 1
+
+        partition.append(event)
+        self._size += 1
+        self._not_empty.set()
+        return True
+
+    def is_full(self, datalogger_serial: str) -> bool:
+        partition = self._partitions.get(datalogger_serial)
+        return partition is not None and len(partition) >= self._max_pending
+
+    async def wait_for_room(self, datalogger_serial: str) -> None:
+        while self.is_full(datalogger_serial):
+            self._space.clear()
+            await self._space.wait()
+
+    def metrics(self) -> SubscriptionMetrics:
+        return SubscriptionMetrics(
+            name=self.name,
+            depth=self._size,
+            delivered=self.delivered,
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+            history_dropped=self.history_dropped,
+        )
+
+    def _pop(self) -> DomainEvent:
+        serial = self._ready.popleft()
+        partition = self._partitions[serial]
+        if len(partition) > self._max_pending:
+            self._history_overflow -= 1
+        event = partition.popleft()
+
+        if partition:
+            self._ready.append(serial)
+        else:
+            del self._partitions[serial]
+
+        self._size -= 1
+        self.delivered += 1
+        self._space.set()
+        return event
+
+    def _make_room(self, partition: deque[DomainEvent]) -> bool:
+        if self._overflow is OverflowPolicy.COALESCE_LATEST and self._remove_pending_state(
+            partition
+        ):
+            return True
+
+        for index, pending in enumerate(partition):
+            if not isinstance(pending, InverterHistoryRecordedEvent):
+                del partition[index]
+                self._size -= 1
+                self.dropped += 1
+                return True
+        return False
+
+    def _remove_pending_state(self, partition: deque[DomainEvent]) -> bool:
+        for index, pending in enumerate(partition):
+            if isinstance(pending, InverterStateUpdatedEvent):
+                del partition[index]
+                self._size -= 1
+                self.coalesced += 1
+                return True
+        return False
+
+
+class DomainEventBus:
+    """Fans domain events out to every subscribed consumer.
+
+    A slow consumer never raises into the publishing session, its overflow is handled by the
+    configured ``OverflowPolicy`` and shows up in the metrics. History events wait for room
+    up to ``history_timeout`` whatever the policy, then go over the limit of the partition.
+    """
+
+    def __init__(self, config: EventBusConfig | None = None):
+        self._config = config or EventBusConfig()
+        self._subscriptions: list[DomainEventSubscription] = []
+
+        self.published = 0
+        self.blocked = 0
+        self.block_timeouts = 0
+
+    def subscribe(self, name: str, coalesce_state: bool = False) -> DomainEventSubscription:
+        subscription = DomainEventSubscription(
+            name,
+            self._config.max_pending,
+            self._config.overflow,
+            coalesce_state,
+            self._config.max_pending_history,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    async def publish(self, event: DomainEvent) -> bool:
+        """Publish the event, False when a consumer had no room left for history."""
+        if isinstance(event, InverterHistoryRecordedEvent):
+            # The readings were acknowledged already, dropping them would lose them for good
+            await self._wait_for_room(event.datalogger_serial, self._config.history_timeout)
+        elif self._config.overflow is OverflowPolicy.BLOCK:
+            await self._wait_for_room(event.datalogger_serial, self._config.block_timeout)
+
+        self.published += 1
+        delivered = True
+        for subscription in self._subscriptions:
+            delivered = subscription.put(event) and delivered
+        return delivered
+
+    def metrics(self) -> EventBusMetrics:
+        return EventBusMetrics(
+            published=self.published,
+            blocked=self.blocked,
+            block_timeouts=self.block_timeouts,
+            subscriptions=[subscription.metrics() for subscription in self._subscriptions],
+        )
+
+    async def _wait_for_room(self, datalogger_serial: str, timeout: float) -> None:
+        full = [s for s in self._subscriptions if s.is_full(datalogger_serial)]
+        if not full:
+            return
+
+        self.blocked += 1
+        try:
+            async with asyncio.timeout(timeout):
+                for subscription in full:
+                    await subscription.wait_for_room(datalogger_serial)
+        except TimeoutError:
+            self.block_timeouts += 1
@@ -1,26 +1,36 @@
 from abc import ABC
-from asyncio import Queue
 from dataclasses import dataclass
 from datetime import datetime
 
 from shine2mqtt.domain.models.datalogger import DataLogger
-from shine2mqtt.domain.models.inverter import Inverter, InverterState
+from shine2mqtt.domain.models.inverter import Inverter, InverterReading, InverterState
 
-DomainEvents = Queue["DomainEvent"]
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvent(ABC):
     datalogger_serial: str
     timestamp: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataloggerAnnouncedEvent(DomainEvent):
     datalogger: DataLogger
     inverter: Inverter
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InverterStateUpdatedEvent(DomainEvent):
     state: InverterState
+
+
+@dataclass(frozen=True, slots=True)
+class InverterHistoryRecordedEvent(DomainEvent):
+    # Buffered readings in the order the datalogger replayed them, not the live inverter state
+    readings: tuple[InverterReading, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class InverterBacklogDrainedEvent(DomainEvent):
+    # Number of buffered readings received and the seconds it took to receive them
+    readings: int
+    duration: float
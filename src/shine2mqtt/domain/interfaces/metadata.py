@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from shine2mqtt.domain.models.datalogger import DataLogger
+
+
+class DataloggerMetadataStore(ABC):
+    @abstractmethod
+    def get(self, datalogger_serial: str) -> DataLogger | None: ...
+
+    @abstractmethod
+    def put(self, datalogger: DataLogger) -> None: ...
@@ -1,8 +1,12 @@
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Inverter:
     # non-writable fields
     serial: str
@@ -18,7 +22,7 @@ class InverterStatus(Enum):
     FAULT = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InverterSettings:
     remote_on_off: bool
     safety_function: SafetyFunction
@@ -35,7 +39,7 @@ class InverterSettings:
     power_factor_control_mode: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InverterState:
     inverter_status: InverterStatus
     # DC
@@ -75,8 +79,24 @@ class InverterState:
     # Temperatures
     temperature: float
 
+    def iter_fields(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over (field name, value) pairs without the recursive copy done by asdict."""
+        return zip(INVERTER_STATE_FIELDS, _get_inverter_state_values(self), strict=True)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
+class InverterReading:
+    """Inverter state as measured at ``timestamp``, e.g. replayed from the datalogger buffer."""
+
+    timestamp: datetime
+    state: InverterState
+
+
+INVERTER_STATE_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(InverterState))
+_get_inverter_state_values = attrgetter(*INVERTER_STATE_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
 class SafetyFunction:
     spi: bool
     auto_test_start: bool
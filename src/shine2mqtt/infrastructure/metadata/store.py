@@ -0,0 +1,62 @@
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+from shine2mqtt.domain.interfaces.metadata import DataloggerMetadataStore
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.util.logger import logger
+
+
+class JsonLinesMetadataStore(DataloggerMetadataStore):
+    """Datalogger metadata appended to a JSON-lines file, the last line of a serial wins.
+
+    The file is read once at startup and compacted when it contains superseded lines.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._dataloggers: dict[str, DataLogger] = {}
+        self._load()
+
+    def get(self, datalogger_serial: str) -> DataLogger | None:
+        return self._dataloggers.get(datalogger_serial)
+
+    def put(self, datalogger: DataLogger) -> None:
+        if self._dataloggers.get(datalogger.serial) == datalogger:
+            return
+
+        self._dataloggers[datalogger.serial] = datalogger
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(asdict(datalogger)) + "\n")
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+
+        lines = 0
+        with self._path.open(encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                lines += 1
+                try:
+                    datalogger = DataLogger(**json.loads(line))
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Skipping invalid line {line_number} in {self._path}: {e}")
+                    continue
+                self._dataloggers[datalogger.serial] = datalogger
+
+        logger.info(f"Loaded metadata of {len(self._dataloggers)} datalogger(s) from {self._path}")
+
+        if lines > len(self._dataloggers):
+            self._compact()
+
+    def _compact(self) -> None:
+        # Worker processes load the file at the same time, each compacts into its own file
+        temporary_path = self._path.with_suffix(f"{self._path.suffix}.{os.getpid()}.tmp")
+        with temporary_path.open("w", encoding="utf-8") as file:
+            for datalogger in self._dataloggers.values():
+                file.write(json.dumps(asdict(datalogger)) + "\n")
+        temporary_path.replace(self._path)
@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class GrowattServerConfig(BaseModel):
     host: str = "0.0.0.0"
     port: int = 5279
+    # Number of processes accepting datalogger connections on the port (SO_REUSEPORT)
+    workers: int = Field(default=1, ge=1)
@@ -1,17 +1,18 @@
 import asyncio
-from asyncio import StreamReader, StreamWriter
 from typing import Any, Protocol
 
 from shine2mqtt.domain.interfaces.registry import SessionRegistry
 from shine2mqtt.domain.interfaces.session import Session
 from shine2mqtt.infrastructure.server.config import GrowattServerConfig
-from shine2mqtt.infrastructure.server.session import TCPSession
+from shine2mqtt.infrastructure.server.session import StreamBufferProtocol, TCPSession
 from shine2mqtt.util.logger import logger
 
 
 class SessionFactory(Protocol):
     async def create(self, transport: TCPSession) -> Session: ...
 
+    def close(self) -> None: ...
+
 
 class TCPServer:
     def __init__(
@@ -24,6 +25,8 @@ class TCPServer:
         self.session_factory = session_factory
         self.host = config.host
         self.port = config.port
+        # Worker processes share the port, the kernel spreads connections over them
+        self.reuse_port = config.workers > 1
         self.server = None
         self.session_tasks: set[asyncio.Task[Any]] = set()
         self.stop_event = asyncio.Event()
@@ -35,26 +38,36 @@ class TCPServer:
         finally:
             await self._close_sessions()
             await self._close_server()
+            self.session_factory.close()
 
     def stop(self):
         logger.info("Stopping TCP server using stop event")
         self.stop_event.set()
 
-    async def _handle_client(self, reader: StreamReader, writer: StreamWriter):
-        addr = writer.get_extra_info("peername")
+    def _create_protocol(self) -> StreamBufferProtocol:
+        return StreamBufferProtocol(on_connection_made=self._on_connection_made)
+
+    def _on_connection_made(self, stream: StreamBufferProtocol):
+        task = asyncio.create_task(self._handle_client(stream))
+        self.session_tasks.add(task)
+        task.add_done_callback(self.session_tasks.discard)
+
+    async def _handle_client(self, stream: StreamBufferProtocol):
+        addr = stream.get_extra_info("peername")
 
         logger.info(f"Accepted new TCP connection from {addr}")
 
-        transport = TCPSession(reader, writer)
+        transport = TCPSession(stream)
 
-        session = await self.session_factory.create(transport=transport)
+        try:
+            session = await self.session_factory.create(transport=transport)
+        except Exception:
+            logger.error(f"Failed to initialize TCP session from {addr}")
+            await transport.close()
+            return
 
         self.session_registry.add(session)
 
-        task = asyncio.current_task()
-        assert task is not None
-        self.session_tasks.add(task)
-
         try:
             logger.info(f"Starting TCP session for {addr}")
             await session.run()
@@ -64,11 +77,13 @@ class TCPServer:
             await session.close()
             logger.info(f"TCP session closed from {addr}")
             self.session_registry.remove(session)
-            self.session_tasks.discard(task)
 
     async def _start_server(self):
         logger.info(f"Starting TCP server on {self.host}:{self.port}")
-        self.server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(
+            self._create_protocol, self.host, self.port, reuse_port=self.reuse_port or None
+        )
         logger.info(
             f"TCP server is {'serving' if self.server.is_serving() else 'NOT serving'} on {self.host}:{self.port}"
         )
@@ -1,21 +1,220 @@
-from asyncio import StreamReader, StreamWriter
+import asyncio
+from asyncio import IncompleteReadError
+from collections import deque
+from collections.abc import Callable
+from typing import Any
 
 from shine2mqtt.util.logger import logger
 
+# Holds the frames dataloggers send regularly, the buffer grows for larger ones
+DEFAULT_RECEIVE_BUFFER_SIZE = 8 * 1024
+# Large enough to hold the biggest frame a 16 bit length field can describe
+MAX_RECEIVE_BUFFER_SIZE = 128 * 1024
+
+
+class StreamBufferProtocol(asyncio.BufferedProtocol):
+    """Receives into one reusable buffer and hands out zero-copy memoryviews.
+
+    A memoryview returned by ``read`` or ``peek`` stays valid until the next call to
+    ``read`` or ``peek``. The buffer starts small and grows when a read needs more room, up
+    to ``max_buffer_size``.
+    """
+
+    def __init__(
+        self,
+        on_connection_made: Callable[[StreamBufferProtocol], None] | None = None,
+        buffer_size: int = DEFAULT_RECEIVE_BUFFER_SIZE,
+        max_buffer_size: int = MAX_RECEIVE_BUFFER_SIZE,
+    ):
+        self._on_connection_made = on_connection_made
+        self._max_buffer_size = max(buffer_size, max_buffer_size)
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self._transport: asyncio.Transport | None = None
+        self._reading_paused = False
+        self._writing_paused = False
+        self._data_waiter: asyncio.Future[None] | None = None
+        # Every write made while writing is paused waits for the transport to drain
+        self._drain_waiters: deque[asyncio.Future[None]] = deque()
+        self._closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._eof = False
+        self._exception: Exception | None = None
+
+    @property
+    def buffered_size(self) -> int:
+        return self._end - self._start
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        if self._transport is None:
+            return default
+        return self._transport.get_extra_info(name, default)
+
+    # asyncio.BufferedProtocol callbacks #######################################################
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+        if self._on_connection_made:
+            self._on_connection_made(self)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._view[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._end += nbytes
+
+        if self._end == len(self._buffer):
+            self._pause_reading()
+
+        self._wake_up_reader()
+
+    def eof_received(self) -> bool:
+        self._eof = True
+        self._wake_up_reader()
+        return False
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._eof = True
+        self._exception = exc
+        self._wake_up_reader()
+        self._wake_up_writers(exc or ConnectionResetError("Connection lost"))
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._writing_paused = True
+
+    def resume_writing(self) -> None:
+        self._writing_paused = False
+        self._wake_up_writers(None)
+
+    # Stream API ###############################################################################
+
+    async def peek(self, num_bytes: int) -> memoryview:
+        await self._wait_for_data(num_bytes)
+        return self._view[self._start : self._start + num_bytes]
+
+    async def read(self, num_bytes: int) -> memoryview:
+        await self._wait_for_data(num_bytes)
+        start = self._start
+        self._start += num_bytes
+        return self._view[start : start + num_bytes]
+
+    async def write(self, data: bytes) -> None:
+        if self._transport is None or self._transport.is_closing():
+            raise ConnectionResetError("Connection lost")
+
+        self._transport.write(data)
+
+        if self._writing_paused:
+            waiter = asyncio.get_running_loop().create_future()
+            self._drain_waiters.append(waiter)
+            await waiter
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+        await self._closed
+
+    async def _wait_for_data(self, num_bytes: int) -> None:
+        if num_bytes > self._max_buffer_size:
+            raise ValueError(
+                f"Cannot read {num_bytes} bytes, receive buffer holds at most "
+                f"{self._max_buffer_size} bytes"
+            )
+
+        if num_bytes > len(self._buffer):
+            self._grow(num_bytes)
+
+        self._compact()
+
+        while self.buffered_size < num_bytes:
+            if self._eof:
+                if self._exception is not None:
+                    raise self._exception
+                partial = bytes(self._view[self._start : self._end])
+                raise IncompleteReadError(partial, num_bytes)
+
+            if self._start + num_bytes > len(self._buffer):
+                self._compact(force=True)
+
+            self._data_waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._data_waiter
+            finally:
+                self._data_waiter = None
+
+    def _compact(self, force: bool = False) -> None:
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif force or self._start > len(self._buffer) // 2:
+            unread = self._end - self._start
+            self._buffer[:unread] = self._view[self._start : self._end]
+            self._start, self._end = 0, unread
+
+        if self._reading_paused and self._end < len(self._buffer):
+            self._resume_reading()
+
+    def _grow(self, num_bytes: int) -> None:
+        # Views handed out before keep the old buffer alive, so it is replaced, not resized
+        size = len(self._buffer)
+        while size < num_bytes:
+            size *= 2
+        buffer = bytearray(min(size, self._max_buffer_size))
+        unread = self._end - self._start
+        buffer[:unread] = self._view[self._start : self._end]
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._start, self._end = 0, unread
+
+    def _pause_reading(self) -> None:
+        if self._transport is not None and not self._reading_paused:
+            self._reading_paused = True
+            self._transport.pause_reading()
+
+    def _resume_reading(self) -> None:
+        if self._transport is not None and self._reading_paused:
+            self._reading_paused = False
+            self._transport.resume_reading()
+
+    def _wake_up_reader(self) -> None:
+        if self._data_waiter is not None and not self._data_waiter.done():
+            self._data_waiter.set_result(None)
+
+    def _wake_up_writers(self, exc: Exception | None) -> None:
+        while self._drain_waiters:
+            waiter = self._drain_waiters.popleft()
+            if waiter.done():
+                continue
+            if exc is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exc)
+
 
 class TCPSession:
-    def __init__(self, reader: StreamReader, writer: StreamWriter):
-        self._reader = reader
-        self._writer = writer
+    def __init__(self, stream: StreamBufferProtocol):
+        self._stream = stream
+
+    @property
+    def peername(self) -> Any:
+        return self._stream.get_extra_info("peername")
+
+    @property
+    def buffered_size(self) -> int:
+        return self._stream.buffered_size
+
+    async def peek(self, num_bytes: int) -> memoryview:
+        return await self._stream.peek(num_bytes)
 
-    async def read(self, num_bytes: int) -> bytes:
-        return await self._reader.readexactly(num_bytes)
+    async def read(self, num_bytes: int) -> memoryview:
+        return await self._stream.read(num_bytes)
 
     async def write(self, frame: bytes):
-        self._writer.write(frame)
-        await self._writer.drain()
+        await self._stream.write(frame)
 
     async def close(self):
         logger.info("Closing TCP session")
-        self._writer.close()
-        await self._writer.wait_closed()
+        await self._stream.close()
@@ -0,0 +1,41 @@
+import asyncio
+import pickle
+import socket
+import struct
+from typing import Any
+
+_LENGTH = struct.Struct(">I")
+
+
+class IpcChannel:
+    """Length prefixed pickle messages over a connected stream socket between two processes."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    @staticmethod
+    async def open(sock: socket.socket) -> IpcChannel:
+        reader, writer = await asyncio.open_connection(sock=sock)
+        return IpcChannel(reader, writer)
+
+    def send_nowait(self, message: Any) -> None:
+        data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        self._writer.write(_LENGTH.pack(len(data)) + data)
+
+    async def send(self, message: Any) -> None:
+        self.send_nowait(message)
+        await self._writer.drain()
+
+    async def receive(self) -> Any:
+        """Return the next message, raises ``asyncio.IncompleteReadError`` when the peer is gone."""
+        header = await self._reader.readexactly(_LENGTH.size)
+        (length,) = _LENGTH.unpack(header)
+        return pickle.loads(await self._reader.readexactly(length))
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
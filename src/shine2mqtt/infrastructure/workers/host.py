@@ -0,0 +1,124 @@
+import asyncio
+import pickle
+from typing import Any, override
+
+from shine2mqtt.domain.events.bus import DomainEventSubscription
+from shine2mqtt.domain.interfaces.registry import SessionRegistry
+from shine2mqtt.domain.interfaces.session import Session
+from shine2mqtt.infrastructure.workers.channel import IpcChannel
+from shine2mqtt.infrastructure.workers.messages import (
+    EventMessage,
+    SessionAddedMessage,
+    SessionCallMessage,
+    SessionCallResultMessage,
+    SessionRemovedMessage,
+)
+from shine2mqtt.util.logger import logger
+
+# Session methods the main process may call on a session owned by a worker
+REMOTE_SESSION_METHODS = frozenset(
+    {
+        "get_config",
+        "set_config",
+        "read_registers",
+        "write_single_register",
+        "write_multiple_registers",
+        "send_raw_frame",
+        "close",
+    }
+)
+
+
+class ReportingSessionRegistry(SessionRegistry):
+    """Worker side registry that reports its sessions to the main process."""
+
+    def __init__(self, registry: SessionRegistry, channel: IpcChannel):
+        self._registry = registry
+        self._channel = channel
+
+    @override
+    def get(self, datalogger_serial: str) -> Session | None:
+        return self._registry.get(datalogger_serial)
+
+    @override
+    def get_all(self) -> list[Session]:
+        return self._registry.get_all()
+
+    @override
+    def add(self, session: Session) -> None:
+        self._registry.add(session)
+        self._channel.send_nowait(SessionAddedMessage(session.datalogger))
+
+    @override
+    def remove(self, session: Session) -> None:
+        self._registry.remove(session)
+        self._channel.send_nowait(SessionRemovedMessage(session.datalogger.serial))
+
+
+class WorkerHost:
+    """Connects the sessions of a worker process to the main process.
+
+    Domain events are forwarded to the main process and session calls from the main process
+    (REST API) are executed on the local sessions.
+    """
+
+    def __init__(
+        self,
+        channel: IpcChannel,
+        registry: SessionRegistry,
+        domain_events: DomainEventSubscription,
+    ):
+        self._channel = channel
+        self._registry = registry
+        self._domain_events = domain_events
+        self._calls: set[asyncio.Task[None]] = set()
+
+    async def run(self) -> None:
+        forward_events = asyncio.create_task(self._forward_events())
+        try:
+            while True:
+                message = await self._channel.receive()
+                match message:
+                    case SessionCallMessage():
+                        task = asyncio.create_task(self._call(message))
+                        self._calls.add(task)
+                        task.add_done_callback(self._calls.discard)
+                    case _:
+                        logger.warning(f"Unexpected message from main process: {message}")
+        except asyncio.IncompleteReadError:
+            logger.info("Main process closed the worker channel")
+        finally:
+            forward_events.cancel()
+            for task in self._calls:
+                task.cancel()
+
+    async def _forward_events(self) -> None:
+        while True:
+            event = await self._domain_events.get()
+            await self._channel.send(EventMessage(event))
+
+    async def _call(self, message: SessionCallMessage) -> None:
+        try:
+            result = await self._call_session(message)
+            response = SessionCallResultMessage(message.call_id, result=result)
+        except Exception as e:
+            response = SessionCallResultMessage(message.call_id, error=_picklable_error(e))
+        await self._channel.send(response)
+
+    async def _call_session(self, message: SessionCallMessage) -> Any:
+        if message.method not in REMOTE_SESSION_METHODS:
+            raise ValueError(f"Session method '{message.method}' can not be called remotely")
+
+        session = self._registry.get(message.datalogger_serial)
+        if session is None:
+            raise LookupError(f"No session for datalogger '{message.datalogger_serial}'")
+
+        return await getattr(session, message.method)(*message.args)
+
+
+def _picklable_error(error: Exception) -> BaseException:
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+    return error
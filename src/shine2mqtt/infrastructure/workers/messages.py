@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Any
+
+from shine2mqtt.domain.events.events import DomainEvent
+from shine2mqtt.domain.models.datalogger import DataLogger
+
+
+# worker -> main process
+@dataclass(slots=True)
+class EventMessage:
+    event: DomainEvent
+
+
+@dataclass(slots=True)
+class SessionAddedMessage:
+    datalogger: DataLogger
+
+
+@dataclass(slots=True)
+class SessionRemovedMessage:
+    datalogger_serial: str
+
+
+@dataclass(slots=True)
+class SessionCallResultMessage:
+    call_id: int
+    result: Any = None
+    error: BaseException | None = None
+
+
+# main process -> worker
+@dataclass(slots=True)
+class SessionCallMessage:
+    call_id: int
+    datalogger_serial: str
+    method: str
+    args: tuple[Any, ...]
@@ -0,0 +1,83 @@
+import asyncio
+import multiprocessing
+import socket
+from collections.abc import Callable
+from typing import Any
+
+from shine2mqtt.infrastructure.workers.channel import IpcChannel
+from shine2mqtt.infrastructure.workers.registry import WorkerConnection, WorkerSessionRegistry
+from shine2mqtt.util.logger import logger
+
+# Called in the worker process with the worker index and its end of the channel socket
+type WorkerTarget = Callable[[int, socket.socket], None]
+
+
+class WorkerPool:
+    """Runs the TCP server in worker processes that accept on the same port (SO_REUSEPORT).
+
+    Each worker is connected to the main process with a socket pair, a worker that exits is
+    restarted after ``restart_delay`` seconds.
+    """
+
+    _JOIN_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        workers: int,
+        target: WorkerTarget,
+        registry: WorkerSessionRegistry,
+        restart_delay: float = 1.0,
+    ):
+        self._workers = workers
+        self._target = target
+        self._registry = registry
+        self._restart_delay = restart_delay
+        # spawn does not inherit the running event loop of the main process
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: dict[int, Any] = {}
+
+    async def serve(self) -> None:
+        logger.info(f"Starting {self._workers} TCP server worker processes")
+        try:
+            async with asyncio.TaskGroup() as group:
+                for index in range(self._workers):
+                    group.create_task(self._supervise(index))
+        finally:
+            self._terminate()
+
+    async def _supervise(self, index: int) -> None:
+        while True:
+            await self._run_worker(index)
+            logger.warning(f"Worker {index} exited, restarting in {self._restart_delay} seconds")
+            await asyncio.sleep(self._restart_delay)
+
+    async def _run_worker(self, index: int) -> None:
+        parent_socket, child_socket = socket.socketpair()
+        process = self._context.Process(
+            target=self._target,
+            args=(index, child_socket),
+            name=f"shine2mqtt-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_socket.close()
+        self._processes[index] = process
+
+        worker = WorkerConnection(
+            f"worker {index} (pid {process.pid})", await IpcChannel.open(parent_socket)
+        )
+        try:
+            await self._registry.serve_worker(worker)
+        finally:
+            # Without its channel the worker stops on its own, terminate it if it does not
+            await worker.close()
+            await asyncio.to_thread(process.join, self._JOIN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+            self._processes.pop(index, None)
+
+    def _terminate(self) -> None:
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        self._processes.clear()
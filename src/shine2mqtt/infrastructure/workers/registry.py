@@ -0,0 +1,179 @@
+import asyncio
+import itertools
+from typing import Any, override
+
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.events.events import DataloggerAnnouncedEvent
+from shine2mqtt.domain.interfaces.registry import SessionRegistry
+from shine2mqtt.domain.interfaces.session import Session
+from shine2mqtt.domain.models.config import ConfigResult
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.infrastructure.workers.channel import IpcChannel
+from shine2mqtt.infrastructure.workers.messages import (
+    EventMessage,
+    SessionAddedMessage,
+    SessionCallMessage,
+    SessionCallResultMessage,
+    SessionRemovedMessage,
+)
+from shine2mqtt.util.logger import logger
+
+
+class WorkerConnection:
+    """Main process end of the channel to one worker process."""
+
+    def __init__(self, name: str, channel: IpcChannel):
+        self.name = name
+        self._channel = channel
+        self._call_ids = itertools.count()
+        self._pending_calls: dict[int, asyncio.Future[Any]] = {}
+
+    async def call(self, datalogger_serial: str, method: str, *args: Any) -> Any:
+        call_id = next(self._call_ids)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending_calls[call_id] = future
+        try:
+            await self._channel.send(SessionCallMessage(call_id, datalogger_serial, method, args))
+            return await future
+        finally:
+            self._pending_calls.pop(call_id, None)
+
+    def resolve(self, message: SessionCallResultMessage) -> None:
+        future = self._pending_calls.pop(message.call_id, None)
+        if future is None or future.done():
+            return
+        if message.error is not None:
+            future.set_exception(message.error)
+        else:
+            future.set_result(message.result)
+
+    def cancel_calls(self) -> None:
+        for future in self._pending_calls.values():
+            future.cancel()
+        self._pending_calls.clear()
+
+    async def receive(self) -> Any:
+        return await self._channel.receive()
+
+    async def close(self) -> None:
+        self.cancel_calls()
+        await self._channel.close()
+
+
+class RemoteSession(Session):
+    """A session running in a worker process.
+
+    The worker runs the session, the main process only calls it. Closing it closes the
+    connection in the worker, which then reports the session as removed.
+    """
+
+    def __init__(self, datalogger: DataLogger, worker: WorkerConnection):
+        self._datalogger = datalogger
+        self.worker = worker
+
+    @property
+    @override
+    def datalogger(self) -> DataLogger:
+        return self._datalogger
+
+    @datalogger.setter
+    def datalogger(self, datalogger: DataLogger) -> None:
+        self._datalogger = datalogger
+
+    @override
+    async def run(self) -> None:
+        raise NotImplementedError("Remote sessions run in their worker process")
+
+    @override
+    async def close(self) -> None:
+        await self._call("close")
+
+    @override
+    async def get_config(self, register: int) -> ConfigResult:
+        return await self._call("get_config", register)
+
+    @override
+    async def set_config(self, register: int, value: str) -> bool:
+        return await self._call("set_config", register, value)
+
+    @override
+    async def read_registers(self, register_start: int, register_end: int) -> dict[int, int]:
+        return await self._call("read_registers", register_start, register_end)
+
+    @override
+    async def write_single_register(self, register: int, value: int) -> bool:
+        return await self._call("write_single_register", register, value)
+
+    @override
+    async def write_multiple_registers(
+        self, register_start: int, register_end: int, values: bytes
+    ) -> bool:
+        return await self._call("write_multiple_registers", register_start, register_end, values)
+
+    @override
+    async def send_raw_frame(self, function_code: int, payload: bytes) -> bytes:
+        return await self._call("send_raw_frame", function_code, payload)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        return await self.worker.call(self._datalogger.serial, method, *args)
+
+
+class WorkerSessionRegistry(SessionRegistry):
+    """Main process registry of the sessions owned by the worker processes."""
+
+    def __init__(self, domain_events: DomainEventBus):
+        self._domain_events = domain_events
+        self._sessions: dict[str, RemoteSession] = {}
+
+    @override
+    def get(self, datalogger_serial: str) -> Session | None:
+        return self._sessions.get(datalogger_serial)
+
+    @override
+    def get_all(self) -> list[Session]:
+        return list(self._sessions.values())
+
+    @override
+    def add(self, session: Session) -> None:
+        if not isinstance(session, RemoteSession):
+            raise TypeError(f"Only remote sessions can be added, got {type(session).__name__}")
+        self._sessions[session.datalogger.serial] = session
+
+    @override
+    def remove(self, session: Session) -> None:
+        # A datalogger that reconnected may already be owned by another worker
+        if self._sessions.get(session.datalogger.serial) is session:
+            del self._sessions[session.datalogger.serial]
+
+    async def serve_worker(self, worker: WorkerConnection) -> None:
+        """Handle messages of a worker until its channel is closed."""
+        try:
+            while True:
+                await self._handle(worker, await worker.receive())
+        except asyncio.IncompleteReadError:
+            logger.warning(f"Lost connection to {worker.name}")
+        finally:
+            worker.cancel_calls()
+            for session in [s for s in self._sessions.values() if s.worker is worker]:
+                self.remove(session)
+
+    async def _handle(self, worker: WorkerConnection, message: Any) -> None:
+        match message:
+            case EventMessage(event=event):
+                if isinstance(event, DataloggerAnnouncedEvent):
+                    self._update_datalogger(worker, event.datalogger)
+                await self._domain_events.publish(event)
+            case SessionCallResultMessage():
+                worker.resolve(message)
+            case SessionAddedMessage(datalogger=datalogger):
+                self.add(RemoteSession(datalogger, worker))
+            case SessionRemovedMessage(datalogger_serial=serial):
+                if (session := self._sessions.get(serial)) is not None and session.worker is worker:
+                    self.remove(session)
+            case _:
+                logger.warning(f"Unexpected message from {worker.name}: {message}")
+
+    def _update_datalogger(self, worker: WorkerConnection, datalogger: DataLogger) -> None:
+        session = self._sessions.get(datalogger.serial)
+        if session is not None and session.worker is worker:
+            session.datalogger = datalogger
@@ -1,86 +1,106 @@
 import asyncio
-from pathlib import Path
+from functools import partial
 
 import uvicorn
 
 from shine2mqtt.adapters.api.api import create_app
 from shine2mqtt.adapters.hass.discovery import HassDiscoveryPayloadBuilder
 from shine2mqtt.adapters.hass.discovery_mapper import HassDiscoveryMapper
-from shine2mqtt.adapters.hass.map import DATALOGGER_SENSOR_MAP, INVERTER_SENSOR_MAP
+from shine2mqtt.adapters.hass.map import (
+    DATALOGGER_SENSOR_MAP,
+    INVERTER_SENSOR_MAP,
+    INVERTER_STATE_SENSORS,
+)
 from shine2mqtt.adapters.mqtt.bridge import MqttBridge
 from shine2mqtt.adapters.mqtt.client import MqttClient
+from shine2mqtt.adapters.mqtt.config import PublishMode
+from shine2mqtt.adapters.mqtt.delta import DeltaPublishFilter
 from shine2mqtt.adapters.mqtt.mapper import MqttEventMapper
 from shine2mqtt.adapters.mqtt.publisher import MqttPublisher
 from shine2mqtt.adapters.mqtt.subscriber import MqttSubscriber
 from shine2mqtt.app.handlers.read_register import ReadRegisterHandler
 from shine2mqtt.app.handlers.send_raw_frame import SendRawFrameHandler
 from shine2mqtt.app.handlers.write_register import WriteRegisterHandler
-from shine2mqtt.domain.events.events import DomainEvents
+from shine2mqtt.domain.events.bus import DomainEventBus
 from shine2mqtt.domain.interfaces.registry import SessionRegistry
-from shine2mqtt.infrastructure.server.server import TCPServer
+from shine2mqtt.infrastructure.workers.pool import WorkerPool
+from shine2mqtt.infrastructure.workers.registry import WorkerSessionRegistry
 from shine2mqtt.main.config.config import ApplicationConfig
-from shine2mqtt.protocol.frame.capturer import CaptureHandler
-from shine2mqtt.protocol.frame.factory import FrameFactory
-from shine2mqtt.protocol.session.factory import ProtocolSessionFactory
+from shine2mqtt.main.worker import create_tcp_server, run_worker
 from shine2mqtt.protocol.session.registry import ProtocolSessionRegistry
 from shine2mqtt.protocol.settings.registry import SettingsRegistry
-from shine2mqtt.util.logger import logger
+from shine2mqtt.util.clock import ClockService, MonotonicClockService
 
 
 class Application:
-    def __init__(self, config: ApplicationConfig):
-        self.config = config
-
-        domain_events = DomainEvents(maxsize=100)
-        session_registry = ProtocolSessionRegistry()
-
-        # Protocol
-        encoder = FrameFactory.encoder()
+    def __init__(self, config: ApplicationConfig, clock: ClockService | None = None):
+        if config.clock.step and config.server.workers > 1:
+            raise ValueError("A stepped clock needs a single server worker")
 
-        if config.capture_data:
-            logger.info("Frame data capturing is ENABLED.")
-            capture_handler = CaptureHandler.create(Path("./captured_frames"), encoder)
-            decoder = FrameFactory.server_decoder(on_decode=capture_handler)
+        self.config = config
+        self._clock = clock or MonotonicClockService()
+
+        event_bus = DomainEventBus(config.events)
+
+        # Protocol and infrastructure, in worker processes when there is more than one worker
+        session_registry: SessionRegistry
+        if config.server.workers > 1:
+            session_registry = WorkerSessionRegistry(event_bus)
+            self._tcp_server = WorkerPool(
+                workers=config.server.workers,
+                target=partial(run_worker, config),
+                registry=session_registry,
+            )
         else:
-            decoder = FrameFactory.server_decoder()
-
-        session_factory = ProtocolSessionFactory(
-            encoder=encoder, decoder=decoder, domain_events=domain_events
-        )
-
-        # Infrastructure
-        self._tcp_server = TCPServer(
-            session_registry=session_registry,
-            session_factory=session_factory,
-            config=config.server,
-        )
+            session_registry = ProtocolSessionRegistry()
+            self._tcp_server = create_tcp_server(config, session_registry, event_bus)
 
         # Adapters
-        self._mqtt_bridge = self._setup_mqtt_bridge(domain_events, config)
-        self._api_server = self._setup_api_server(session_registry, config)
+        self._mqtt_bridge = self._setup_mqtt_bridge(event_bus, config)
+        self._api_server = self._setup_api_server(session_registry, event_bus, config)
 
     def _setup_mqtt_bridge(
-        self, domain_events: DomainEvents, config: ApplicationConfig
+        self, event_bus: DomainEventBus, config: ApplicationConfig
     ) -> MqttBridge:
         discovery_builder = HassDiscoveryPayloadBuilder(
             config=config.mqtt.discovery,
             datalogger_sensor_map=DATALOGGER_SENSOR_MAP,
             inverter_sensor_map=INVERTER_SENSOR_MAP,
+            inverter_state_sensors=(
+                INVERTER_STATE_SENSORS.keys()
+                if config.mqtt.publish_mode is PublishMode.AGGREGATED
+                else ()
+            ),
         )
 
-        mapper = MqttEventMapper(config=config.mqtt)
+        delta_filter = (
+            DeltaPublishFilter(
+                sensor_map=INVERTER_SENSOR_MAP,
+                max_age=config.mqtt.publish.max_age,
+                clock=self._clock,
+            )
+            if config.mqtt.publish.changes_only
+            else None
+        )
+        mapper = MqttEventMapper(config=config.mqtt, delta_filter=delta_filter)
         discovery = HassDiscoveryMapper(
             discovery=discovery_builder,
             enabled=config.mqtt.discovery.enabled,
         )
         publisher = MqttPublisher(
-            domain_events=domain_events,
+            # Only the newest inverter state matters when the broker can not keep up
+            domain_events=event_bus.subscribe("mqtt", coalesce_state=True),
             mapper=mapper,
             discovery=discovery,
+            config=config.mqtt.publish,
         )
         subscriber = MqttSubscriber()
         will_message = mapper.map_availability(online=False)
-        mqtt_client = MqttClient(config.mqtt.server, will_message=will_message)
+        mqtt_client = MqttClient(
+            config.mqtt.server,
+            will_message=will_message,
+            max_inflight_messages=config.mqtt.publish.max_in_flight,
+        )
 
         return MqttBridge(
             client=mqtt_client,
@@ -90,7 +110,10 @@ class Application:
         )
 
     def _setup_api_server(
-        self, session_registry: SessionRegistry, config: ApplicationConfig
+        self,
+        session_registry: SessionRegistry,
+        event_bus: DomainEventBus,
+        config: ApplicationConfig,
     ) -> uvicorn.Server | None:
         if not config.api.enabled:
             return None
@@ -102,7 +125,7 @@ class Application:
         send_raw_frame_handler = SendRawFrameHandler(session_registry)
 
         self._api_app = create_app(
-            session_registry, read_handler, write_handler, send_raw_frame_handler
+            session_registry, read_handler, write_handler, send_raw_frame_handler, event_bus
         )
 
         uvicorn_config = uvicorn.Config(
@@ -124,4 +147,10 @@ class Application:
         if self.config.api.enabled and self._api_server is not None:
             tasks.append(asyncio.create_task(self._api_server.serve()))
 
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            # Cancelling gather cancels all tasks but returns as soon as the first one is done,
+            # wait for the others to shut down, e.g. the MQTT bridge publishing it went offline
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
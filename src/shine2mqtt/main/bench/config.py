@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from shine2mqtt.protocol.frame.capturer.loader import DEFAULT_CAPTURE_DIR
+
+
+@dataclass
+class BenchConfig:
+    enabled: bool = False
+    # Timed operations per stage, after the warmup
+    iterations: int = 10_000
+    warmup: int = 1_000
+    # Stages to run, all stages when empty
+    stages: list[str] = field(default_factory=list)
+    # Directory with the captured JSON frames the stages are fed with
+    captures: Path = DEFAULT_CAPTURE_DIR
+    # Write the results as JSON to this file, "-" for stdout
+    output: Path | None = None
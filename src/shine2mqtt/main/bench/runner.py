@@ -0,0 +1,122 @@
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+
+type Operation = Callable[[], object]
+
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyStats:
+    # In the unit of the samples, named by the field holding the stats (e.g. latency_ns)
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> LatencyStats:
+        if not samples:
+            return cls(p50=0.0, p90=0.0, p99=0.0, max=0.0)
+
+        ordered = sorted(samples)
+        p50, p90, p99 = (
+            float(ordered[round(percentile / 100 * (len(ordered) - 1))])
+            for percentile in PERCENTILES
+        )
+        return cls(p50=p50, p90=p90, p99=p99, max=float(ordered[-1]))
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationStats:
+    # Peak traced memory above the baseline while running one operation
+    peak_bytes_per_op: float
+    # Memory still allocated after the operations, e.g. caches that keep growing
+    retained_bytes_per_op: float
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    stage: str
+    iterations: int
+    ops_per_sec: float
+    latency_ns: LatencyStats
+    allocations: AllocationStats
+
+
+class BenchRunner:
+    """Measures one operation three times: throughput, per operation latency and allocations.
+
+    The passes are separate, so the timer calls of the latency pass and the tracing overhead of
+    tracemalloc do not end up in the throughput.
+    """
+
+    def __init__(self, iterations: int, warmup: int):
+        if iterations < 1:
+            raise ValueError("Benchmark needs at least one iteration")
+        self._iterations = iterations
+        self._warmup = warmup
+
+    def run(self, stage: str, operation: Operation) -> BenchResult:
+        for _ in range(self._warmup):
+            operation()
+
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            ops_per_sec = self._measure_throughput(operation)
+            latency = self._measure_latency(operation)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        return BenchResult(
+            stage=stage,
+            iterations=self._iterations,
+            ops_per_sec=ops_per_sec,
+            latency_ns=latency,
+            allocations=self._measure_allocations(operation),
+        )
+
+    def _measure_throughput(self, operation: Operation) -> float:
+        iterations = range(self._iterations)
+        start = time.perf_counter()
+        for _ in iterations:
+            operation()
+        elapsed = time.perf_counter() - start
+        return self._iterations / elapsed if elapsed > 0 else float("inf")
+
+    def _measure_latency(self, operation: Operation) -> LatencyStats:
+        clock = time.perf_counter_ns
+        samples: list[float] = [0.0] * self._iterations
+        for i in range(self._iterations):
+            start = clock()
+            operation()
+            samples[i] = clock() - start
+
+        return LatencyStats.from_samples(samples)
+
+    def _measure_allocations(self, operation: Operation) -> AllocationStats:
+        # Tracing slows every allocation down, a smaller sample is representative enough
+        iterations = min(self._iterations, 1_000)
+
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            peak_total = 0
+            for _ in range(iterations):
+                current, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                operation()
+                peak_total += tracemalloc.get_traced_memory()[1] - current
+            retained = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+
+        return AllocationStats(
+            peak_bytes_per_op=peak_total / iterations,
+            retained_bytes_per_op=max(retained, 0) / iterations,
+        )
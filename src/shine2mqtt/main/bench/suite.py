@@ -0,0 +1,185 @@
+import json
+import platform
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from shine2mqtt import __version__
+from shine2mqtt.adapters.hass.config import HassDiscoveryConfig
+from shine2mqtt.adapters.hass.discovery import HassDiscoveryPayloadBuilder
+from shine2mqtt.adapters.hass.map import DATALOGGER_SENSOR_MAP, INVERTER_SENSOR_MAP
+from shine2mqtt.adapters.mqtt.config import MqttConfig, PublishMode
+from shine2mqtt.adapters.mqtt.mapper import MqttEventMapper
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.main.bench.config import BenchConfig
+from shine2mqtt.main.bench.runner import BenchResult, BenchRunner, Operation
+from shine2mqtt.protocol.frame.capturer.loader import CapturedFrameLoader
+from shine2mqtt.protocol.frame.cipher import PayloadCipher
+from shine2mqtt.protocol.frame.constants import CRC_LENGTH, DECRYPTION_KEY, HEADER_LENGTH
+from shine2mqtt.protocol.frame.crc.calculator import CRCCalculator
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.messages.announce.announce import GrowattAnnounceMessage
+from shine2mqtt.protocol.messages.data.data import GrowattDataMessage
+from shine2mqtt.protocol.session.mapper import MessageEventMapper
+
+
+class BenchFixtures:
+    """Captured frames and what they decode to, shared by all stages."""
+
+    def __init__(self, captures: Path):
+        data_frames, _, _ = CapturedFrameLoader.load("data_message", captures)
+        announce_frames, _, _ = CapturedFrameLoader.load("announce_message", captures)
+
+        decoder = FrameFactory.server_decoder()
+        self.data_frame = data_frames[0]
+        self.data_message = decoder.decode(self.data_frame)
+        assert isinstance(self.data_message, GrowattDataMessage)
+        announce = decoder.decode(announce_frames[0])
+        assert isinstance(announce, GrowattAnnounceMessage)
+
+        mapper = MessageEventMapper()
+        self.inverter_state_event = mapper.map_data_message_to_inverter_state_updated_event(
+            self.data_message
+        )
+        self.inverter = mapper.map_announce_message_to_inverter(announce)
+        self.datalogger = DataLogger(
+            serial=announce.datalogger_serial,
+            protocol_id=announce.header.protocol_id,
+            unit_id=announce.header.unit_id,
+            sw_version="3.1.0.0",
+            hw_version="2.0",
+            ip_address="192.168.1.10",
+            mac_address="00:11:22:33:44:55",
+        )
+
+
+def _cipher(fixtures: BenchFixtures) -> Operation:
+    cipher = PayloadCipher()
+    payload = fixtures.data_frame[HEADER_LENGTH:-CRC_LENGTH]
+    return lambda: cipher.decrypt(payload, DECRYPTION_KEY)
+
+
+def _crc(fixtures: BenchFixtures) -> Operation:
+    calculator = CRCCalculator()
+    frame = fixtures.data_frame[:-CRC_LENGTH]
+    return lambda: calculator.calculate_crc16(frame)
+
+
+def _frame_decode(fixtures: BenchFixtures) -> Operation:
+    decoder = FrameFactory.server_decoder()
+    frame = fixtures.data_frame
+    return lambda: decoder.decode(frame)
+
+
+def _frame_encode(fixtures: BenchFixtures) -> Operation:
+    encoder = FrameFactory.encoder()
+    message = fixtures.data_message
+    return lambda: encoder.encode(message)
+
+
+def _message_event_mapper(fixtures: BenchFixtures) -> Operation:
+    mapper = MessageEventMapper()
+    message = fixtures.data_message
+    return lambda: mapper.map_data_message_to_inverter_state_updated_event(message)
+
+
+def _mqtt_mapper(publish_mode: PublishMode) -> Callable[[BenchFixtures], Operation]:
+    def stage(fixtures: BenchFixtures) -> Operation:
+        mapper = MqttEventMapper(MqttConfig(publish_mode=publish_mode))
+        event = fixtures.inverter_state_event
+        return lambda: mapper.map_inverter_state(event)
+
+    return stage
+
+
+def _hass_discovery(fixtures: BenchFixtures) -> Operation:
+    builder = HassDiscoveryPayloadBuilder(
+        config=HassDiscoveryConfig(),
+        datalogger_sensor_map=DATALOGGER_SENSOR_MAP,
+        inverter_sensor_map=INVERTER_SENSOR_MAP,
+    )
+    inverter = fixtures.inverter
+    datalogger = fixtures.datalogger
+
+    def build() -> tuple[str, str]:
+        # Serialized as published, HassDiscoveryMapper caches the result per datalogger
+        return (
+            json.dumps(
+                builder.build_inverter_discovery_message(
+                    inverter_fw_version=inverter.fw_version, inverter_serial=inverter.serial
+                )
+            ),
+            json.dumps(builder.build_datalogger_discovery_message(datalogger)),
+        )
+
+    return build
+
+
+STAGES: dict[str, Callable[[BenchFixtures], Operation]] = {
+    "cipher": _cipher,
+    "crc": _crc,
+    "frame_decode": _frame_decode,
+    "frame_encode": _frame_encode,
+    "message_event_mapper": _message_event_mapper,
+    "mqtt_map_state_per_sensor": _mqtt_mapper(PublishMode.PER_SENSOR),
+    "mqtt_map_state_aggregated": _mqtt_mapper(PublishMode.AGGREGATED),
+    "hass_discovery": _hass_discovery,
+}
+
+
+def format_result(result: BenchResult) -> str:
+    latency = result.latency_ns
+    return (
+        f"{result.stage:<28} {result.ops_per_sec:>12,.0f} ops/s  "
+        f"p50 {latency.p50 / 1000:>7.2f} µs  p99 {latency.p99 / 1000:>7.2f} µs  "
+        f"peak {result.allocations.peak_bytes_per_op:>8,.0f} B/op"
+    )
+
+
+@dataclass
+class BenchReport:
+    version: str
+    python: str
+    started_at: str
+    results: list[BenchResult] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+
+class BenchSuite:
+    def __init__(self, config: BenchConfig):
+        unknown = set(config.stages) - STAGES.keys()
+        if unknown:
+            raise ValueError(
+                f"Unknown benchmark stages: {', '.join(sorted(unknown))} "
+                f"(available: {', '.join(STAGES)})"
+            )
+
+        # The default captures are part of the test data, only a source checkout has them
+        if not (config.captures / "data_message.json").is_file():
+            raise FileNotFoundError(
+                f"No captured frames in {config.captures}, the default captures only come with "
+                "a source checkout. Pass --captures DIR with captured JSON frames."
+            )
+
+        self._config = config
+        self._stages = config.stages or list(STAGES)
+        self._runner = BenchRunner(iterations=config.iterations, warmup=config.warmup)
+
+    def run(self, on_result: Callable[[BenchResult], None] | None = None) -> BenchReport:
+        fixtures = BenchFixtures(self._config.captures)
+        report = BenchReport(
+            version=__version__,
+            python=f"{platform.python_implementation()} {platform.python_version()}",
+            started_at=datetime.now().isoformat(timespec="seconds"),
+        )
+
+        for stage in self._stages:
+            result = self._runner.run(stage, STAGES[stage](fixtures))
+            report.results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        return report
@@ -5,6 +5,8 @@ from collections.abc import Sequence
 from pathlib import Path
 
 from shine2mqtt import NAME
+from shine2mqtt.adapters.mqtt.config import PublishMode
+from shine2mqtt.protocol.frame.pool import DecodeExecutor
 
 
 class _CustomHelpFormatter(HelpFormatter):
@@ -50,12 +52,34 @@ class CliArgParser:
         )
         sim_parser.set_defaults(simulated_client__enabled=True)
 
+        bench_parser = subparsers.add_parser(
+            "bench",
+            help="Benchmark the frame and event processing stages (use 'shine2mqtt bench --help' for more info)",
+            description="Benchmark the frame and event processing stages with captured frames.",
+            formatter_class=_CustomHelpFormatter,
+            prog=self.prog,
+        )
+        bench_parser.set_defaults(bench__enabled=True, simulated_client__enabled=False)
+
+        replay_parser = subparsers.add_parser(
+            "replay",
+            help="Load test the server by replaying datalogger traffic (use 'shine2mqtt replay --help' for more info)",
+            description="Run the Shine2MQTT server against an in-process MQTT broker and replay captured datalogger traffic from many virtual dataloggers.",
+            formatter_class=_CustomHelpFormatter,
+            prog=self.prog,
+        )
+        replay_parser.set_defaults(replay__enabled=True, simulated_client__enabled=False)
+
         self._add_top_level_args(parser)
 
         self._add_run_args(run_parser)
 
         self._add_simulated_client_args(sim_parser)
 
+        self._add_bench_args(bench_parser)
+
+        self._add_replay_args(replay_parser)
+
         return parser
 
     def _add_top_level_args(self, parser: ArgumentParser) -> None:
@@ -85,9 +109,24 @@ class CliArgParser:
             dest="config_file",
             metavar="FILE",
         )
+        parser.add_argument(
+            "--clock-speed",
+            type=float,
+            help="Run the timers of the server and simulator this many times faster than real time",
+            dest="clock__speed",
+            metavar="FACTOR",
+        )
+        parser.add_argument(
+            "--clock-step",
+            help="Jump straight to the next timer whenever there is nothing to do",
+            action="store_true",
+            default=None,
+            dest="clock__step",
+        )
 
     def _add_run_args(self, parser: ArgumentParser) -> None:
         self._add_capture_data_args(parser)
+        self._add_metadata_cache_args(parser)
         self._add_mqtt_args(parser)
         self._add_server_args(parser)
         self._add_api_args(parser)
@@ -101,6 +140,14 @@ class CliArgParser:
             dest="capture_data",
         )
 
+    def _add_metadata_cache_args(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--metadata-cache",
+            help="File to cache datalogger metadata in, skips the config handshake on reconnect",
+            dest="metadata_cache",
+            metavar="PATH",
+        )
+
     def _add_mqtt_args(self, parser: ArgumentParser) -> None:
         parser.add_argument(
             "--mqtt-base-topic", help="Base MQTT topic", dest="mqtt__base_topic", metavar="TOPIC"
@@ -111,6 +158,12 @@ class CliArgParser:
             dest="mqtt__availability_topic",
             metavar="TOPIC",
         )
+        parser.add_argument(
+            "--mqtt-publish-mode",
+            choices=[mode.value for mode in PublishMode],
+            help="Publish inverter state per sensor or as one aggregated JSON document",
+            dest="mqtt__publish_mode",
+        )
 
         parser.add_argument(
             "--mqtt-host", help="MQTT server host", dest="mqtt__server__host", metavar="HOST"
@@ -160,6 +213,18 @@ class CliArgParser:
         parser.add_argument(
             "--server-port", type=int, help="Server listen port", dest="server__port"
         )
+        parser.add_argument(
+            "--server-workers",
+            type=int,
+            help="Number of worker processes accepting datalogger connections",
+            dest="server__workers",
+        )
+        parser.add_argument(
+            "--decode-executor",
+            choices=[executor.value for executor in DecodeExecutor],
+            help="Decode large frames and buffered backlogs in a thread or process pool",
+            dest="decode_pool__executor",
+        )
 
     def _add_api_args(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -190,6 +255,140 @@ class CliArgParser:
             dest="simulated_client__server_port",
             metavar="PORT",
         )
+        parser.add_argument(
+            "--loggers",
+            type=int,
+            help="Number of simulated dataloggers, each with its own connection and serial",
+            dest="simulated_client__loggers",
+            metavar="N",
+        )
+        parser.add_argument(
+            "--ramp-up",
+            type=float,
+            help="Seconds over which the simulated dataloggers connect",
+            dest="simulated_client__ramp_up",
+            metavar="SECONDS",
+        )
+        parser.add_argument(
+            "--buffered-data",
+            type=int,
+            help="BUFFERED_DATA frames every datalogger sends after it announced itself",
+            dest="simulated_client__buffered_data",
+            metavar="N",
+        )
+        parser.add_argument(
+            "--peak-power",
+            type=float,
+            help="DC power of a simulated inverter in full sun",
+            dest="simulated_client__solar__peak_power",
+            metavar="WATT",
+        )
+        parser.add_argument(
+            "--latitude",
+            type=float,
+            help="Latitude of the simulated inverters, sets the day length and height of the sun",
+            dest="simulated_client__solar__latitude",
+            metavar="DEGREES",
+        )
+
+    def _add_bench_args(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            help="Timed operations per stage",
+            dest="bench__iterations",
+            metavar="N",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            help="Untimed operations per stage before measuring",
+            dest="bench__warmup",
+            metavar="N",
+        )
+        parser.add_argument(
+            "--stage",
+            action="append",
+            help="Stage to run, can be repeated (default: all stages)",
+            dest="bench__stages",
+            metavar="STAGE",
+        )
+        parser.add_argument(
+            "--captures",
+            type=Path,
+            help="Directory with captured JSON frames (required outside a source checkout)",
+            dest="bench__captures",
+            metavar="DIR",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Write the results as JSON to FILE, '-' for stdout",
+            dest="bench__output",
+            metavar="FILE",
+        )
+
+    def _add_replay_args(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--loggers",
+            type=int,
+            help="Number of virtual dataloggers",
+            dest="replay__loggers",
+            metavar="N",
+        )
+        parser.add_argument(
+            "--speed",
+            type=float,
+            help="Replay speed relative to real time (e.g. 60)",
+            dest="replay__speed",
+            metavar="FACTOR",
+        )
+        parser.add_argument(
+            "--capture",
+            type=Path,
+            help="Binary capture file to replay (default: captured JSON frames at real send intervals)",
+            dest="replay__capture",
+            metavar="FILE",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            help="Seconds of datalogger traffic to replay from the captured JSON frames",
+            dest="replay__duration",
+            metavar="SECONDS",
+        )
+        parser.add_argument(
+            "--ramp-up",
+            type=float,
+            help="Seconds over which the virtual dataloggers connect",
+            dest="replay__ramp_up",
+            metavar="SECONDS",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Write the results as JSON to FILE, '-' for stdout",
+            dest="replay__output",
+            metavar="FILE",
+        )
+        parser.add_argument(
+            "--mqtt-publish-mode",
+            choices=[mode.value for mode in PublishMode],
+            help="Publish inverter state per sensor or as one aggregated JSON document",
+            dest="mqtt__publish_mode",
+        )
+        parser.add_argument(
+            "--server-workers",
+            type=int,
+            help="Number of worker processes accepting datalogger connections",
+            dest="server__workers",
+        )
+        parser.add_argument(
+            "--decode-executor",
+            choices=[executor.value for executor in DecodeExecutor],
+            help="Decode large frames and buffered backlogs in a thread or process pool",
+            dest="decode_pool__executor",
+        )
 
     def parse(self) -> Namespace:
         return self.parser.parse_args(self.argv)
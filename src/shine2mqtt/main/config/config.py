@@ -7,8 +7,15 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from shine2mqtt import util
 from shine2mqtt.adapters.api.config import ApiConfig
 from shine2mqtt.adapters.mqtt.config import MqttConfig
+from shine2mqtt.domain.events.bus import EventBusConfig
 from shine2mqtt.infrastructure.server.config import GrowattServerConfig
+from shine2mqtt.main.bench.config import BenchConfig
+from shine2mqtt.main.replay.config import ReplayConfig
+from shine2mqtt.protocol.frame.capturer.config import FrameCaptureConfig
+from shine2mqtt.protocol.frame.pool import FrameDecodePoolConfig
+from shine2mqtt.protocol.session.config import ProtocolSessionConfig
 from shine2mqtt.protocol.simulator.config import SimulatedClientConfig
+from shine2mqtt.util.clock import ClockConfig
 
 ENV_PREFIX = "SHINE2MQTT_"
 
@@ -18,12 +25,21 @@ NESTED_DELIMITER = "__"
 class ApplicationConfig(BaseSettings):
     log_level: str = logging.getLevelName(logging.INFO)
     log_color: bool = True
+    clock: ClockConfig = Field(default_factory=ClockConfig)
     config_file: Path | None = None
     capture_data: bool = False
+    capture: FrameCaptureConfig = Field(default_factory=FrameCaptureConfig)
+    # JSON-lines file with datalogger metadata, lets sessions start without the config handshake
+    metadata_cache: Path | None = None
+    events: EventBusConfig = Field(default_factory=EventBusConfig)
     mqtt: MqttConfig = Field(default_factory=MqttConfig)
     api: ApiConfig = Field(default_factory=ApiConfig)
     server: GrowattServerConfig = Field(default_factory=GrowattServerConfig)
+    session: ProtocolSessionConfig = Field(default_factory=ProtocolSessionConfig)
+    decode_pool: FrameDecodePoolConfig = Field(default_factory=FrameDecodePoolConfig)
     simulated_client: SimulatedClientConfig = Field(default_factory=SimulatedClientConfig)
+    bench: BenchConfig = Field(default_factory=BenchConfig)
+    replay: ReplayConfig = Field(default_factory=ReplayConfig)
 
     model_config = SettingsConfigDict(
         env_prefix=ENV_PREFIX,
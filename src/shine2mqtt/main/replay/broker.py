@@ -0,0 +1,233 @@
+import asyncio
+import struct
+import time
+from collections.abc import Callable
+from enum import IntEnum
+
+from shine2mqtt.util.logger import logger
+
+type PublishCallback = Callable[[str, bytes, float], None]
+
+MQTT_V311 = 4
+MQTT_V5 = 5
+
+
+class PacketType(IntEnum):
+    CONNECT = 1
+    CONNACK = 2
+    PUBLISH = 3
+    PUBACK = 4
+    PUBREC = 5
+    PUBREL = 6
+    PUBCOMP = 7
+    SUBSCRIBE = 8
+    SUBACK = 9
+    UNSUBSCRIBE = 10
+    UNSUBACK = 11
+    PINGREQ = 12
+    PINGRESP = 13
+    DISCONNECT = 14
+
+
+class MqttProtocolError(Exception):
+    pass
+
+
+class MqttBrokerStub:
+    """Minimal in-process MQTT 3.1.1 and 5 broker that reports every PUBLISH it receives.
+
+    Every client is accepted and every packet is acknowledged as successful, messages are not
+    routed to subscribers or retained. Good enough to terminate the MQTT bridge in load tests
+    without a real broker.
+    """
+
+    def __init__(self, on_publish: PublishCallback | None = None):
+        self._on_publish = on_publish
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task] = set()
+        self._connected = asyncio.Event()
+        self.publishes = 0
+
+    @property
+    def port(self) -> int:
+        if self._server is None:
+            raise RuntimeError("Broker is not started")
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        logger.info(f"MQTT broker stub listening on {host}:{self.port}")
+
+    async def wait_for_client(self) -> None:
+        await self._connected.wait()
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for task in self._connections:
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            await self._serve(reader, writer)
+        except asyncio.IncompleteReadError, ConnectionError:
+            pass
+        except MqttProtocolError as e:
+            logger.warning(f"MQTT broker stub closes connection: {e}")
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        packet_type, _, body = await self._read_packet(reader)
+        if packet_type is not PacketType.CONNECT:
+            raise MqttProtocolError(f"Expected CONNECT, got {packet_type.name}")
+
+        version = self._parse_connect(body)
+        # Session present = 0, return/reason code = 0 (accepted), MQTT 5 adds no properties
+        writer.write(self._packet(PacketType.CONNACK, b"\x00\x00" + self._no_properties(version)))
+        self._connected.set()
+
+        while True:
+            packet_type, flags, body = await self._read_packet(reader)
+            match packet_type:
+                case PacketType.PUBLISH:
+                    self._handle_publish(writer, version, flags, body)
+                case PacketType.PUBREL:
+                    writer.write(self._packet(PacketType.PUBCOMP, body[:2]))
+                case PacketType.SUBSCRIBE:
+                    writer.write(self._suback(version, body))
+                case PacketType.UNSUBSCRIBE:
+                    writer.write(self._unsuback(version, body))
+                case PacketType.PINGREQ:
+                    writer.write(self._packet(PacketType.PINGRESP, b""))
+                case PacketType.DISCONNECT:
+                    return
+                case PacketType.PUBACK | PacketType.PUBREC | PacketType.PUBCOMP:
+                    # Acknowledgements of messages to subscribers, which are never sent
+                    pass
+                case _:
+                    raise MqttProtocolError(f"Unexpected {packet_type.name} packet")
+
+    def _handle_publish(
+        self, writer: asyncio.StreamWriter, version: int, flags: int, body: bytes
+    ) -> None:
+        received_at = time.perf_counter()
+        qos = (flags >> 1) & 0x03
+
+        (topic_length,) = struct.unpack_from(">H", body)
+        position = 2 + topic_length
+        topic = body[2:position].decode()
+
+        packet_id = b""
+        if qos > 0:
+            packet_id = body[position : position + 2]
+            position += 2
+        if version == MQTT_V5:
+            properties_length, position = self._read_varint(body, position)
+            position += properties_length
+
+        self.publishes += 1
+        if self._on_publish is not None:
+            self._on_publish(topic, body[position:], received_at)
+
+        # Without reason code MQTT 5 acknowledgements mean success
+        if qos == 1:
+            writer.write(self._packet(PacketType.PUBACK, packet_id))
+        elif qos == 2:
+            writer.write(self._packet(PacketType.PUBREC, packet_id))
+
+    def _parse_connect(self, body: bytes) -> int:
+        (name_length,) = struct.unpack_from(">H", body)
+        name = body[2 : 2 + name_length]
+        version = body[2 + name_length]
+        if name != b"MQTT" or version not in (MQTT_V311, MQTT_V5):
+            raise MqttProtocolError(f"Unsupported protocol {name!r} version {version}")
+        return version
+
+    def _suback(self, version: int, body: bytes) -> bytes:
+        packet_id = body[:2]
+        position = 2
+        if version == MQTT_V5:
+            properties_length, position = self._read_varint(body, position)
+            position += properties_length
+
+        granted = bytearray()
+        while position < len(body):
+            (filter_length,) = struct.unpack_from(">H", body, position)
+            position += 2 + filter_length
+            # Grant the requested QoS, the lowest two bits of the subscription options
+            granted.append(body[position] & 0x03)
+            position += 1
+
+        return self._packet(
+            PacketType.SUBACK, packet_id + self._no_properties(version) + bytes(granted)
+        )
+
+    def _unsuback(self, version: int, body: bytes) -> bytes:
+        packet_id = body[:2]
+        if version != MQTT_V5:
+            return self._packet(PacketType.UNSUBACK, packet_id)
+
+        properties_length, position = self._read_varint(body, 2)
+        position += properties_length
+        filters = 0
+        while position < len(body):
+            (filter_length,) = struct.unpack_from(">H", body, position)
+            position += 2 + filter_length
+            filters += 1
+        return self._packet(PacketType.UNSUBACK, packet_id + b"\x00" + bytes(filters))
+
+    async def _read_packet(self, reader: asyncio.StreamReader) -> tuple[PacketType, int, bytes]:
+        first = (await reader.readexactly(1))[0]
+
+        remaining_length = 0
+        for shift in range(0, 28, 7):
+            byte = (await reader.readexactly(1))[0]
+            remaining_length |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+        else:
+            raise MqttProtocolError("Malformed remaining length")
+
+        try:
+            packet_type = PacketType(first >> 4)
+        except ValueError:
+            raise MqttProtocolError(f"Unknown packet type {first >> 4}") from None
+
+        body = await reader.readexactly(remaining_length) if remaining_length else b""
+        return packet_type, first & 0x0F, body
+
+    @staticmethod
+    def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+        value = 0
+        for shift in range(0, 28, 7):
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, position
+        raise MqttProtocolError("Malformed variable byte integer")
+
+    @staticmethod
+    def _no_properties(version: int) -> bytes:
+        return b"\x00" if version == MQTT_V5 else b""
+
+    @staticmethod
+    def _packet(packet_type: PacketType, body: bytes) -> bytes:
+        remaining = len(body)
+        encoded = bytearray()
+        while True:
+            byte = remaining & 0x7F
+            remaining >>= 7
+            encoded.append(byte | 0x80 if remaining else byte)
+            if not remaining:
+                break
+        return bytes([packet_type << 4]) + bytes(encoded) + body
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from shine2mqtt.protocol.frame.capturer.loader import DEFAULT_CAPTURE_DIR
+
+
+@dataclass
+class ReplayConfig:
+    enabled: bool = False
+    # Number of virtual dataloggers replaying the stream concurrently
+    loggers: int = 10
+    # Replay speed relative to the captured timing, 60 replays an hour of traffic in a minute
+    speed: float = 60.0
+    # Binary capture file to replay, the captured JSON frames at real send intervals when not set
+    capture: Path | None = None
+    # Directory with the captured JSON frames
+    captures: Path = DEFAULT_CAPTURE_DIR
+    # Seconds of datalogger traffic replayed from the captured JSON frames
+    duration: float = 3600.0
+    # Seconds over which the virtual dataloggers connect, spreads their send times
+    ramp_up: float = 1.0
+    # Seconds to wait for the publishes of the last frames after the replay
+    drain_timeout: float = 5.0
+    # Write the results as JSON to this file, "-" for stdout
+    output: Path | None = None
@@ -0,0 +1,171 @@
+import asyncio
+from collections.abc import Iterator
+from dataclasses import replace
+
+from shine2mqtt.infrastructure.client.transport import TCPTransport
+from shine2mqtt.main.replay.marker import LatencyMarker
+from shine2mqtt.main.replay.stats import ReplayStats
+from shine2mqtt.main.replay.stream import ReplayStream, StreamFrame
+from shine2mqtt.protocol.codec.byte import ByteEncoder
+from shine2mqtt.protocol.frame.decoder import FrameDecoder
+from shine2mqtt.protocol.frame.encoder import FrameEncoder
+from shine2mqtt.protocol.frame.header.header import FunctionCode
+from shine2mqtt.protocol.messages.ack.ack import GrowattAckMessage
+from shine2mqtt.protocol.messages.get_config.get_config import GrowattGetConfigRequestMessage
+from shine2mqtt.protocol.messages.ping.message import GrowattPingMessage
+from shine2mqtt.protocol.messages.set_config.set_config import GrowattSetConfigRequestMessage
+from shine2mqtt.protocol.simulator.handler import ClientMessageHandler
+from shine2mqtt.util.logger import logger
+
+
+class VirtualDatalogger:
+    """Replays a stream under its own datalogger serial, answering the server's requests.
+
+    All frames are encoded before the replay starts, so sending costs no more than a write.
+    """
+
+    CONNECT_TIMEOUT = 5.0
+    # The server starts the config handshake right after it acknowledged the ANNOUNCE, a
+    # session restored from the metadata cache has none
+    HANDSHAKE_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        serial: str,
+        stream: ReplayStream,
+        speed: float,
+        encoder: FrameEncoder,
+        decoder: FrameDecoder,
+        message_handler: ClientMessageHandler,
+        marker: LatencyMarker,
+        sequences: Iterator[int],
+        stats: ReplayStats,
+    ):
+        self.serial = serial
+        self._speed = speed
+        self._decoder = decoder
+        self._message_handler = message_handler
+        self._stats = stats
+        self._transport = TCPTransport()
+        self._announced = asyncio.Event()
+        self._configured = asyncio.Event()
+        self._receive_task: asyncio.Task | None = None
+
+        self._announce = self._encode(encoder, stream.announce, 1)
+        self._frames = self._encode_stream(encoder, stream, marker, sequences)
+
+    async def run(self, host: str, port: int) -> None:
+        await self._connect(host, port)
+        self._receive_task = asyncio.create_task(self._receive_loop())
+
+        await self._transport.write(self._announce)
+        self._stats.record_sent(FunctionCode.ANNOUNCE)
+        await self._wait_for_announce_ack()
+        try:
+            await asyncio.wait_for(self._configured.wait(), self.HANDSHAKE_TIMEOUT)
+        except TimeoutError:
+            pass
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for offset, function_code, sequence, frame in self._frames:
+            delay = start + offset / self._speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._stats.record_sent(function_code, sequence)
+            await self._transport.write(frame)
+
+    async def close(self) -> None:
+        if self._receive_task is not None:
+            self._receive_task.cancel()
+            await asyncio.gather(self._receive_task, return_exceptions=True)
+        await self._transport.close()
+
+    async def _connect(self, host: str, port: int) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.CONNECT_TIMEOUT
+        while True:
+            try:
+                await self._transport.connect(host, port)
+                return
+            except ConnectionRefusedError:
+                # The server may still be starting
+                if loop.time() > deadline:
+                    raise
+                await asyncio.sleep(0.05)
+
+    async def _wait_for_announce_ack(self) -> None:
+        assert self._receive_task is not None
+        announced = asyncio.create_task(self._announced.wait())
+        done, _ = await asyncio.wait(
+            {announced, self._receive_task},
+            timeout=self.CONNECT_TIMEOUT,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if announced in done:
+            return
+
+        announced.cancel()
+        if self._receive_task in done:
+            raise ConnectionError(f"{self.serial} was disconnected before the ANNOUNCE was acked")
+        raise TimeoutError(f"Server did not acknowledge the ANNOUNCE of {self.serial}")
+
+    async def _receive_loop(self) -> None:
+        try:
+            while True:
+                message = self._decoder.decode(await self._transport.read())
+                match message:
+                    case GrowattAckMessage() if (
+                        message.header.function_code is FunctionCode.ANNOUNCE
+                    ):
+                        self._announced.set()
+                    case GrowattAckMessage() | GrowattPingMessage():
+                        pass
+                    case GrowattGetConfigRequestMessage() | GrowattSetConfigRequestMessage():
+                        response = self._message_handler.handle_message(message)
+                        if response is not None:
+                            await self._transport.write(response)
+                        # The time sync request is sent after all config requests
+                        if isinstance(message, GrowattSetConfigRequestMessage):
+                            self._configured.set()
+                    case _:
+                        logger.debug(f"{self.serial} ignores {type(message).__name__}")
+        except asyncio.IncompleteReadError, ConnectionError:
+            logger.warning(f"Virtual datalogger {self.serial} was disconnected")
+
+    def _encode_stream(
+        self,
+        encoder: FrameEncoder,
+        stream: ReplayStream,
+        marker: LatencyMarker,
+        sequences: Iterator[int],
+    ) -> list[tuple[float, FunctionCode, int | None, bytes]]:
+        frames = []
+        for transaction_id, frame in enumerate(stream.frames, start=2):
+            function_code = frame.header.function_code
+            sequence = next(sequences) if function_code is FunctionCode.DATA else None
+            frames.append(
+                (
+                    frame.offset,
+                    function_code,
+                    sequence,
+                    self._encode(encoder, frame, transaction_id, marker, sequence),
+                )
+            )
+        return frames
+
+    def _encode(
+        self,
+        encoder: FrameEncoder,
+        frame: StreamFrame,
+        transaction_id: int,
+        marker: LatencyMarker | None = None,
+        sequence: int | None = None,
+    ) -> bytes:
+        payload = bytearray(frame.payload)
+        payload[0:10] = ByteEncoder.encode_str(self.serial, 10)
+        if marker is not None and sequence is not None:
+            marker.stamp(payload, sequence)
+
+        header = replace(frame.header, transaction_id=transaction_id & 0xFFFF)
+        return encoder.encode_frame(header, bytes(payload))
@@ -0,0 +1,234 @@
+import asyncio
+import json
+import platform
+import socket
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from itertools import count
+
+from shine2mqtt import __version__
+from shine2mqtt.main.app import Application
+from shine2mqtt.main.bench.runner import LatencyStats
+from shine2mqtt.main.config.config import ApplicationConfig
+from shine2mqtt.main.replay.broker import MqttBrokerStub
+from shine2mqtt.main.replay.datalogger import VirtualDatalogger
+from shine2mqtt.main.replay.marker import LatencyMarker
+from shine2mqtt.main.replay.stats import ReplayStats
+from shine2mqtt.main.replay.stream import ReplayStream
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.simulator.generator import FrameGenerator
+from shine2mqtt.protocol.simulator.handler import ClientMessageHandler
+from shine2mqtt.util.clock import ClockService, MonotonicClockService
+from shine2mqtt.util.logger import logger
+
+HOST = "127.0.0.1"
+
+
+class LoopLagMonitor:
+    """Samples how much later than requested the event loop wakes up a sleeping task."""
+
+    def __init__(self, interval: float = 0.01):
+        self._interval = interval
+        self.samples: list[float] = []
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(loop.time() - start - self._interval, 0.0))
+
+
+@dataclass
+class ReplayReport:
+    version: str
+    python: str
+    started_at: str
+    loggers: int
+    speed: float
+    # Wall clock seconds from the first connect until the last frame was sent
+    duration: float
+    frames_sent: int
+    frames_per_sec: float
+    publishes: int
+    publishes_per_sec: float
+    # From writing a DATA frame until the broker received its inverter state
+    latency_ms: LatencyStats
+    latency_samples: int
+    # DATA frames without publish, replaced by a newer state or not published in time
+    unmatched: int
+    loop_lag_ms: LatencyStats
+    failed_loggers: int
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+
+def format_report(report: ReplayReport) -> str:
+    latency = report.latency_ms
+    lag = report.loop_lag_ms
+    return "\n".join(
+        [
+            f"loggers      {report.loggers} at {report.speed:g}x, {report.duration:.1f} s",
+            f"frames       {report.frames_sent} ({report.frames_per_sec:,.0f}/s)",
+            f"publishes    {report.publishes} ({report.publishes_per_sec:,.0f}/s)",
+            f"latency      p50 {latency.p50:.2f} ms  p99 {latency.p99:.2f} ms  "
+            f"max {latency.max:.2f} ms ({report.latency_samples} samples, "
+            f"{report.unmatched} unmatched)",
+            f"loop lag     p50 {lag.p50:.2f} ms  p99 {lag.p99:.2f} ms  max {lag.max:.2f} ms",
+        ]
+    )
+
+
+class ReplayHarness:
+    """Runs the application against an in-process MQTT broker and replays datalogger traffic.
+
+    The virtual dataloggers, the broker and (with a single server worker) the protocol
+    sessions share one event loop, so the measured loop lag includes the replay itself.
+    """
+
+    STARTUP_TIMEOUT = 10.0
+
+    def __init__(self, config: ApplicationConfig, clock: ClockService | None = None):
+        if config.replay.loggers < 1:
+            raise ValueError("Replay needs at least one virtual datalogger")
+        if config.replay.speed <= 0:
+            raise ValueError("Replay speed must be positive")
+
+        self._app_config = config
+        self._config = config.replay
+        # Clock of the event loop, e.g. virtual with --clock-speed
+        self._clock = clock or MonotonicClockService()
+
+    async def run(self) -> ReplayReport:
+        marker = LatencyMarker(self._app_config.mqtt)
+        stats = ReplayStats(marker)
+        loggers = self._create_loggers(self._load_stream(), marker, stats)
+
+        broker = MqttBrokerStub(on_publish=stats.record_publish)
+        await broker.start(HOST)
+        server_port = self._find_free_port()
+        app = Application(self._create_app_config(server_port, broker.port), clock=self._clock)
+        app_task = asyncio.create_task(app.run())
+        lag_monitor = LoopLagMonitor()
+        lag_task = asyncio.create_task(lag_monitor.run())
+
+        started_at = datetime.now().isoformat(timespec="seconds")
+        try:
+            await self._wait_for_startup(broker, app_task)
+
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(
+                    self._replay(datalogger, server_port, index)
+                    for index, datalogger in enumerate(loggers)
+                ),
+                return_exceptions=True,
+            )
+            duration = time.perf_counter() - start
+            await self._drain(stats)
+            publish_duration = stats.last_publish_at - start
+        finally:
+            await asyncio.gather(*(datalogger.close() for datalogger in loggers))
+            for task in (app_task, lag_task):
+                task.cancel()
+            await asyncio.gather(app_task, lag_task, return_exceptions=True)
+            await broker.close()
+
+        failed = [result for result in results if isinstance(result, BaseException)]
+        for error in failed:
+            logger.warning(f"Virtual datalogger failed: {error!r}")
+
+        return ReplayReport(
+            version=__version__,
+            python=f"{platform.python_implementation()} {platform.python_version()}",
+            started_at=started_at,
+            loggers=len(loggers),
+            speed=self._config.speed,
+            duration=duration,
+            frames_sent=stats.frames_sent,
+            frames_per_sec=stats.frames_sent / duration if duration > 0 else 0.0,
+            publishes=stats.publishes,
+            publishes_per_sec=stats.publishes / publish_duration if publish_duration > 0 else 0.0,
+            latency_ms=self._to_ms(stats.latencies),
+            latency_samples=len(stats.latencies),
+            unmatched=stats.unmatched,
+            loop_lag_ms=self._to_ms(lag_monitor.samples),
+            failed_loggers=len(failed),
+        )
+
+    def _load_stream(self) -> ReplayStream:
+        if self._config.capture is not None:
+            return ReplayStream.from_capture(self._config.capture, self._config.captures)
+        return ReplayStream.from_templates(self._config.captures, self._config.duration)
+
+    def _create_loggers(
+        self, stream: ReplayStream, marker: LatencyMarker, stats: ReplayStats
+    ) -> list[VirtualDatalogger]:
+        encoder = FrameFactory.encoder()
+        decoder = FrameFactory.client_decoder()
+        message_handler = ClientMessageHandler(
+            generator=FrameGenerator(encoder=encoder, clock=self._clock)
+        )
+        sequences = (sequence % marker.max_sequence + 1 for sequence in count())
+
+        logger.info(f"Encoding {len(stream.frames)} frames for {self._config.loggers} loggers")
+        return [
+            VirtualDatalogger(
+                serial=f"RP{index:08d}",
+                stream=stream,
+                speed=self._config.speed,
+                encoder=encoder,
+                decoder=decoder,
+                message_handler=message_handler,
+                marker=marker,
+                sequences=sequences,
+                stats=stats,
+            )
+            for index in range(self._config.loggers)
+        ]
+
+    def _create_app_config(self, server_port: int, broker_port: int) -> ApplicationConfig:
+        config = self._app_config.model_copy(deep=True)
+        config.server.host = HOST
+        config.server.port = server_port
+        config.mqtt.server.host = HOST
+        config.mqtt.server.port = broker_port
+        config.api.enabled = False
+        return config
+
+    async def _wait_for_startup(self, broker: MqttBrokerStub, app_task: asyncio.Task) -> None:
+        connected = asyncio.create_task(broker.wait_for_client())
+        done, _ = await asyncio.wait(
+            {connected, app_task},
+            timeout=self.STARTUP_TIMEOUT,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if connected in done:
+            return
+
+        connected.cancel()
+        if app_task in done:
+            app_task.result()
+        raise TimeoutError("Application did not connect to the MQTT broker")
+
+    async def _replay(self, datalogger: VirtualDatalogger, port: int, index: int) -> None:
+        await asyncio.sleep(index * self._config.ramp_up / self._config.loggers)
+        await datalogger.run(HOST, port)
+
+    async def _drain(self, stats: ReplayStats) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._config.drain_timeout
+        while stats.unmatched and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+
+    @staticmethod
+    def _find_free_port() -> int:
+        with socket.socket() as sock:
+            sock.bind((HOST, 0))
+            return sock.getsockname()[1]
+
+    @staticmethod
+    def _to_ms(samples: list[float]) -> LatencyStats:
+        return LatencyStats.from_samples([sample * 1000 for sample in samples])
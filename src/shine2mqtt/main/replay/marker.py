@@ -0,0 +1,43 @@
+import json
+import struct
+
+from shine2mqtt.adapters.hass.map import INVERTER_SENSOR_MAP
+from shine2mqtt.adapters.mqtt.config import MqttConfig, PublishMode
+from shine2mqtt.protocol.messages.data.layout import DATA_LAYOUT
+
+# Replaced by a sequence number in replayed DATA frames, published in every publish mode
+MARKER_FIELD = "energy_ac_total"
+
+
+class LatencyMarker:
+    """Tags DATA frames with a sequence number and finds it back in the MQTT publishes.
+
+    The inverter topics carry no datalogger serial, so the sequence numbers are unique over
+    all virtual dataloggers.
+    """
+
+    def __init__(self, config: MqttConfig):
+        field = next(field for field in DATA_LAYOUT.fields if field.name == MARKER_FIELD)
+        self._struct = struct.Struct(f">{field.fmt}")
+        self._offset = field.offset
+        # Register counts per published unit, so the published value equals the sequence
+        self._unit = field.divisor
+        self.max_sequence = (1 << (8 * self._struct.size)) // self._unit - 1
+
+        # Topics as published by MqttEventMapper
+        entity_id = INVERTER_SENSOR_MAP[MARKER_FIELD]["entity_id"]
+        if config.publish_mode is PublishMode.AGGREGATED:
+            self._topic = f"{config.base_topic}/inverter/state"
+            self._key = entity_id
+        else:
+            self._topic = f"{config.base_topic}/inverter/sensor/{entity_id}"
+            self._key = "value"
+
+    def stamp(self, payload: bytearray, sequence: int) -> None:
+        self._struct.pack_into(payload, self._offset, sequence * self._unit)
+
+    def read(self, topic: str, payload: bytes) -> int | None:
+        if topic != self._topic:
+            return None
+        value = json.loads(payload).get(self._key)
+        return round(value) if value is not None else None
@@ -0,0 +1,41 @@
+import time
+from collections import Counter
+
+from shine2mqtt.main.replay.marker import LatencyMarker
+from shine2mqtt.protocol.frame.header.header import FunctionCode
+
+
+class ReplayStats:
+    """Frames sent by the virtual dataloggers and publishes received by the broker."""
+
+    def __init__(self, marker: LatencyMarker):
+        self._marker = marker
+        self._sent_at: dict[int, float] = {}
+        self.frames = Counter[FunctionCode]()
+        self.publishes = 0
+        self.last_publish_at = 0.0
+        self.latencies: list[float] = []
+
+    @property
+    def frames_sent(self) -> int:
+        return self.frames.total()
+
+    @property
+    def unmatched(self) -> int:
+        """DATA frames without a publish, e.g. replaced by a newer state or still in flight."""
+        return len(self._sent_at)
+
+    def record_sent(self, function_code: FunctionCode, sequence: int | None = None) -> None:
+        self.frames[function_code] += 1
+        if sequence is not None:
+            self._sent_at[sequence] = time.perf_counter()
+
+    def record_publish(self, topic: str, payload: bytes, received_at: float) -> None:
+        self.publishes += 1
+        self.last_publish_at = received_at
+        sequence = self._marker.read(topic, payload)
+        if sequence is None:
+            return
+        sent_at = self._sent_at.pop(sequence, None)
+        if sent_at is not None:
+            self.latencies.append(received_at - sent_at)
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from itertools import cycle
+from pathlib import Path
+
+from shine2mqtt.protocol.frame.capturer.capturer import FrameDirection
+from shine2mqtt.protocol.frame.capturer.loader import CapturedFrameLoader
+from shine2mqtt.protocol.frame.capturer.reader import CaptureReader
+from shine2mqtt.protocol.frame.header.header import FunctionCode, MBAPHeader
+
+# Frames sent by a datalogger on its own, responses to server requests are generated
+REPLAYED_FUNCTION_CODES = (
+    FunctionCode.ANNOUNCE,
+    FunctionCode.DATA,
+    FunctionCode.BUFFERED_DATA,
+    FunctionCode.PING,
+)
+
+# Send intervals of a real Shine Wifi-X datalogger in seconds
+DATA_INTERVAL = 300
+PING_INTERVAL = 180
+
+
+@dataclass(frozen=True, slots=True)
+class StreamFrame:
+    # Seconds after the datalogger was announced
+    offset: float
+    header: MBAPHeader
+    # Decrypted payload
+    payload: bytes
+
+
+@dataclass(frozen=True)
+class ReplayStream:
+    """What a datalogger sends from its first ANNOUNCE on, with the original timing."""
+
+    announce: StreamFrame
+    frames: tuple[StreamFrame, ...]
+
+    @property
+    def duration(self) -> float:
+        return self.frames[-1].offset if self.frames else 0.0
+
+    @classmethod
+    def from_capture(cls, path: Path, captures: Path) -> ReplayStream:
+        """Stream of the frames a datalogger sent in a binary capture file.
+
+        Frames of all dataloggers in the capture are replayed as one stream. Without an
+        ANNOUNCE in the capture the first captured JSON announce frame is used.
+        """
+        with CaptureReader.open(path) as reader:
+            captured = [
+                frame
+                for frame in reader.frames(function_codes=REPLAYED_FUNCTION_CODES)
+                if frame.direction is FrameDirection.RECEIVED
+            ]
+        if not captured:
+            raise ValueError(f"No datalogger frames to replay in {path}")
+
+        first = captured[0]
+        start = first.timestamp
+        announce = None
+        if first.header.function_code is FunctionCode.ANNOUNCE:
+            announce = StreamFrame(0.0, first.header, first.payload)
+            captured = captured[1:]
+
+        return cls(
+            announce=announce or cls._load_templates("announce_message", captures)[0],
+            frames=tuple(
+                StreamFrame(frame.timestamp - start, frame.header, frame.payload)
+                for frame in captured
+            ),
+        )
+
+    @classmethod
+    def from_templates(cls, captures: Path, duration: float) -> ReplayStream:
+        """Stream cycling the captured JSON frames at the send intervals of a real datalogger."""
+        data = cycle(cls._load_templates("data_message", captures))
+        ping = cycle(cls._load_templates("ping_message", captures))
+
+        frames = [
+            StreamFrame(float(offset), template.header, template.payload)
+            for interval, templates in ((DATA_INTERVAL, data), (PING_INTERVAL, ping))
+            for offset, template in zip(
+                range(interval, int(duration) + 1, interval), templates, strict=False
+            )
+        ]
+        frames.sort(key=lambda frame: frame.offset)
+
+        return cls(
+            announce=cls._load_templates("announce_message", captures)[0],
+            frames=tuple(frames),
+        )
+
+    @staticmethod
+    def _load_templates(message_name: str, captures: Path) -> list[StreamFrame]:
+        _, headers, payloads = CapturedFrameLoader.load(message_name, captures)
+        return [
+            StreamFrame(0.0, header, payload)
+            for header, payload in zip(headers, payloads, strict=True)
+        ]
@@ -0,0 +1,113 @@
+import asyncio
+import socket
+
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.interfaces.registry import SessionRegistry
+from shine2mqtt.infrastructure.metadata.store import JsonLinesMetadataStore
+from shine2mqtt.infrastructure.server.server import TCPServer
+from shine2mqtt.infrastructure.workers.channel import IpcChannel
+from shine2mqtt.infrastructure.workers.host import ReportingSessionRegistry, WorkerHost
+from shine2mqtt.main.config.config import ApplicationConfig
+from shine2mqtt.main.logger import LoggerConfigurator
+from shine2mqtt.protocol.frame.capturer import CaptureHandler
+from shine2mqtt.protocol.frame.decoder import FrameDecoder
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.frame.pool import DecodeExecutor, FrameDecodePool
+from shine2mqtt.protocol.session.factory import ProtocolSessionFactory
+from shine2mqtt.protocol.session.registry import ProtocolSessionRegistry
+from shine2mqtt.util.clock import create_clock
+from shine2mqtt.util.event_loop import create_loop_factory
+from shine2mqtt.util.logger import logger
+
+
+def create_decode_pool(config: ApplicationConfig, decoder: FrameDecoder) -> FrameDecodePool | None:
+    if config.decode_pool.executor is None:
+        return None
+
+    if config.capture_data and config.decode_pool.executor is DecodeExecutor.PROCESS:
+        logger.warning("Frames decoded in the process decode pool are not captured")
+
+    logger.info(
+        f"Decoding large frames and backlogs in a {config.decode_pool.executor} pool "
+        f"with {config.decode_pool.workers} workers"
+    )
+    return FrameDecodePool(
+        decoder=decoder,
+        config=config.decode_pool,
+        decoder_factory=FrameFactory.server_decoder,
+    )
+
+
+def create_session_factory(
+    config: ApplicationConfig, event_bus: DomainEventBus
+) -> ProtocolSessionFactory:
+    encoder = FrameFactory.encoder()
+
+    if config.capture_data:
+        logger.info("Frame data capturing is ENABLED.")
+        capture_handler = CaptureHandler.create(config.capture, encoder)
+        decoder = FrameFactory.server_decoder(on_decode=capture_handler)
+    else:
+        decoder = FrameFactory.server_decoder()
+
+    metadata_store = None
+    if config.metadata_cache is not None:
+        metadata_store = JsonLinesMetadataStore(config.metadata_cache)
+
+    return ProtocolSessionFactory(
+        encoder=encoder,
+        decoder=decoder,
+        domain_events=event_bus,
+        config=config.session,
+        metadata_store=metadata_store,
+        decode_pool=create_decode_pool(config, decoder),
+    )
+
+
+def create_tcp_server(
+    config: ApplicationConfig, registry: SessionRegistry, event_bus: DomainEventBus
+) -> TCPServer:
+    return TCPServer(
+        session_registry=registry,
+        session_factory=create_session_factory(config, event_bus),
+        config=config.server,
+    )
+
+
+class Worker:
+    """TCP server worker process, its sessions are reported to the main process."""
+
+    def __init__(self, config: ApplicationConfig, index: int, channel_socket: socket.socket):
+        self._config = config
+        self._index = index
+        self._channel_socket = channel_socket
+
+    async def run(self) -> None:
+        channel = await IpcChannel.open(self._channel_socket)
+
+        event_bus = DomainEventBus(self._config.events)
+        registry = ReportingSessionRegistry(ProtocolSessionRegistry(), channel)
+        host = WorkerHost(channel, registry, event_bus.subscribe("main"))
+        tcp_server = create_tcp_server(self._config, registry, event_bus)
+
+        server_task = asyncio.create_task(tcp_server.serve())
+        try:
+            # The worker lives as long as its channel to the main process
+            await host.run()
+        finally:
+            tcp_server.stop()
+            await server_task
+            await channel.close()
+
+
+def run_worker(config: ApplicationConfig, index: int, channel_socket: socket.socket) -> None:
+    """Entry point of a worker process."""
+    LoggerConfigurator.setup(log_level=config.log_level, color=config.log_color)
+    logger.info(f"Worker {index} started")
+    try:
+        asyncio.run(
+            Worker(config, index, channel_socket).run(),
+            loop_factory=create_loop_factory(create_clock(config.clock)),
+        )
+    except KeyboardInterrupt:
+        pass
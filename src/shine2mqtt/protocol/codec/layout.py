@@ -0,0 +1,120 @@
+import re
+import struct
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+type Buffer = bytes | bytearray | memoryview
+
+_FORMAT_PATTERN = re.compile(r"^(\d*)([BHIs])$")
+
+DATETIME_PARTS = ("year", "month", "day", "hour", "minute", "second", "weekday")
+
+
+@dataclass(frozen=True)
+class RegisterField:
+    name: str
+    offset: int
+    # Big-endian struct format of a single value: "B", "H", "I" or "<length>s"
+    fmt: str
+    # Multiplier applied to the raw integer, must be 1 or the reciprocal of an integer (0.1, 0.01)
+    scale: float = 1
+
+    @property
+    def size(self) -> int:
+        return struct.calcsize(f">{self.fmt}")
+
+    @property
+    def divisor(self) -> int:
+        divisor = round(1 / self.scale)
+        if abs(divisor * self.scale - 1) > 1e-9:
+            raise ValueError(f"Scale {self.scale} of field '{self.name}' is not 1/n")
+        return divisor
+
+    @property
+    def is_str(self) -> bool:
+        return self.fmt.endswith("s")
+
+
+def datetime_fields(name: str, offset: int, fmt: str) -> list[RegisterField]:
+    """Fields for a year..weekday datetime block stored as consecutive B or H values."""
+    step = struct.calcsize(f">{fmt}")
+    return [
+        RegisterField(f"{name}_{part}", offset + index * step, fmt)
+        for index, part in enumerate(DATETIME_PARTS)
+    ]
+
+
+def datetime_values(name: str, value: datetime, year_offset: int = 0) -> dict[str, int]:
+    return {
+        f"{name}_year": value.year - year_offset,
+        f"{name}_month": value.month,
+        f"{name}_day": value.day,
+        f"{name}_hour": value.hour,
+        f"{name}_minute": value.minute,
+        f"{name}_second": value.second,
+        f"{name}_weekday": value.weekday(),
+    }
+
+
+class RegisterLayout:
+    """A fixed payload layout compiled into one precompiled big-endian struct.
+
+    Gaps between fields are skipped with pad bytes, so a whole payload is decoded with a single
+    ``unpack_from`` call. Scaled values are divided by an integer divisor which gives the same
+    result as ``round(raw * scale, 6)`` without the rounding step.
+    """
+
+    def __init__(self, fields: Sequence[RegisterField], size: int | None = None):
+        self.fields = tuple(sorted(fields, key=lambda field: field.offset))
+        self.names = tuple(field.name for field in self.fields)
+
+        fmt = ">"
+        position = 0
+        for field in self.fields:
+            if not _FORMAT_PATTERN.match(field.fmt):
+                raise ValueError(f"Unsupported format '{field.fmt}' for field '{field.name}'")
+            if field.offset < position:
+                raise ValueError(f"Field '{field.name}' overlaps the previous field")
+            if field.offset > position:
+                fmt += f"{field.offset - position}x"
+            fmt += field.fmt
+            position = field.offset + field.size
+
+        self.struct = struct.Struct(fmt)
+        self.size = size if size is not None else self.struct.size
+        if self.size < self.struct.size:
+            raise ValueError(f"Layout needs {self.struct.size} bytes, size is {self.size}")
+
+        self._scaled = tuple(
+            (index, field.divisor) for index, field in enumerate(self.fields) if field.scale != 1
+        )
+        self._strings = tuple(index for index, field in enumerate(self.fields) if field.is_str)
+
+    def unpack(self, buffer: Buffer) -> dict[str, Any]:
+        values = list(self.struct.unpack_from(buffer))
+
+        for index, divisor in self._scaled:
+            values[index] /= divisor
+
+        for index in self._strings:
+            values[index] = values[index].decode("ascii").strip()
+
+        return dict(zip(self.names, values, strict=True))
+
+    def pack(self, values: Mapping[str, Any]) -> bytes:
+        payload = bytearray(self.size)
+        self.pack_into(payload, values)
+        return bytes(payload)
+
+    def pack_into(self, buffer: bytearray | memoryview, values: Mapping[str, Any]) -> None:
+        raw_values = [values[name] for name in self.names]
+
+        for index, divisor in self._scaled:
+            raw_values[index] = round(raw_values[index] * divisor)
+
+        for index in self._strings:
+            raw_values[index] = raw_values[index].encode("ascii")
+
+        self.struct.pack_into(buffer, 0, *raw_values)
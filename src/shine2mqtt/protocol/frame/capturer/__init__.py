@@ -1,10 +1,23 @@
-from .capturer import CapturedFrame, FileFrameCapturer, FrameCapturer
+from .binary import BinaryCaptureFormat, BinaryFrameCapturer
+from .capturer import CapturedFrame, FileFrameCapturer, FrameCapturer, FrameDirection
+from .config import CaptureFormat, FrameCaptureConfig
+from .converter import BinaryCaptureConverter
 from .handler import CaptureHandler, RawPayloadSanitizer
+from .reader import CaptureIndex, CaptureIndexEntry, CaptureReader
 
 __all__ = [
+    "BinaryCaptureConverter",
+    "BinaryCaptureFormat",
+    "BinaryFrameCapturer",
+    "CaptureFormat",
     "CapturedFrame",
     "CaptureHandler",
+    "CaptureIndex",
+    "CaptureIndexEntry",
+    "CaptureReader",
     "FileFrameCapturer",
     "FrameCapturer",
+    "FrameCaptureConfig",
+    "FrameDirection",
     "RawPayloadSanitizer",
 ]
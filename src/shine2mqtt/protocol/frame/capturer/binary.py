@@ -0,0 +1,286 @@
+import atexit
+import os
+import queue
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from shine2mqtt.protocol.frame.capturer.capturer import (
+    CapturedFrame,
+    FrameCapturer,
+    FrameDirection,
+)
+from shine2mqtt.protocol.frame.capturer.config import FrameCaptureConfig
+from shine2mqtt.protocol.frame.header.header import FUNCTION_CODE_BY_BYTE, MBAPHeader
+from shine2mqtt.util.logger import logger
+
+CAPTURE_FILE_SUFFIX = ".s2mcap"
+
+
+class BinaryCaptureFormat:
+    """Append-only capture file format, all values big endian.
+
+    A file starts with ``MAGIC`` and a version byte, followed by records::
+
+        u32 record length (excluding this field)
+        f64 capture time (unix) | u8 direction
+        u16 transaction id | u16 protocol id | u16 length | u8 unit id | u8 function code
+        u32 frame length | frame | payload (rest of the record)
+
+    A record is only complete once fully written, a truncated last record (e.g. after a crash)
+    is skipped by the reader.
+    """
+
+    MAGIC = b"S2MCAP"
+    VERSION = 1
+    # Length of the datalogger serial at the start of the payload
+    SERIAL_LENGTH = 10
+
+    _FILE_HEADER = struct.Struct(f">{len(MAGIC)}sB")
+    _LENGTH = struct.Struct(">I")
+    _RECORD = struct.Struct(">dBHHHBBI")
+    # Capture time, function code and frame length at their offsets in the record
+    _SUMMARY = struct.Struct(">d8xBI")
+
+    HEADER_SIZE = _FILE_HEADER.size
+
+    @classmethod
+    def file_header(cls) -> bytes:
+        return cls._FILE_HEADER.pack(cls.MAGIC, cls.VERSION)
+
+    @classmethod
+    def encode(cls, frame: CapturedFrame) -> bytes:
+        header = frame.header
+        record = cls._RECORD.pack(
+            frame.timestamp,
+            frame.direction.value,
+            header.transaction_id,
+            header.protocol_id,
+            header.length,
+            header.unit_id,
+            header.function_code.value,
+            len(frame.frame),
+        )
+        length = len(record) + len(frame.frame) + len(frame.payload)
+        return b"".join((cls._LENGTH.pack(length), record, frame.frame, frame.payload))
+
+    @classmethod
+    def check_file_header(cls, data: bytes, path: Path) -> None:
+        if len(data) < cls.HEADER_SIZE or cls._FILE_HEADER.unpack_from(data) != (
+            cls.MAGIC,
+            cls.VERSION,
+        ):
+            raise ValueError(f"{path} is not a version {cls.VERSION} binary capture file")
+
+    @classmethod
+    def read(cls, path: Path) -> Iterator[CapturedFrame]:
+        with open(path, "rb") as f:
+            cls.check_file_header(f.read(cls.HEADER_SIZE), path)
+
+            while raw_length := f.read(cls._LENGTH.size):
+                record = cls._read_record(f, raw_length)
+                if record is None:
+                    logger.warning(f"Skipping truncated record at the end of {path}")
+                    return
+                yield cls.decode(record)
+
+    @classmethod
+    def _read_record(cls, f: BinaryIO, raw_length: bytes) -> bytes | None:
+        if len(raw_length) < cls._LENGTH.size:
+            return None
+
+        (length,) = cls._LENGTH.unpack(raw_length)
+        record = f.read(length)
+        if len(record) < max(length, cls._RECORD.size):
+            return None
+        return record
+
+    @classmethod
+    def scan(cls, buffer: bytes | memoryview, offset: int) -> Iterator[tuple[int, int]]:
+        """Yield (offset, end) of the complete records in buffer, starting at offset."""
+        size = len(buffer)
+        while offset + cls._LENGTH.size <= size:
+            (length,) = cls._LENGTH.unpack_from(buffer, offset)
+            end = offset + cls._LENGTH.size + length
+            if length < cls._RECORD.size or end > size:
+                return
+            yield offset, end
+            offset = end
+
+    @classmethod
+    def summarize(cls, buffer: bytes | memoryview, offset: int) -> tuple[float, int, bytes]:
+        """Capture time, function code and raw datalogger serial of the record at offset."""
+        record = offset + cls._LENGTH.size
+        timestamp, function_code, frame_length = cls._SUMMARY.unpack_from(buffer, record)
+        payload = record + cls._RECORD.size + frame_length
+        return timestamp, function_code, bytes(buffer[payload : payload + cls.SERIAL_LENGTH])
+
+    @classmethod
+    def decode_at(cls, buffer: bytes | memoryview, offset: int, end: int) -> CapturedFrame:
+        return cls.decode(bytes(buffer[offset + cls._LENGTH.size : end]))
+
+    @classmethod
+    def decode(cls, record: bytes) -> CapturedFrame:
+        (
+            timestamp,
+            direction,
+            transaction_id,
+            protocol_id,
+            length,
+            unit_id,
+            function_code,
+            frame_length,
+        ) = cls._RECORD.unpack_from(record)
+        header = MBAPHeader(
+            transaction_id=transaction_id,
+            protocol_id=protocol_id,
+            length=length,
+            unit_id=unit_id,
+            function_code=FUNCTION_CODE_BY_BYTE[function_code],
+        )
+        frame_end = cls._RECORD.size + frame_length
+        return CapturedFrame(
+            frame=record[cls._RECORD.size : frame_end],
+            header=header,
+            payload=record[frame_end:],
+            timestamp=timestamp,
+            direction=FrameDirection(direction),
+        )
+
+
+class RotatingCaptureFile:
+    """Binary capture file that is replaced by a new one once it is too large or too old."""
+
+    def __init__(self, directory: Path, max_size: int, max_age: float):
+        self._directory = directory
+        self._max_size = max_size
+        self._max_age = max_age
+        self._file: BinaryIO | None = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._sequence = 0
+
+    @property
+    def path(self) -> Path | None:
+        return Path(self._file.name) if self._file is not None else None
+
+    def write(self, data: bytes) -> None:
+        if self._file is None or self._is_due():
+            self._open()
+        assert self._file is not None
+
+        self._file.write(data)
+        self._size += len(data)
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def rotate_if_due(self) -> None:
+        if self._file is not None and self._is_due():
+            self.close()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _is_due(self) -> bool:
+        return self._size >= self._max_size or time.monotonic() - self._opened_at >= self._max_age
+
+    def _open(self) -> None:
+        self.close()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        # The pid keeps the files of server worker processes apart
+        self._sequence += 1
+        started = datetime.now().strftime("%Y%m%d-%H%M%S")
+        name = f"frames-{started}-{os.getpid()}-{self._sequence}{CAPTURE_FILE_SUFFIX}"
+        self._file = open(self._directory / name, "xb")
+
+        header = BinaryCaptureFormat.file_header()
+        self._file.write(header)
+        self._size = len(header)
+        self._opened_at = time.monotonic()
+        logger.info(f"Capturing frames to {self._directory / name}")
+
+
+class BinaryFrameCapturer(FrameCapturer):
+    """Appends captured frames to rotating binary capture files from a writer thread.
+
+    ``capture`` only encodes and queues the record, so it is safe and cheap to call from the
+    decoder on the event loop or in a decode pool thread. The writer collects the queued records
+    and writes them at once, at least every ``flush_interval`` seconds.
+    """
+
+    def __init__(self, config: FrameCaptureConfig):
+        self._config = config
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=config.max_pending)
+        self._file = RotatingCaptureFile(
+            Path(config.directory), config.max_file_size, config.max_file_age
+        )
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="frame-capture", daemon=True)
+        self._thread.start()
+        # Sessions do not own the capturer, write out what is left when the process exits
+        atexit.register(self.close)
+
+        self.captured = 0
+        self.dropped = 0
+
+    def capture(self, frame: CapturedFrame) -> None:
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(BinaryCaptureFormat.encode(frame))
+            self.captured += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # A writer that stopped on an error no longer empties the queue
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=self._config.flush_interval)
+                break
+            except queue.Full:
+                pass
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            while self._write_pending():
+                pass
+        except Exception as e:
+            self._closed = True
+            logger.exception(f"Frame capture writer stopped: {e}")
+        finally:
+            self._file.close()
+
+    def _write_pending(self) -> bool:
+        """Write the queued records, returns False once the capturer is closed."""
+        try:
+            records = [self._queue.get(timeout=self._config.flush_interval)]
+        except queue.Empty:
+            self._file.rotate_if_due()
+            return True
+
+        while True:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        running = None not in records
+        data = b"".join(record for record in records if record is not None)
+        if data:
+            self._file.write(data)
+            self._file.flush()
+        return running
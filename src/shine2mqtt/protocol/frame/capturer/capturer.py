@@ -1,17 +1,28 @@
 import json
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
 
 from shine2mqtt.protocol.frame.header.header import FunctionCode, MBAPHeader
 from shine2mqtt.util.logger import logger
 
 
+class FrameDirection(Enum):
+    RECEIVED = 0
+    SENT = 1
+
+
 @dataclass
 class CapturedFrame:
     frame: bytes
     header: MBAPHeader
     payload: bytes
+    # Unix time the frame was captured at
+    timestamp: float = field(default_factory=time.time)
+    direction: FrameDirection = FrameDirection.RECEIVED
 
 
 class FrameCapturer(ABC):
@@ -26,9 +37,18 @@ class FileFrameCapturer(FrameCapturer):
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def capture(self, frame: CapturedFrame) -> None:
-        filename = self._get_filename(frame)
-        filepath = self.output_dir / filename
+        self.capture_all([frame])
+
+    def capture_all(self, frames: Iterable[CapturedFrame]) -> None:
+        """Append frames to their capture files, every file is read and written once."""
+        frames_by_filename: dict[str, list[CapturedFrame]] = {}
+        for frame in frames:
+            frames_by_filename.setdefault(self._get_filename(frame), []).append(frame)
+
+        for filename, file_frames in frames_by_filename.items():
+            self._append(self.output_dir / filename, file_frames)
 
+    def _append(self, filepath: Path, frames: list[CapturedFrame]) -> None:
         data = {"frames": [], "headers": [], "payloads": []}
 
         if filepath.exists():
@@ -40,9 +60,10 @@ class FileFrameCapturer(FrameCapturer):
                         f"Failed to decode existing capture file {filepath}, starting with empty data"
                     )
 
-        data["frames"].append(frame.frame.hex())
-        data["headers"].append(frame.header.asdict())
-        data["payloads"].append(frame.payload.hex())
+        for frame in frames:
+            data["frames"].append(frame.frame.hex())
+            data["headers"].append(frame.header.asdict())
+            data["payloads"].append(frame.payload.hex())
 
         with open(filepath, "w") as f:
             json.dump(data, f, indent=2)
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+
+class CaptureFormat(StrEnum):
+    # Append-only binary files, see capturer/binary.py
+    BINARY = "binary"
+    # One JSON file per message type, as loaded by CapturedFrameLoader
+    JSON = "json"
+
+
+@dataclass
+class FrameCaptureConfig:
+    directory: Path = Path("./captured_frames")
+    format: CaptureFormat = CaptureFormat.BINARY
+    # A new binary capture file is started when the current one reaches this size or age
+    max_file_size: int = 16 * 1024 * 1024
+    max_file_age: float = 3600.0
+    # Seconds between writes of the captured frames
+    flush_interval: float = 1.0
+    # Frames waiting to be written, newer frames are dropped when the writer falls behind
+    max_pending: int = 10_000
@@ -0,0 +1,24 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from shine2mqtt.protocol.frame.capturer.binary import BinaryCaptureFormat
+from shine2mqtt.protocol.frame.capturer.capturer import CapturedFrame, FileFrameCapturer
+
+
+class BinaryCaptureConverter:
+    """Converts binary capture files to the JSON capture files loaded by CapturedFrameLoader."""
+
+    @staticmethod
+    def to_json(paths: Iterable[Path], output_dir: Path) -> int:
+        """Append the frames of the binary files to the JSON files in output_dir.
+
+        Returns the number of converted frames.
+        """
+        frames = list(BinaryCaptureConverter._read_all(paths))
+        FileFrameCapturer(output_dir).capture_all(frames)
+        return len(frames)
+
+    @staticmethod
+    def _read_all(paths: Iterable[Path]) -> Iterator[CapturedFrame]:
+        for path in paths:
+            yield from BinaryCaptureFormat.read(path)
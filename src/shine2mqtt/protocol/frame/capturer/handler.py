@@ -1,10 +1,10 @@
-from pathlib import Path
-
+from shine2mqtt.protocol.frame.capturer.binary import BinaryFrameCapturer
 from shine2mqtt.protocol.frame.capturer.capturer import (
     CapturedFrame,
     FileFrameCapturer,
     FrameCapturer,
 )
+from shine2mqtt.protocol.frame.capturer.config import CaptureFormat, FrameCaptureConfig
 from shine2mqtt.protocol.frame.capturer.sanitizer import (
     RawPayloadSanitizer,
 )
@@ -21,8 +21,12 @@ class CaptureHandler:
         self.sanitizer = sanitizer
 
     @staticmethod
-    def create(capture_dir: Path, encoder: FrameEncoder) -> CaptureHandler:
-        capturer = FileFrameCapturer(capture_dir)
+    def create(config: FrameCaptureConfig, encoder: FrameEncoder) -> CaptureHandler:
+        capturer: FrameCapturer
+        if config.format is CaptureFormat.BINARY:
+            capturer = BinaryFrameCapturer(config)
+        else:
+            capturer = FileFrameCapturer(config.directory)
         sanitizer = RawPayloadSanitizer.create()
 
         return CaptureHandler(encoder, capturer, sanitizer)
@@ -1,15 +1,18 @@
 import json
+from pathlib import Path
 
 from shine2mqtt import PROJECT_ROOT
 from shine2mqtt.protocol.frame.header.header import MBAPHeader
 
 CAPTURED_FRAMES_DIR = PROJECT_ROOT / "tests" / "data" / "captured"
+DEFAULT_CAPTURE_DIR = CAPTURED_FRAMES_DIR / "shine_wifi_x" / "mic_3000tl_x"
 
 
 class CapturedFrameLoader:
     @staticmethod
-    def load(message_name: str) -> tuple[list[bytes], list[MBAPHeader], list[bytes]]:
-        base_path = CAPTURED_FRAMES_DIR / "shine_wifi_x" / "mic_3000tl_x"
+    def load(
+        message_name: str, base_path: Path = DEFAULT_CAPTURE_DIR
+    ) -> tuple[list[bytes], list[MBAPHeader], list[bytes]]:
         file_path = base_path / f"{message_name}.json"
 
         with open(file_path, encoding="utf-8") as f:
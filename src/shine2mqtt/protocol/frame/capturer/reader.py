@@ -0,0 +1,205 @@
+import mmap
+import os
+import struct
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from shine2mqtt.protocol.frame.capturer.binary import BinaryCaptureFormat
+from shine2mqtt.protocol.frame.capturer.capturer import CapturedFrame
+from shine2mqtt.protocol.frame.header.header import FunctionCode
+from shine2mqtt.util.logger import logger
+
+INDEX_FILE_SUFFIX = ".idx"
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureIndexEntry:
+    offset: int
+    end: int
+    timestamp: float
+    function_code: int
+    datalogger_serial: str
+
+
+class CaptureIndex:
+    """Sidecar index of a binary capture file, one fixed size entry per record.
+
+    The index remembers up to where the capture file was indexed, records appended to the
+    capture file later are added on the next open.
+    """
+
+    MAGIC = b"S2MIDX"
+    VERSION = 1
+
+    # magic | version | indexed capture file size | entry count
+    _HEADER = struct.Struct(f">{len(MAGIC)}sBQQ")
+    # record offset | record end | capture time | function code | datalogger serial
+    _ENTRY = struct.Struct(f">QQdB{BinaryCaptureFormat.SERIAL_LENGTH}s")
+
+    def __init__(self, path: Path, data: bytes | memoryview):
+        self.path = path
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._data) // self._ENTRY.size
+
+    def __iter__(self) -> Iterator[CaptureIndexEntry]:
+        for offset, end, timestamp, function_code, serial in self._ENTRY.iter_unpack(self._data):
+            yield CaptureIndexEntry(
+                offset=offset,
+                end=end,
+                timestamp=timestamp,
+                function_code=function_code,
+                datalogger_serial=self._decode_serial(serial),
+            )
+
+    @staticmethod
+    def path_for(capture_path: Path) -> Path:
+        return capture_path.with_name(capture_path.name + INDEX_FILE_SUFFIX)
+
+    @classmethod
+    def update(cls, capture: bytes | memoryview, capture_path: Path) -> Path:
+        """Index the records of the capture that are not in its sidecar index yet."""
+        path = cls.path_for(capture_path)
+        indexed_size, count = cls._read_header(path)
+
+        if indexed_size > len(capture):
+            logger.warning(f"Capture file {capture_path} shrank since it was indexed, reindexing")
+            indexed_size, count = 0, 0
+        if indexed_size == len(capture) and count:
+            return path
+
+        start = indexed_size or BinaryCaptureFormat.HEADER_SIZE
+        with open(path, "r+b" if count else "w+b") as f:
+            f.seek(cls._HEADER.size + count * cls._ENTRY.size)
+            f.truncate()
+            end = start
+            for offset, end in BinaryCaptureFormat.scan(capture, start):
+                timestamp, function_code, serial = BinaryCaptureFormat.summarize(capture, offset)
+                f.write(cls._ENTRY.pack(offset, end, timestamp, function_code, serial))
+                count += 1
+
+            # The header goes last, an interrupted update is redone on the next open
+            f.seek(0)
+            f.write(cls._HEADER.pack(cls.MAGIC, cls.VERSION, max(end, start), count))
+
+        logger.debug(f"Indexed {count} records of {capture_path}")
+        return path
+
+    @classmethod
+    def entries(cls, index: bytes | memoryview) -> memoryview:
+        """The entries of a loaded index file, without its header."""
+        _, _, _, count = cls._HEADER.unpack_from(index)
+        return memoryview(index)[cls._HEADER.size : cls._HEADER.size + count * cls._ENTRY.size]
+
+    @classmethod
+    def _read_header(cls, path: Path) -> tuple[int, int]:
+        """Indexed capture size and entry count, zero when there is no usable index."""
+        if not path.exists():
+            return 0, 0
+
+        with open(path, "rb") as f:
+            raw = f.read(cls._HEADER.size)
+            size = os.fstat(f.fileno()).st_size
+
+        if len(raw) < cls._HEADER.size:
+            return 0, 0
+        magic, version, indexed_size, count = cls._HEADER.unpack(raw)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            return 0, 0
+        if size < cls._HEADER.size + count * cls._ENTRY.size:
+            return 0, 0
+        return indexed_size, count
+
+    @staticmethod
+    def _decode_serial(serial: bytes) -> str:
+        return serial.decode("ascii", errors="replace").strip("\x00 ")
+
+
+class CaptureReader:
+    """Reads a binary capture file through a memory map, frames are decoded when iterated.
+
+    Filtering uses the sidecar index, so only matching records are read from the capture file.
+
+        with CaptureReader.open(path) as reader:
+            for frame in reader.frames(function_codes={FunctionCode.DATA}):
+                ...
+    """
+
+    def __init__(self, path: Path, capture_file: BinaryIO):
+        self.path = path
+        self._file = capture_file
+        BinaryCaptureFormat.check_file_header(
+            capture_file.read(BinaryCaptureFormat.HEADER_SIZE), path
+        )
+        self._capture = self._map(capture_file)
+
+        index_path = CaptureIndex.update(self._capture, path)
+        self._index_file = open(index_path, "rb")
+        self._index_map = self._map(self._index_file)
+        self._entries = CaptureIndex.entries(self._index_map)
+        self.index = CaptureIndex(index_path, self._entries)
+
+    @staticmethod
+    def open(path: Path) -> CaptureReader:
+        capture_file = open(path, "rb")
+        try:
+            return CaptureReader(Path(path), capture_file)
+        except BaseException:
+            capture_file.close()
+            raise
+
+    def __enter__(self) -> CaptureReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def entries(
+        self,
+        function_codes: Collection[FunctionCode] | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        datalogger_serial: str | None = None,
+    ) -> Iterator[CaptureIndexEntry]:
+        """Index entries of the records matching all given filters, time range is [start, end)."""
+        codes = None if function_codes is None else {code.value for code in function_codes}
+        for entry in self.index:
+            if codes is not None and entry.function_code not in codes:
+                continue
+            if start is not None and entry.timestamp < start:
+                continue
+            if end is not None and entry.timestamp >= end:
+                continue
+            if datalogger_serial is not None and entry.datalogger_serial != datalogger_serial:
+                continue
+            yield entry
+
+    def frames(
+        self,
+        function_codes: Collection[FunctionCode] | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        datalogger_serial: str | None = None,
+    ) -> Iterator[CapturedFrame]:
+        for entry in self.entries(function_codes, start, end, datalogger_serial):
+            yield self.read(entry)
+
+    def read(self, entry: CaptureIndexEntry) -> CapturedFrame:
+        return BinaryCaptureFormat.decode_at(self._capture, entry.offset, entry.end)
+
+    def close(self) -> None:
+        # Views into the maps have to be released before the maps can be closed
+        self.index = CaptureIndex(self.index.path, b"")
+        self._entries.release()
+        for resource in (self._index_map, self._capture, self._index_file, self._file):
+            resource.close()
+
+    @staticmethod
+    def _map(f: BinaryIO) -> mmap.mmap:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
@@ -67,7 +67,7 @@ class RawPayloadSanitizer:
 
         encrypted_payload = self.payload_cipher.encrypt(sanitized_payload, self.encryption_key)
 
-        crc = self.crc_calculator.calculate_crc16(raw_header + encrypted_payload)
+        crc = self.crc_calculator.calculate_crc16(raw_header, encrypted_payload)
 
         sanitized_frame = raw_header + encrypted_payload + self.crc_encoder.encode(crc)
 
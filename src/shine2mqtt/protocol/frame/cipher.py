@@ -1,12 +1,37 @@
+type Buffer = bytes | bytearray | memoryview
+
+
 class PayloadCipher:
-    def decrypt(self, raw_payload: bytes, key: bytes) -> bytes:
+    def __init__(self):
+        self._key_streams: dict[bytes, bytes] = {}
+
+    def decrypt(self, raw_payload: Buffer, key: bytes) -> bytes:
         return self._xor_with_key(raw_payload, key)
 
-    def encrypt(self, raw_payload: bytes, key: bytes) -> bytes:
+    def encrypt(self, raw_payload: Buffer, key: bytes) -> bytes:
         return self._xor_with_key(raw_payload, key)
 
-    def _xor_with_key(self, data: bytes, key: bytes):
-        decrypted = b""
-        for i in range(0, len(data)):
-            decrypted += bytes([data[i] ^ key[i % len(key)]])
-        return decrypted
+    def decrypt_into(self, buffer: bytearray | memoryview, key: bytes) -> None:
+        buffer[:] = self._xor_with_key(buffer, key)
+
+    def encrypt_into(self, buffer: bytearray | memoryview, key: bytes) -> None:
+        buffer[:] = self._xor_with_key(buffer, key)
+
+    def key_stream(self, key: bytes, length: int) -> memoryview:
+        key_stream = self._key_streams.get(key, b"")
+
+        if len(key_stream) < length:
+            repeats = -(-length // len(key))
+            key_stream = key * repeats
+            self._key_streams[key] = key_stream
+
+        return memoryview(key_stream)[:length]
+
+    def _xor_with_key(self, data: Buffer, key: bytes) -> bytes:
+        length = len(data)
+        if length == 0:
+            return b""
+
+        key_stream = self.key_stream(key, length)
+        xored = int.from_bytes(data) ^ int.from_bytes(key_stream)
+        return xored.to_bytes(length)
@@ -1,4 +1,5 @@
 HEADER_LENGTH = 8
+FUNCTION_CODE_OFFSET = 7
 CRC_LENGTH = 2
 ENCRYPTION_KEY = b"Growatt"
 DECRYPTION_KEY = ENCRYPTION_KEY
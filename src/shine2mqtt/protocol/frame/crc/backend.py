@@ -0,0 +1,132 @@
+import sys
+import time
+from abc import ABC, abstractmethod
+from array import array
+from functools import cache
+
+type Buffer = bytes | bytearray | memoryview
+
+# CRC-16-ANSI/CRC-16-IBM polynomial: 0xA001 (reversed 0x8005)
+CRC16_POLYNOMIAL = 0xA001
+CRC16_INITIAL_VALUE = 0xFFFF
+
+
+def _compute_crc16_lookup_table() -> array:
+    """Compute a crc16 lookup table
+
+    .. note:: This will only be generated once
+    """
+    table = array("H")
+    for byte_value in range(256):
+        crc = 0x0000
+        for _ in range(8):
+            if (byte_value ^ crc) & 0x0001:
+                crc = (crc >> 1) ^ CRC16_POLYNOMIAL
+            else:
+                crc >>= 1
+            byte_value >>= 1
+        table.append(crc)
+    return table
+
+
+CRC16_LOOKUP_TABLE = _compute_crc16_lookup_table()
+
+
+def _compute_crc16_word_lookup_table() -> array:
+    """Compute a 65536 entry table that advances the crc by two bytes at once
+
+    The table is indexed with ``crc ^ word`` where ``word`` is the next two bytes read as a
+    little endian unsigned short, so on little endian hosts it can be used directly with
+    ``memoryview.cast("H")``.
+    """
+    table = CRC16_LOOKUP_TABLE
+    word_table = array("H", bytes(2 * 0x10000))
+    for value in range(0x10000):
+        # value is crc ^ (first_byte | second_byte << 8)
+        first = table[value & 0xFF]
+        word_table[value] = (first >> 8) ^ table[((value >> 8) ^ first) & 0xFF]
+    return word_table
+
+
+class CRC16Backend(ABC):
+    name: str
+
+    @classmethod
+    def supports(cls, byteorder: str) -> bool:
+        """Whether the backend computes the right crc on a host with this byte order."""
+        return True
+
+    @abstractmethod
+    def update(self, crc: int, data: Buffer) -> int:
+        """Feed data into a running (not yet byte swapped) crc and return the new crc."""
+
+
+class TableCRC16Backend(CRC16Backend):
+    name = "table"
+
+    def update(self, crc: int, data: Buffer) -> int:
+        table = CRC16_LOOKUP_TABLE
+        for byte in data:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        return crc
+
+
+class SlicingBy2CRC16Backend(CRC16Backend):
+    name = "slicing-by-2"
+
+    @classmethod
+    def supports(cls, byteorder: str) -> bool:
+        # The xor of the crc with a native word only lines up with the table on little endian
+        return byteorder == "little"
+
+    def __init__(self):
+        self._word_table = _compute_crc16_word_lookup_table()
+
+    def update(self, crc: int, data: Buffer) -> int:
+        view = memoryview(data).cast("B")
+        even_length = len(view) & ~1
+
+        word_table = self._word_table
+        for word in view[:even_length].cast("H"):
+            crc = word_table[crc ^ word]
+
+        if even_length != len(view):
+            crc = (crc >> 8) ^ CRC16_LOOKUP_TABLE[(crc ^ view[-1]) & 0xFF]
+
+        return crc
+
+
+CRC16_BACKENDS: tuple[type[CRC16Backend], ...] = (SlicingBy2CRC16Backend, TableCRC16Backend)
+
+_SELECTION_SAMPLE = bytes(range(256)) * 2 + bytes(range(63))
+_SELECTION_ROUNDS = 20
+
+
+@cache
+def select_crc16_backend(byteorder: str = sys.byteorder) -> CRC16Backend:
+    """Return the fastest backend that produces the same crc as the reference table.
+
+    Backends that do not support the byte order of the host are not even built.
+    """
+    reference = TableCRC16Backend()
+    expected = reference.update(CRC16_INITIAL_VALUE, _SELECTION_SAMPLE)
+
+    fastest: tuple[float, CRC16Backend] | None = None
+    for backend_type in CRC16_BACKENDS:
+        if not backend_type.supports(byteorder):
+            continue
+        backend = reference if backend_type is TableCRC16Backend else backend_type()
+
+        if backend.update(CRC16_INITIAL_VALUE, _SELECTION_SAMPLE) != expected:
+            continue
+
+        start = time.perf_counter()
+        for _ in range(_SELECTION_ROUNDS):
+            backend.update(CRC16_INITIAL_VALUE, _SELECTION_SAMPLE)
+        elapsed = time.perf_counter() - start
+
+        if fastest is None or elapsed < fastest[0]:
+            fastest = (elapsed, backend)
+
+    assert fastest is not None
+    return fastest[1]
@@ -1,7 +1,12 @@
 from collections.abc import Callable
 
 from shine2mqtt.protocol.frame.cipher import PayloadCipher
-from shine2mqtt.protocol.frame.constants import CRC_LENGTH, DECRYPTION_KEY, HEADER_LENGTH
+from shine2mqtt.protocol.frame.constants import (
+    CRC_LENGTH,
+    DECRYPTION_KEY,
+    FUNCTION_CODE_OFFSET,
+    HEADER_LENGTH,
+)
 from shine2mqtt.protocol.frame.crc.calculator import CRCCalculator
 from shine2mqtt.protocol.frame.crc.decoder import CRCDecoder
 from shine2mqtt.protocol.frame.header.decoder import HeaderDecoder
@@ -78,13 +83,13 @@ class FrameDecoder:
         self.on_decode = on_decode
 
     @staticmethod
-    def extract_payload_length(raw_header: bytes) -> int:
+    def extract_payload_length(raw_header: bytes | memoryview) -> int:
         return ByteDecoder.decode_u16(raw_header, 4)
 
-    def decode_header(self, raw_header: bytes) -> MBAPHeader:
+    def decode_header(self, raw_header: bytes | memoryview) -> MBAPHeader:
         return self.header_decoder.decode(raw_header)
 
-    def decode(self, frame: bytes) -> BaseMessage:
+    def decode(self, frame: bytes | memoryview) -> BaseMessage:
         header: MBAPHeader = self.decode_header(frame[:HEADER_LENGTH])
         self.validator.validate(frame, header)
 
@@ -93,7 +98,9 @@ class FrameDecoder:
         raw_payload = self.payload_cipher.decrypt(encrypted_payload, self.decryption_key)
 
         try:
-            decoder: MessageDecoder = self.decoder_registry.get_decoder(header.function_code)
+            decoder: MessageDecoder = self.decoder_registry.get_decoder_by_byte(
+                frame[FUNCTION_CODE_OFFSET]
+            )
         except KeyError as e:
             message = f"Decoder not found for function code {header.function_code.name} ({header.function_code.value:#02x})"
             logger.error(message)
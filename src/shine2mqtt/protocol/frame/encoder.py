@@ -5,6 +5,7 @@ from shine2mqtt.protocol.frame.crc.constants import CRC16_LENGTH
 from shine2mqtt.protocol.frame.crc.encoder import CRCEncoder
 from shine2mqtt.protocol.frame.header.encoder import HeaderEncoder
 from shine2mqtt.protocol.frame.header.header import MBAPHeader
+from shine2mqtt.protocol.frame.template import FrameTemplate
 from shine2mqtt.protocol.messages.encoder.registry import PayloadEncoderRegistry
 from shine2mqtt.protocol.messages.message import BaseMessage
 
@@ -56,8 +57,18 @@ class FrameEncoder:
 
         encrypted_payload = self.payload_cipher.encrypt(payload, self.encryption_key)
 
-        crc = self.crc_calculator.calculate_crc16(raw_header + encrypted_payload)
+        crc = self.crc_calculator.calculate_crc16(raw_header, encrypted_payload)
 
         frame = raw_header + encrypted_payload + self.crc_encoder.encode(crc)
 
         return frame
+
+    def encode_template(self, header: MBAPHeader, payload: bytes) -> FrameTemplate:
+        """Encode a frame once to send it many times with a few fields patched."""
+        raw_header = self.header_encoder.encode(header)
+        encrypted_payload = self.payload_cipher.encrypt(payload, self.encryption_key)
+        key_stream = self.payload_cipher.key_stream(self.encryption_key, len(payload))
+
+        return FrameTemplate(
+            raw_header + encrypted_payload, key_stream, self.crc_calculator, self.crc_encoder
+        )
@@ -1,14 +1,21 @@
-from shine2mqtt.protocol.frame.header.header import FunctionCode, MBAPHeader
+import struct
+
+from shine2mqtt.protocol.frame.header.header import FUNCTION_CODE_BY_BYTE, MBAPHeader
 from shine2mqtt.protocol.messages.decoder.decoder import ByteDecoder
 
+# transaction id, protocol id, length, unit id, function code
+_HEADER_STRUCT = struct.Struct(">HHHBB")
+
 
 class HeaderDecoder(ByteDecoder):
-    def decode(self, frame: bytes) -> MBAPHeader:
-        transaction_id = self.decode_u16(frame, 0)
-        protocol_id = self.decode_u16(frame, 2)
-        length = self.decode_u16(frame, 4)
-        unit_id = self.decode_u8(frame, 6)
-        function_code = FunctionCode(self.decode_u8(frame, 7))
+    def decode(self, frame: bytes | memoryview) -> MBAPHeader:
+        transaction_id, protocol_id, length, unit_id, raw_function_code = (
+            _HEADER_STRUCT.unpack_from(frame)
+        )
+
+        function_code = FUNCTION_CODE_BY_BYTE[raw_function_code]
+        if function_code is None:
+            raise ValueError(f"{raw_function_code} is not a valid FunctionCode")
 
         return MBAPHeader(
             transaction_id=transaction_id,
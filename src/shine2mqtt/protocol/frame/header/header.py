@@ -38,7 +38,13 @@ class FunctionCode(Enum):
     X50_80 = 0x50  # (80)
 
 
-@dataclass
+# Indexed by the raw function code byte, avoids the Enum lookup (and its aliases) per frame
+FUNCTION_CODE_BY_BYTE: tuple[FunctionCode | None, ...] = tuple(
+    FunctionCode._value2member_map_.get(value) for value in range(256)
+)
+
+
+@dataclass(slots=True)
 class MBAPHeader:
     transaction_id: int
     protocol_id: int
@@ -0,0 +1,116 @@
+import asyncio
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+
+from shine2mqtt.protocol.frame.decoder import DecodingError, FrameDecoder
+from shine2mqtt.protocol.messages.message import BaseMessage
+
+type DecodeResult = BaseMessage | DecodingError
+
+
+class DecodeExecutor(StrEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass
+class FrameDecodePoolConfig:
+    # Decode frames off the event loop, disabled when not set
+    executor: DecodeExecutor | None = None
+    workers: int = 2
+    # Frames of at least this many bytes are decoded in the pool
+    min_frame_size: int = 1024
+    # Decode in the pool when at least this many bytes are buffered behind a frame
+    min_backlog_size: int = 4096
+    # Maximum number of buffered frames decoded together
+    max_batch_size: int = 64
+
+
+# Decoder of a pool worker process, created once by the process initializer
+_process_decoder: FrameDecoder | None = None
+
+
+def _init_process_decoder(decoder_factory: Callable[[], FrameDecoder]) -> None:
+    global _process_decoder
+    _process_decoder = decoder_factory()
+
+
+def _decode_in_process(frames: Sequence[bytes]) -> list[DecodeResult]:
+    assert _process_decoder is not None, "Decode worker process is not initialized"
+    return _decode_all(_process_decoder, frames)
+
+
+def _decode_all(decoder: FrameDecoder, frames: Sequence[bytes]) -> list[DecodeResult]:
+    results: list[DecodeResult] = []
+    for frame in frames:
+        try:
+            results.append(decoder.decode(frame))
+        except Exception as e:
+            # Only plain decoding errors are passed back, any exception has to survive pickling
+            results.append(DecodingError(str(e)))
+    return results
+
+
+class FrameDecodePool:
+    """Decodes frames in a thread or process pool to keep the event loop responsive.
+
+    A process pool builds its own decoder in every worker with ``decoder_factory``, hooks of
+    the given decoder (e.g. frame capturing) only run with a thread pool.
+    """
+
+    def __init__(
+        self,
+        decoder: FrameDecoder,
+        config: FrameDecodePoolConfig,
+        decoder_factory: Callable[[], FrameDecoder] | None = None,
+    ):
+        if config.executor is None:
+            raise ValueError("Decode pool requires an executor")
+
+        self._decoder = decoder
+        self._config = config
+        self._executor = self._create_executor(config, decoder_factory)
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._config.max_batch_size
+
+    def should_offload(self, frame_size: int, backlog_size: int) -> bool:
+        return (
+            frame_size >= self._config.min_frame_size
+            or backlog_size >= self._config.min_backlog_size
+        )
+
+    async def decode(self, frame: bytes) -> BaseMessage:
+        [result] = await self.decode_batch([frame])
+        if isinstance(result, DecodingError):
+            raise result
+        return result
+
+    async def decode_batch(self, frames: Sequence[bytes]) -> list[DecodeResult]:
+        """Decode frames in order, a frame that fails to decode yields a ``DecodingError``."""
+        loop = asyncio.get_running_loop()
+        if isinstance(self._executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(self._executor, _decode_in_process, frames)
+        return await loop.run_in_executor(self._executor, _decode_all, self._decoder, frames)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _create_executor(
+        self,
+        config: FrameDecodePoolConfig,
+        decoder_factory: Callable[[], FrameDecoder] | None,
+    ) -> Executor:
+        if config.executor is DecodeExecutor.THREAD:
+            return ThreadPoolExecutor(max_workers=config.workers, thread_name_prefix="decode")
+
+        if decoder_factory is None:
+            raise ValueError("Process decode pool requires a decoder factory")
+        return ProcessPoolExecutor(
+            max_workers=config.workers,
+            initializer=_init_process_decoder,
+            initargs=(decoder_factory,),
+        )
@@ -0,0 +1,49 @@
+import struct
+
+from shine2mqtt.protocol.frame.constants import HEADER_LENGTH
+from shine2mqtt.protocol.frame.crc.calculator import CRCCalculator
+from shine2mqtt.protocol.frame.crc.encoder import CRCEncoder
+
+type Buffer = bytes | bytearray | memoryview
+
+_TRANSACTION_ID = struct.Struct(">H")
+
+
+class FrameTemplate:
+    """An encoded frame of which the transaction id and payload fields are patched per send.
+
+    The payload cipher XORs every byte with the key byte at the same position, so a patched
+    field is encrypted on its own and the rest of the frame is only encoded once. Only the CRC
+    is calculated over the whole frame again.
+    """
+
+    def __init__(
+        self,
+        frame: Buffer,
+        key_stream: Buffer,
+        crc_calculator: CRCCalculator,
+        crc_encoder: CRCEncoder,
+    ):
+        # Header and encrypted payload, without CRC
+        self._frame = bytearray(frame)
+        self._key_stream = bytes(key_stream)
+        self._crc_calculator = crc_calculator
+        self._crc_encoder = crc_encoder
+
+    def set_transaction_id(self, transaction_id: int) -> None:
+        _TRANSACTION_ID.pack_into(self._frame, 0, transaction_id)
+
+    def set_payload(self, offset: int, value: Buffer) -> None:
+        """Encrypt the plain value into the payload at offset."""
+        length = len(value)
+        if offset < 0 or offset + length > len(self._key_stream):
+            raise ValueError(f"{length} bytes at offset {offset} do not fit the payload")
+
+        key = self._key_stream[offset : offset + length]
+        encrypted = int.from_bytes(value) ^ int.from_bytes(key)
+        start = HEADER_LENGTH + offset
+        self._frame[start : start + length] = encrypted.to_bytes(length)
+
+    def render(self) -> bytes:
+        crc = self._crc_calculator.calculate_crc16(self._frame)
+        return bytes(self._frame) + self._crc_encoder.encode(crc)
@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from shine2mqtt.protocol.messages.message import BaseMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class GrowattAckMessage(BaseMessage):
     ack: bool
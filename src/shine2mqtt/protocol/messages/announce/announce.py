@@ -4,7 +4,7 @@ from datetime import datetime
 from shine2mqtt.protocol.messages.message import DataloggerMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyFunction:
     spi: bool
     auto_test_start: bool
@@ -20,7 +20,7 @@ class SafetyFunction:
 
 # Datalogger messages ######################################################################
 # requests
-@dataclass
+@dataclass(slots=True)
 class GrowattAnnounceMessage(DataloggerMessage):
     # message header fields
     inverter_serial: str
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from shine2mqtt.protocol.frame.header.header import MBAPHeader
 from shine2mqtt.protocol.messages.announce.announce import GrowattAnnounceMessage, SafetyFunction
+from shine2mqtt.protocol.messages.announce.layout import ANNOUNCE_LAYOUT
 from shine2mqtt.protocol.messages.decoder.decoder import MessageDecoder
 
 POWER_FACTOR_MODES = {
@@ -30,41 +31,41 @@ LCD_LANGUAGE_MAP = {
 @dataclass
 class AnnounceRequestDecoder(MessageDecoder[GrowattAnnounceMessage]):
     def decode(self, header: MBAPHeader, payload: bytes) -> GrowattAnnounceMessage:
+        # See protocol/messages/announce/layout.py for the register offsets and scales
+        fields = ANNOUNCE_LAYOUT.unpack(payload)
+
         return GrowattAnnounceMessage(
             header=header,
-            # Message header block #####################################################
-            # first 70 bytes
-            datalogger_serial=self.decode_str(payload, 0, 10),
-            # 10-30 is \x00
-            inverter_serial=self.decode_str(payload, 30, 10),
-            # 40-60 is \x00
-            timestamp=self._decode_datetime(payload, offset=60, fmt="B"),
-            # 67-70 is \x00
-            # Holding registers (read/write) ###########################################
-            # See 4.1 Holding Registers in Protocol document v1.20 (page 9)
-            # Offset of 71 in the payload, every register is 2 bytes
-            remote_on_off=self.decode_bool(payload, 71),
-            safety_function=self._decode_safety_function(payload, 73),
-            power_factor_memory=self.decode_bool(payload, 75),
-            active_power_ac_max=self.decode_u16(payload, 77),
-            reactive_power_ac_max=self.decode_u16(payload, 79),
-            power_factor=self._decode_u16_scaled(payload, 81, 0.0001),
-            rated_power_ac=self._decode_u32_scaled(payload, 83, 0.1),
-            rated_voltage_dc=self._decode_u16_scaled(payload, 87, 0.1),
-            inverter_fw_version=self._decode_inverter_fw_version(payload, 89),
-            inverter_control_fw_version=self._decode_inverter_control_fw_version(payload, 95),
-            lcd_language=self._decode_lcd_language(payload, 101),
-            device_type=self.decode_str(payload, 139, 16).rstrip("\x00"),
-            system_time=self._decode_datetime(payload, offset=161, fmt="H"),
-            voltage_ac_low_limit=self._decode_u16_scaled(payload, 175, 0.1),
-            voltage_ac_high_limit=self._decode_u16_scaled(payload, 177, 0.1),
-            frequency_ac_low_limit=self._decode_u16_scaled(payload, 179, 0.01),
-            frequency_ac_high_limit=self._decode_u16_scaled(payload, 181, 0.01),
-            power_factor_control_mode=self._decode_power_factor_control_mode(payload, 249),
+            datalogger_serial=fields["datalogger_serial"],
+            inverter_serial=fields["inverter_serial"],
+            timestamp=self._pop_datetime(fields, "timestamp", year_offset=2000),
+            remote_on_off=fields["remote_on_off"] == 1,
+            safety_function=self._to_safety_function(fields["safety_function"]),
+            power_factor_memory=fields["power_factor_memory"] == 1,
+            active_power_ac_max=fields["active_power_ac_max"],
+            reactive_power_ac_max=fields["reactive_power_ac_max"],
+            power_factor=fields["power_factor"],
+            rated_power_ac=fields["rated_power_ac"],
+            rated_voltage_dc=fields["rated_voltage_dc"],
+            inverter_fw_version=fields["inverter_fw_version"].rstrip("\x00"),
+            inverter_control_fw_version=(
+                f"{fields['inverter_control_fw_version_high']}"
+                f"{fields['inverter_control_fw_version_mid']}"
+                f".{fields['inverter_control_fw_version_low']}"
+            ),
+            lcd_language=LCD_LANGUAGE_MAP.get(fields["lcd_language"], "Unknown"),
+            device_type=fields["device_type"].rstrip("\x00"),
+            system_time=self._pop_datetime(fields, "system_time"),
+            voltage_ac_low_limit=fields["voltage_ac_low_limit"],
+            voltage_ac_high_limit=fields["voltage_ac_high_limit"],
+            frequency_ac_low_limit=fields["frequency_ac_low_limit"],
+            frequency_ac_high_limit=fields["frequency_ac_high_limit"],
+            power_factor_control_mode=POWER_FACTOR_MODES.get(
+                fields["power_factor_control_mode"], "Unknown"
+            ),
         )
 
-    def _decode_safety_function(self, payload: bytes, offset: int) -> SafetyFunction:
-        value = self.decode_u16(payload, offset)
+    def _to_safety_function(self, value: int) -> SafetyFunction:
         return SafetyFunction(
             spi=self.get_bit(value, 0),
             auto_test_start=self.get_bit(value, 1),
@@ -77,22 +78,3 @@ class AnnounceRequestDecoder(MessageDecoder[GrowattAnnounceMessage]):
             rate_of_change_of_frequency_protection=self.get_bit(value, 8),
             frequency_derating_recovery=self.get_bit(value, 9),
         )
-
-    def _decode_power_factor_control_mode(self, payload: bytes, offset: int) -> str:
-        value = self.decode_u16(payload, offset)
-
-        return POWER_FACTOR_MODES.get(value, "Unknown")
-
-    def _decode_inverter_fw_version(self, payload: bytes, offset: int) -> str:
-        return self.decode_str(payload, offset, 6).rstrip("\x00")
-
-    def _decode_inverter_control_fw_version(self, payload: bytes, offset: int) -> str:
-        high = self.decode_str(payload, offset, 2)
-        mid = self.decode_str(payload, offset + 2, 2)
-        low = self.decode_u16(payload, offset + 4)
-        return f"{high}{mid}.{low}"
-
-    def _decode_lcd_language(self, payload: bytes, offset: int) -> str:
-        lang_code = self.decode_u16(payload, offset)
-
-        return LCD_LANGUAGE_MAP.get(lang_code, "Unknown")
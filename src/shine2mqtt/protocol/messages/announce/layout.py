@@ -0,0 +1,38 @@
+from shine2mqtt.protocol.codec.layout import RegisterField, RegisterLayout, datetime_fields
+
+ANNOUNCE_LAYOUT = RegisterLayout(
+    [
+        # Message header block #####################################################
+        # first 70 bytes
+        RegisterField("datalogger_serial", 0, "10s"),
+        # 10-30 is \x00
+        RegisterField("inverter_serial", 30, "10s"),
+        # 40-60 is \x00
+        *datetime_fields("timestamp", 60, "B"),
+        # 67-70 is \x00
+        # Holding registers (read/write) ###########################################
+        # See 4.1 Holding Registers in Protocol document v1.20 (page 9)
+        # Offset of 71 in the payload, every register is 2 bytes
+        RegisterField("remote_on_off", 71, "B"),
+        RegisterField("safety_function", 73, "H"),
+        RegisterField("power_factor_memory", 75, "B"),
+        RegisterField("active_power_ac_max", 77, "H"),
+        RegisterField("reactive_power_ac_max", 79, "H"),
+        RegisterField("power_factor", 81, "H", 0.0001),
+        RegisterField("rated_power_ac", 83, "I", 0.1),
+        RegisterField("rated_voltage_dc", 87, "H", 0.1),
+        RegisterField("inverter_fw_version", 89, "6s"),
+        # Control firmware version "ZAAA.8" is stored as "ZA", "AA", 8
+        RegisterField("inverter_control_fw_version_high", 95, "2s"),
+        RegisterField("inverter_control_fw_version_mid", 97, "2s"),
+        RegisterField("inverter_control_fw_version_low", 99, "H"),
+        RegisterField("lcd_language", 101, "H"),
+        RegisterField("device_type", 139, "16s"),
+        *datetime_fields("system_time", 161, "H"),
+        RegisterField("voltage_ac_low_limit", 175, "H", 0.1),
+        RegisterField("voltage_ac_high_limit", 177, "H", 0.1),
+        RegisterField("frequency_ac_low_limit", 179, "H", 0.01),
+        RegisterField("frequency_ac_high_limit", 181, "H", 0.01),
+        RegisterField("power_factor_control_mode", 249, "H"),
+    ]
+)
@@ -13,7 +13,7 @@ class InverterStatus(Enum):
 
 # Datalogger messages ######################################################################
 # requests
-@dataclass
+@dataclass(slots=True)
 class GrowattDataMessage(DataloggerMessage):
     inverter_serial: str
     #
@@ -57,6 +57,6 @@ class GrowattDataMessage(DataloggerMessage):
     temperature: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GrowattBufferedDataMessage(GrowattDataMessage):
     pass
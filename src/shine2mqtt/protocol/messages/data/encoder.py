@@ -1,80 +1,34 @@
+from shine2mqtt.protocol.codec.layout import datetime_values
 from shine2mqtt.protocol.messages.data.data import (
     GrowattBufferedDataMessage,
     GrowattDataMessage,
 )
+from shine2mqtt.protocol.messages.data.layout import DATA_LAYOUT
 from shine2mqtt.protocol.messages.encoder.encoder import PayloadEncoder
 
+# Layout fields that map one-to-one onto a message attribute
+_MESSAGE_FIELDS = tuple(
+    name
+    for name in DATA_LAYOUT.names
+    if not name.startswith("timestamp_") and name not in ("inverter_status", "total_run_time")
+)
 
-class DataPayloadEncoder(PayloadEncoder[GrowattDataMessage]):
-    DATA_MESSAGE_PAYLOAD_SIZE = 575
 
+class DataPayloadEncoder(PayloadEncoder[GrowattDataMessage]):
     def __init__(self):
         super().__init__(GrowattDataMessage)
 
     def encode(self, message: GrowattDataMessage) -> bytes:
-        payload = bytearray(self.DATA_MESSAGE_PAYLOAD_SIZE)
-
-        # Datalogger serial (0-10)
-        payload[0:10] = self.encode_str(message.datalogger_serial, 10)
-        # 10-30 is \x00 (padding)
-        # Inverter serial (30-40)
-        payload[30:40] = self.encode_str(message.inverter_serial, 10)
-        # 40-60 is \x00 (padding)
-        payload[60:67] = self.encode_datetime(message.timestamp, fmt="B")
-        # Input registers (read) ###################################################
-        # See 4.2 Input Reg -> Protocol document v1.20 (page 33)
-        # See 4.2 Input Reg -> Protocol document v1.20 (page 48 for TL-X and TL-XH)
-        # Offset of 71 in the payload, every register is 2 bytes
-        # 0 Inverter Status
-        payload[71:73] = self.encode_u16(message.inverter_status.value)
-
-        # DC Power (73-77)
-        payload[73:77] = self.encode_u32(int(message.power_dc * 10))
-
-        # DC 1 (77-85)
-        payload[77:79] = self.encode_u16(int(message.voltage_dc_1 * 10))
-        payload[79:81] = self.encode_u16(int(message.current_dc_1 * 10))
-        payload[81:85] = self.encode_u32(int(message.power_dc_1 * 10))
-
-        # DC 2 (85-93)
-        payload[85:87] = self.encode_u16(int(message.voltage_dc_2 * 10))
-        payload[87:89] = self.encode_u16(int(message.current_dc_2 * 10))
-        payload[89:93] = self.encode_u32(int(message.power_dc_2 * 10))
-
-        # AC Power and frequency (117-123)
-        payload[117:121] = self.encode_u32(int(message.power_ac * 10))
-        payload[121:123] = self.encode_u16(int(message.frequency_ac * 100))
-
-        # AC 1 (123-131)
-        payload[123:125] = self.encode_u16(int(message.voltage_ac_1 * 10))
-        payload[125:127] = self.encode_u16(int(message.current_ac_1 * 10))
-        payload[127:131] = self.encode_u32(int(message.power_ac_1 * 10))
-
-        # AC line voltages (147-153)
-        payload[147:149] = self.encode_u16(int(message.voltage_ac_l1_l2 * 10))
-        payload[149:151] = self.encode_u16(int(message.voltage_ac_l2_l3 * 10))
-        payload[151:153] = self.encode_u16(int(message.voltage_ac_l3_l1 * 10))
-
-        payload[165:169] = self._encode_total_run_time(message.total_run_time)
-
-        # Energy AC (169-178)
-        payload[169:173] = self.encode_u32(int(message.energy_ac_today * 10))
-        payload[173:177] = self.encode_u32(int(message.energy_ac_total * 10))
-
-        # Energy DC (177-194)
-        payload[177:181] = self.encode_u32(int(message.energy_dc_total * 10))
-        payload[181:185] = self.encode_u32(int(message.energy_dc_1_today * 10))
-        payload[185:189] = self.encode_u32(int(message.energy_dc_1_total * 10))
-        payload[189:193] = self.encode_u32(int(message.energy_dc_2_today * 10))
-        payload[193:197] = self.encode_u32(int(message.energy_dc_2_total * 10))
-
-        payload[257:259] = self.encode_u16(int(message.temperature * 10))
+        # See protocol/messages/data/layout.py for the register offsets and scales
+        values = {name: getattr(message, name) for name in _MESSAGE_FIELDS}
+        values.update(datetime_values("timestamp", message.timestamp, year_offset=2000))
+        values["inverter_status"] = message.inverter_status.value
+        values["total_run_time"] = self._to_total_run_time_seconds(message.total_run_time)
 
-        return bytes(payload)
+        return DATA_LAYOUT.pack(values)
 
-    def _encode_total_run_time(self, total_run_time: int) -> bytes:
-        total_run_time_seconds = total_run_time * 3600
-        return self.encode_u32(total_run_time_seconds)
+    def _to_total_run_time_seconds(self, total_run_time: int) -> int:
+        return total_run_time * 3600
 
 
 class BufferedDataPayloadEncoder(DataPayloadEncoder):
@@ -0,0 +1,62 @@
+from shine2mqtt.protocol.codec.layout import RegisterField, RegisterLayout, datetime_fields
+
+DATA_MESSAGE_PAYLOAD_SIZE = 575
+
+DATA_LAYOUT = RegisterLayout(
+    [
+        # Message header block #####################################################
+        RegisterField("datalogger_serial", 0, "10s"),
+        # 10-30 is \x00 (padding)
+        RegisterField("inverter_serial", 30, "10s"),
+        # 40-60 is \x00 (padding)
+        *datetime_fields("timestamp", 60, "B"),
+        # Input registers (read) ###################################################
+        # See 4.2 Input Reg -> Protocol document v1.20 (page 33)
+        # See 4.2 Input Reg -> Protocol document v1.20 (page 48 for TL-X and TL-XH)
+        # Offset of 71 in the payload, every register is 2 bytes
+        # 0 Inverter Status
+        RegisterField("inverter_status", 71, "H"),
+        # DC
+        RegisterField("power_dc", 73, "I", 0.1),
+        # DC 1
+        RegisterField("voltage_dc_1", 77, "H", 0.1),
+        RegisterField("current_dc_1", 79, "H", 0.1),
+        RegisterField("power_dc_1", 81, "I", 0.1),
+        # DC 2
+        RegisterField("voltage_dc_2", 85, "H", 0.1),
+        RegisterField("current_dc_2", 87, "H", 0.1),
+        RegisterField("power_dc_2", 89, "I", 0.1),
+        # AC
+        RegisterField("power_ac", 117, "I", 0.1),
+        RegisterField("frequency_ac", 121, "H", 0.01),
+        # AC 1
+        RegisterField("voltage_ac_1", 123, "H", 0.1),
+        RegisterField("current_ac_1", 125, "H", 0.1),
+        RegisterField("power_ac_1", 127, "I", 0.1),
+        # AC line
+        RegisterField("voltage_ac_l1_l2", 147, "H", 0.1),
+        RegisterField("voltage_ac_l2_l3", 149, "H", 0.1),
+        RegisterField("voltage_ac_l3_l1", 151, "H", 0.1),
+        # Seconds, exposed as hours on the message
+        RegisterField("total_run_time", 165, "I"),
+        # Energy AC
+        RegisterField("energy_ac_today", 169, "I", 0.1),
+        RegisterField("energy_ac_total", 173, "I", 0.1),
+        # Energy DC
+        RegisterField("energy_dc_total", 177, "I", 0.1),
+        # Energy DC 1
+        RegisterField("energy_dc_1_today", 181, "I", 0.1),
+        RegisterField("energy_dc_1_total", 185, "I", 0.1),
+        # Energy DC 2
+        RegisterField("energy_dc_2_today", 189, "I", 0.1),
+        RegisterField("energy_dc_2_total", 193, "I", 0.1),
+        # Energy DC 3
+        # RegisterField("energy_dc_3_today", 197, "I", 0.1),
+        # RegisterField("energy_dc_3_total", 201, "I", 0.1),
+        # Temperatures
+        RegisterField("temperature", 257, "H", 0.1),
+        # RegisterField("temperature_ipm", 259, "H", 0.1),
+        # RegisterField("temperature_boost", 261, "H", 0.1),
+    ],
+    size=DATA_MESSAGE_PAYLOAD_SIZE,
+)
@@ -1,8 +1,9 @@
-import struct
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Any
 
 from shine2mqtt.protocol.codec.byte import ByteDecoder
+from shine2mqtt.protocol.codec.layout import DATETIME_PARTS
 from shine2mqtt.protocol.frame.header.header import MBAPHeader
 from shine2mqtt.protocol.messages.message import BaseMessage
 from shine2mqtt.util.logger import logger
@@ -11,35 +12,19 @@ from shine2mqtt.util.logger import logger
 class MessageDecoder[T: BaseMessage](ABC, ByteDecoder):
     DEFAULT_DATETIME = datetime(2000, 1, 1, 0, 0, 0)
 
-    FLOAT_DIGITS = 6
-
     @abstractmethod
     def decode(self, header: MBAPHeader, payload: bytes) -> T:
         pass
 
-    def _decode_u8_scaled(self, frame: bytes, offset: int, scale: float) -> float:
-        value = self.decode_u8(frame, offset)
-        return round(value * scale, self.FLOAT_DIGITS)
-
-    def _decode_u16_scaled(self, frame: bytes, offset: int, scale: float) -> float:
-        value = self.decode_u16(frame, offset)
-        return round(value * scale, self.FLOAT_DIGITS)
-
-    def _decode_u32_scaled(self, frame: bytes, offset: int, scale: float) -> float:
-        value = self.decode_u32(frame, offset)
-        return round(value * scale, self.FLOAT_DIGITS)
-
-    def _decode_datetime(self, frame: bytes, offset: int, fmt: str) -> datetime:
-        step = 2 if fmt == "H" else 1
-        year_offset = 0 if fmt == "H" else 2000
-
-        year = struct.unpack_from(f">{fmt}", frame, offset + 0)[0] + year_offset
-        month = struct.unpack_from(f">{fmt}", frame, offset + 1 * step)[0]
-        day = struct.unpack_from(f">{fmt}", frame, offset + 2 * step)[0]
-        hour = struct.unpack_from(f">{fmt}", frame, offset + 3 * step)[0]
-        minute = struct.unpack_from(f">{fmt}", frame, offset + 4 * step)[0]
-        second = struct.unpack_from(f">{fmt}", frame, offset + 5 * step)[0]
+    def _pop_datetime(self, fields: dict[str, Any], name: str, year_offset: int = 0) -> datetime:
+        """Remove the datetime part fields of a register layout and combine them."""
+        parts = [fields.pop(f"{name}_{part}") for part in DATETIME_PARTS]
+        year, month, day, hour, minute, second, _weekday = parts
+        return self._to_datetime(year + year_offset, month, day, hour, minute, second)
 
+    def _to_datetime(
+        self, year: int, month: int, day: int, hour: int, minute: int, second: int
+    ) -> datetime:
         try:
             return datetime(
                 year=year, month=month, day=day, hour=hour, minute=minute, second=second
@@ -25,16 +25,20 @@ from shine2mqtt.util.logger import logger
 
 class DecoderRegistry:
     def __init__(self):
-        self._decoders = {}
+        # Indexed by the raw function code byte
+        self._decoders: list[MessageDecoder | None] = [None] * 256
 
     def register_decoder(self, function_code: FunctionCode, decoder: MessageDecoder):
-        self._decoders[function_code] = decoder
+        self._decoders[function_code.value] = decoder
 
     def get_decoder(self, function_code: FunctionCode) -> MessageDecoder:
-        decoder = self._decoders.get(function_code, None)
+        return self.get_decoder_by_byte(function_code.value)
+
+    def get_decoder_by_byte(self, raw_function_code: int) -> MessageDecoder:
+        decoder = self._decoders[raw_function_code]
 
         if decoder is None:
-            message = f"No decoder registered for this function code {function_code.name} ({function_code.value:#02x})"
+            message = f"No decoder registered for this function code {raw_function_code:#02x}"
             logger.error(message)
             raise KeyError(message)
 
@@ -6,7 +6,7 @@ from shine2mqtt.protocol.messages.message import DataloggerMessage
 
 
 # responses
-@dataclass
+@dataclass(slots=True)
 class GrowattGetConfigResponseMessage(DataloggerMessage):
     register: int
     data: bytes
@@ -19,7 +19,7 @@ class GrowattGetConfigResponseMessage(DataloggerMessage):
 
 
 # request
-@dataclass
+@dataclass(slots=True)
 class GrowattGetConfigRequestMessage(DataloggerMessage):
     register_start: int
     register_end: int
@@ -3,11 +3,11 @@ from dataclasses import dataclass
 from shine2mqtt.protocol.frame.header.header import MBAPHeader
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseMessage:
     header: MBAPHeader
 
 
-@dataclass
+@dataclass(slots=True)
 class DataloggerMessage(BaseMessage):
     datalogger_serial: str
@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from shine2mqtt.protocol.messages.message import DataloggerMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class GrowattPingMessage(DataloggerMessage):
     pass
@@ -5,7 +5,7 @@ from shine2mqtt.protocol.messages.message import DataloggerMessage
 
 # Server messages ######################################################################
 # request
-@dataclass
+@dataclass(slots=True)
 class GrowattReadMultipleRegistersRequestMessage(DataloggerMessage):
     register_start: int
     register_end: int
@@ -13,7 +13,7 @@ class GrowattReadMultipleRegistersRequestMessage(DataloggerMessage):
 
 # Datalogger messages ######################################################################
 # response
-@dataclass
+@dataclass(slots=True)
 class GrowattReadMultipleRegisterResponseMessage(DataloggerMessage):
     register_start: int
     register_end: int
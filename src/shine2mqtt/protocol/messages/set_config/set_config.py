@@ -6,7 +6,7 @@ from shine2mqtt.protocol.messages.message import DataloggerMessage
 # Server messages ######################################################################
 # responses
 # request
-@dataclass
+@dataclass(slots=True)
 class GrowattSetConfigRequestMessage(DataloggerMessage):
     register: int
     value: str
@@ -14,7 +14,7 @@ class GrowattSetConfigRequestMessage(DataloggerMessage):
 
 # Datalogger messages ##################################################################
 # responses
-@dataclass
+@dataclass(slots=True)
 class GrowattSetConfigResponseMessage(DataloggerMessage):
     register: int
     ack: bool
@@ -6,13 +6,13 @@ from shine2mqtt.protocol.messages.message import DataloggerMessage
 # Server messages ######################################################################
 # responses
 # request
-@dataclass
+@dataclass(slots=True)
 class GrowattWriteSingleRegisterRequestMessage(DataloggerMessage):
     register: int
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GrowattWriteMultipleRegistersRequestMessage(DataloggerMessage):
     register_start: int
     register_end: int
@@ -21,14 +21,14 @@ class GrowattWriteMultipleRegistersRequestMessage(DataloggerMessage):
 
 # Datalogger messages ##################################################################
 # responses
-@dataclass
+@dataclass(slots=True)
 class GrowattWriteSingleRegisterResponseMessage(DataloggerMessage):
     register: int
     ack: bool
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GrowattWriteMultipleRegistersResponseMessage(DataloggerMessage):
     register_start: int
     register_end: int
@@ -0,0 +1,49 @@
+from shine2mqtt.domain.models.inverter import InverterReading
+from shine2mqtt.util.clock import ClockService, MonotonicClockService
+
+
+class BufferedDataBacklog:
+    """Collects the readings a datalogger replays from its buffer, e.g. after an outage.
+
+    Readings are handed out in batches, so hours of buffered data become a few history events
+    instead of one state update per reading. A drain lasts from the first buffered reading until
+    ``finish`` is called, which the session does on the first live data message.
+    """
+
+    def __init__(self, batch_size: int, clock: ClockService | None = None):
+        self._batch_size = batch_size
+        self._clock = clock or MonotonicClockService()
+        self._batch: list[InverterReading] = []
+
+        self._readings = 0
+        self._started_at: float | None = None
+        self._last_reading_at = 0.0
+
+    @property
+    def draining(self) -> bool:
+        return self._started_at is not None
+
+    def add(self, reading: InverterReading) -> bool:
+        """Add a reading, returns whether the current batch is full."""
+        now = self._clock.now()
+        if self._started_at is None:
+            self._started_at = now
+        self._last_reading_at = now
+
+        self._readings += 1
+        self._batch.append(reading)
+        return len(self._batch) >= self._batch_size
+
+    def take_batch(self) -> list[InverterReading]:
+        batch, self._batch = self._batch, []
+        return batch
+
+    def finish(self) -> tuple[int, float] | None:
+        """End the drain, returns the number of readings and the seconds they took to arrive."""
+        if self._started_at is None:
+            return None
+
+        drained = (self._readings, self._last_reading_at - self._started_at)
+        self._readings = 0
+        self._started_at = None
+        return drained
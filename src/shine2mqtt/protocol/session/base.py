@@ -1,25 +1,87 @@
+from collections import deque
+
 from shine2mqtt.infrastructure.server.session import TCPSession
 from shine2mqtt.protocol.frame.constants import HEADER_LENGTH
-from shine2mqtt.protocol.frame.decoder import FrameDecoder
+from shine2mqtt.protocol.frame.decoder import DecodingError, FrameDecoder
 from shine2mqtt.protocol.frame.encoder import FrameEncoder
+from shine2mqtt.protocol.frame.pool import DecodeResult, FrameDecodePool
 from shine2mqtt.protocol.messages.message import BaseMessage, DataloggerMessage
 from shine2mqtt.util.logger import logger
 
 
 class BaseProtocolSession:
-    def __init__(self, transport: TCPSession, encoder: FrameEncoder, decoder: FrameDecoder):
+    def __init__(
+        self,
+        transport: TCPSession,
+        encoder: FrameEncoder,
+        decoder: FrameDecoder,
+        decode_pool: FrameDecodePool | None = None,
+    ):
         self.transport = transport
         self.encoder = encoder
         self.decoder = decoder
+        self.decode_pool = decode_pool
+        # Messages decoded in a batch by the decode pool, waiting to be read
+        self._decoded: deque[tuple[bytes, DecodeResult]] = deque()
 
     async def _read_message(self) -> BaseMessage | None:
+        if self._decoded:
+            frame, result = self._decoded.popleft()
+            return self._handle_decode_result(frame, result)
+
         frame = await self._read_frame()
+
+        if self.decode_pool is not None and self.decode_pool.should_offload(
+            len(frame), self.transport.buffered_size
+        ):
+            await self._decode_batch(bytes(frame))
+            frame, result = self._decoded.popleft()
+            return self._handle_decode_result(frame, result)
+
         try:
             message = self.decoder.decode(frame)
         except Exception as e:
-            logger.error(f"Failed to decode incoming frame {frame}: {e}")
+            logger.error(f"Failed to decode incoming frame {bytes(frame)}: {e}")
             return None
 
+        self._log_received(message)
+        return message
+
+    async def _decode_batch(self, first_frame: bytes) -> None:
+        """Decode the frame together with the complete frames already buffered behind it."""
+        assert self.decode_pool is not None
+
+        frames = [first_frame]
+        while len(frames) < self.decode_pool.max_batch_size:
+            frame = await self._read_buffered_frame()
+            if frame is None:
+                break
+            frames.append(frame)
+
+        results = await self.decode_pool.decode_batch(frames)
+        self._decoded.extend(zip(frames, results, strict=True))
+
+    async def _read_buffered_frame(self) -> bytes | None:
+        buffered_size = self.transport.buffered_size
+        if buffered_size < HEADER_LENGTH:
+            return None
+
+        raw_header = await self.transport.peek(HEADER_LENGTH)
+        frame_length = HEADER_LENGTH + FrameDecoder.extract_payload_length(raw_header)
+        if buffered_size < frame_length:
+            return None
+
+        return bytes(await self.transport.read(frame_length))
+
+    def _handle_decode_result(self, frame: bytes, result: DecodeResult) -> BaseMessage | None:
+        if isinstance(result, DecodingError):
+            logger.error(f"Failed to decode incoming frame {frame}: {result}")
+            return None
+
+        self._log_received(result)
+        return result
+
+    def _log_received(self, message: BaseMessage) -> None:
         if isinstance(message, DataloggerMessage):
             transaction_id = message.header.transaction_id
             datalogger_serial = message.datalogger_serial
@@ -27,16 +89,19 @@ class BaseProtocolSession:
                 f"✓ Receive {message.header.function_code.name} ({message.header.function_code.value:#02x}) message, {transaction_id=}, {datalogger_serial=}"
             )
 
-        return message
+    def _hand_over_decoded(self, session: BaseProtocolSession) -> None:
+        """Pass messages decoded ahead of time on to the session that continues reading."""
+        session._decoded.extend(self._decoded)
+        self._decoded.clear()
 
-    async def _read_frame(self) -> bytes:
-        raw_header = await self.transport.read(HEADER_LENGTH)
+    async def _read_frame(self) -> memoryview:
+        # The returned view points into the transport's receive buffer and is only valid until
+        # the next read, so it must be fully decoded before reading again
+        raw_header = await self.transport.peek(HEADER_LENGTH)
 
         raw_payload_length = FrameDecoder.extract_payload_length(raw_header)
 
-        raw_payload = await self.transport.read(raw_payload_length)
-
-        return raw_header + raw_payload
+        return await self.transport.read(HEADER_LENGTH + raw_payload_length)
 
     async def _write_message(self, response: BaseMessage) -> None:
         transaction_id = response.header.transaction_id
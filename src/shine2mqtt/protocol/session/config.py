@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+
+
+class ProtocolSessionConfig(BaseModel):
+    # Number of requests awaiting a datalogger response at the same time
+    max_in_flight: int = Field(default=4, ge=1)
+    # Seconds a request may wait for a slot and its response before it is abandoned
+    request_timeout: float = Field(default=30.0, gt=0)
+    # Buffered readings replayed by a datalogger are published together in history events
+    history_batch_size: int = Field(default=64, ge=1)
+    # Seconds after which an incomplete batch of buffered readings is published
+    history_flush_interval: float = Field(default=1.0, gt=0)
@@ -1,9 +1,10 @@
-import asyncio
-
-from shine2mqtt.domain.events.events import DomainEvent
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.interfaces.metadata import DataloggerMetadataStore
 from shine2mqtt.infrastructure.server.session import TCPSession
 from shine2mqtt.protocol.frame.decoder import FrameDecoder
 from shine2mqtt.protocol.frame.encoder import FrameEncoder
+from shine2mqtt.protocol.frame.pool import FrameDecodePool
+from shine2mqtt.protocol.session.config import ProtocolSessionConfig
 from shine2mqtt.protocol.session.initializer import ProtocolSessionInitializer
 from shine2mqtt.protocol.session.mapper import MessageEventMapper
 from shine2mqtt.protocol.session.session import ProtocolSession
@@ -14,11 +15,17 @@ class ProtocolSessionFactory:
         self,
         encoder: FrameEncoder,
         decoder: FrameDecoder,
-        domain_events: asyncio.Queue[DomainEvent],
+        domain_events: DomainEventBus,
+        config: ProtocolSessionConfig | None = None,
+        metadata_store: DataloggerMetadataStore | None = None,
+        decode_pool: FrameDecodePool | None = None,
     ):
         self.encoder = encoder
         self.decoder = decoder
         self.domain_events = domain_events
+        self.config = config or ProtocolSessionConfig()
+        self.metadata_store = metadata_store
+        self.decode_pool = decode_pool
 
     async def create(self, transport: TCPSession) -> ProtocolSession:
         mapper = MessageEventMapper()
@@ -28,5 +35,13 @@ class ProtocolSessionFactory:
             mapper=mapper,
             transport=transport,
             domain_events=self.domain_events,
+            config=self.config,
+            metadata_store=self.metadata_store,
+            decode_pool=self.decode_pool,
         )
         return await initializer.initialize()
+
+    def close(self) -> None:
+        """Release what the sessions shared, e.g. the workers of the decode pool."""
+        if self.decode_pool is not None:
+            self.decode_pool.close()
@@ -1,25 +1,36 @@
 import asyncio
+from dataclasses import replace
 from datetime import datetime
 
-from shine2mqtt.domain.events.events import DomainEvent
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.interfaces.metadata import DataloggerMetadataStore
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.domain.models.inverter import Inverter
 from shine2mqtt.infrastructure.server.session import TCPSession
 from shine2mqtt.protocol.frame.decoder import FrameDecoder
 from shine2mqtt.protocol.frame.encoder import FrameEncoder
+from shine2mqtt.protocol.frame.pool import FrameDecodePool
 from shine2mqtt.protocol.messages.ack.ack import GrowattAckMessage
 from shine2mqtt.protocol.messages.announce.announce import GrowattAnnounceMessage
 from shine2mqtt.protocol.messages.get_config.get_config import GrowattGetConfigResponseMessage
 from shine2mqtt.protocol.messages.ping.message import GrowattPingMessage
-from shine2mqtt.protocol.messages.set_config.set_config import GrowattSetConfigResponseMessage
+from shine2mqtt.protocol.messages.set_config.set_config import (
+    GrowattSetConfigRequestMessage,
+    GrowattSetConfigResponseMessage,
+)
 from shine2mqtt.protocol.session.base import BaseProtocolSession
+from shine2mqtt.protocol.session.config import ProtocolSessionConfig
 from shine2mqtt.protocol.session.mapper import MessageEventMapper
 from shine2mqtt.protocol.session.message_factory import MessageFactory
 from shine2mqtt.protocol.session.session import ProtocolSession
 from shine2mqtt.protocol.session.state import ServerProtocolSessionState, TransactionIdTracker
 from shine2mqtt.protocol.settings.constants import (
     DATALOGGER_HW_VERSION_REGISTER,
+    DATALOGGER_IDENTITY_REGISTERS,
     DATALOGGER_IP_ADDRESS_REGISTER,
     DATALOGGER_MAC_ADDRESS_REGISTER,
     DATALOGGER_SW_VERSION_REGISTER,
+    DATALOGGER_SYSTEM_TIME_FORMAT,
     DATALOGGER_SYSTEM_TIME_REGISTER,
 )
 from shine2mqtt.util.logger import logger
@@ -32,11 +43,18 @@ class ProtocolSessionInitializer(BaseProtocolSession):
         decoder: FrameDecoder,
         mapper: MessageEventMapper,
         transport: TCPSession,
-        domain_events: asyncio.Queue[DomainEvent],
+        domain_events: DomainEventBus,
+        config: ProtocolSessionConfig | None = None,
+        metadata_store: DataloggerMetadataStore | None = None,
+        decode_pool: FrameDecodePool | None = None,
     ):
-        super().__init__(transport=transport, encoder=encoder, decoder=decoder)
+        super().__init__(
+            transport=transport, encoder=encoder, decoder=decoder, decode_pool=decode_pool
+        )
         self.mapper = mapper
         self.domain_events = domain_events
+        self.config = config or ProtocolSessionConfig()
+        self.metadata_store = metadata_store
         self.transaction_id_tracker = TransactionIdTracker()
 
     async def initialize(self) -> ProtocolSession:
@@ -49,42 +67,77 @@ class ProtocolSessionInitializer(BaseProtocolSession):
             tracker=self.transaction_id_tracker,
         )
 
-        sw_version = await self._request_datalogger_config(
-            factory, announce.datalogger_serial, register=DATALOGGER_SW_VERSION_REGISTER
-        )
-        hw_version = await self._request_datalogger_config(
-            factory, announce.datalogger_serial, register=DATALOGGER_HW_VERSION_REGISTER
-        )
-        ip_address = await self._request_datalogger_config(
-            factory, announce.datalogger_serial, register=DATALOGGER_IP_ADDRESS_REGISTER
-        )
-        mac_address = await self._request_datalogger_config(
-            factory, announce.datalogger_serial, register=DATALOGGER_MAC_ADDRESS_REGISTER
-        )
+        inverter = self.mapper.map_announce_message_to_inverter(announce)
 
-        await self._sync_datalogger_system_time(factory, announce)
+        if (datalogger := self._get_cached_datalogger(announce)) is not None:
+            logger.info(
+                f"Starting session for datalogger '{datalogger.serial}' from cached metadata, "
+                "refreshing its config in the background"
+            )
+            return self._create_session(factory, datalogger, inverter, refresh_datalogger=True)
+
+        # Send all handshake requests at once and match the responses by register, the time
+        # sync response is not needed to start the session
+        time_sync = self._system_time_request(factory, announce.datalogger_serial)
+        config, time_synced = await self._request_datalogger_configs(
+            factory, announce.datalogger_serial, DATALOGGER_IDENTITY_REGISTERS, time_sync
+        )
 
-        inverter = self.mapper.map_announce_message_to_inverter(announce)
         datalogger = self.mapper.map_config_to_datalogger(
             datalogger_serial=announce.datalogger_serial,
-            ip_address=ip_address,
-            mac_address=mac_address,
-            sw_version=sw_version,
-            hw_version=hw_version,
+            ip_address=config[DATALOGGER_IP_ADDRESS_REGISTER],
+            mac_address=config[DATALOGGER_MAC_ADDRESS_REGISTER],
+            sw_version=config[DATALOGGER_SW_VERSION_REGISTER],
+            hw_version=config[DATALOGGER_HW_VERSION_REGISTER],
             protocol_id=announce.header.protocol_id,
             unit_id=announce.header.unit_id,
         )
 
-        state = ServerProtocolSessionState(datalogger=datalogger, inverter=inverter)
+        if self.metadata_store is not None:
+            self.metadata_store.put(datalogger)
+
+        session = self._create_session(factory, datalogger, inverter)
+
+        if not time_synced:
+            session.expect_response(time_sync).add_done_callback(self._log_time_sync_result)
 
-        return ProtocolSession(
+        return session
+
+    def _get_cached_datalogger(self, announce: GrowattAnnounceMessage) -> DataLogger | None:
+        if self.metadata_store is None:
+            return None
+
+        datalogger = self.metadata_store.get(announce.datalogger_serial)
+        if datalogger is None:
+            return None
+
+        return replace(
+            datalogger,
+            protocol_id=announce.header.protocol_id,
+            unit_id=announce.header.unit_id,
+        )
+
+    def _create_session(
+        self,
+        factory: MessageFactory,
+        datalogger: DataLogger,
+        inverter: Inverter,
+        refresh_datalogger: bool = False,
+    ) -> ProtocolSession:
+        session = ProtocolSession(
             transport=self.transport,
-            state=state,
+            state=ServerProtocolSessionState(datalogger=datalogger, inverter=inverter),
             factory=factory,
             encoder=self.encoder,
             decoder=self.decoder,
             domain_events=self.domain_events,
+            config=self.config,
+            metadata_store=self.metadata_store,
+            refresh_datalogger=refresh_datalogger,
+            decode_pool=self.decode_pool,
         )
+        self._hand_over_decoded(session)
+        return session
 
     async def _wait_for_announce(self) -> GrowattAnnounceMessage:
         while True:
@@ -100,56 +153,50 @@ class ProtocolSessionInitializer(BaseProtocolSession):
                         f"Received unexpected message while waiting for announce: {type(message).__name__}"
                     )
 
-    async def _sync_datalogger_system_time(
-        self, factory: MessageFactory, announce: GrowattAnnounceMessage
-    ) -> None:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        await self._write_datalogger_config(
-            factory=factory,
-            datalogger_serial=announce.datalogger_serial,
+    def _system_time_request(
+        self, factory: MessageFactory, datalogger_serial: str
+    ) -> GrowattSetConfigRequestMessage:
+        current_time = datetime.now().strftime(DATALOGGER_SYSTEM_TIME_FORMAT)
+        return factory.set_config_request(
+            datalogger_serial=datalogger_serial,
             register=DATALOGGER_SYSTEM_TIME_REGISTER,
             value=current_time,
         )
 
-    async def _write_datalogger_config(
-        self, factory: MessageFactory, datalogger_serial: str, register: int, value: str
-    ) -> bool:
-        message = factory.set_config_request(
-            datalogger_serial=datalogger_serial,
-            register=register,
-            value=value,
-        )
-
-        await self._write_message(message)
-
-        while True:
-            match message := await self._read_message():
-                case GrowattSetConfigResponseMessage() if message.register == register:
-                    return message.ack
-                case GrowattPingMessage():
-                    await self._write_message(message)
-                case _:
-                    logger.debug(
-                        f"Received unexpected message while waiting for set config response: {type(message).__name__}"
-                    )
-
-    async def _request_datalogger_config(
-        self, factory: MessageFactory, datalogger_serial: str, register: int
-    ) -> str:
-        message = factory.get_config_request(
-            datalogger_serial=datalogger_serial,
-            register=register,
-        )
-
-        await self._write_message(message)
-
-        while True:
+    async def _request_datalogger_configs(
+        self,
+        factory: MessageFactory,
+        datalogger_serial: str,
+        registers: tuple[int, ...],
+        time_sync: GrowattSetConfigRequestMessage,
+    ) -> tuple[dict[int, str], bool]:
+        """Request the config registers and wait for all of them.
+
+        ``time_sync`` is sent along with the requests, the returned flag tells whether its
+        response was received while waiting.
+        """
+        for register in registers:
+            await self._write_message(factory.get_config_request(datalogger_serial, register))
+        await self._write_message(time_sync)
+
+        values: dict[int, str] = {}
+        time_synced = False
+        while len(values) < len(registers):
             match message := await self._read_message():
-                case GrowattGetConfigResponseMessage() if message.register == register:
-                    return message.value
+                case GrowattGetConfigResponseMessage() if message.register in registers:
+                    values[message.register] = message.value
+                case GrowattSetConfigResponseMessage() if message.register == time_sync.register:
+                    logger.info(f"Datalogger system time synchronized: {message.ack}")
+                    time_synced = True
                 case GrowattPingMessage():
                     await self._write_message(message)
                 case _:
                     logger.warning(
                         f"Received unexpected message while waiting for get config response: {type(message).__name__}"
                     )
+
+        return values, time_synced
+
+    def _log_time_sync_result(self, response: asyncio.Future[bool]) -> None:
+        if not response.cancelled():
+            logger.info(f"Datalogger system time synchronized: {response.result()}")
@@ -1,9 +1,17 @@
 from datetime import datetime
+from operator import attrgetter
 
-from shine2mqtt.domain.events.events import DataloggerAnnouncedEvent, InverterStateUpdatedEvent
+from shine2mqtt.domain.events.events import (
+    DataloggerAnnouncedEvent,
+    InverterBacklogDrainedEvent,
+    InverterHistoryRecordedEvent,
+    InverterStateUpdatedEvent,
+)
 from shine2mqtt.domain.models.datalogger import DataLogger
 from shine2mqtt.domain.models.inverter import (
+    INVERTER_STATE_FIELDS,
     Inverter,
+    InverterReading,
     InverterSettings,
     InverterState,
     InverterStatus,
@@ -13,6 +21,10 @@ from shine2mqtt.protocol.messages.announce.announce import GrowattAnnounceMessag
 from shine2mqtt.protocol.messages.data.data import GrowattBufferedDataMessage, GrowattDataMessage
 from shine2mqtt.protocol.session.state import ServerProtocolSessionState
 
+# GrowattDataMessage uses the same field names as InverterState
+_get_message_state_values = attrgetter(*INVERTER_STATE_FIELDS)
+_INVERTER_STATUS_INDEX = INVERTER_STATE_FIELDS.index("inverter_status")
+
 
 class MessageEventMapper:
     def map_announce_message_to_inverter(self, message: GrowattAnnounceMessage) -> Inverter:
@@ -83,50 +95,44 @@ class MessageEventMapper:
     def map_data_message_to_inverter_state_updated_event(
         self, message: GrowattDataMessage | GrowattBufferedDataMessage
     ) -> InverterStateUpdatedEvent:
-        status = InverterStatus(message.inverter_status.value)
-
-        state = InverterState(
-            inverter_status=status,
-            # DC
-            power_dc=message.power_dc,
-            # DC 1
-            voltage_dc_1=message.voltage_dc_1,
-            current_dc_1=message.current_dc_1,
-            power_dc_1=message.power_dc_1,
-            # DC 2
-            voltage_dc_2=message.voltage_dc_2,
-            current_dc_2=message.current_dc_2,
-            power_dc_2=message.power_dc_2,
-            # AC
-            power_ac=message.power_ac,
-            frequency_ac=message.frequency_ac,
-            # AC 1
-            voltage_ac_1=message.voltage_ac_1,
-            current_ac_1=message.current_ac_1,
-            power_ac_1=message.power_ac_1,
-            # AC line
-            voltage_ac_l1_l2=message.voltage_ac_l1_l2,
-            voltage_ac_l2_l3=message.voltage_ac_l2_l3,
-            voltage_ac_l3_l1=message.voltage_ac_l3_l1,
-            #
-            total_run_time=message.total_run_time,
-            # Energy AC
-            energy_ac_today=message.energy_ac_today,
-            energy_ac_total=message.energy_ac_total,
-            # Energy DC 1
-            energy_dc_1_today=message.energy_dc_1_today,
-            energy_dc_1_total=message.energy_dc_1_total,
-            # Energy DC 2
-            energy_dc_2_today=message.energy_dc_2_today,
-            energy_dc_2_total=message.energy_dc_2_total,
-            # Energy DC
-            energy_dc_total=message.energy_dc_total,
-            # Temperatures
-            temperature=message.temperature,
-        )
-
         return InverterStateUpdatedEvent(
             datalogger_serial=message.datalogger_serial,
-            state=state,
+            state=self._map_data_message_to_inverter_state(message),
             timestamp=message.timestamp,
         )
+
+    def map_buffered_data_message_to_reading(
+        self, message: GrowattBufferedDataMessage
+    ) -> InverterReading:
+        return InverterReading(
+            timestamp=message.timestamp,
+            state=self._map_data_message_to_inverter_state(message),
+        )
+
+    def map_readings_to_history_recorded_event(
+        self, datalogger_serial: str, readings: list[InverterReading]
+    ) -> InverterHistoryRecordedEvent:
+        return InverterHistoryRecordedEvent(
+            datalogger_serial=datalogger_serial,
+            timestamp=datetime.now(),
+            readings=tuple(readings),
+        )
+
+    def map_backlog_drained_event(
+        self, datalogger_serial: str, readings: int, duration: float
+    ) -> InverterBacklogDrainedEvent:
+        return InverterBacklogDrainedEvent(
+            datalogger_serial=datalogger_serial,
+            timestamp=datetime.now(),
+            readings=readings,
+            duration=duration,
+        )
+
+    def _map_data_message_to_inverter_state(
+        self, message: GrowattDataMessage | GrowattBufferedDataMessage
+    ) -> InverterState:
+        # Copy the fields straight from the message, in InverterState field order
+        values = list(_get_message_state_values(message))
+        values[_INVERTER_STATUS_INDEX] = InverterStatus(values[_INVERTER_STATUS_INDEX].value)
+
+        return InverterState(*values)
@@ -29,6 +29,20 @@ class PendingResponseTracker:
         self._pending_responses[key] = future
         return future
 
+    def discard(self, request: BaseMessage) -> None:
+        future = self._pending_responses.pop(self._get_transaction_key(request), None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    def cancel_all(self) -> None:
+        for future in self._pending_responses.values():
+            future.cancel()
+        self._pending_responses.clear()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending_responses)
+
     def resolve(self, message: BaseMessage) -> None:
         key = self._get_transaction_key(message)
         response = self._pending_responses.pop(key, None)
@@ -37,6 +51,10 @@ class PendingResponseTracker:
             logger.warning(f"Received unexpected response: {message}")
             return
 
+        if response.done():
+            # The request was cancelled or timed out before its response arrived
+            return
+
         match message:
             case GrowattGetConfigResponseMessage():
                 response.set_result(
@@ -0,0 +1,94 @@
+import asyncio
+import heapq
+import itertools
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+from typing import Any
+
+from shine2mqtt.protocol.messages.message import BaseMessage
+from shine2mqtt.protocol.session.config import ProtocolSessionConfig
+from shine2mqtt.protocol.session.response_tracker import PendingResponseTracker
+
+
+class RequestPriority(IntEnum):
+    # Lower values are sent first
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class RequestScheduler:
+    """Limits the requests awaiting a datalogger response and orders the waiting ones.
+
+    Waiting requests are sent by priority, then in submission order. Every request has a
+    deadline covering both the wait for a slot and the wait for its response; when it expires,
+    or the caller is cancelled, the tracker entry is removed so late responses are ignored.
+    """
+
+    def __init__(
+        self,
+        tracker: PendingResponseTracker,
+        write: Callable[[BaseMessage], Awaitable[None]],
+        config: ProtocolSessionConfig,
+    ):
+        self._tracker = tracker
+        self._write = write
+        self._max_in_flight = config.max_in_flight
+        self._request_timeout = config.request_timeout
+
+        self._in_flight = 0
+        self._waiting: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return sum(not waiter.done() for _, _, waiter in self._waiting)
+
+    async def request(
+        self,
+        request: BaseMessage,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        timeout: float | None = None,
+    ) -> Any:
+        async with asyncio.timeout(timeout if timeout is not None else self._request_timeout):
+            await self._acquire(priority)
+            try:
+                response = self._tracker.track(request)
+                await self._write(request)
+                return await response
+            finally:
+                self._tracker.discard(request)
+                self._release()
+
+    def close(self) -> None:
+        for _, _, waiter in self._waiting:
+            waiter.cancel()
+        self._waiting.clear()
+        self._tracker.cancel_all()
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        if self._in_flight < self._max_in_flight:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._sequence), waiter))
+        try:
+            # The releasing request hands its slot over, so in_flight is not incremented here
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiting:
+            _, _, waiter = heapq.heappop(self._waiting)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
@@ -1,21 +1,33 @@
 import asyncio
+from dataclasses import replace
+from datetime import datetime
 from typing import Any, override
 
-from shine2mqtt.domain.events.events import DomainEvent
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.interfaces.metadata import DataloggerMetadataStore
 from shine2mqtt.domain.interfaces.session import Session
 from shine2mqtt.domain.models.config import ConfigResult
 from shine2mqtt.infrastructure.server.session import TCPSession
 from shine2mqtt.protocol.frame.decoder import FrameDecoder
 from shine2mqtt.protocol.frame.encoder import FrameEncoder
+from shine2mqtt.protocol.frame.pool import FrameDecodePool
 from shine2mqtt.protocol.messages.announce.announce import GrowattAnnounceMessage
 from shine2mqtt.protocol.messages.data.data import GrowattBufferedDataMessage, GrowattDataMessage
 from shine2mqtt.protocol.messages.message import BaseMessage
 from shine2mqtt.protocol.messages.ping.message import GrowattPingMessage
+from shine2mqtt.protocol.session.backlog import BufferedDataBacklog
 from shine2mqtt.protocol.session.base import BaseProtocolSession
+from shine2mqtt.protocol.session.config import ProtocolSessionConfig
 from shine2mqtt.protocol.session.mapper import MessageEventMapper
 from shine2mqtt.protocol.session.message_factory import MessageFactory
 from shine2mqtt.protocol.session.response_tracker import PendingResponseTracker
+from shine2mqtt.protocol.session.scheduler import RequestPriority, RequestScheduler
 from shine2mqtt.protocol.session.state import ServerProtocolSessionState
+from shine2mqtt.protocol.settings.constants import (
+    DATALOGGER_IDENTITY_REGISTERS,
+    DATALOGGER_SYSTEM_TIME_FORMAT,
+    DATALOGGER_SYSTEM_TIME_REGISTER,
+)
 from shine2mqtt.util.logger import logger
 
 
@@ -27,14 +39,30 @@ class ProtocolSession(BaseProtocolSession, Session):
         factory: MessageFactory,
         encoder: FrameEncoder,
         decoder: FrameDecoder,
-        domain_events: asyncio.Queue[DomainEvent],
+        domain_events: DomainEventBus,
+        config: ProtocolSessionConfig | None = None,
+        metadata_store: DataloggerMetadataStore | None = None,
+        refresh_datalogger: bool = False,
+        decode_pool: FrameDecodePool | None = None,
     ):
-        super().__init__(transport=transport, encoder=encoder, decoder=decoder)
+        super().__init__(
+            transport=transport, encoder=encoder, decoder=decoder, decode_pool=decode_pool
+        )
         self._domain_events = domain_events
         self._mapper = MessageEventMapper()
         self._state = state
         self._factory = factory
+        self._metadata_store = metadata_store
+        # Started from cached metadata, the datalogger config still has to be requested
+        self._refresh_datalogger_on_start = refresh_datalogger
+        self._config = config or ProtocolSessionConfig()
+        self._backlog = BufferedDataBacklog(batch_size=self._config.history_batch_size)
         self._tracker = PendingResponseTracker()
+        self._scheduler = RequestScheduler(
+            tracker=self._tracker,
+            write=self._write_message,
+            config=self._config,
+        )
 
     @property
     @override
@@ -47,29 +75,64 @@ class ProtocolSession(BaseProtocolSession, Session):
 
     async def run(self):
         event = self._mapper.map_state_to_announce_event(self._state)
-        self._domain_events.put_nowait(event)
+        await self._domain_events.publish(event)
 
-        while True:
-            message = await self._read_message()
+        refresh = None
+        if self._refresh_datalogger_on_start:
+            refresh = asyncio.create_task(self._refresh_datalogger())
+        history_flusher = asyncio.create_task(self._flush_history_periodically())
+
+        try:
+            while True:
+                message = await self._read_message()
 
-            if message is None:
-                continue
+                if message is None:
+                    continue
 
-            self._publish_domain_event(message)
+                if isinstance(message, GrowattBufferedDataMessage):
+                    # Acknowledge first, the datalogger only sends its next reading after the ack
+                    await self._respond_to_periodic_message(message)
+                    await self._record_history(message)
+                    continue
 
-            if self._is_periodic_message(message):
-                await self._respond_to_periodic_message(message)
-            else:
-                self._tracker.resolve(message)
+                if isinstance(message, GrowattDataMessage):
+                    await self._finish_backlog()
+
+                await self._publish_domain_event(message)
+
+                if self._is_periodic_message(message):
+                    await self._respond_to_periodic_message(message)
+                else:
+                    self._tracker.resolve(message)
+        finally:
+            history_flusher.cancel()
+            if refresh is not None:
+                refresh.cancel()
+            # Buffered readings were acknowledged already, the datalogger will not send them again
+            await self._finish_backlog()
 
     async def close(self):
         logger.info("Closing protocol session")
+        self._scheduler.close()
         await self.transport.close()
 
+    def expect_response(self, request: BaseMessage) -> asyncio.Future[Any]:
+        """Track a request that was sent before the session started.
+
+        Like a scheduled request it is discarded when no response arrives within the request
+        timeout.
+        """
+        response = self._tracker.track(request)
+        deadline = asyncio.get_running_loop().call_later(
+            self._config.request_timeout, self._tracker.discard, request
+        )
+        response.add_done_callback(lambda _: deadline.cancel())
+        return response
+
     @override
     async def get_config(self, register: int) -> ConfigResult:
         request = self._factory.get_config_request(self.datalogger.serial, register)
-        return await self._resolve_request(request)
+        return await self._resolve_request(request, RequestPriority.HIGH)
 
     @override
     async def set_config(self, register: int, value: str) -> bool:
@@ -81,7 +144,7 @@ class ProtocolSession(BaseProtocolSession, Session):
         request = self._factory.read_registers_request(
             self.datalogger.serial, register_start, register_end
         )
-        return await self._resolve_request(request)
+        return await self._resolve_request(request, RequestPriority.HIGH)
 
     @override
     async def write_single_register(self, register: int, value: int) -> bool:
@@ -97,17 +160,85 @@ class ProtocolSession(BaseProtocolSession, Session):
         request = self._factory.write_multiple_registers_request(
             self.datalogger.serial, register_start, register_end, values
         )
-        return await self._resolve_request(request)
+        return await self._resolve_request(request, RequestPriority.LOW)
 
     @override
     async def send_raw_frame(self, function_code: int, payload: bytes) -> bytes:
         request = self._factory.raw_frame_request(self.datalogger.serial, function_code, payload)
         return await self._resolve_request(request)
 
-    async def _resolve_request(self, request: BaseMessage) -> Any:
-        future_response = self._tracker.track(request)
-        await self._write_message(request)
-        return await future_response
+    async def _refresh_datalogger(self) -> None:
+        try:
+            sw_version, hw_version, ip_address, mac_address = await asyncio.gather(
+                *(self.get_config(register) for register in DATALOGGER_IDENTITY_REGISTERS)
+            )
+            current_time = datetime.now().strftime(DATALOGGER_SYSTEM_TIME_FORMAT)
+            await self.set_config(DATALOGGER_SYSTEM_TIME_REGISTER, current_time)
+        except Exception as e:
+            logger.warning(
+                f"Failed to refresh config of datalogger '{self.datalogger.serial}': {e}"
+            )
+            return
+
+        datalogger = replace(
+            self.datalogger,
+            sw_version=sw_version.value,
+            hw_version=hw_version.value,
+            ip_address=ip_address.value,
+            mac_address=mac_address.value,
+        )
+        if datalogger == self.datalogger:
+            return
+
+        logger.info(f"Config of datalogger '{datalogger.serial}' changed since it was cached")
+        self._state.datalogger = datalogger
+        if self._metadata_store is not None:
+            self._metadata_store.put(datalogger)
+        await self._domain_events.publish(self._mapper.map_state_to_announce_event(self._state))
+
+    async def _record_history(self, message: GrowattBufferedDataMessage) -> None:
+        reading = self._mapper.map_buffered_data_message_to_reading(message)
+        if self._backlog.add(reading):
+            await self._publish_history()
+
+    async def _publish_history(self) -> None:
+        readings = self._backlog.take_batch()
+        if not readings:
+            return
+
+        event = self._mapper.map_readings_to_history_recorded_event(
+            self.datalogger.serial, readings
+        )
+        if not await self._domain_events.publish(event):
+            logger.error(
+                f"History of {len(readings)} readings from datalogger "
+                f"{self.datalogger.serial} lost, consumer is not keeping up"
+            )
+
+    async def _flush_history_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.history_flush_interval)
+            await self._publish_history()
+
+    async def _finish_backlog(self) -> None:
+        await self._publish_history()
+
+        drained = self._backlog.finish()
+        if drained is None:
+            return
+
+        readings, duration = drained
+        logger.info(
+            f"Received {readings} buffered readings from datalogger '{self.datalogger.serial}' "
+            f"in {duration:.1f}s ({readings / max(duration, 0.001):.1f} readings/s)"
+        )
+        event = self._mapper.map_backlog_drained_event(self.datalogger.serial, readings, duration)
+        await self._domain_events.publish(event)
+
+    async def _resolve_request(
+        self, request: BaseMessage, priority: RequestPriority = RequestPriority.NORMAL
+    ) -> Any:
+        return await self._scheduler.request(request, priority)
 
     def _is_periodic_message(self, message: BaseMessage) -> bool:
         return isinstance(
@@ -134,11 +265,11 @@ class ProtocolSession(BaseProtocolSession, Session):
 
         await self._write_message(response)
 
-    def _publish_domain_event(self, message: BaseMessage) -> None:
+    async def _publish_domain_event(self, message: BaseMessage) -> None:
         match message:
-            case GrowattDataMessage() | GrowattBufferedDataMessage():
+            case GrowattDataMessage():
                 event = self._mapper.map_data_message_to_inverter_state_updated_event(message)
             case _:
                 return
 
-        self._domain_events.put_nowait(event)
+        await self._domain_events.publish(event)
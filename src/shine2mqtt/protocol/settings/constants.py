@@ -9,6 +9,16 @@ DATALOGGER_SYSTEM_TIME_REGISTER = 31
 DATALOGGER_WIFI_SSID_REGISTER = 56
 DATALOGGER_WIFI_PASSWORD_REGISTER = 57
 
+# registers describing the datalogger, requested when a session starts
+DATALOGGER_IDENTITY_REGISTERS = (
+    DATALOGGER_SW_VERSION_REGISTER,
+    DATALOGGER_HW_VERSION_REGISTER,
+    DATALOGGER_IP_ADDRESS_REGISTER,
+    DATALOGGER_MAC_ADDRESS_REGISTER,
+)
+
+DATALOGGER_SYSTEM_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 CONFIG_REGISTERS = {
     4: {
         "name": "update_interval",
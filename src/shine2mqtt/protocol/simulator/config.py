@@ -1,4 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SolarConfig:
+    # DC power of an inverter in full sun (W), varies up to 25% per simulated inverter
+    peak_power: float = 3000.0
+    # Latitude of the simulated installations, sets the day length and the height of the sun
+    latitude: float = 52.0
+    # Share of the sunlight the clouds block at most, on the cloudiest days
+    cloudiness: float = 0.8
 
 
 # Use a bit shorter intervals compared to the real datalogger for better testing feedback loop
@@ -11,3 +21,11 @@ class SimulatedClientConfig:
     announce_interval: int = 5
     data_interval: int = 10
     ping_interval: int = 20
+    # Simulated dataloggers, each with its own connection and serial
+    loggers: int = 1
+    # Seconds over which the dataloggers connect, staggers their announce, data and ping sends
+    ramp_up: float = 0.0
+    # BUFFERED_DATA frames a datalogger sends after every announce, the data intervals it
+    # missed while offline
+    buffered_data: int = 0
+    solar: SolarConfig = field(default_factory=SolarConfig)
@@ -15,22 +15,29 @@ class ClientProtocolSessionFactory:
         config: SimulatedClientConfig,
         clock: ClockService,
         generator: FrameGenerator,
-        message_handler: ClientMessageHandler,
     ):
         self.decoder = decoder
         self.config = config
         self.clock = clock
         self.generator = generator
-        self.message_handler = message_handler
         self._datalogger_serial = generate_random_uppercase_string(10)
 
-    def create(self) -> ClientProtocolSession:
-        datalogger_serial = self._datalogger_serial
+    def create(self, datalogger_serial: str | None = None) -> ClientProtocolSession:
+        """Create a session, for the datalogger of this factory unless a serial is given."""
+        datalogger_serial = datalogger_serial or self._datalogger_serial
         session_state = ClientProtocolSessionState(
-            protocol_id=1, unit_id=1, datalogger_serial=datalogger_serial
+            protocol_id=1,
+            unit_id=1,
+            datalogger_serial=datalogger_serial,
+            buffered_data_backlog=self.config.buffered_data,
         )
 
-        self.message_handler.set_announce_callback(session_state.announce)
+        # One handler per session, the callbacks update the state of this session
+        message_handler = ClientMessageHandler(
+            generator=self.generator,
+            announce_callback=session_state.announce,
+            buffered_data_callback=session_state.acknowledge_buffered_data,
+        )
 
         send_intervals = SendIntervals(
             announce=self.config.announce_interval,
@@ -43,6 +50,6 @@ class ClientProtocolSessionFactory:
             session_state=session_state,
             clock=self.clock,
             generator=self.generator,
-            message_handler=self.message_handler,
+            message_handler=message_handler,
             send_intervals=send_intervals,
         )
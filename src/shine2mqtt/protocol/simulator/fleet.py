@@ -0,0 +1,147 @@
+import asyncio
+from asyncio import IncompleteReadError
+from dataclasses import dataclass, field
+
+from shine2mqtt.infrastructure.client.transport import TCPTransport
+from shine2mqtt.protocol.simulator.config import SimulatedClientConfig
+from shine2mqtt.protocol.simulator.factory import ClientProtocolSessionFactory
+from shine2mqtt.protocol.simulator.session import ClientProtocolSession
+from shine2mqtt.util.clock import ClockService
+from shine2mqtt.util.logger import logger
+from shine2mqtt.util.strings import generate_random_uppercase_string
+from shine2mqtt.util.timer_wheel import Timer, TimerWheel
+
+
+@dataclass(eq=False)
+class FleetDatalogger:
+    serial: str
+    transport: TCPTransport = field(default_factory=TCPTransport)
+    session: ClientProtocolSession | None = None
+    timer: Timer[FleetDatalogger] | None = None
+
+
+class SimulatedFleet:
+    """Simulates many dataloggers in one process, each with its own connection and serial.
+
+    Instead of every datalogger polling its session, one timer wheel wakes a datalogger
+    when its session has something to send. Between sends the fleet sleeps until the next
+    deadline, so a stepped virtual clock jumps from send to send.
+    """
+
+    RETRY_DELAY = 2
+    # Slot width of the timer wheel
+    TICK = 0.1
+
+    def __init__(
+        self,
+        session_factory: ClientProtocolSessionFactory,
+        config: SimulatedClientConfig,
+        clock: ClockService,
+    ):
+        self.config = config
+        self.session_factory = session_factory
+        self.clock = clock
+        self._wheel = TimerWheel[FleetDatalogger](start=clock.now(), tick=self.TICK)
+        # Deadline the send loop sleeps until, set the wakeup event to schedule an earlier one
+        self._sleep_until: float | None = None
+        self._wakeup = asyncio.Event()
+
+        # A random prefix keeps the serials of fleets in different processes apart
+        prefix = generate_random_uppercase_string(3)
+        self.dataloggers = [
+            FleetDatalogger(serial=f"{prefix}{index:07d}") for index in range(config.loggers)
+        ]
+
+    async def run(self):
+        logger.info(f"Starting fleet of {len(self.dataloggers)} simulated dataloggers")
+        try:
+            await asyncio.gather(
+                self._send_loop(),
+                *(
+                    self._connection_loop(
+                        datalogger, index * self.config.ramp_up / len(self.dataloggers)
+                    )
+                    for index, datalogger in enumerate(self.dataloggers)
+                ),
+            )
+        finally:
+            await asyncio.gather(
+                *(datalogger.transport.close() for datalogger in self.dataloggers),
+                return_exceptions=True,
+            )
+
+    async def _connection_loop(self, datalogger: FleetDatalogger, delay: float):
+        await asyncio.sleep(delay)
+        while True:
+            try:
+                await datalogger.transport.connect(self.config.server_host, self.config.server_port)
+                datalogger.session = self.session_factory.create(datalogger.serial)
+                self._schedule(datalogger)
+                await self._receive_loop(datalogger)
+            except (IncompleteReadError, ConnectionError) as e:
+                logger.warning(f"Datalogger {datalogger.serial} connection lost or failed: {e}")
+                self._unschedule(datalogger)
+                await datalogger.transport.close()
+                await asyncio.sleep(self.RETRY_DELAY)
+
+    async def _receive_loop(self, datalogger: FleetDatalogger):
+        session = datalogger.session
+        assert session is not None
+        while True:
+            frame = await datalogger.transport.read()
+            if response_frame := session.handle_incoming_frame(frame):
+                await datalogger.transport.write(response_frame)
+            # E.g. the ANNOUNCE acknowledgement makes DATA and PING due right away
+            timer = datalogger.timer
+            if timer is None or session.get_next_send_time() < timer.deadline:
+                self._schedule(datalogger)
+
+    async def _send_loop(self):
+        while True:
+            deadline = self._wheel.next_deadline()
+            if deadline is None or deadline > self.clock.now():
+                await self._sleep(deadline)
+
+            for datalogger in self._wheel.advance(self.clock.now()):
+                datalogger.timer = None
+                await self._send_pending(datalogger)
+
+    async def _sleep(self, deadline: float | None):
+        self._sleep_until = deadline
+        self._wakeup.clear()
+        timeout = None if deadline is None else deadline - self.clock.now()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except TimeoutError:
+            pass
+        finally:
+            self._sleep_until = None
+
+    async def _send_pending(self, datalogger: FleetDatalogger):
+        session = datalogger.session
+        if session is None:
+            return
+
+        for action in session.get_pending_actions():
+            if frame := session.get_send_message_frame(action):
+                logger.debug(f"→ {datalogger.serial} sends {action.function_code.name}")
+                try:
+                    await datalogger.transport.write(frame)
+                except ConnectionError, RuntimeError:
+                    # Reconnecting, the connection loop schedules the datalogger again
+                    return
+
+        self._schedule(datalogger)
+
+    def _schedule(self, datalogger: FleetDatalogger):
+        assert datalogger.session is not None
+        self._unschedule(datalogger)
+        deadline = datalogger.session.get_next_send_time()
+        datalogger.timer = self._wheel.schedule(deadline, datalogger)
+        if self._sleep_until is None or deadline < self._sleep_until:
+            self._wakeup.set()
+
+    def _unschedule(self, datalogger: FleetDatalogger):
+        if datalogger.timer is not None:
+            datalogger.timer.cancel()
+            datalogger.timer = None
@@ -1,10 +1,19 @@
+from dataclasses import replace
+from datetime import datetime
 from itertools import cycle
 
 from shine2mqtt.protocol.codec.byte import ByteEncoder
+from shine2mqtt.protocol.codec.layout import RegisterLayout, datetime_values
 from shine2mqtt.protocol.frame.capturer.loader import CapturedFrameLoader
+from shine2mqtt.protocol.frame.crc.constants import CRC16_LENGTH
 from shine2mqtt.protocol.frame.encoder import FrameEncoder
 from shine2mqtt.protocol.frame.header.header import FunctionCode, MBAPHeader
+from shine2mqtt.protocol.frame.template import FrameTemplate
 from shine2mqtt.protocol.messages.constants import ACK, NACK
+from shine2mqtt.protocol.messages.data.layout import DATA_LAYOUT
+from shine2mqtt.protocol.simulator.config import SolarConfig
+from shine2mqtt.protocol.simulator.solar import SolarInverter
+from shine2mqtt.util.clock import ClockService, MonotonicClockService
 
 announce_frames, announce_headers, announce_payloads = CapturedFrameLoader.load("announce_message")
 buffered_data_frames, buffered_data_headers, buffered_data_payloads = CapturedFrameLoader.load(
@@ -16,22 +25,61 @@ get_config_frames, get_config_headers, get_config_payloads = CapturedFrameLoader
 )
 ping_frames, ping_headers, ping_payloads = CapturedFrameLoader.load("ping_message")
 
+DATALOGGER_SERIAL_OFFSET = 0
+INVERTER_SERIAL_OFFSET = next(
+    field.offset for field in DATA_LAYOUT.fields if field.name == "inverter_serial"
+)
+SERIAL_LENGTH = 10
 
-class FrameGenerator:
-    def __init__(self, encoder: FrameEncoder):
-        self.announce_headers = cycle(announce_headers)
-        self.announce_payloads = cycle(announce_payloads)
-
-        self.data_headers = cycle(data_headers)
-        self.data_payloads = cycle(data_payloads)
+# The timestamp and registers of a DATA payload, packed in one go. Registers in between the
+# layout fields are zero in generated payloads.
+DATA_REGISTERS_OFFSET = next(
+    field.offset for field in DATA_LAYOUT.fields if field.name == "timestamp_year"
+)
+DATA_REGISTERS = RegisterLayout(
+    [
+        replace(field, offset=field.offset - DATA_REGISTERS_OFFSET)
+        for field in DATA_LAYOUT.fields
+        if field.offset >= DATA_REGISTERS_OFFSET
+    ]
+)
 
-        self.get_config_headers = dict(enumerate(get_config_headers))
-        self.get_config_payloads = dict(enumerate(get_config_payloads))
 
-        self.ping_headers = cycle(ping_headers)
-        self.ping_payloads = cycle(ping_payloads)
+class FrameGenerator:
+    """Generates the frames of simulated dataloggers.
+
+    Frames are encoded once from captured frames, a send only patches the serials, the
+    transaction id and for DATA the timestamp and registers. DATA and BUFFERED_DATA registers
+    come from a solar model per inverter, stamped with the wall time of the clock.
+    """
+
+    def __init__(
+        self,
+        encoder: FrameEncoder,
+        clock: ClockService | None = None,
+        solar: SolarConfig | None = None,
+    ):
+        self.announce_templates = cycle(
+            self._encode_templates(encoder, announce_headers, announce_payloads)
+        )
+        self.ping_templates = cycle(self._encode_templates(encoder, ping_headers, ping_payloads))
+        self.get_config_templates = dict(
+            enumerate(self._encode_templates(encoder, get_config_headers, get_config_payloads))
+        )
+        self.data_template = encoder.encode_template(data_headers[0], data_payloads[0])
+        self.buffered_data_template = encoder.encode_template(
+            buffered_data_headers[0], buffered_data_payloads[0]
+        )
+        # Inverter serials of the simulated dataloggers start like the captured one
+        self._inverter_prefix = data_payloads[0][
+            INVERTER_SERIAL_OFFSET : INVERTER_SERIAL_OFFSET + 3
+        ].decode("ascii")
 
         self.encoder = encoder
+        # DATA frames are stamped with the wall time of the clock
+        self.clock = clock or MonotonicClockService()
+        self.solar = solar or SolarConfig()
+        self._inverters: dict[str, SolarInverter] = {}
 
     def generate_frame(
         self, transaction_id: int, function_code: FunctionCode, datalogger_serial: str
@@ -41,49 +89,44 @@ class FrameGenerator:
                 return self.generate_announce_frame(transaction_id, datalogger_serial)
             case FunctionCode.DATA:
                 return self.generate_data_frame(transaction_id, datalogger_serial)
+            case FunctionCode.BUFFERED_DATA:
+                return self.generate_buffered_data_frame(transaction_id, datalogger_serial)
             case FunctionCode.PING:
                 return self.generate_ping_frame(transaction_id, datalogger_serial)
             case _:
                 raise NotImplementedError(f"No generator for {function_code}")
 
     def generate_announce_frame(self, transaction_id: int, datalogger_serial: str) -> bytes:
-        raw_payload = self.set_datalogger_serial(next(self.announce_payloads), datalogger_serial)
-
-        header = next(self.announce_headers)
-        header.transaction_id = transaction_id
-
-        return self.encoder.encode_frame(header, raw_payload)
+        template = next(self.announce_templates)
+        return self._render(template, transaction_id, datalogger_serial)
 
-    def generate_data_frame(self, transaction_id: int, datalogger_serial: str) -> bytes:
-        raw_payload = self.set_datalogger_serial(next(self.data_payloads), datalogger_serial)
-
-        header = next(self.data_headers)
-        header.transaction_id = transaction_id
+    def generate_data_frame(
+        self, transaction_id: int, datalogger_serial: str, timestamp: datetime | None = None
+    ) -> bytes:
+        template = self.data_template
+        self._set_registers(template, datalogger_serial, timestamp or self.clock.wall_time())
+        return self._render(template, transaction_id, datalogger_serial)
 
-        return self.encoder.encode_frame(header, raw_payload)
+    def generate_buffered_data_frame(
+        self, transaction_id: int, datalogger_serial: str, timestamp: datetime | None = None
+    ) -> bytes:
+        template = self.buffered_data_template
+        self._set_registers(template, datalogger_serial, timestamp or self.clock.wall_time())
+        return self._render(template, transaction_id, datalogger_serial)
 
     def generate_ping_frame(self, transaction_id: int, datalogger_serial: str) -> bytes:
-        raw_payload = self.set_datalogger_serial(next(self.ping_payloads), datalogger_serial)
-
-        header = next(self.ping_headers)
-        header.transaction_id = transaction_id
-
-        return self.encoder.encode_frame(header, raw_payload)
+        template = next(self.ping_templates)
+        return self._render(template, transaction_id, datalogger_serial)
 
     def generate_get_config_response_frame(
         self, transaction_id: int, register: int, datalogger_serial: str
     ) -> bytes:
-        raw_payload = self.get_config_payloads.get(register)
-        header = self.get_config_headers.get(register)
+        template = self.get_config_templates.get(register)
 
-        if header is None or raw_payload is None:
+        if template is None:
             raise ValueError(f"Unknown register {register}")
 
-        header.transaction_id = transaction_id
-
-        raw_payload = self.set_datalogger_serial(raw_payload, datalogger_serial)
-
-        return self.encoder.encode_frame(header, raw_payload)
+        return self._render(template, transaction_id, datalogger_serial)
 
     def generate_set_config_response_frame(
         self, transaction_id: int, register: int, datalogger_serial: str, ack: bool
@@ -95,7 +138,7 @@ class FrameGenerator:
             protocol_id=0,
             unit_id=0,
             function_code=FunctionCode.SET_CONFIG,
-            length=len(payload),
+            length=len(payload) + CRC16_LENGTH,
         )
 
         payload[0:10] = ByteEncoder.encode_str(datalogger_serial, 10)
@@ -109,5 +152,41 @@ class FrameGenerator:
         payload = ACK if ack else NACK
         return self.encoder.encode_frame(header, payload)
 
-    def set_datalogger_serial(self, raw_payload: bytes, datalogger_serial: str):
-        return ByteEncoder.encode_str(datalogger_serial, 10) + raw_payload[10:]
+    def get_inverter(self, datalogger_serial: str) -> SolarInverter:
+        """The simulated inverter behind a datalogger, created on first use."""
+        inverter = self._inverters.get(datalogger_serial)
+        if inverter is None:
+            serial = f"{self._inverter_prefix}{datalogger_serial[len(self._inverter_prefix) :]}"
+            inverter = SolarInverter(serial, self.solar)
+            self._inverters[datalogger_serial] = inverter
+        return inverter
+
+    def _set_registers(
+        self, template: FrameTemplate, datalogger_serial: str, timestamp: datetime
+    ) -> None:
+        inverter = self.get_inverter(datalogger_serial)
+        values = inverter.sample(timestamp)
+        values.update(datetime_values("timestamp", timestamp, year_offset=2000))
+
+        template.set_payload(
+            INVERTER_SERIAL_OFFSET, ByteEncoder.encode_str(inverter.serial, SERIAL_LENGTH)
+        )
+        template.set_payload(DATA_REGISTERS_OFFSET, DATA_REGISTERS.pack(values))
+
+    def _render(
+        self, template: FrameTemplate, transaction_id: int, datalogger_serial: str
+    ) -> bytes:
+        template.set_transaction_id(transaction_id)
+        template.set_payload(
+            DATALOGGER_SERIAL_OFFSET, ByteEncoder.encode_str(datalogger_serial, SERIAL_LENGTH)
+        )
+        return template.render()
+
+    @staticmethod
+    def _encode_templates(
+        encoder: FrameEncoder, headers: list[MBAPHeader], payloads: list[bytes]
+    ) -> list[FrameTemplate]:
+        return [
+            encoder.encode_template(header, payload)
+            for header, payload in zip(headers, payloads, strict=True)
+        ]
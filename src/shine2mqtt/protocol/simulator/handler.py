@@ -19,9 +19,11 @@ class ClientMessageHandler:
         self,
         generator: FrameGenerator,
         announce_callback: Callable[[GrowattAckMessage], None] | None = None,
+        buffered_data_callback: Callable[[GrowattAckMessage], None] | None = None,
     ):
         self.generator = generator
         self._announce_callback = announce_callback
+        self._buffered_data_callback = buffered_data_callback
 
     def set_announce_callback(self, callback: Callable[[GrowattAckMessage], None]) -> None:
         self._announce_callback = callback
@@ -43,6 +45,7 @@ class ClientMessageHandler:
                 logger.info(
                     f"✓ Received ACK for BUFFERED_DATA ({hex_value}) response, {transaction_id=}"
                 )
+                self._buffered_data_callback(message) if self._buffered_data_callback else None
             case GrowattPingMessage():
                 logger.info(f"✓ Received PING ({hex_value}) response, {transaction_id=}")
             case GrowattGetConfigRequestMessage():
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import timedelta
 
 from shine2mqtt.protocol.frame.decoder import FrameDecoder
 from shine2mqtt.protocol.frame.header.header import FunctionCode
@@ -52,16 +53,36 @@ class ClientProtocolSession:
         if self._need_to_send_data():
             actions.append(SendMessageAction(function_code=FunctionCode.DATA))
 
+        if self.session_state.is_buffered_data_pending():
+            actions.append(SendMessageAction(function_code=FunctionCode.BUFFERED_DATA))
+
         if self._need_to_send_ping():
             actions.append(SendMessageAction(function_code=FunctionCode.PING))
 
         return actions
 
+    def get_next_send_time(self) -> float:
+        """Clock time from which get_pending_actions returns an action, as long as no frame
+        is sent or received in the meantime."""
+        if not self.session_state.is_announced():
+            return self._get_next_send_time(FunctionCode.ANNOUNCE, self.intervals.announce)
+
+        if self.session_state.is_buffered_data_pending():
+            return self.clock.now()
+
+        return min(
+            self._get_next_send_time(FunctionCode.DATA, self.intervals.data),
+            self._get_next_send_time(FunctionCode.PING, self.intervals.ping),
+        )
+
     def get_send_message_frame(self, action: SendMessageAction) -> bytes | None:
         match action.function_code:
             case FunctionCode.ANNOUNCE | FunctionCode.DATA | FunctionCode.PING:
                 return self._generate_frame(function_code=action.function_code)
 
+            case FunctionCode.BUFFERED_DATA:
+                return self._generate_buffered_data_frame()
+
             case _:
                 logger.warning(
                     f"⚠ No frame generation logic for function code {action.function_code}"
@@ -77,6 +98,24 @@ class ClientProtocolSession:
             datalogger_serial=self.session_state.datalogger_serial,
         )
 
+    def _generate_buffered_data_frame(self) -> bytes:
+        self.session_state.update_last_send(FunctionCode.BUFFERED_DATA, self.clock.now())
+        transaction_id = self.session_state.get_next_transaction_id(FunctionCode.BUFFERED_DATA)
+        remaining = self.session_state.take_buffered_data()
+        # The backlog holds the data intervals before now, the oldest is sent first
+        timestamp = self.clock.wall_time() - timedelta(
+            seconds=(remaining + 1) * self.intervals.data
+        )
+        return self.generator.generate_buffered_data_frame(
+            transaction_id=transaction_id,
+            datalogger_serial=self.session_state.datalogger_serial,
+            timestamp=timestamp,
+        )
+
+    def _get_next_send_time(self, function_code: FunctionCode, interval: int) -> float:
+        last_time = self.session_state.get_last_send(function_code)
+        return self.clock.now() if last_time is None else last_time + interval
+
     def _need_to_send_announce(self) -> bool:
         if self.session_state.is_announced():
             return False
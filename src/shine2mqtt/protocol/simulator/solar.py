@@ -0,0 +1,236 @@
+import math
+import random
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from shine2mqtt.protocol.messages.data.data import InverterStatus
+from shine2mqtt.protocol.simulator.config import SolarConfig
+
+# Resolution of the daily energy curve in seconds, energy in between is interpolated
+STEP = 300
+STEPS_PER_DAY = 86400 // STEP
+# Curves of the days around the sampled times kept per inverter
+CACHED_DAYS = 2
+ONE_DAY = timedelta(days=1)
+
+# Tilt of the earth's axis, the declination of the sun at the solstices
+MAX_DECLINATION = math.radians(23.44)
+# Hour angle of the sun per hour from solar noon
+HOUR_ANGLE = math.pi / 12
+# Low sun shines through more atmosphere, sunlight scales with sin(elevation) ** exponent
+AIR_MASS_EXPONENT = 1.3
+# DC power below which an inverter is waiting for the sun (W)
+START_POWER = 20.0
+# Heating of the inverter above ambient at peak power (°C)
+PEAK_HEATING = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Day:
+    # Height of the sun over the day: sin(elevation) = offset + amplitude * cos(hour angle)
+    offset: float
+    amplitude: float
+    # Share of the sunlight the clouds block at most on this day
+    cloudiness: float
+    # Ambient temperature (°C)
+    ambient: float
+    # Time of the cloud drift at midnight (s)
+    start: float
+    # Cumulative AC energy (Wh) and run time (s) at every step of the day
+    energy: array
+    run_time: array
+
+
+class SolarInverter:
+    """Parametric model of a solar inverter, the register values of a DATA message at any time.
+
+    Power follows the height of the sun at the configured latitude, dimmed by clouds that
+    drift over the day and vary per day. The energy and run time counters start at midnight of
+    the first sampled day and are integrated per day from the same curve, so a backlog of older
+    samples counts up to the newer ones in whatever order they are sampled.
+
+    All parameters are derived from the serial, the same serial gives the same inverter.
+    """
+
+    def __init__(self, serial: str, config: SolarConfig):
+        self.serial = serial
+        self._config = config
+        parameters = random.Random(serial)
+        self._noise = random.Random(f"{serial}:noise")
+
+        self.peak_power = config.peak_power * parameters.uniform(0.75, 1.25)
+        self.efficiency = parameters.uniform(0.95, 0.975)
+        # Share of the power on the first string, inverters with one string report zeros for the
+        # second
+        self.string_share = parameters.uniform(0.4, 0.6) if parameters.random() < 0.5 else 1.0
+        self.voltage_dc = parameters.uniform(300.0, 380.0)
+        # Local time of solar noon, shifted by the longitude in the time zone
+        self.solar_noon = parameters.uniform(12.5, 13.75)
+        # Angular speed (rad/s) and phase of the cloud drift
+        self._clouds = [
+            (2 * math.pi / parameters.uniform(600.0, 7200.0), parameters.uniform(0, 2 * math.pi))
+            for _ in range(3)
+        ]
+
+        # Counters at midnight of the first sampled day
+        self._energy = parameters.uniform(500.0, 20000.0) * 1000
+        self._run_time = self._energy / self.peak_power * 3600 * parameters.uniform(2.0, 3.0)
+
+        self._days: dict[date, _Day] = {}
+        # Energy and run time of whole days, and counted from the first sampled day on
+        self._day_totals: dict[date, tuple[float, float]] = {}
+        self._before: dict[date, tuple[float, float]] = {}
+        self._origin: date | None = None
+
+    def sample(self, timestamp: datetime) -> dict[str, float]:
+        """Values of the DATA registers at the timestamp, by layout field name."""
+        day = self._day(timestamp.date())
+        seconds = (
+            timestamp.hour * 3600
+            + timestamp.minute * 60
+            + timestamp.second
+            + timestamp.microsecond / 1e6
+        )
+
+        power_dc = self._power_dc(day, seconds)
+        power_ac = power_dc * self.efficiency
+        energy_today, energy_total, run_time = self._counters(timestamp.date(), day, seconds)
+        # Only AC energy is integrated, DC energy follows from the efficiency
+        energy_dc_today = energy_today / self.efficiency
+        energy_dc_total = energy_total / self.efficiency
+        share = self.string_share
+        voltage_ac = self._noise.gauss(230.0, 1.5)
+
+        return {
+            "inverter_status": (
+                InverterStatus.NORMAL if power_dc else InverterStatus.WAITING
+            ).value,
+            "power_dc": power_dc,
+            **self._string(1, power_dc * share),
+            **self._string(2, power_dc * (1 - share)),
+            "power_ac": power_ac,
+            "frequency_ac": self._noise.gauss(50.0, 0.02),
+            "voltage_ac_1": voltage_ac,
+            "current_ac_1": power_ac / voltage_ac,
+            "power_ac_1": power_ac,
+            # Single phase, the line voltage is the phase voltage
+            "voltage_ac_l1_l2": voltage_ac,
+            "voltage_ac_l2_l3": 0.0,
+            "voltage_ac_l3_l1": 0.0,
+            "total_run_time": int(run_time),
+            "energy_ac_today": energy_today,
+            "energy_ac_total": energy_total,
+            "energy_dc_total": energy_dc_total,
+            "energy_dc_1_today": energy_dc_today * share,
+            "energy_dc_1_total": energy_dc_total * share,
+            "energy_dc_2_today": energy_dc_today * (1 - share),
+            "energy_dc_2_total": energy_dc_total * (1 - share),
+            "temperature": day.ambient + PEAK_HEATING * power_dc / self.peak_power,
+        }
+
+    def _string(self, number: int, power: float) -> dict[str, float]:
+        voltage = current = 0.0
+        if power:
+            # The MPP voltage drops in weak light
+            light = min(1.0, 5 * power / self.peak_power)
+            voltage = self.voltage_dc * (0.85 + 0.15 * light) * self._noise.gauss(1.0, 0.005)
+            current = power / voltage
+        return {
+            f"voltage_dc_{number}": voltage,
+            f"current_dc_{number}": current,
+            f"power_dc_{number}": power,
+        }
+
+    def _power_dc(self, day: _Day, seconds: float) -> float:
+        hour_angle = (seconds / 3600 - self.solar_noon) * HOUR_ANGLE
+        sin_elevation = day.offset + day.amplitude * math.cos(hour_angle)
+        if sin_elevation <= 0:
+            return 0.0
+
+        time = day.start + seconds
+        drift = sum(math.sin(speed * time + phase) for speed, phase in self._clouds)
+        clouds = 1 - day.cloudiness * (0.5 + 0.5 * drift / len(self._clouds))
+
+        power = self.peak_power * sin_elevation**AIR_MASS_EXPONENT * clouds
+        return power if power >= START_POWER else 0.0
+
+    def _counters(self, date_: date, day: _Day, seconds: float) -> tuple[float, float, float]:
+        """AC energy today and in total (kWh) and the run time (s) at the time of the day."""
+        position = seconds / STEP
+        index = min(int(position), STEPS_PER_DAY - 1)
+        fraction = position - index
+        energy = day.energy[index] + (day.energy[index + 1] - day.energy[index]) * fraction
+        run_time = day.run_time[index] + (day.run_time[index + 1] - day.run_time[index]) * fraction
+
+        energy_before, run_time_before = self._counted_before(date_)
+        return (
+            energy / 1000,
+            (self._energy + energy_before + energy) / 1000,
+            self._run_time + run_time_before + run_time,
+        )
+
+    def _counted_before(self, date_: date) -> tuple[float, float]:
+        """Energy (Wh) and run time (s) from midnight of the first sampled day to this day."""
+        if self._origin is None:
+            self._origin = date_
+            self._before[date_] = (0.0, 0.0)
+
+        # Walk towards the first sampled day until a counted day
+        forward = date_ > self._origin
+        uncounted = []
+        while date_ not in self._before:
+            uncounted.append(date_)
+            date_ -= ONE_DAY if forward else -ONE_DAY
+
+        energy, run_time = self._before[date_]
+        for date_ in reversed(uncounted):
+            if forward:
+                day_energy, day_run_time = self._totals(date_ - ONE_DAY)
+            else:
+                day_energy, day_run_time = self._totals(date_)
+                day_energy, day_run_time = -day_energy, -day_run_time
+            energy += day_energy
+            run_time += day_run_time
+            self._before[date_] = (energy, run_time)
+
+        return energy, run_time
+
+    def _totals(self, date_: date) -> tuple[float, float]:
+        if date_ not in self._day_totals:
+            self._day(date_)
+        return self._day_totals[date_]
+
+    def _day(self, date_: date) -> _Day:
+        if (day := self._days.get(date_)) is not None:
+            return day
+
+        day_of_year = date_.timetuple().tm_yday
+        declination = MAX_DECLINATION * math.sin(2 * math.pi * (284 + day_of_year) / 365)
+        latitude = math.radians(self._config.latitude)
+        weather = random.Random(f"{self.serial}:{date_.isoformat()}")
+        day = _Day(
+            offset=math.sin(latitude) * math.sin(declination),
+            amplitude=math.cos(latitude) * math.cos(declination),
+            # Mostly clear days, now and then an overcast one
+            cloudiness=self._config.cloudiness * weather.random() ** 2,
+            # Coldest around January 20th
+            ambient=10.0 - 8.0 * math.cos(2 * math.pi * (day_of_year - 20) / 365),
+            start=date_.toordinal() * 86400.0,
+            energy=array("d", [0.0]),
+            run_time=array("d", [0.0]),
+        )
+
+        # Trapezoidal integration of the power over the steps of the day
+        previous = self._power_dc(day, 0.0) * self.efficiency
+        for step in range(1, STEPS_PER_DAY + 1):
+            power = self._power_dc(day, step * STEP) * self.efficiency
+            day.energy.append(day.energy[-1] + (previous + power) / 2 * STEP / 3600)
+            day.run_time.append(day.run_time[-1] + (STEP if previous or power else 0))
+            previous = power
+
+        if len(self._days) >= CACHED_DAYS:
+            del self._days[next(iter(self._days))]
+        self._days[date_] = day
+        self._day_totals[date_] = (day.energy[-1], day.run_time[-1])
+        return day
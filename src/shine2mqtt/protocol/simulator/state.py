@@ -9,8 +9,11 @@ class ClientProtocolSessionState:
     protocol_id: int
     unit_id: int
     datalogger_serial: str
+    # BUFFERED_DATA frames still to send, the next one once the server acknowledged the last
+    buffered_data_backlog: int = 0
 
     _announced: bool = False
+    _buffered_data_in_flight: bool = False
     _transaction_id: dict[FunctionCode, int] = field(
         default_factory=lambda: {
             FunctionCode.PING: 0,
@@ -44,6 +47,20 @@ class ClientProtocolSessionState:
     def announce(self, message: GrowattAckMessage) -> None:
         self._announced = message.ack
 
+    def is_buffered_data_pending(self) -> bool:
+        return (
+            self._announced and self.buffered_data_backlog > 0 and not self._buffered_data_in_flight
+        )
+
+    def take_buffered_data(self) -> int:
+        """Take the next frame of the backlog, returns how many frames remain after it."""
+        self.buffered_data_backlog -= 1
+        self._buffered_data_in_flight = True
+        return self.buffered_data_backlog
+
+    def acknowledge_buffered_data(self, message: GrowattAckMessage) -> None:
+        self._buffered_data_in_flight = False
+
     def get_next_transaction_id(self, function_code: FunctionCode) -> int:
         """Get a new transaction ID for a given function code to use in outgoing messages."""
         self._transaction_id[function_code] += 1
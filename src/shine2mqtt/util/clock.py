@@ -1,15 +1,74 @@
 import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Protocol
 
 
 class ClockService(Protocol):
     def now(self) -> float: ...
 
+    def wall_time(self) -> datetime: ...
+
 
 class MonotonicClockService:
     def now(self) -> float:
         return time.monotonic()
 
+    def wall_time(self) -> datetime:
+        return datetime.now()
+
+
+class VirtualClockService:
+    """Clock for simulations that runs `speed` times faster than real time.
+
+    Without a speed the clock stands still until it is advanced, see VirtualTimeEventLoop.
+    The wall time starts at the epoch and advances with the clock.
+    """
+
+    def __init__(self, speed: float | None = None, epoch: datetime | None = None):
+        if speed is not None and speed <= 0:
+            raise ValueError("Clock speed must be positive")
+
+        self.speed = speed
+        self._start = time.monotonic()
+        self._epoch = epoch or datetime.now()
+        self._elapsed = 0.0
+
+    @property
+    def stepped(self) -> bool:
+        return self.speed is None
+
+    def now(self) -> float:
+        if self.speed is None:
+            return self._start + self._elapsed
+        return self._start + (time.monotonic() - self._start) * self.speed
+
+    def wall_time(self) -> datetime:
+        return self._epoch + timedelta(seconds=self.now() - self._start)
+
+    def advance(self, seconds: float) -> None:
+        if self.speed is not None:
+            raise RuntimeError("Only a stepped clock can be advanced")
+        self._elapsed += seconds
+
+
+@dataclass
+class ClockConfig:
+    # Run all timers this many times faster than real time, e.g. for soak tests
+    speed: float = 1.0
+    # Jump straight to the next timer whenever there is nothing to do, ignores speed
+    step: bool = False
+
+    @property
+    def virtual(self) -> bool:
+        return self.step or self.speed != 1.0
+
+
+def create_clock(config: ClockConfig) -> ClockService:
+    if not config.virtual:
+        return MonotonicClockService()
+    return VirtualClockService(speed=None if config.step else config.speed)
+
 
 def has_interval_elapsed(now: float, last_time: float | None, interval: int) -> bool:
     if last_time is None:
@@ -0,0 +1,93 @@
+import asyncio
+import selectors
+from collections.abc import Callable
+from functools import partial
+
+from shine2mqtt.util.clock import ClockService, VirtualClockService
+
+
+class VirtualTimeSelector(selectors.BaseSelector):
+    """Scales the waits of the event loop to the virtual clock, or skips them when stepped."""
+
+    # Steps go a bit past the timer, so rounding never leaves the clock just short of it
+    STEP_OVERSHOOT = 1e-6
+
+    def __init__(
+        self,
+        clock: VirtualClockService,
+        selector: selectors.BaseSelector | None = None,
+        hold: Callable[[], bool] | None = None,
+    ):
+        self._clock = clock
+        self._selector = selector or selectors.DefaultSelector()
+        # Whether work outside the loop runs that a step would time out, e.g. in an executor
+        self._hold = hold
+
+    def select(self, timeout: float | None = None) -> list:
+        if timeout is None or timeout <= 0:
+            return self._selector.select(timeout)
+
+        if self._clock.speed is not None:
+            return self._selector.select(timeout / self._clock.speed)
+
+        if self._hold is not None and self._hold():
+            return self._selector.select(timeout)
+
+        # Nothing to do until the next timer unless I/O is ready right now
+        events = self._selector.select(0)
+        if not events:
+            self._clock.advance(timeout + self.STEP_OVERSHOOT)
+        return events
+
+    def register(self, fileobj, events, data=None) -> selectors.SelectorKey:
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj) -> selectors.SelectorKey:
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None) -> selectors.SelectorKey:
+        return self._selector.modify(fileobj, events, data)
+
+    def get_map(self):
+        return self._selector.get_map()
+
+    def close(self) -> None:
+        self._selector.close()
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose timers, e.g. asyncio.sleep and wait_for, run on a virtual clock.
+
+    A stepped clock moves to the next timer as soon as no callback or I/O is ready, so only
+    peers in the same process keep up with it. Peers in other processes, like an MQTT broker
+    or server workers, see the time jump. While executor jobs run, e.g. a blocking connect or
+    a DNS lookup, the clock holds and the loop waits for them in real time.
+    """
+
+    def __init__(self, clock: VirtualClockService):
+        self._executor_jobs = 0
+        super().__init__(selector=VirtualTimeSelector(clock, hold=lambda: self._executor_jobs > 0))
+        self._virtual_clock = clock
+
+    def time(self) -> float:
+        return self._virtual_clock.now()
+
+    def run_in_executor(self, executor, func, *args) -> asyncio.Future:
+        future = super().run_in_executor(executor, func, *args)
+        self._executor_jobs += 1
+        future.add_done_callback(self._executor_job_done)
+        return future
+
+    def _executor_job_done(self, future: asyncio.Future) -> None:
+        self._executor_jobs -= 1
+
+    async def shutdown_default_executor(self, timeout: float | None = None) -> None:
+        # A timeout would be virtual too, so a stepped clock would not wait for the threads
+        await super().shutdown_default_executor(timeout=None)
+
+
+def create_loop_factory(clock: ClockService) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Loop factory for asyncio.run, None (the default loop) unless the clock is virtual."""
+    if isinstance(clock, VirtualClockService):
+        return partial(VirtualTimeEventLoop, clock)
+    return None
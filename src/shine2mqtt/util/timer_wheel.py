@@ -0,0 +1,77 @@
+import math
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, eq=False)
+class Timer[T]:
+    deadline: float
+    item: T
+    cancelled: bool = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TimerWheel[T]:
+    """Hashed timer wheel, schedules timers in constant time and expires them per tick.
+
+    Timers are kept in a ring of slots, one per tick of time. Deadlines further ahead than one
+    revolution share a slot with nearer ones and stay until the wheel has turned far enough.
+    Cancelled timers are dropped when their slot is visited.
+    """
+
+    def __init__(self, start: float, tick: float = 0.1, slots: int = 4096):
+        self._tick = tick
+        self._slots: list[list[tuple[int, Timer[T]]]] = [[] for _ in range(slots)]
+        # Tick of the last advance, its slot can hold timers due later in the same tick
+        self._current = math.floor(start / tick)
+
+    def schedule(self, deadline: float, item: T) -> Timer[T]:
+        timer = Timer(deadline, item)
+        tick = max(math.floor(deadline / self._tick), self._current)
+        self._slots[tick % len(self._slots)].append((tick, timer))
+        return timer
+
+    def advance(self, now: float) -> list[T]:
+        """Expire all timers with a deadline up to now, returns their items by deadline."""
+        target = math.floor(now / self._tick)
+        slots = len(self._slots)
+
+        expired: list[Timer[T]] = []
+        # Past one revolution every slot is visited once, whatever the time elapsed
+        for tick in range(self._current, self._current + min(target - self._current + 1, slots)):
+            slot = self._slots[tick % slots]
+            if not slot:
+                continue
+            pending = []
+            for entry in slot:
+                timer = entry[1]
+                if timer.cancelled:
+                    continue
+                if timer.deadline <= now:
+                    expired.append(timer)
+                else:
+                    pending.append(entry)
+            slot[:] = pending
+
+        self._current = max(target, self._current)
+        expired.sort(key=lambda timer: timer.deadline)
+        return [timer.item for timer in expired]
+
+    def next_deadline(self) -> float | None:
+        """Deadline of the first timer to expire, None without timers."""
+        slots = len(self._slots)
+        for tick in range(self._current, self._current + slots):
+            deadlines = [
+                timer.deadline
+                for timer_tick, timer in self._slots[tick % slots]
+                if timer_tick == tick and not timer.cancelled
+            ]
+            if deadlines:
+                return min(deadlines)
+
+        # All timers are more than one revolution ahead
+        return min(
+            (timer.deadline for slot in self._slots for _, timer in slot if not timer.cancelled),
+            default=None,
+        )
@@ -5,7 +5,11 @@ import pytest
 from shine2mqtt.protocol.frame.decoder import FrameDecoder
 from shine2mqtt.protocol.frame.factory import FrameFactory
 from shine2mqtt.protocol.messages.announce.announce import GrowattAnnounceMessage, SafetyFunction
-from shine2mqtt.protocol.messages.data.data import GrowattDataMessage, InverterStatus
+from shine2mqtt.protocol.messages.data.data import (
+    GrowattBufferedDataMessage,
+    GrowattDataMessage,
+    InverterStatus,
+)
 from shine2mqtt.protocol.messages.get_config.get_config import (
     GrowattGetConfigResponseMessage,
 )
@@ -69,7 +73,7 @@ EXPECTED_MESSAGES = [
         frequency_ac_high_limit=51.5,
         power_factor_control_mode="Unity PF",
     ),
-    GrowattDataMessage(
+    GrowattBufferedDataMessage(
         header=buffered_data_headers[0],
         datalogger_serial=DATALOGGER_SERIAL,
         inverter_serial=INVERTER_SERIAL,
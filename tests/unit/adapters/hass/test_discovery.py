@@ -216,3 +216,45 @@ class TestMqttDiscoveryBuilderTopics:
 
         assert builder.build_inverter_discovery_topic() == "ha/device/test_inverter/config"
         assert builder.build_datalogger_discovery_topic() == "ha/device/test_logger/config"
+
+
+class TestMqttDiscoveryBuilderAggregatedState:
+    def test_state_sensors_read_from_aggregated_state_topic(
+        self, config: HassDiscoveryConfig, sensor_map: dict[str, dict[str, str]]
+    ):
+        builder = HassDiscoveryPayloadBuilder(
+            config=config,
+            datalogger_sensor_map=sensor_map,
+            inverter_sensor_map=sensor_map,
+            inverter_state_sensors={"temperature"},
+        )
+
+        components = builder.build_inverter_discovery_message("1.2.3", "INV789")["components"]
+
+        assert components["temperature"]["state_topic"] == "solar/inverter/state"
+        assert components["temperature"]["value_template"] == "{{ value_json.temperature }}"
+        assert components["simple"]["state_topic"] == "solar/inverter/sensor/simple"
+        assert components["simple"]["value_template"] == "{{ value_json.value }}"
+
+    def test_datalogger_sensors_keep_per_sensor_topics(
+        self, config: HassDiscoveryConfig, sensor_map: dict[str, dict[str, str]]
+    ):
+        builder = HassDiscoveryPayloadBuilder(
+            config=config,
+            datalogger_sensor_map=sensor_map,
+            inverter_sensor_map=sensor_map,
+            inverter_state_sensors={"temperature"},
+        )
+        datalogger = DataLogger(
+            serial="ABC123",
+            sw_version="1.2.3",
+            hw_version="4.5.6",
+            protocol_id=0,
+            unit_id=1,
+            ip_address="192.168.1.100",
+            mac_address="00:11:22:33:44:55",
+        )
+
+        components = builder.build_datalogger_discovery_message(datalogger)["components"]
+
+        assert components["temperature"]["state_topic"] == "solar/datalogger/sensor/temperature"
@@ -0,0 +1,95 @@
+import json
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from shine2mqtt.adapters.hass.config import HassDiscoveryConfig
+from shine2mqtt.adapters.hass.discovery import HassDiscoveryPayloadBuilder
+from shine2mqtt.adapters.hass.discovery_mapper import HassDiscoveryMapper
+from shine2mqtt.adapters.hass.map import DATALOGGER_SENSOR_MAP, INVERTER_SENSOR_MAP
+from shine2mqtt.domain.events.events import DataloggerAnnouncedEvent
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.domain.models.inverter import Inverter, InverterSettings
+
+
+@pytest.fixture
+def event() -> DataloggerAnnouncedEvent:
+    return DataloggerAnnouncedEvent(
+        datalogger_serial="XGDABCDEFG",
+        timestamp=datetime(2026, 1, 12, 11, 27),
+        datalogger=DataLogger(
+            serial="XGDABCDEFG",
+            protocol_id=6,
+            unit_id=1,
+            sw_version="3.1.0.0",
+            hw_version="2.0",
+            ip_address="192.168.1.10",
+            mac_address="00:11:22:33:44:55",
+        ),
+        inverter=Inverter(
+            serial="MLM0000001",
+            fw_version="GH1.0",
+            control_fw_version="ZAbc",
+            settings=MagicMock(spec=InverterSettings),
+        ),
+    )
+
+
+@pytest.fixture
+def builder() -> HassDiscoveryPayloadBuilder:
+    return HassDiscoveryPayloadBuilder(
+        config=HassDiscoveryConfig(),
+        datalogger_sensor_map=DATALOGGER_SENSOR_MAP,
+        inverter_sensor_map=INVERTER_SENSOR_MAP,
+    )
+
+
+class TestHassDiscoveryMapper:
+    def test_publishes_inverter_and_datalogger_discovery(self, builder, event):
+        mapper = HassDiscoveryMapper(builder, enabled=True)
+
+        messages = mapper.get_discovery_messages(event)
+
+        assert [m.topic for m in messages] == [
+            builder.build_inverter_discovery_topic(),
+            builder.build_datalogger_discovery_topic(),
+        ]
+        assert json.loads(messages[0].payload)["device"]["serial_number"] == "MLM0000001"
+        assert all(m.retain and m.qos == 1 for m in messages)
+
+    def test_disabled_publishes_nothing(self, builder, event):
+        assert HassDiscoveryMapper(builder, enabled=False).get_discovery_messages(event) == []
+
+    def test_same_identity_is_published_once(self, builder, event):
+        mapper = HassDiscoveryMapper(builder, enabled=True)
+        mapper.get_discovery_messages(event)
+
+        assert mapper.get_discovery_messages(event) == []
+
+    def test_changed_identity_is_published_again(self, builder, event):
+        mapper = HassDiscoveryMapper(builder, enabled=True)
+        mapper.get_discovery_messages(event)
+        event = replace(event, inverter=replace(event.inverter, fw_version="GH1.1"))
+
+        messages = mapper.get_discovery_messages(event)
+
+        assert json.loads(messages[0].payload)["device"]["sw_version"] == "GH1.1"
+
+    def test_reset_announced_republishes_cached_payloads(self, event):
+        builder = MagicMock(
+            wraps=HassDiscoveryPayloadBuilder(
+                config=HassDiscoveryConfig(),
+                datalogger_sensor_map=DATALOGGER_SENSOR_MAP,
+                inverter_sensor_map=INVERTER_SENSOR_MAP,
+            )
+        )
+        mapper = HassDiscoveryMapper(builder, enabled=True)
+        first = mapper.get_discovery_messages(event)
+
+        mapper.reset_announced()
+        second = mapper.get_discovery_messages(event)
+
+        assert second == first
+        builder.build_inverter_discovery_message.assert_called_once()
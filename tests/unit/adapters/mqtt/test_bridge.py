@@ -0,0 +1,54 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shine2mqtt.adapters.mqtt.bridge import MqttBridge
+from shine2mqtt.adapters.mqtt.config import MqttConfig
+from shine2mqtt.adapters.mqtt.mapper import MqttEventMapper
+
+
+class FakeConnection:
+    """Accepts the same publish arguments as the aiomqtt (paho) client."""
+
+    def __init__(self):
+        self.published: list[tuple[str, str, int, bool]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def publish(
+        self, topic, payload=None, qos=0, retain=False, properties=None, *, timeout=None
+    ):
+        self.published.append((topic, payload, qos, retain))
+
+
+class TestMqttBridge:
+    @pytest.mark.asyncio
+    async def test_publishes_availability_on_connect_and_shutdown(self):
+        connection = FakeConnection()
+        client = MagicMock()
+        client.connect.return_value = connection
+        publisher = MagicMock()
+        publisher.run = AsyncMock(side_effect=asyncio.CancelledError)
+        publisher.flush = AsyncMock()
+        subscriber = MagicMock()
+        subscriber.run = AsyncMock()
+        bridge = MqttBridge(
+            client=client,
+            publisher=publisher,
+            subscriber=subscriber,
+            mapper=MqttEventMapper(MqttConfig()),
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await bridge.run()
+
+        assert connection.published == [
+            ("solar/state", "online", 1, True),
+            ("solar/state", "offline", 1, True),
+        ]
+        publisher.flush.assert_awaited_once_with(connection)
@@ -0,0 +1,88 @@
+import pytest
+
+from shine2mqtt.adapters.mqtt.delta import DeltaPublishFilter
+
+SERIAL = "XGDABCDEFG"
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def now(self) -> float:
+        return self.time
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def delta_filter(clock) -> DeltaPublishFilter:
+    sensor_map = {
+        "voltage_ac_l1": {
+            "entity_id": "voltage_ac_l1",
+            "name": "Voltage",
+            "icon": "",
+            "deadband": 1.0,
+        },
+        "power_ac": {"entity_id": "power_ac", "name": "Power", "icon": ""},
+    }
+    return DeltaPublishFilter(sensor_map, max_age=60, clock=clock)
+
+
+class TestDeltaPublishFilter:
+    def test_first_values_are_published(self, delta_filter):
+        fields = [("voltage_ac_l1", 230.0), ("power_ac", 100.0)]
+
+        assert delta_filter.changed_fields(SERIAL, fields) == fields
+
+    def test_unchanged_values_are_dropped(self, delta_filter):
+        delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)])
+
+        assert delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)]) == []
+        assert delta_filter.changed_fields(SERIAL, [("power_ac", 100.1)]) == [("power_ac", 100.1)]
+
+    def test_changes_within_deadband_are_dropped(self, delta_filter):
+        delta_filter.changed_fields(SERIAL, [("voltage_ac_l1", 230.0)])
+
+        assert delta_filter.changed_fields(SERIAL, [("voltage_ac_l1", 230.8)]) == []
+        assert delta_filter.changed_fields(SERIAL, [("voltage_ac_l1", 231.1)]) == [
+            ("voltage_ac_l1", 231.1)
+        ]
+
+    def test_deadband_is_relative_to_last_published_value(self, delta_filter):
+        delta_filter.changed_fields(SERIAL, [("voltage_ac_l1", 230.0)])
+        delta_filter.changed_fields(SERIAL, [("voltage_ac_l1", 230.6)])
+
+        assert delta_filter.changed_fields(SERIAL, [("voltage_ac_l1", 231.2)]) == [
+            ("voltage_ac_l1", 231.2)
+        ]
+
+    def test_unchanged_value_is_republished_after_max_age(self, delta_filter, clock):
+        delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)])
+
+        clock.time = 59.9
+        assert delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)]) == []
+        clock.time = 60.0
+        assert delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)]) == [("power_ac", 100.0)]
+
+    def test_cache_is_kept_per_datalogger(self, delta_filter):
+        delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)])
+
+        assert delta_filter.changed_fields("OTHER", [("power_ac", 100.0)]) == [("power_ac", 100.0)]
+
+    def test_reset_publishes_values_again(self, delta_filter):
+        delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)])
+        delta_filter.reset(SERIAL)
+
+        assert delta_filter.changed_fields(SERIAL, [("power_ac", 100.0)]) == [("power_ac", 100.0)]
+
+    def test_any_changed_marks_all_fields_published(self, delta_filter):
+        fields = [("voltage_ac_l1", 230.0), ("power_ac", 100.0)]
+        assert delta_filter.any_changed(SERIAL, fields) is True
+        assert delta_filter.any_changed(SERIAL, fields) is False
+
+        assert delta_filter.any_changed(SERIAL, [("voltage_ac_l1", 230.0), ("power_ac", 90.0)])
+        assert delta_filter.changed_fields(SERIAL, [("power_ac", 90.0)]) == []
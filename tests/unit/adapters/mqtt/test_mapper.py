@@ -0,0 +1,148 @@
+import json
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from shine2mqtt.adapters.hass.map import INVERTER_SENSOR_MAP, INVERTER_STATE_SENSORS
+from shine2mqtt.adapters.mqtt.config import MqttConfig, PublishMode
+from shine2mqtt.adapters.mqtt.delta import DeltaPublishFilter
+from shine2mqtt.adapters.mqtt.mapper import MqttEventMapper
+from shine2mqtt.domain.events.events import (
+    InverterBacklogDrainedEvent,
+    InverterHistoryRecordedEvent,
+    InverterStateUpdatedEvent,
+)
+from shine2mqtt.domain.models.inverter import (
+    INVERTER_STATE_FIELDS,
+    InverterReading,
+    InverterState,
+    InverterStatus,
+)
+from shine2mqtt.util.clock import MonotonicClockService
+
+
+@pytest.fixture
+def event() -> InverterStateUpdatedEvent:
+    values = {field: 1.5 for field in INVERTER_STATE_FIELDS}
+    values["inverter_status"] = InverterStatus.NORMAL
+    values["power_ac"] = 197.7
+    return InverterStateUpdatedEvent(
+        datalogger_serial="XGDABCDEFG",
+        timestamp=datetime(2026, 1, 12, 11, 27),
+        state=InverterState(**values),
+    )
+
+
+class TestMqttEventMapperInverterState:
+    def test_per_sensor_mode_publishes_one_message_per_sensor(self, event):
+        mapper = MqttEventMapper(MqttConfig(publish_mode=PublishMode.PER_SENSOR))
+
+        messages = mapper.map_inverter_state(event)
+
+        assert len(messages) == len(INVERTER_STATE_SENSORS)
+        power_ac = next(m for m in messages if m.topic == "solar/inverter/sensor/power_ac")
+        assert json.loads(power_ac.payload) == {"value": 197.7}
+
+    def test_aggregated_mode_publishes_single_state_document(self, event):
+        mapper = MqttEventMapper(MqttConfig(publish_mode=PublishMode.AGGREGATED))
+
+        messages = mapper.map_inverter_state(event)
+
+        assert len(messages) == 1
+        assert messages[0].topic == "solar/inverter/state"
+        document = json.loads(messages[0].payload)
+        assert document.keys() == INVERTER_STATE_SENSORS.keys()
+        assert document["power_ac"] == 197.7
+
+
+class TestMqttEventMapperChangesOnly:
+    @pytest.fixture
+    def delta_filter(self) -> DeltaPublishFilter:
+        return DeltaPublishFilter(INVERTER_SENSOR_MAP, max_age=300, clock=MonotonicClockService())
+
+    def test_per_sensor_mode_publishes_only_changed_sensors(self, event, delta_filter):
+        mapper = MqttEventMapper(MqttConfig(), delta_filter=delta_filter)
+        mapper.map_inverter_state(event)
+        event = replace(event, state=replace(event.state, power_ac=250.0))
+
+        messages = mapper.map_inverter_state(event)
+
+        assert [m.topic for m in messages] == ["solar/inverter/sensor/power_ac"]
+
+    def test_aggregated_mode_skips_unchanged_state(self, event, delta_filter):
+        mapper = MqttEventMapper(
+            MqttConfig(publish_mode=PublishMode.AGGREGATED), delta_filter=delta_filter
+        )
+
+        assert len(mapper.map_inverter_state(event)) == 1
+        assert mapper.map_inverter_state(event) == []
+
+    def test_reset_published_publishes_full_state_again(self, event, delta_filter):
+        mapper = MqttEventMapper(MqttConfig(), delta_filter=delta_filter)
+        mapper.map_inverter_state(event)
+
+        mapper.reset_published()
+
+        assert len(mapper.map_inverter_state(event)) == len(INVERTER_STATE_SENSORS)
+
+
+class TestMqttEventMapperHistory:
+    def test_every_reading_is_published_to_the_history_topic(self, event):
+        readings = tuple(
+            InverterReading(
+                timestamp=datetime(2026, 1, 12, 3, minute),
+                state=replace(event.state, power_ac=float(minute)),
+            )
+            for minute in (0, 5)
+        )
+        history = InverterHistoryRecordedEvent(
+            datalogger_serial="XGDABCDEFG", timestamp=datetime(2026, 1, 12, 11), readings=readings
+        )
+        mapper = MqttEventMapper(MqttConfig())
+
+        messages = mapper.map_inverter_history(history)
+
+        assert [m.topic for m in messages] == ["solar/inverter/history"] * 2
+        assert all(m.qos == 1 and not m.retain and not m.coalesce for m in messages)
+        documents = [json.loads(m.payload) for m in messages]
+        assert [d["timestamp"] for d in documents] == [
+            "2026-01-12T03:00:00",
+            "2026-01-12T03:05:00",
+        ]
+        assert [d["power_ac"] for d in documents] == [0.0, 5.0]
+        assert documents[0].keys() - {"timestamp"} == INVERTER_STATE_SENSORS.keys()
+
+    def test_history_does_not_affect_changes_only_state(self, event):
+        delta_filter = DeltaPublishFilter(
+            INVERTER_SENSOR_MAP, max_age=300, clock=MonotonicClockService()
+        )
+        mapper = MqttEventMapper(MqttConfig(), delta_filter=delta_filter)
+        history = InverterHistoryRecordedEvent(
+            datalogger_serial="XGDABCDEFG",
+            timestamp=datetime(2026, 1, 12, 11),
+            readings=(InverterReading(timestamp=datetime(2026, 1, 12, 3), state=event.state),),
+        )
+
+        mapper.map_inverter_history(history)
+
+        assert len(mapper.map_inverter_state(event)) == len(INVERTER_STATE_SENSORS)
+
+    def test_backlog_drained_reports_throughput(self):
+        drained = InverterBacklogDrainedEvent(
+            datalogger_serial="XGDABCDEFG",
+            timestamp=datetime(2026, 1, 12, 11),
+            readings=120,
+            duration=4.0,
+        )
+
+        message = MqttEventMapper(MqttConfig()).map_backlog_drained(drained)
+
+        assert message.topic == "solar/datalogger/backlog"
+        assert message.retain
+        assert json.loads(message.payload) == {
+            "readings": 120,
+            "duration": 4.0,
+            "rate": 30.0,
+            "timestamp": "2026-01-12T11:00:00",
+        }
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from shine2mqtt.adapters.mqtt.config import MqttPublishConfig
+from shine2mqtt.adapters.mqtt.message import MqttMessage
+from shine2mqtt.adapters.mqtt.pipeline import MqttPublishPipeline
+
+
+class FakeClient:
+    """Publishes only complete when the test releases them."""
+
+    def __init__(self):
+        self.started: list[tuple[str, str]] = []
+        self.acks: list[asyncio.Future[None]] = []
+
+    async def publish(self, topic, payload, qos=0, retain=False, timeout=None):
+        self.started.append((topic, payload))
+        ack = asyncio.get_running_loop().create_future()
+        self.acks.append(ack)
+        await ack
+
+    def ack_all(self):
+        for ack in self.acks:
+            if not ack.done():
+                ack.set_result(None)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestMqttPublishPipeline:
+    @pytest.mark.asyncio
+    async def test_publishes_concurrently_up_to_in_flight_window(self):
+        client = FakeClient()
+        pipeline = MqttPublishPipeline(client, MqttPublishConfig(max_in_flight=3))
+
+        for i in range(5):
+            await pipeline.publish(MqttMessage(topic=f"solar/{i}", payload=str(i)))
+        await settle()
+
+        assert len(client.started) == 3
+        assert pipeline.in_flight == 3
+        assert pipeline.pending == 2
+
+        client.ack_all()
+        await settle()
+        client.ack_all()
+        await pipeline.flush()
+
+        assert [topic for topic, _ in client.started] == [f"solar/{i}" for i in range(5)]
+        assert pipeline.published == 5
+
+    @pytest.mark.asyncio
+    async def test_coalesces_waiting_messages_for_same_topic(self):
+        client = FakeClient()
+        pipeline = MqttPublishPipeline(client, MqttPublishConfig(max_in_flight=1))
+
+        await pipeline.publish(MqttMessage(topic="solar/a", payload="1"))
+        await pipeline.publish(MqttMessage(topic="solar/b", payload="1"))
+        await pipeline.publish(MqttMessage(topic="solar/b", payload="2"))
+        await pipeline.publish(MqttMessage(topic="solar/b", payload="3"))
+        await settle()
+
+        client.ack_all()
+        await settle()
+        client.ack_all()
+        await pipeline.flush()
+
+        assert client.started == [("solar/a", "1"), ("solar/b", "3")]
+        assert pipeline.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_keeps_every_message_when_coalescing_disabled(self):
+        client = FakeClient()
+        config = MqttPublishConfig(max_in_flight=1, coalesce=False)
+        pipeline = MqttPublishPipeline(client, config)
+
+        for payload in ("1", "2", "3"):
+            await pipeline.publish(MqttMessage(topic="solar/a", payload=payload))
+
+        while pipeline.pending or pipeline.in_flight:
+            await settle()
+            client.ack_all()
+        await pipeline.flush()
+
+        assert client.started == [("solar/a", "1"), ("solar/a", "2"), ("solar/a", "3")]
+
+    @pytest.mark.asyncio
+    async def test_keeps_messages_that_opt_out_of_coalescing(self):
+        client = FakeClient()
+        pipeline = MqttPublishPipeline(client, MqttPublishConfig(max_in_flight=1))
+
+        for payload in ("1", "2", "3"):
+            await pipeline.publish(MqttMessage(topic="solar/a", payload=payload, coalesce=False))
+
+        while pipeline.pending or pipeline.in_flight:
+            await settle()
+            client.ack_all()
+        await pipeline.flush()
+
+        assert client.started == [("solar/a", "1"), ("solar/a", "2"), ("solar/a", "3")]
+        assert pipeline.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_blocks_while_pending_queue_is_full(self):
+        client = FakeClient()
+        config = MqttPublishConfig(max_in_flight=1, max_pending=1, coalesce=False)
+        pipeline = MqttPublishPipeline(client, config)
+
+        await pipeline.publish(MqttMessage(topic="solar/a", payload="1"))
+        await pipeline.publish(MqttMessage(topic="solar/a", payload="2"))
+        blocked = asyncio.create_task(pipeline.publish(MqttMessage(topic="solar/a", payload="3")))
+        await settle()
+        assert not blocked.done()
+
+        client.ack_all()
+        await settle()
+
+        assert blocked.done()
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_is_raised_from_next_call(self):
+        client = FakeClient()
+        pipeline = MqttPublishPipeline(client, MqttPublishConfig())
+
+        await pipeline.publish(MqttMessage(topic="solar/a", payload="1"))
+        await settle()
+        client.acks[0].set_exception(ConnectionError("broker gone"))
+        await settle()
+
+        with pytest.raises(ConnectionError):
+            await pipeline.publish(MqttMessage(topic="solar/b", payload="1"))
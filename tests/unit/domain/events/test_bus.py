@@ -0,0 +1,267 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from shine2mqtt.domain.events.bus import DomainEventBus, EventBusConfig, OverflowPolicy
+from shine2mqtt.domain.events.events import (
+    DataloggerAnnouncedEvent,
+    InverterHistoryRecordedEvent,
+    InverterStateUpdatedEvent,
+)
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.domain.models.inverter import Inverter, InverterState
+
+TIMESTAMP = datetime(2026, 1, 12, 11, 27)
+
+
+def state_event(serial: str = "A", index: int = 0) -> InverterStateUpdatedEvent:
+    state = MagicMock(spec=InverterState)
+    state.index = index
+    return InverterStateUpdatedEvent(datalogger_serial=serial, timestamp=TIMESTAMP, state=state)
+
+
+def announce_event(serial: str = "A") -> DataloggerAnnouncedEvent:
+    return DataloggerAnnouncedEvent(
+        datalogger_serial=serial,
+        timestamp=TIMESTAMP,
+        datalogger=MagicMock(spec=DataLogger),
+        inverter=MagicMock(spec=Inverter),
+    )
+
+
+def history_event(serial: str = "A") -> InverterHistoryRecordedEvent:
+    return InverterHistoryRecordedEvent(datalogger_serial=serial, timestamp=TIMESTAMP, readings=())
+
+
+def drain(subscription) -> list:
+    events = []
+    while not subscription.empty():
+        events.append(subscription.get_nowait())
+    return events
+
+
+class TestDomainEventBus:
+    @pytest.mark.asyncio
+    async def test_events_are_fanned_out_to_every_subscription(self):
+        bus = DomainEventBus()
+        mqtt = bus.subscribe("mqtt")
+        api = bus.subscribe("api")
+        event = state_event()
+
+        await bus.publish(event)
+
+        assert await mqtt.get() is event
+        assert await api.get() is event
+
+    @pytest.mark.asyncio
+    async def test_dataloggers_are_delivered_round_robin_in_order(self):
+        bus = DomainEventBus()
+        subscription = bus.subscribe("mqtt")
+        a1, a2, b1 = state_event("A", 1), state_event("A", 2), state_event("B", 1)
+
+        for event in (a1, a2, b1):
+            await bus.publish(event)
+
+        assert drain(subscription) == [a1, b1, a2]
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_publish(self):
+        bus = DomainEventBus()
+        subscription = bus.subscribe("mqtt")
+        event = state_event()
+
+        getter = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        await bus.publish(event)
+
+        assert await getter is event
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_newest_events(self):
+        bus = DomainEventBus(EventBusConfig(max_pending=2, overflow=OverflowPolicy.DROP_OLDEST))
+        subscription = bus.subscribe("mqtt")
+        events = [state_event(index=i) for i in range(3)]
+
+        for event in events:
+            await bus.publish(event)
+
+        assert drain(subscription) == events[1:]
+        assert subscription.metrics().dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_full_partition_does_not_affect_other_dataloggers(self):
+        bus = DomainEventBus(EventBusConfig(max_pending=1))
+        subscription = bus.subscribe("mqtt")
+
+        await bus.publish(state_event("A"))
+        await bus.publish(state_event("B"))
+
+        assert subscription.qsize() == 2
+        assert subscription.metrics().dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_latest_drops_state_before_announce(self):
+        bus = DomainEventBus(EventBusConfig(max_pending=2, overflow=OverflowPolicy.COALESCE_LATEST))
+        subscription = bus.subscribe("mqtt")
+        announce, old_state, new_state = (
+            announce_event(),
+            state_event(index=1),
+            state_event(index=2),
+        )
+
+        for event in (announce, old_state, new_state):
+            await bus.publish(event)
+
+        assert drain(subscription) == [announce, new_state]
+        assert subscription.metrics().coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_consumer(self):
+        bus = DomainEventBus(EventBusConfig(max_pending=1, overflow=OverflowPolicy.BLOCK))
+        subscription = bus.subscribe("mqtt")
+        first, second = state_event(index=1), state_event(index=2)
+        await bus.publish(first)
+
+        publisher = asyncio.create_task(bus.publish(second))
+        await asyncio.sleep(0)
+        assert not publisher.done()
+
+        assert await subscription.get() is first
+        await publisher
+        assert drain(subscription) == [second]
+        assert bus.metrics().blocked == 1
+
+    @pytest.mark.asyncio
+    async def test_block_drops_oldest_after_timeout(self):
+        config = EventBusConfig(max_pending=1, overflow=OverflowPolicy.BLOCK, block_timeout=0.01)
+        bus = DomainEventBus(config)
+        subscription = bus.subscribe("mqtt")
+        first, second = state_event(index=1), state_event(index=2)
+
+        await bus.publish(first)
+        await bus.publish(second)
+
+        assert drain(subscription) == [second]
+        metrics = bus.metrics()
+        assert metrics.block_timeouts == 1
+        assert metrics.subscriptions[0].dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_history_waits_for_room_in_a_full_partition(self):
+        bus = DomainEventBus(EventBusConfig(max_pending=2, overflow=OverflowPolicy.DROP_OLDEST))
+        subscription = bus.subscribe("mqtt")
+        history = [history_event() for _ in range(3)]
+        await bus.publish(history[0])
+        await bus.publish(history[1])
+
+        publisher = asyncio.create_task(bus.publish(history[2]))
+        await asyncio.sleep(0.01)
+        assert not publisher.done()
+
+        assert await subscription.get() is history[0]
+        await publisher
+        assert drain(subscription) == history[1:]
+        assert subscription.metrics().dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_history_goes_over_the_limit_after_the_history_timeout(self):
+        config = EventBusConfig(max_pending=1, overflow=OverflowPolicy.BLOCK, history_timeout=0.01)
+        bus = DomainEventBus(config)
+        subscription = bus.subscribe("mqtt")
+        first, second = history_event(), history_event()
+        await bus.publish(first)
+
+        assert await bus.publish(second)
+
+        assert drain(subscription) == [first, second]
+        assert bus.metrics().block_timeouts == 1
+
+    @pytest.mark.asyncio
+    async def test_history_beyond_max_pending_history_is_dropped(self):
+        config = EventBusConfig(max_pending=1, history_timeout=0, max_pending_history=1)
+        bus = DomainEventBus(config)
+        subscription = bus.subscribe("mqtt")
+        history = [history_event() for _ in range(3)]
+
+        delivered = [await bus.publish(event) for event in history]
+
+        assert delivered == [True, True, False]
+        assert drain(subscription) == history[:2]
+        assert subscription.metrics().history_dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_history_fits_again_once_the_partition_is_drained(self):
+        config = EventBusConfig(max_pending=1, history_timeout=0, max_pending_history=1)
+        bus = DomainEventBus(config)
+        subscription = bus.subscribe("mqtt")
+        history = [history_event() for _ in range(4)]
+        await bus.publish(history[0])
+        await bus.publish(history[1])
+
+        assert drain(subscription) == history[:2]
+        assert await bus.publish(history[2])
+        assert await bus.publish(history[3])
+
+    @pytest.mark.asyncio
+    async def test_live_events_are_dropped_from_a_partition_full_of_history(self):
+        bus = DomainEventBus(EventBusConfig(max_pending=1, overflow=OverflowPolicy.DROP_OLDEST))
+        subscription = bus.subscribe("mqtt")
+        history = history_event()
+        await bus.publish(history)
+
+        assert await bus.publish(state_event())
+
+        assert drain(subscription) == [history]
+        assert subscription.metrics().dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_live_events_do_not_push_out_pending_history(self):
+        bus = DomainEventBus(EventBusConfig(max_pending=2, overflow=OverflowPolicy.DROP_OLDEST))
+        subscription = bus.subscribe("mqtt")
+        history, old_state, new_state = history_event(), state_event(index=1), state_event(index=2)
+
+        for event in (history, old_state, new_state):
+            await bus.publish(event)
+
+        assert drain(subscription) == [history, new_state]
+        assert subscription.metrics().dropped == 1
+
+
+class TestDomainEventSubscriptionCoalesceState:
+    @pytest.mark.asyncio
+    async def test_keeps_only_newest_state_per_datalogger(self):
+        bus = DomainEventBus()
+        subscription = bus.subscribe("mqtt", coalesce_state=True)
+        events = [state_event("A", i) for i in range(1000)] + [state_event("B", 0)]
+
+        for event in events:
+            await bus.publish(event)
+
+        assert drain(subscription) == [events[-2], events[-1]]
+        assert subscription.metrics().coalesced == 999
+
+    @pytest.mark.asyncio
+    async def test_announce_events_stay_ordered(self):
+        bus = DomainEventBus()
+        subscription = bus.subscribe("mqtt", coalesce_state=True)
+        first_announce, second_announce = announce_event(), announce_event()
+        old_state, new_state = state_event(index=1), state_event(index=2)
+
+        for event in (first_announce, old_state, second_announce, new_state):
+            await bus.publish(event)
+
+        assert drain(subscription) == [first_announce, second_announce, new_state]
+
+    @pytest.mark.asyncio
+    async def test_only_coalescing_subscriptions_drop_states(self):
+        bus = DomainEventBus()
+        mqtt = bus.subscribe("mqtt", coalesce_state=True)
+        recorder = bus.subscribe("recorder")
+
+        for index in range(3):
+            await bus.publish(state_event(index=index))
+
+        assert mqtt.qsize() == 1
+        assert recorder.qsize() == 3
@@ -0,0 +1,60 @@
+from dataclasses import replace
+
+import pytest
+
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.infrastructure.metadata.store import JsonLinesMetadataStore
+
+
+@pytest.fixture
+def datalogger() -> DataLogger:
+    return DataLogger(
+        serial="XGDABCDEFG",
+        protocol_id=6,
+        unit_id=1,
+        sw_version="3.1.0.0",
+        hw_version="2.0",
+        ip_address="192.168.1.10",
+        mac_address="00:11:22:33:44:55",
+    )
+
+
+class TestJsonLinesMetadataStore:
+    def test_get_unknown_serial_returns_none(self, tmp_path):
+        assert JsonLinesMetadataStore(tmp_path / "metadata.jsonl").get("UNKNOWN") is None
+
+    def test_put_is_persisted(self, tmp_path, datalogger):
+        path = tmp_path / "cache" / "metadata.jsonl"
+        JsonLinesMetadataStore(path).put(datalogger)
+
+        assert JsonLinesMetadataStore(path).get(datalogger.serial) == datalogger
+
+    def test_unchanged_datalogger_is_not_appended(self, tmp_path, datalogger):
+        path = tmp_path / "metadata.jsonl"
+        store = JsonLinesMetadataStore(path)
+
+        store.put(datalogger)
+        store.put(replace(datalogger))
+
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_last_line_wins_and_file_is_compacted(self, tmp_path, datalogger):
+        path = tmp_path / "metadata.jsonl"
+        store = JsonLinesMetadataStore(path)
+        updated = replace(datalogger, ip_address="192.168.1.11")
+        store.put(datalogger)
+        store.put(updated)
+
+        reloaded = JsonLinesMetadataStore(path)
+
+        assert reloaded.get(datalogger.serial) == updated
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_invalid_lines_are_skipped(self, tmp_path, datalogger):
+        path = tmp_path / "metadata.jsonl"
+        JsonLinesMetadataStore(path).put(datalogger)
+        with path.open("a") as file:
+            file.write("not json\n")
+            file.write('{"serial": "INCOMPLETE"}\n')
+
+        assert JsonLinesMetadataStore(path).get(datalogger.serial) == datalogger
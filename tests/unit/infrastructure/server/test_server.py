@@ -0,0 +1,44 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.infrastructure.server.config import GrowattServerConfig
+from shine2mqtt.infrastructure.server.server import TCPServer
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.frame.pool import DecodeExecutor, FrameDecodePool, FrameDecodePoolConfig
+from shine2mqtt.protocol.session.factory import ProtocolSessionFactory
+from tests.utils.loader import CapturedFrameLoader
+
+ping_frames, _, _ = CapturedFrameLoader.load("ping_message")
+
+
+class TestTCPServer:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor", list(DecodeExecutor))
+    async def test_stop_shuts_down_the_decode_pool(self, executor):
+        decode_pool = FrameDecodePool(
+            decoder=FrameFactory.server_decoder(),
+            config=FrameDecodePoolConfig(executor=executor, workers=1),
+            decoder_factory=FrameFactory.server_decoder,
+        )
+        session_factory = ProtocolSessionFactory(
+            encoder=FrameFactory.encoder(),
+            decoder=FrameFactory.server_decoder(),
+            domain_events=DomainEventBus(),
+            decode_pool=decode_pool,
+        )
+        server = TCPServer(
+            session_registry=MagicMock(),
+            session_factory=session_factory,
+            config=GrowattServerConfig(host="127.0.0.1", port=0),
+        )
+        serve = asyncio.create_task(server.serve())
+        await asyncio.sleep(0)
+
+        server.stop()
+        await serve
+
+        with pytest.raises(RuntimeError, match="shutdown"):
+            await decode_pool.decode_batch(ping_frames)
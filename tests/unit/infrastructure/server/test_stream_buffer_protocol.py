@@ -0,0 +1,174 @@
+import asyncio
+from asyncio import IncompleteReadError
+
+import pytest
+
+from shine2mqtt.infrastructure.server.session import StreamBufferProtocol
+
+
+class FakeTransport(asyncio.Transport):
+    def __init__(self):
+        super().__init__()
+        self.written = bytearray()
+        self.reading_paused = False
+        self.closing = False
+
+    def write(self, data):
+        self.written += data
+
+    def pause_reading(self):
+        self.reading_paused = True
+
+    def resume_reading(self):
+        self.reading_paused = False
+
+    def is_closing(self):
+        return self.closing
+
+    def close(self):
+        self.closing = True
+
+
+def feed(protocol: StreamBufferProtocol, data: bytes) -> None:
+    buffer = protocol.get_buffer(len(data))
+    buffer[: len(data)] = data
+    protocol.buffer_updated(len(data))
+
+
+def connect(
+    buffer_size: int = 64, max_buffer_size: int = 64
+) -> tuple[StreamBufferProtocol, FakeTransport]:
+    protocol = StreamBufferProtocol(buffer_size=buffer_size, max_buffer_size=max_buffer_size)
+    transport = FakeTransport()
+    protocol.connection_made(transport)
+    return protocol, transport
+
+
+class TestStreamBufferProtocol:
+    @pytest.mark.asyncio
+    async def test_read_returns_memoryview_into_receive_buffer(self):
+        protocol, _ = connect()
+        feed(protocol, b"headerpayload")
+
+        header = await protocol.peek(6)
+        frame = await protocol.read(13)
+
+        assert isinstance(frame, memoryview)
+        assert header == b"header"
+        assert frame == b"headerpayload"
+        assert protocol.buffered_size == 0
+
+    @pytest.mark.asyncio
+    async def test_read_waits_for_frame_split_across_packets(self):
+        protocol, _ = connect()
+        feed(protocol, b"abc")
+
+        read = asyncio.create_task(protocol.read(6))
+        await asyncio.sleep(0)
+        assert not read.done()
+
+        feed(protocol, b"def")
+
+        assert await read == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_read_compacts_buffer_and_resumes_reading_when_full(self):
+        protocol, transport = connect(buffer_size=8)
+        feed(protocol, b"12345678")
+        assert transport.reading_paused
+
+        assert await protocol.read(6) == b"123456"
+
+        read = asyncio.create_task(protocol.read(8))
+        await asyncio.sleep(0)
+        assert not transport.reading_paused
+
+        feed(protocol, b"abcdef")
+
+        assert await read == b"78abcdef"
+
+    @pytest.mark.asyncio
+    async def test_read_raises_incomplete_read_on_eof(self):
+        protocol, _ = connect()
+        feed(protocol, b"abc")
+        protocol.eof_received()
+
+        with pytest.raises(IncompleteReadError) as exc_info:
+            await protocol.read(6)
+
+        assert exc_info.value.partial == b"abc"
+
+    @pytest.mark.asyncio
+    async def test_read_larger_than_buffer_grows_it(self):
+        protocol, transport = connect(buffer_size=8)
+        feed(protocol, b"12345678")
+        assert transport.reading_paused
+
+        assert await protocol.peek(2) == b"12"
+        read = asyncio.create_task(protocol.read(12))
+        await asyncio.sleep(0)
+        assert not transport.reading_paused
+
+        feed(protocol, b"abcd")
+
+        assert await read == b"12345678abcd"
+
+    @pytest.mark.asyncio
+    async def test_read_larger_than_max_buffer_raises(self):
+        protocol, _ = connect(buffer_size=8, max_buffer_size=16)
+
+        with pytest.raises(ValueError):
+            await protocol.read(17)
+
+    @pytest.mark.asyncio
+    async def test_write_waits_for_drain_while_writing_is_paused(self):
+        protocol, transport = connect()
+        protocol.pause_writing()
+
+        write = asyncio.create_task(protocol.write(b"frame"))
+        await asyncio.sleep(0)
+        assert not write.done()
+
+        protocol.resume_writing()
+        await write
+
+        assert transport.written == b"frame"
+
+    @pytest.mark.asyncio
+    async def test_every_paused_writer_resumes_when_writing_resumes(self):
+        protocol, transport = connect()
+        protocol.pause_writing()
+
+        writes = [asyncio.create_task(protocol.write(frame)) for frame in (b"ack", b"request")]
+        await asyncio.sleep(0)
+        assert not any(write.done() for write in writes)
+
+        protocol.resume_writing()
+        await asyncio.gather(*writes)
+
+        assert transport.written == b"ackrequest"
+
+    @pytest.mark.asyncio
+    async def test_every_paused_writer_fails_when_the_connection_is_lost(self):
+        protocol, _ = connect()
+        protocol.pause_writing()
+
+        writes = [asyncio.create_task(protocol.write(frame)) for frame in (b"ack", b"request")]
+        await asyncio.sleep(0)
+
+        protocol.connection_lost(None)
+        results = await asyncio.gather(*writes, return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionResetError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_connection_lost(self):
+        protocol, transport = connect()
+
+        close = asyncio.create_task(protocol.close())
+        await asyncio.sleep(0)
+        assert transport.closing
+        assert not close.done()
+
+        protocol.connection_lost(None)
+        await close
@@ -0,0 +1,166 @@
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.events.events import InverterStateUpdatedEvent
+from shine2mqtt.domain.interfaces.session import Session
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.domain.models.inverter import INVERTER_STATE_FIELDS, InverterState, InverterStatus
+from shine2mqtt.infrastructure.workers.channel import IpcChannel
+from shine2mqtt.infrastructure.workers.host import ReportingSessionRegistry, WorkerHost
+from shine2mqtt.infrastructure.workers.registry import (
+    RemoteSession,
+    WorkerConnection,
+    WorkerSessionRegistry,
+)
+from shine2mqtt.protocol.session.registry import ProtocolSessionRegistry
+
+DATALOGGER = DataLogger(
+    serial="XGDABCDEFG",
+    protocol_id=6,
+    unit_id=1,
+    sw_version="3.1.0.0",
+    hw_version="2.0",
+    ip_address="192.168.1.10",
+    mac_address="00:11:22:33:44:55",
+)
+
+
+async def open_channels() -> tuple[IpcChannel, IpcChannel]:
+    main_socket, worker_socket = socket.socketpair()
+    return await IpcChannel.open(main_socket), await IpcChannel.open(worker_socket)
+
+
+async def wait_until(condition) -> None:
+    async with asyncio.timeout(1):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+def local_session() -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.datalogger = DATALOGGER
+    session.get_config = AsyncMock(return_value="3.1.0.0")
+    session.set_config = AsyncMock(side_effect=TimeoutError())
+    session.close = AsyncMock(return_value=None)
+    return session
+
+
+class TestIpcChannel:
+    @pytest.mark.asyncio
+    async def test_messages_are_received_in_order(self):
+        main, worker = await open_channels()
+
+        await main.send({"value": 1})
+        main.send_nowait(DATALOGGER)
+        await main.send(b"\x00" * 100_000)
+
+        assert await worker.receive() == {"value": 1}
+        assert await worker.receive() == DATALOGGER
+        assert await worker.receive() == b"\x00" * 100_000
+
+    @pytest.mark.asyncio
+    async def test_receive_raises_when_peer_closes(self):
+        main, worker = await open_channels()
+
+        await main.close()
+
+        with pytest.raises(asyncio.IncompleteReadError):
+            await worker.receive()
+
+
+@asynccontextmanager
+async def connected_worker():
+    main_channel, worker_channel = await open_channels()
+
+    main_events = DomainEventBus()
+    main_subscription = main_events.subscribe("mqtt")
+    main_registry = WorkerSessionRegistry(main_events)
+    connection = WorkerConnection("worker 0", main_channel)
+
+    worker_events = DomainEventBus()
+    worker_registry = ReportingSessionRegistry(ProtocolSessionRegistry(), worker_channel)
+    host = WorkerHost(worker_channel, worker_registry, worker_events.subscribe("main"))
+
+    tasks = [
+        asyncio.create_task(main_registry.serve_worker(connection)),
+        asyncio.create_task(host.run()),
+    ]
+    try:
+        yield main_registry, main_subscription, worker_registry, worker_events
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class TestWorkerSessions:
+    @pytest.mark.asyncio
+    async def test_worker_sessions_are_registered_in_main_process(self):
+        async with connected_worker() as (main_registry, _, worker_registry, _):
+            session = local_session()
+
+            worker_registry.add(session)
+            await wait_until(lambda: main_registry.get(DATALOGGER.serial) is not None)
+            assert main_registry.get(DATALOGGER.serial).datalogger == DATALOGGER
+
+            worker_registry.remove(session)
+            await wait_until(lambda: main_registry.get(DATALOGGER.serial) is None)
+
+    @pytest.mark.asyncio
+    async def test_calls_are_executed_on_worker_session(self):
+        async with connected_worker() as (main_registry, _, worker_registry, _):
+            session = local_session()
+            worker_registry.add(session)
+            await wait_until(lambda: main_registry.get(DATALOGGER.serial) is not None)
+
+            remote = main_registry.get(DATALOGGER.serial)
+
+            assert await remote.get_config(21) == "3.1.0.0"
+            session.get_config.assert_awaited_once_with(21)
+            with pytest.raises(TimeoutError):
+                await remote.set_config(31, "2026-01-01 00:00:00")
+
+    @pytest.mark.asyncio
+    async def test_closing_remote_session_closes_worker_session(self):
+        async with connected_worker() as (main_registry, _, worker_registry, _):
+            session = local_session()
+            worker_registry.add(session)
+            await wait_until(lambda: main_registry.get(DATALOGGER.serial) is not None)
+
+            await main_registry.get(DATALOGGER.serial).close()
+
+            session.close.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_worker_events_are_published_in_main_process(self):
+        async with connected_worker() as (_, main_subscription, _, worker_events):
+            values = dict.fromkeys(INVERTER_STATE_FIELDS, 1.5)
+            values["inverter_status"] = InverterStatus.NORMAL
+            event = InverterStateUpdatedEvent(
+                datalogger_serial=DATALOGGER.serial,
+                timestamp=datetime(2026, 1, 12, 11, 27),
+                state=InverterState(**values),
+            )
+
+            await worker_events.publish(event)
+
+            async with asyncio.timeout(1):
+                assert await main_subscription.get() == event
+
+    @pytest.mark.asyncio
+    async def test_sessions_of_lost_worker_are_removed(self):
+        main_channel, worker_channel = await open_channels()
+        registry = WorkerSessionRegistry(DomainEventBus())
+        connection = WorkerConnection("worker 0", main_channel)
+        registry.add(RemoteSession(DATALOGGER, connection))
+
+        await worker_channel.close()
+        await registry.serve_worker(connection)
+
+        assert registry.get_all() == []
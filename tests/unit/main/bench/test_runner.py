@@ -0,0 +1,41 @@
+import pytest
+
+from shine2mqtt.main.bench.runner import BenchRunner
+
+
+class TestBenchRunner:
+    def test_rejects_zero_iterations(self):
+        with pytest.raises(ValueError):
+            BenchRunner(iterations=0, warmup=0)
+
+    def test_runs_operation_for_warmup_and_every_pass(self):
+        calls = []
+        runner = BenchRunner(iterations=20, warmup=5)
+
+        result = runner.run("append", lambda: calls.append(None))
+
+        # warmup + throughput + latency + allocations
+        assert len(calls) == 5 + 20 + 20 + 20
+        assert result.stage == "append"
+        assert result.iterations == 20
+        assert result.ops_per_sec > 0
+
+    def test_latency_percentiles_are_ordered(self):
+        result = BenchRunner(iterations=100, warmup=0).run("sum", lambda: sum(range(100)))
+
+        latency = result.latency_ns
+        assert 0 < latency.p50 <= latency.p90 <= latency.p99 <= latency.max
+
+    def test_measures_allocations_per_operation(self):
+        result = BenchRunner(iterations=50, warmup=0).run("alloc", lambda: bytearray(10_000))
+
+        assert result.allocations.peak_bytes_per_op >= 10_000
+        assert result.allocations.retained_bytes_per_op < 10_000
+
+    def test_measures_retained_allocations(self):
+        retained = []
+        result = BenchRunner(iterations=50, warmup=0).run(
+            "leak", lambda: retained.append(bytearray(1_000))
+        )
+
+        assert result.allocations.retained_bytes_per_op >= 1_000
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from shine2mqtt.main.bench.config import BenchConfig
+from shine2mqtt.main.bench.suite import STAGES, BenchSuite, format_result
+
+
+class TestBenchSuite:
+    def test_rejects_unknown_stage(self):
+        with pytest.raises(ValueError, match="no_such_stage"):
+            BenchSuite(BenchConfig(stages=["cipher", "no_such_stage"]))
+
+    def test_rejects_directory_without_captures(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="--captures"):
+            BenchSuite(BenchConfig(captures=tmp_path))
+
+    def test_runs_all_stages_by_default(self):
+        reported = []
+        suite = BenchSuite(BenchConfig(iterations=3, warmup=1))
+
+        report = suite.run(on_result=reported.append)
+
+        assert [result.stage for result in report.results] == list(STAGES)
+        assert reported == report.results
+        assert all(result.iterations == 3 for result in report.results)
+
+    def test_runs_selected_stages_in_given_order(self):
+        suite = BenchSuite(BenchConfig(iterations=2, warmup=0, stages=["crc", "cipher"]))
+
+        report = suite.run()
+
+        assert [result.stage for result in report.results] == ["crc", "cipher"]
+
+    def test_report_serializes_to_json(self):
+        report = BenchSuite(BenchConfig(iterations=2, warmup=0, stages=["frame_decode"])).run()
+
+        data = json.loads(report.to_json())
+
+        assert data["version"] == report.version
+        [result] = data["results"]
+        assert result["stage"] == "frame_decode"
+        assert set(result["latency_ns"]) == {"p50", "p90", "p99", "max"}
+        assert set(result["allocations"]) == {"peak_bytes_per_op", "retained_bytes_per_op"}
+
+    def test_format_result(self):
+        report = BenchSuite(BenchConfig(iterations=2, warmup=0, stages=["crc"])).run()
+
+        line = format_result(report.results[0])
+
+        assert line.startswith("crc ")
+        assert "ops/s" in line
@@ -22,6 +22,70 @@ class TestCliArgParser:
         args = CliArgParser(["sim"], "app").parse()
         assert args.simulated_client__enabled is True
 
+    def test_sim_subcommand_with_fleet(self) -> None:
+        args = CliArgParser(["sim", "--loggers", "1000", "--ramp-up", "60"], "app").parse()
+        assert args.simulated_client__loggers == 1000
+        assert args.simulated_client__ramp_up == 60.0
+
+    def test_sim_subcommand_with_solar_model_and_backlog(self) -> None:
+        args = CliArgParser(
+            ["sim", "--buffered-data", "12", "--peak-power", "5000", "--latitude", "40.5"], "app"
+        ).parse()
+        assert args.simulated_client__buffered_data == 12
+        assert args.simulated_client__solar__peak_power == 5000.0
+        assert args.simulated_client__solar__latitude == 40.5
+
+    def test_virtual_clock_args(self) -> None:
+        args = CliArgParser(["--clock-speed", "100", "--clock-step", "sim"], "app").parse()
+        assert args.clock__speed == 100.0
+        assert args.clock__step is True
+
+    def test_bench_subcommand_enables_bench(self) -> None:
+        args = CliArgParser(
+            [
+                "bench",
+                "--iterations",
+                "500",
+                "--warmup",
+                "50",
+                "--stage",
+                "crc",
+                "--stage",
+                "cipher",
+                "--output",
+                "results.json",
+            ],
+            "app",
+        ).parse()
+        assert args.bench__enabled is True
+        assert args.simulated_client__enabled is False
+        assert args.bench__iterations == 500
+        assert args.bench__warmup == 50
+        assert args.bench__stages == ["crc", "cipher"]
+        assert args.bench__output == Path("results.json")
+
+    def test_replay_subcommand_enables_replay(self) -> None:
+        args = CliArgParser(
+            [
+                "replay",
+                "--loggers",
+                "100",
+                "--speed",
+                "600",
+                "--capture",
+                "frames.bin",
+                "--output",
+                "replay.json",
+            ],
+            "app",
+        ).parse()
+        assert args.replay__enabled is True
+        assert args.simulated_client__enabled is False
+        assert args.replay__loggers == 100
+        assert args.replay__speed == 600
+        assert args.replay__capture == Path("frames.bin")
+        assert args.replay__output == Path("replay.json")
+
     def test_run_with_full_mqtt_config(self) -> None:
         args = CliArgParser(
             [
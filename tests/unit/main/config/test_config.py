@@ -1,5 +1,8 @@
 import logging
 
+import pytest
+from pydantic import ValidationError
+
 from shine2mqtt.main.config.config import ApplicationConfig
 
 
@@ -42,3 +45,16 @@ class TestApplicationConfig:
         assert config.log_level == "WARNING"
         assert config.mqtt.server.host == "broker.local"
         assert config.mqtt.server.port == 8883
+
+    @pytest.mark.parametrize(
+        "session",
+        [
+            {"max_in_flight": 0},
+            {"request_timeout": 0},
+            {"history_batch_size": 0},
+            {"history_flush_interval": -1},
+        ],
+    )
+    def test_create_with_invalid_session_config_should_raise(self, session: dict) -> None:
+        with pytest.raises(ValidationError):
+            ApplicationConfig.create(base={"session": session}, override={})
@@ -0,0 +1,31 @@
+import aiomqtt
+import pytest
+
+from shine2mqtt.main.replay.broker import MqttBrokerStub
+
+
+class TestMqttBrokerStub:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("version", [aiomqtt.ProtocolVersion.V311, aiomqtt.ProtocolVersion.V5])
+    @pytest.mark.parametrize("qos", [0, 1, 2])
+    async def test_reports_publishes(self, version, qos):
+        received = []
+        broker = MqttBrokerStub(
+            on_publish=lambda topic, payload, _: received.append((topic, payload))
+        )
+        await broker.start()
+        try:
+            async with aiomqtt.Client("127.0.0.1", broker.port, protocol=version) as client:
+                await client.subscribe("solar/#", qos=qos)
+                await client.publish("solar/inverter/state", b'{"power": 1}', qos=qos)
+                await client.unsubscribe("solar/#")
+        finally:
+            await broker.close()
+
+        assert received == [("solar/inverter/state", b'{"power": 1}')]
+        assert broker.publishes == 1
+
+    @pytest.mark.asyncio
+    async def test_port_before_start_raises(self):
+        with pytest.raises(RuntimeError):
+            _ = MqttBrokerStub().port
@@ -0,0 +1,66 @@
+import asyncio
+from itertools import count
+from unittest.mock import MagicMock
+
+import pytest
+
+from shine2mqtt.adapters.mqtt.config import MqttConfig
+from shine2mqtt.main.replay.datalogger import VirtualDatalogger
+from shine2mqtt.main.replay.marker import LatencyMarker
+from shine2mqtt.main.replay.stats import ReplayStats
+from shine2mqtt.main.replay.stream import ReplayStream
+from shine2mqtt.protocol.frame.capturer.loader import DEFAULT_CAPTURE_DIR
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.simulator.handler import ClientMessageHandler
+
+HOST = "127.0.0.1"
+
+
+def virtual_datalogger() -> VirtualDatalogger:
+    marker = LatencyMarker(MqttConfig())
+    return VirtualDatalogger(
+        serial="RP00000000",
+        stream=ReplayStream.from_templates(DEFAULT_CAPTURE_DIR, duration=300),
+        speed=6000,
+        encoder=FrameFactory.encoder(),
+        decoder=FrameFactory.client_decoder(),
+        message_handler=MagicMock(spec=ClientMessageHandler),
+        marker=marker,
+        sequences=count(1),
+        stats=ReplayStats(marker),
+    )
+
+
+async def run_against(server_callback) -> None:
+    server = await asyncio.start_server(server_callback, HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+    datalogger = virtual_datalogger()
+    try:
+        async with server:
+            await datalogger.run(HOST, port)
+    finally:
+        await datalogger.close()
+
+
+class TestVirtualDatalogger:
+    @pytest.mark.asyncio
+    async def test_fails_when_the_announce_is_not_acknowledged(self, monkeypatch):
+        monkeypatch.setattr(VirtualDatalogger, "CONNECT_TIMEOUT", 0.05)
+        connections = []
+
+        async def ignore(reader, writer):
+            connections.append(writer)
+
+        with pytest.raises(TimeoutError, match="ANNOUNCE"):
+            await run_against(ignore)
+
+        for writer in connections:
+            writer.close()
+
+    @pytest.mark.asyncio
+    async def test_fails_when_disconnected_before_the_announce_is_acknowledged(self):
+        async def disconnect(reader, writer):
+            writer.close()
+
+        with pytest.raises(ConnectionError, match="disconnected"):
+            await run_against(disconnect)
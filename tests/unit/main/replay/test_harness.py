@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from shine2mqtt.main.app import Application
+from shine2mqtt.main.config.config import ApplicationConfig
+from shine2mqtt.main.replay import harness
+from shine2mqtt.main.replay.harness import ReplayHarness, format_report
+from shine2mqtt.util.clock import VirtualClockService
+
+
+def replay_config(**replay) -> ApplicationConfig:
+    return ApplicationConfig.create(
+        base={"log_level": "WARNING", "replay": {"enabled": True, **replay}}, override={}
+    )
+
+
+class TestReplayHarness:
+    @pytest.mark.parametrize("replay", [{"loggers": 0}, {"speed": 0}])
+    def test_rejects_invalid_config(self, replay):
+        with pytest.raises(ValueError):
+            ReplayHarness(replay_config(**replay))
+
+    @pytest.mark.asyncio
+    async def test_replays_data_to_mqtt(self):
+        config = replay_config(loggers=2, speed=6000, duration=900, ramp_up=0)
+
+        report = await ReplayHarness(config).run()
+
+        assert report.failed_loggers == 0
+        # Per datalogger an ANNOUNCE, 3 DATA and 5 PING frames
+        assert report.frames_sent == 2 * 9
+        assert report.publishes > 0
+        assert report.latency_samples + report.unmatched == 2 * 3
+        assert report.latency_samples > 0
+        assert json.loads(report.to_json())["loggers"] == 2
+        assert "latency" in format_report(report)
+
+    @pytest.mark.asyncio
+    async def test_application_runs_on_the_given_clock(self, monkeypatch):
+        clocks = []
+
+        class RecordingApplication(Application):
+            def __init__(self, config, clock=None):
+                clocks.append(clock)
+                super().__init__(config, clock=clock)
+
+        monkeypatch.setattr(harness, "Application", RecordingApplication)
+        clock = VirtualClockService(speed=1.0)
+        config = replay_config(loggers=1, speed=6000, duration=300, ramp_up=0)
+
+        await ReplayHarness(config, clock=clock).run()
+
+        assert clocks == [clock]
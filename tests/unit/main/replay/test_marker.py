@@ -0,0 +1,36 @@
+import json
+import struct
+
+import pytest
+
+from shine2mqtt.adapters.mqtt.config import MqttConfig, PublishMode
+from shine2mqtt.main.replay.marker import MARKER_FIELD, LatencyMarker
+from shine2mqtt.protocol.messages.data.layout import DATA_LAYOUT
+
+
+@pytest.fixture
+def field():
+    return next(field for field in DATA_LAYOUT.fields if field.name == MARKER_FIELD)
+
+
+class TestLatencyMarker:
+    def test_stamp_writes_sequence_in_register_units(self, field):
+        marker = LatencyMarker(MqttConfig())
+        payload = bytearray(DATA_LAYOUT.size)
+
+        marker.stamp(payload, 1234)
+
+        assert struct.unpack_from(f">{field.fmt}", payload, field.offset) == (1234 * field.divisor,)
+
+    def test_max_sequence_fits_register(self):
+        marker = LatencyMarker(MqttConfig())
+
+        marker.stamp(bytearray(DATA_LAYOUT.size), marker.max_sequence)
+
+    def test_reads_sequence_from_aggregated_state(self):
+        marker = LatencyMarker(MqttConfig(publish_mode=PublishMode.AGGREGATED))
+
+        payload = json.dumps({"energy_ac_total": 1234.0, "power_ac": 10}).encode()
+
+        assert marker.read("solar/inverter/state", payload) == 1234
+        assert marker.read("solar/datalogger/state", payload) is None
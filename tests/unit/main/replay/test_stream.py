@@ -0,0 +1,21 @@
+from shine2mqtt.main.replay.stream import ReplayStream
+from shine2mqtt.protocol.frame.capturer.loader import DEFAULT_CAPTURE_DIR
+from shine2mqtt.protocol.frame.header.header import FunctionCode
+
+
+class TestReplayStream:
+    def test_from_templates_uses_datalogger_intervals(self):
+        stream = ReplayStream.from_templates(DEFAULT_CAPTURE_DIR, duration=900)
+
+        assert stream.announce.header.function_code is FunctionCode.ANNOUNCE
+        assert [(frame.offset, frame.header.function_code) for frame in stream.frames] == [
+            (180.0, FunctionCode.PING),
+            (300.0, FunctionCode.DATA),
+            (360.0, FunctionCode.PING),
+            (540.0, FunctionCode.PING),
+            (600.0, FunctionCode.DATA),
+            (720.0, FunctionCode.PING),
+            (900.0, FunctionCode.DATA),
+            (900.0, FunctionCode.PING),
+        ]
+        assert stream.duration == 900
@@ -0,0 +1,65 @@
+import pytest
+
+from shine2mqtt.protocol.codec.layout import RegisterField, RegisterLayout
+
+
+class TestRegisterLayout:
+    @pytest.fixture
+    def layout(self) -> RegisterLayout:
+        return RegisterLayout(
+            [
+                RegisterField("voltage", 4, "H", 0.1),
+                RegisterField("serial", 0, "4s"),
+                RegisterField("energy", 8, "I", 0.1),
+                RegisterField("frequency", 12, "H", 0.01),
+                RegisterField("status", 14, "B"),
+            ],
+            size=20,
+        )
+
+    def test_compiles_fields_into_single_struct_with_padding(self, layout: RegisterLayout):
+        assert layout.struct.format == ">4sH2xIHB"
+        assert layout.names == ("serial", "voltage", "energy", "frequency", "status")
+
+    def test_unpack_decodes_and_scales_all_fields(self, layout: RegisterLayout):
+        payload = bytes.fromhex("41 42 20 20 0969 0000 0001e240 1388 01 0000000000")
+
+        fields = layout.unpack(payload)
+
+        assert fields == {
+            "serial": "AB",
+            "voltage": 240.9,
+            "energy": 12345.6,
+            "frequency": 50.0,
+            "status": 1,
+        }
+
+    @pytest.mark.parametrize("raw", [0, 1, 3, 7, 29, 4095, 65535])
+    def test_unpack_scaling_matches_rounded_multiplication(self, raw: int):
+        layout = RegisterLayout([RegisterField("a", 0, "H", 0.1), RegisterField("b", 2, "H", 0.01)])
+
+        fields = layout.unpack(raw.to_bytes(2) * 2)
+
+        assert fields == {"a": round(raw * 0.1, 6), "b": round(raw * 0.01, 6)}
+
+    def test_pack_roundtrips_scaled_values(self, layout: RegisterLayout):
+        values = {
+            "serial": "ABCD",
+            "voltage": 0.3,
+            "energy": 12345.6,
+            "frequency": 49.99,
+            "status": 3,
+        }
+
+        payload = layout.pack(values)
+
+        assert len(payload) == 20
+        assert layout.unpack(payload) == values
+
+    def test_overlapping_fields_raise(self):
+        with pytest.raises(ValueError):
+            RegisterLayout([RegisterField("a", 0, "I"), RegisterField("b", 2, "H")])
+
+    def test_non_reciprocal_scale_raises(self):
+        with pytest.raises(ValueError):
+            RegisterLayout([RegisterField("a", 0, "H", 0.3)])
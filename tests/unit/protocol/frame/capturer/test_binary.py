@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from shine2mqtt.protocol.frame.capturer import (
+    BinaryCaptureConverter,
+    BinaryCaptureFormat,
+    BinaryFrameCapturer,
+    CapturedFrame,
+    FrameCaptureConfig,
+    FrameDirection,
+)
+from shine2mqtt.protocol.frame.capturer.binary import RotatingCaptureFile
+from shine2mqtt.protocol.frame.header.header import MBAPHeader
+from tests.utils.loader import CapturedFrameLoader
+
+data_frames, data_headers, data_payloads = CapturedFrameLoader.load("data_message")
+ping_frames, ping_headers, ping_payloads = CapturedFrameLoader.load("ping_message")
+
+
+def data_frame(timestamp: float = 1_767_000_000.5) -> CapturedFrame:
+    return CapturedFrame(
+        frame=data_frames[0],
+        header=data_headers[0],
+        payload=data_payloads[0],
+        timestamp=timestamp,
+    )
+
+
+def ping_frame() -> CapturedFrame:
+    return CapturedFrame(
+        frame=ping_frames[0],
+        header=ping_headers[0],
+        payload=ping_payloads[0],
+        timestamp=1_767_000_030.0,
+        direction=FrameDirection.SENT,
+    )
+
+
+def write_capture_file(path, frames: list[CapturedFrame]) -> None:
+    path.write_bytes(
+        BinaryCaptureFormat.file_header()
+        + b"".join(BinaryCaptureFormat.encode(frame) for frame in frames)
+    )
+
+
+class TestBinaryCaptureFormat:
+    def test_records_roundtrip(self, tmp_path):
+        path = tmp_path / "frames.s2mcap"
+        frames = [data_frame(), ping_frame()]
+        write_capture_file(path, frames)
+
+        assert list(BinaryCaptureFormat.read(path)) == frames
+
+    def test_truncated_last_record_is_skipped(self, tmp_path):
+        path = tmp_path / "frames.s2mcap"
+        write_capture_file(path, [data_frame(), ping_frame()])
+        path.write_bytes(path.read_bytes()[:-3])
+
+        assert list(BinaryCaptureFormat.read(path)) == [data_frame()]
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "frames.json"
+        path.write_text('{"frames": []}')
+
+        with pytest.raises(ValueError):
+            list(BinaryCaptureFormat.read(path))
+
+
+class TestRotatingCaptureFile:
+    def test_starts_new_file_when_size_is_reached(self, tmp_path):
+        record = BinaryCaptureFormat.encode(ping_frame())
+        capture_file = RotatingCaptureFile(tmp_path, max_size=len(record), max_age=3600)
+
+        for _ in range(3):
+            capture_file.write(record)
+        capture_file.close()
+
+        paths = sorted(tmp_path.iterdir())
+        assert len(paths) == 3
+        assert all(list(BinaryCaptureFormat.read(path)) == [ping_frame()] for path in paths)
+
+
+class TestBinaryFrameCapturer:
+    def test_close_writes_captured_frames(self, tmp_path):
+        capturer = BinaryFrameCapturer(FrameCaptureConfig(directory=tmp_path))
+
+        capturer.capture(data_frame())
+        capturer.capture(data_frame(timestamp=1_767_000_060.0))
+        capturer.close()
+
+        [path] = tmp_path.iterdir()
+        assert [frame.timestamp for frame in BinaryCaptureFormat.read(path)] == [
+            1_767_000_000.5,
+            1_767_000_060.0,
+        ]
+        assert capturer.captured == 2
+
+    def test_frames_captured_after_close_are_ignored(self, tmp_path):
+        capturer = BinaryFrameCapturer(FrameCaptureConfig(directory=tmp_path))
+        capturer.close()
+
+        capturer.capture(data_frame())
+
+        assert capturer.captured == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_close_returns_after_the_writer_stopped_on_an_error(self, tmp_path):
+        (tmp_path / "not-a-directory").touch()
+        config = FrameCaptureConfig(
+            directory=tmp_path / "not-a-directory" / "frames", flush_interval=0.01, max_pending=1
+        )
+        capturer = BinaryFrameCapturer(config)
+        capturer.capture(data_frame())
+        capturer._thread.join(timeout=1)
+
+        capturer.capture(data_frame())
+        capturer.close()
+
+        assert capturer.captured == 1
+
+
+class TestBinaryCaptureConverter:
+    def test_converts_to_json_capture_files(self, tmp_path):
+        write_capture_file(tmp_path / "a.s2mcap", [data_frame(), ping_frame()])
+        write_capture_file(tmp_path / "b.s2mcap", [data_frame()])
+        output_dir = tmp_path / "json"
+
+        count = BinaryCaptureConverter.to_json(
+            [tmp_path / "a.s2mcap", tmp_path / "b.s2mcap"], output_dir
+        )
+
+        assert count == 3
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            "data_message.json",
+            "ping_message.json",
+        ]
+        data = json.loads((output_dir / "data_message.json").read_text())
+        assert [bytes.fromhex(frame) for frame in data["frames"]] == [data_frames[0]] * 2
+        assert [MBAPHeader.fromdict(header) for header in data["headers"]] == [data_headers[0]] * 2
+        assert [bytes.fromhex(payload) for payload in data["payloads"]] == [data_payloads[0]] * 2
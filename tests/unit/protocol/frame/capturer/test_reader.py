@@ -0,0 +1,104 @@
+import pytest
+
+from shine2mqtt.protocol.frame.capturer import (
+    BinaryCaptureFormat,
+    CapturedFrame,
+    CaptureIndex,
+    CaptureReader,
+)
+from shine2mqtt.protocol.frame.header.header import FunctionCode
+from tests.utils.loader import CapturedFrameLoader
+
+data_frames, data_headers, data_payloads = CapturedFrameLoader.load("data_message")
+ping_frames, ping_headers, ping_payloads = CapturedFrameLoader.load("ping_message")
+
+
+def data_frame(timestamp: float) -> CapturedFrame:
+    return CapturedFrame(
+        frame=data_frames[0], header=data_headers[0], payload=data_payloads[0], timestamp=timestamp
+    )
+
+
+def ping_frame(timestamp: float) -> CapturedFrame:
+    return CapturedFrame(
+        frame=ping_frames[0], header=ping_headers[0], payload=ping_payloads[0], timestamp=timestamp
+    )
+
+
+def append_records(path, frames: list[CapturedFrame]) -> None:
+    with open(path, "ab") as f:
+        if f.tell() == 0:
+            f.write(BinaryCaptureFormat.file_header())
+        for frame in frames:
+            f.write(BinaryCaptureFormat.encode(frame))
+
+
+@pytest.fixture
+def capture_path(tmp_path):
+    path = tmp_path / "frames.s2mcap"
+    append_records(path, [ping_frame(100.0), data_frame(160.0), ping_frame(220.0)])
+    append_records(path, [data_frame(280.0)])
+    return path
+
+
+class TestCaptureReader:
+    def test_index_is_built_on_first_open(self, capture_path):
+        with CaptureReader.open(capture_path) as reader:
+            entries = list(reader.index)
+
+        assert CaptureIndex.path_for(capture_path).exists()
+        assert [entry.timestamp for entry in entries] == [100.0, 160.0, 220.0, 280.0]
+        assert [entry.function_code for entry in entries] == [
+            FunctionCode.PING.value,
+            FunctionCode.DATA.value,
+            FunctionCode.PING.value,
+            FunctionCode.DATA.value,
+        ]
+        assert {entry.datalogger_serial for entry in entries} == {"XGDABCDEFG"}
+
+    def test_frames_are_filtered_by_function_code(self, capture_path):
+        with CaptureReader.open(capture_path) as reader:
+            frames = list(reader.frames(function_codes={FunctionCode.DATA}))
+
+        assert frames == [data_frame(160.0), data_frame(280.0)]
+
+    def test_frames_are_filtered_by_time_range(self, capture_path):
+        with CaptureReader.open(capture_path) as reader:
+            frames = list(reader.frames(start=160.0, end=280.0))
+
+        assert [frame.timestamp for frame in frames] == [160.0, 220.0]
+
+    def test_frames_are_filtered_by_datalogger_serial(self, capture_path):
+        with CaptureReader.open(capture_path) as reader:
+            assert len(list(reader.frames(datalogger_serial="XGDABCDEFG"))) == 4
+            assert list(reader.frames(datalogger_serial="OTHER00000")) == []
+
+    def test_records_appended_later_are_indexed_on_next_open(self, capture_path):
+        with CaptureReader.open(capture_path) as reader:
+            assert len(reader) == 4
+
+        append_records(capture_path, [ping_frame(340.0)])
+
+        with CaptureReader.open(capture_path) as reader:
+            assert len(reader) == 5
+            assert list(reader.frames(start=300.0)) == [ping_frame(340.0)]
+
+    def test_truncated_last_record_is_not_indexed(self, capture_path):
+        append_records(capture_path, [ping_frame(340.0)])
+        capture_path.write_bytes(capture_path.read_bytes()[:-2])
+
+        with CaptureReader.open(capture_path) as reader:
+            assert len(reader) == 4
+
+    def test_damaged_index_is_rebuilt(self, capture_path):
+        CaptureIndex.path_for(capture_path).write_bytes(b"garbage")
+
+        with CaptureReader.open(capture_path) as reader:
+            assert len(reader) == 4
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "frames.json"
+        path.write_text('{"frames": []}')
+
+        with pytest.raises(ValueError):
+            CaptureReader.open(path)
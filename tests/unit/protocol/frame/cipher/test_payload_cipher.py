@@ -0,0 +1,65 @@
+import pytest
+
+from shine2mqtt.protocol.frame.cipher import PayloadCipher
+from shine2mqtt.protocol.frame.constants import DECRYPTION_KEY, ENCRYPTION_KEY
+
+
+def xor_with_key_bytewise(data: bytes, key: bytes) -> bytes:
+    return bytes(byte ^ key[i % len(key)] for i, byte in enumerate(data))
+
+
+class TestPayloadCipher:
+    @pytest.fixture
+    def cipher(self) -> PayloadCipher:
+        return PayloadCipher()
+
+    @pytest.mark.parametrize("length", [0, 1, 6, 7, 8, 575, 1024])
+    def test_encrypt_matches_bytewise_xor(self, cipher: PayloadCipher, length: int):
+        payload = bytes(range(256)) * 5
+        payload = payload[:length]
+
+        result = cipher.encrypt(payload, ENCRYPTION_KEY)
+
+        assert result == xor_with_key_bytewise(payload, ENCRYPTION_KEY)
+
+    def test_decrypt_reverses_encrypt(self, cipher: PayloadCipher):
+        payload = b"XGDABCDEFG\x00\x00\x01\x02\xff" * 40
+
+        encrypted = cipher.encrypt(payload, ENCRYPTION_KEY)
+
+        assert cipher.decrypt(encrypted, DECRYPTION_KEY) == payload
+
+    def test_leading_zero_bytes_are_preserved(self, cipher: PayloadCipher):
+        payload = ENCRYPTION_KEY + b"\x01"
+
+        result = cipher.encrypt(payload, ENCRYPTION_KEY)
+
+        assert result == b"\x00" * len(ENCRYPTION_KEY) + bytes([0x01 ^ ENCRYPTION_KEY[0]])
+
+    def test_key_stream_is_reused_for_shorter_payloads(self, cipher: PayloadCipher):
+        cipher.encrypt(bytes(100), ENCRYPTION_KEY)
+
+        result = cipher.encrypt(bytes(10), ENCRYPTION_KEY)
+
+        assert result == (ENCRYPTION_KEY * 2)[:10]
+
+    def test_decrypt_accepts_memoryview(self, cipher: PayloadCipher):
+        frame = b"header" + cipher.encrypt(b"payload", ENCRYPTION_KEY)
+
+        result = cipher.decrypt(memoryview(frame)[6:], DECRYPTION_KEY)
+
+        assert result == b"payload"
+
+    def test_encrypt_into_bytearray(self, cipher: PayloadCipher):
+        buffer = bytearray(b"payload")
+
+        cipher.encrypt_into(buffer, ENCRYPTION_KEY)
+
+        assert buffer == xor_with_key_bytewise(b"payload", ENCRYPTION_KEY)
+
+    def test_decrypt_into_memoryview_slice(self, cipher: PayloadCipher):
+        buffer = bytearray(b"header") + bytearray(cipher.encrypt(b"payload", ENCRYPTION_KEY))
+
+        cipher.decrypt_into(memoryview(buffer)[6:], DECRYPTION_KEY)
+
+        assert buffer == bytearray(b"headerpayload")
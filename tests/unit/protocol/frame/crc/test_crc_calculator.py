@@ -0,0 +1,68 @@
+import sys
+
+import pytest
+
+from shine2mqtt.protocol.frame.crc import backend as crc_backend
+from shine2mqtt.protocol.frame.crc.backend import (
+    CRC16_BACKENDS,
+    CRC16_INITIAL_VALUE,
+    CRC16Backend,
+    TableCRC16Backend,
+    select_crc16_backend,
+)
+from shine2mqtt.protocol.frame.crc.calculator import CRCCalculator
+from tests.utils.loader import CapturedFrameLoader
+
+frames, _, _ = CapturedFrameLoader.load("data_message")
+
+
+class TestCRC16Backends:
+    @pytest.mark.parametrize("backend_type", CRC16_BACKENDS)
+    @pytest.mark.parametrize("length", [0, 1, 2, 7, 8, 575, 1024])
+    def test_backend_matches_reference_table(self, backend_type: type[CRC16Backend], length: int):
+        if not backend_type.supports(sys.byteorder):
+            pytest.skip(f"{backend_type.name} does not support {sys.byteorder} endian hosts")
+        data = (bytes(range(256)) * 5)[:length]
+
+        result = backend_type().update(CRC16_INITIAL_VALUE, data)
+
+        assert result == TableCRC16Backend().update(CRC16_INITIAL_VALUE, data)
+
+    def test_select_backend_returns_verified_backend(self):
+        backend = select_crc16_backend()
+
+        assert isinstance(backend, CRC16_BACKENDS)
+
+    def test_select_backend_on_big_endian_host_skips_slicing(self, monkeypatch):
+        def build_word_table():
+            raise AssertionError("Word table built for a big endian host")
+
+        monkeypatch.setattr(crc_backend, "_compute_crc16_word_lookup_table", build_word_table)
+
+        # Bypass the cache, the selection must run with the patched table
+        backend = select_crc16_backend.__wrapped__("big")
+
+        assert isinstance(backend, TableCRC16Backend)
+
+
+class TestCRCCalculator:
+    @pytest.fixture(params=CRC16_BACKENDS)
+    def calculator(self, request) -> CRCCalculator:
+        return CRCCalculator(request.param())
+
+    def test_calculate_crc16_of_captured_frame_matches_trailer(self, calculator: CRCCalculator):
+        frame = frames[0]
+
+        crc = calculator.calculate_crc16(frame[:-2])
+
+        assert crc == int.from_bytes(frame[-2:], "little")
+
+    @pytest.mark.parametrize("split", [0, 1, 8, 9, 300])
+    def test_calculate_crc16_over_chunks_equals_contiguous(
+        self, calculator: CRCCalculator, split: int
+    ):
+        data = memoryview(frames[0])[:-2]
+
+        chunked = calculator.calculate_crc16(data[:split], data[split:])
+
+        assert chunked == calculator.calculate_crc16(data)
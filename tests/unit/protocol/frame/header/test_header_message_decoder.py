@@ -1,6 +1,7 @@
 import pytest
 
 from shine2mqtt.protocol.frame.header.decoder import HeaderDecoder
+from shine2mqtt.protocol.frame.header.header import FUNCTION_CODE_BY_BYTE, FunctionCode
 from tests.utils.loader import CapturedFrameLoader
 
 frames, headers, payloads = CapturedFrameLoader.load("ping_message")
@@ -20,3 +21,20 @@ class TestHeaderDecoder:
         header = decoder.decode(frame)
 
         assert header == expected_header
+
+    def test_decode_resolves_aliased_function_code_to_canonical_member(self):
+        header = HeaderDecoder().decode(bytes.fromhex("0001 0006 0002 01 04"))
+
+        assert header.function_code is FunctionCode.DATA
+
+    def test_decode_unknown_function_code_raises(self):
+        with pytest.raises(ValueError):
+            HeaderDecoder().decode(bytes.fromhex("0001 0006 0002 01 ff"))
+
+
+class TestFunctionCodeByByte:
+    def test_matches_enum_lookup_for_every_byte(self):
+        for value in range(256):
+            expected = FunctionCode(value) if value in FunctionCode._value2member_map_ else None
+
+            assert FUNCTION_CODE_BY_BYTE[value] is expected
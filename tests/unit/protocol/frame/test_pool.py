@@ -0,0 +1,76 @@
+import pytest
+
+from shine2mqtt.protocol.frame.decoder import DecodingError
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.frame.pool import DecodeExecutor, FrameDecodePool, FrameDecodePoolConfig
+from shine2mqtt.protocol.messages.data.data import GrowattDataMessage
+from shine2mqtt.protocol.messages.ping.message import GrowattPingMessage
+from tests.utils.loader import CapturedFrameLoader
+
+data_frames, _, _ = CapturedFrameLoader.load("data_message")
+ping_frames, _, _ = CapturedFrameLoader.load("ping_message")
+
+
+def create_pool(executor: DecodeExecutor, **config) -> FrameDecodePool:
+    return FrameDecodePool(
+        decoder=FrameFactory.server_decoder(),
+        config=FrameDecodePoolConfig(executor=executor, workers=1, **config),
+        decoder_factory=FrameFactory.server_decoder,
+    )
+
+
+class TestFrameDecodePool:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor", list(DecodeExecutor))
+    async def test_decode_batch_keeps_frame_order(self, executor):
+        pool = create_pool(executor)
+        try:
+            results = await pool.decode_batch([data_frames[0], ping_frames[0], data_frames[0]])
+        finally:
+            pool.close()
+
+        assert [type(result) for result in results] == [
+            GrowattDataMessage,
+            GrowattPingMessage,
+            GrowattDataMessage,
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor", list(DecodeExecutor))
+    async def test_decode_batch_returns_error_for_invalid_frame(self, executor):
+        corrupt = bytearray(ping_frames[0])
+        corrupt[-1] ^= 0xFF
+
+        pool = create_pool(executor)
+        try:
+            results = await pool.decode_batch([bytes(corrupt), ping_frames[0]])
+        finally:
+            pool.close()
+
+        assert isinstance(results[0], DecodingError)
+        assert isinstance(results[1], GrowattPingMessage)
+
+    @pytest.mark.asyncio
+    async def test_decode_raises_decoding_error(self):
+        pool = create_pool(DecodeExecutor.THREAD)
+        try:
+            with pytest.raises(DecodingError):
+                await pool.decode(ping_frames[0][:-1] + b"\x00")
+        finally:
+            pool.close()
+
+    def test_should_offload_large_frames_and_backlogs(self):
+        pool = create_pool(DecodeExecutor.THREAD, min_frame_size=500, min_backlog_size=1000)
+        try:
+            assert pool.should_offload(frame_size=500, backlog_size=0)
+            assert pool.should_offload(frame_size=10, backlog_size=1000)
+            assert not pool.should_offload(frame_size=499, backlog_size=999)
+        finally:
+            pool.close()
+
+    def test_process_pool_requires_decoder_factory(self):
+        with pytest.raises(ValueError):
+            FrameDecodePool(
+                decoder=FrameFactory.server_decoder(),
+                config=FrameDecodePoolConfig(executor=DecodeExecutor.PROCESS),
+            )
@@ -0,0 +1,40 @@
+import pytest
+
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.frame.header.header import FunctionCode, MBAPHeader
+
+
+class TestFrameTemplate:
+    @pytest.fixture
+    def header(self) -> MBAPHeader:
+        return MBAPHeader(
+            transaction_id=1, protocol_id=6, length=34, unit_id=1, function_code=FunctionCode.PING
+        )
+
+    def test_render_without_patches_equals_encoded_frame(self, header):
+        encoder = FrameFactory.encoder()
+        payload = bytes(range(32))
+
+        template = encoder.encode_template(header, payload)
+
+        assert template.render() == encoder.encode_frame(header, payload)
+
+    def test_patched_fields_equal_encoded_frame(self, header):
+        encoder = FrameFactory.encoder()
+        payload = bytearray(range(32))
+        template = encoder.encode_template(header, bytes(payload))
+
+        template.set_transaction_id(513)
+        template.set_payload(0, b"XGD0000001")
+        template.set_payload(23, b"\xff\x00\xab")
+
+        header.transaction_id = 513
+        payload[0:10] = b"XGD0000001"
+        payload[23:26] = b"\xff\x00\xab"
+        assert template.render() == encoder.encode_frame(header, bytes(payload))
+
+    def test_set_payload_outside_payload_raises(self, header):
+        template = FrameFactory.encoder().encode_template(header, bytes(32))
+
+        with pytest.raises(ValueError):
+            template.set_payload(30, b"\x00\x00\x00")
@@ -2,7 +2,7 @@ from datetime import datetime
 
 import pytest
 
-from shine2mqtt.protocol.messages.data.data import GrowattDataMessage, InverterStatus
+from shine2mqtt.protocol.messages.data.data import GrowattBufferedDataMessage, InverterStatus
 from shine2mqtt.protocol.messages.data.decoder import BufferDataRequestDecoder
 from tests.utils.loader import CapturedFrameLoader
 
@@ -12,7 +12,7 @@ DATALOGGER_SERIAL = "XGDABCDEFG"
 INVERTER_SERIAL = "MLG0A12345"
 
 EXPECTED_MESSAGES = [
-    GrowattDataMessage(
+    GrowattBufferedDataMessage(
         header=headers[0],
         datalogger_serial=DATALOGGER_SERIAL,
         inverter_serial=INVERTER_SERIAL,
@@ -0,0 +1,47 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from shine2mqtt.domain.models.inverter import InverterReading
+from shine2mqtt.protocol.session.backlog import BufferedDataBacklog
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 100.0
+
+    def now(self) -> float:
+        return self.time
+
+
+def reading() -> InverterReading:
+    return InverterReading(timestamp=datetime(2026, 1, 12, 3), state=MagicMock())
+
+
+class TestBufferedDataBacklog:
+    def test_add_reports_a_full_batch(self):
+        backlog = BufferedDataBacklog(batch_size=2, clock=FakeClock())
+
+        assert not backlog.add(reading())
+        assert backlog.add(reading())
+        assert len(backlog.take_batch()) == 2
+        assert backlog.take_batch() == []
+
+    def test_finish_reports_readings_and_drain_duration(self):
+        clock = FakeClock()
+        backlog = BufferedDataBacklog(batch_size=10, clock=clock)
+
+        backlog.add(reading())
+        clock.time += 2.5
+        backlog.add(reading())
+        backlog.add(reading())
+        clock.time += 10.0
+
+        assert backlog.draining
+        # The drain ends with the last reading, not with the call to finish
+        assert backlog.finish() == (3, 2.5)
+        assert not backlog.draining
+
+    def test_finish_without_readings_reports_nothing(self):
+        backlog = BufferedDataBacklog(batch_size=10, clock=FakeClock())
+
+        assert backlog.finish() is None
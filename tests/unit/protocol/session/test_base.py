@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.frame.pool import DecodeExecutor, FrameDecodePool, FrameDecodePoolConfig
+from shine2mqtt.protocol.messages.data.data import GrowattDataMessage
+from shine2mqtt.protocol.messages.ping.message import GrowattPingMessage
+from shine2mqtt.protocol.session.base import BaseProtocolSession
+from tests.utils.loader import CapturedFrameLoader
+
+data_frames, _, _ = CapturedFrameLoader.load("data_message")
+ping_frames, _, _ = CapturedFrameLoader.load("ping_message")
+
+
+class FakeTransport:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.position = 0
+
+    @property
+    def buffered_size(self) -> int:
+        return len(self.data) - self.position
+
+    async def peek(self, num_bytes: int) -> memoryview:
+        return memoryview(self.data)[self.position : self.position + num_bytes]
+
+    async def read(self, num_bytes: int) -> memoryview:
+        start = self.position
+        self.position += num_bytes
+        return memoryview(self.data)[start : self.position]
+
+
+class RecordingDecodePool(FrameDecodePool):
+    def __init__(self, config: FrameDecodePoolConfig):
+        super().__init__(decoder=FrameFactory.server_decoder(), config=config)
+        self.batches: list[int] = []
+
+    async def decode_batch(self, frames):
+        self.batches.append(len(frames))
+        return await super().decode_batch(frames)
+
+
+def create_session(data: bytes, **config) -> tuple[BaseProtocolSession, RecordingDecodePool]:
+    pool = RecordingDecodePool(FrameDecodePoolConfig(executor=DecodeExecutor.THREAD, **config))
+    session = BaseProtocolSession(
+        transport=FakeTransport(data),
+        encoder=MagicMock(),
+        decoder=FrameFactory.server_decoder(),
+        decode_pool=pool,
+    )
+    return session, pool
+
+
+class TestBaseProtocolSessionDecodePool:
+    @pytest.mark.asyncio
+    async def test_small_frames_are_decoded_inline(self):
+        session, pool = create_session(ping_frames[0] + data_frames[0])
+        try:
+            assert isinstance(await session._read_message(), GrowattPingMessage)
+            assert isinstance(await session._read_message(), GrowattDataMessage)
+        finally:
+            pool.close()
+
+        assert pool.batches == []
+
+    @pytest.mark.asyncio
+    async def test_buffered_backlog_is_decoded_in_one_batch(self):
+        backlog = data_frames[0] + ping_frames[0] + data_frames[0]
+        session, pool = create_session(backlog, min_backlog_size=1)
+        try:
+            messages = [await session._read_message() for _ in range(3)]
+        finally:
+            pool.close()
+
+        assert pool.batches == [3]
+        assert [type(message) for message in messages] == [
+            GrowattDataMessage,
+            GrowattPingMessage,
+            GrowattDataMessage,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_limited(self):
+        session, pool = create_session(ping_frames[0] * 5, min_backlog_size=1, max_batch_size=2)
+        try:
+            for _ in range(5):
+                assert isinstance(await session._read_message(), GrowattPingMessage)
+        finally:
+            pool.close()
+
+        # The last frame has no backlog left behind it and is decoded inline
+        assert pool.batches == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_invalid_frame_in_batch_is_skipped(self):
+        corrupt = bytearray(ping_frames[0])
+        corrupt[-1] ^= 0xFF
+        session, pool = create_session(bytes(corrupt) + ping_frames[0], min_backlog_size=1)
+        try:
+            assert await session._read_message() is None
+            assert isinstance(await session._read_message(), GrowattPingMessage)
+        finally:
+            pool.close()
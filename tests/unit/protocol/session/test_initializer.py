@@ -0,0 +1,192 @@
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.interfaces.metadata import DataloggerMetadataStore
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.protocol.frame.header.header import FunctionCode, MBAPHeader
+from shine2mqtt.protocol.messages.announce.announce import GrowattAnnounceMessage
+from shine2mqtt.protocol.messages.get_config.get_config import (
+    GrowattGetConfigRequestMessage,
+    GrowattGetConfigResponseMessage,
+)
+from shine2mqtt.protocol.messages.ping.message import GrowattPingMessage
+from shine2mqtt.protocol.messages.set_config.set_config import (
+    GrowattSetConfigRequestMessage,
+    GrowattSetConfigResponseMessage,
+)
+from shine2mqtt.protocol.session.initializer import ProtocolSessionInitializer
+from shine2mqtt.protocol.settings.constants import (
+    DATALOGGER_HW_VERSION_REGISTER,
+    DATALOGGER_IP_ADDRESS_REGISTER,
+    DATALOGGER_MAC_ADDRESS_REGISTER,
+    DATALOGGER_SW_VERSION_REGISTER,
+    DATALOGGER_SYSTEM_TIME_REGISTER,
+)
+
+SERIAL = "XGDABCDEFG"
+
+
+def header(function_code: FunctionCode) -> MBAPHeader:
+    return MBAPHeader(
+        transaction_id=1, protocol_id=6, length=0, unit_id=1, function_code=function_code
+    )
+
+
+def get_config_response(register: int, value: str) -> GrowattGetConfigResponseMessage:
+    return GrowattGetConfigResponseMessage(
+        header=header(FunctionCode.GET_CONFIG),
+        datalogger_serial=SERIAL,
+        register=register,
+        data=value.encode(),
+        value=value,
+    )
+
+
+class FakeConnection:
+    def __init__(self, incoming: list):
+        self.incoming = incoming
+        # ("read", message) and ("write", message) in the order they happened
+        self.log: list[tuple[str, object]] = []
+
+    async def read(self):
+        message = self.incoming.pop(0)
+        self.log.append(("read", message))
+        return message
+
+    async def write(self, message) -> None:
+        self.log.append(("write", message))
+
+
+@pytest.fixture
+def announce() -> GrowattAnnounceMessage:
+    announce = MagicMock(spec=GrowattAnnounceMessage)
+    announce.header = header(FunctionCode.ANNOUNCE)
+    announce.datalogger_serial = SERIAL
+    return announce
+
+
+@pytest.fixture
+def mapper() -> MagicMock:
+    return MagicMock()
+
+
+def create_initializer(connection: FakeConnection, mapper) -> ProtocolSessionInitializer:
+    initializer = ProtocolSessionInitializer(
+        encoder=MagicMock(),
+        decoder=MagicMock(),
+        mapper=mapper,
+        transport=MagicMock(),
+        domain_events=DomainEventBus(),
+    )
+    initializer._read_message = connection.read
+    initializer._write_message = connection.write
+    return initializer
+
+
+class TestProtocolSessionInitializer:
+    @pytest.mark.asyncio
+    async def test_handshake_requests_are_sent_before_waiting_for_responses(self, announce, mapper):
+        connection = FakeConnection(
+            [
+                announce,
+                get_config_response(DATALOGGER_MAC_ADDRESS_REGISTER, "00:11:22:33:44:55"),
+                get_config_response(DATALOGGER_SW_VERSION_REGISTER, "3.1.0.0"),
+                get_config_response(DATALOGGER_IP_ADDRESS_REGISTER, "192.168.1.10"),
+                get_config_response(DATALOGGER_HW_VERSION_REGISTER, "2.0"),
+            ]
+        )
+
+        await create_initializer(connection, mapper).initialize()
+
+        actions = [action for action, _ in connection.log]
+        assert actions == ["read"] + ["write"] * 6 + ["read"] * 4
+        requests = [message for _, message in connection.log[2:7]]
+        assert [r.register_start for r in requests[:4]] == [
+            DATALOGGER_SW_VERSION_REGISTER,
+            DATALOGGER_HW_VERSION_REGISTER,
+            DATALOGGER_IP_ADDRESS_REGISTER,
+            DATALOGGER_MAC_ADDRESS_REGISTER,
+        ]
+        assert isinstance(requests[0], GrowattGetConfigRequestMessage)
+        assert isinstance(requests[4], GrowattSetConfigRequestMessage)
+        assert requests[4].register == DATALOGGER_SYSTEM_TIME_REGISTER
+
+    @pytest.mark.asyncio
+    async def test_responses_are_matched_by_register(self, announce, mapper):
+        ping = GrowattPingMessage(header=header(FunctionCode.PING), datalogger_serial=SERIAL)
+        time_sync = GrowattSetConfigResponseMessage(
+            header=header(FunctionCode.SET_CONFIG),
+            datalogger_serial=SERIAL,
+            register=DATALOGGER_SYSTEM_TIME_REGISTER,
+            ack=True,
+        )
+        connection = FakeConnection(
+            [
+                announce,
+                get_config_response(DATALOGGER_HW_VERSION_REGISTER, "2.0"),
+                ping,
+                time_sync,
+                get_config_response(DATALOGGER_MAC_ADDRESS_REGISTER, "00:11:22:33:44:55"),
+                get_config_response(DATALOGGER_IP_ADDRESS_REGISTER, "192.168.1.10"),
+                get_config_response(DATALOGGER_SW_VERSION_REGISTER, "3.1.0.0"),
+            ]
+        )
+
+        await create_initializer(connection, mapper).initialize()
+
+        assert ("write", ping) in connection.log
+        assert not connection.incoming
+        kwargs = mapper.map_config_to_datalogger.call_args.kwargs
+        assert kwargs["sw_version"] == "3.1.0.0"
+        assert kwargs["hw_version"] == "2.0"
+        assert kwargs["ip_address"] == "192.168.1.10"
+        assert kwargs["mac_address"] == "00:11:22:33:44:55"
+
+    @pytest.mark.asyncio
+    async def test_cached_datalogger_skips_handshake(self, announce, mapper):
+        cached = DataLogger(
+            serial=SERIAL,
+            protocol_id=5,
+            unit_id=1,
+            sw_version="3.1.0.0",
+            hw_version="2.0",
+            ip_address="192.168.1.10",
+            mac_address="00:11:22:33:44:55",
+        )
+        store = MagicMock(spec=DataloggerMetadataStore)
+        store.get.return_value = cached
+        connection = FakeConnection([announce])
+        initializer = create_initializer(connection, mapper)
+        initializer.metadata_store = store
+
+        session = await initializer.initialize()
+
+        assert session.datalogger == replace(cached, protocol_id=6)
+        assert [action for action, _ in connection.log] == ["read", "write"]
+        mapper.map_config_to_datalogger.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handshake_result_is_stored(self, announce, mapper):
+        store = MagicMock(spec=DataloggerMetadataStore)
+        store.get.return_value = None
+        connection = FakeConnection(
+            [announce]
+            + [
+                get_config_response(register, "value")
+                for register in (
+                    DATALOGGER_SW_VERSION_REGISTER,
+                    DATALOGGER_HW_VERSION_REGISTER,
+                    DATALOGGER_IP_ADDRESS_REGISTER,
+                    DATALOGGER_MAC_ADDRESS_REGISTER,
+                )
+            ]
+        )
+        initializer = create_initializer(connection, mapper)
+        initializer.metadata_store = store
+
+        await initializer.initialize()
+
+        store.put.assert_called_once_with(mapper.map_config_to_datalogger.return_value)
@@ -0,0 +1,33 @@
+from dataclasses import asdict
+
+import pytest
+
+from shine2mqtt.domain.models.inverter import InverterStatus
+from shine2mqtt.protocol.messages.data.decoder import DataRequestDecoder
+from shine2mqtt.protocol.session.mapper import MessageEventMapper
+from tests.utils.loader import CapturedFrameLoader
+
+_, headers, payloads = CapturedFrameLoader.load("data_message")
+
+
+class TestMessageEventMapper:
+    @pytest.fixture
+    def message(self):
+        return DataRequestDecoder().decode(headers[0], payloads[0])
+
+    def test_map_data_message_copies_all_state_fields(self, message):
+        event = MessageEventMapper().map_data_message_to_inverter_state_updated_event(message)
+
+        for field, value in event.state.iter_fields():
+            if field == "inverter_status":
+                assert value is InverterStatus.NORMAL
+            else:
+                assert value == getattr(message, field)
+
+        assert event.datalogger_serial == message.datalogger_serial
+        assert event.timestamp == message.timestamp
+
+    def test_inverter_state_iter_fields_matches_asdict(self, message):
+        event = MessageEventMapper().map_data_message_to_inverter_state_updated_event(message)
+
+        assert dict(event.state.iter_fields()) == asdict(event.state)
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from shine2mqtt.protocol.messages.get_config.get_config import (
+    GrowattGetConfigRequestMessage,
+    GrowattGetConfigResponseMessage,
+)
+from shine2mqtt.protocol.session.config import ProtocolSessionConfig
+from shine2mqtt.protocol.session.message_factory import MessageFactory
+from shine2mqtt.protocol.session.response_tracker import PendingResponseTracker
+from shine2mqtt.protocol.session.scheduler import RequestPriority, RequestScheduler
+from shine2mqtt.protocol.session.state import TransactionIdTracker
+
+SERIAL = "XGDABCDEFG"
+
+
+class FakeDatalogger:
+    def __init__(self):
+        self.received: list[GrowattGetConfigRequestMessage] = []
+
+    async def write(self, request) -> None:
+        self.received.append(request)
+
+    def respond(self, tracker: PendingResponseTracker, request) -> None:
+        tracker.resolve(
+            GrowattGetConfigResponseMessage(
+                header=request.header,
+                datalogger_serial=SERIAL,
+                register=request.register_start,
+                data=b"",
+                value=str(request.register_start),
+            )
+        )
+
+
+@pytest.fixture
+def factory() -> MessageFactory:
+    return MessageFactory(protocol_id=6, unit_id=1, tracker=TransactionIdTracker())
+
+
+@pytest.fixture
+def tracker() -> PendingResponseTracker:
+    return PendingResponseTracker()
+
+
+@pytest.fixture
+def datalogger() -> FakeDatalogger:
+    return FakeDatalogger()
+
+
+def create_scheduler(tracker, datalogger, max_in_flight=1, request_timeout=1.0):
+    config = ProtocolSessionConfig(max_in_flight=max_in_flight, request_timeout=request_timeout)
+    return RequestScheduler(tracker=tracker, write=datalogger.write, config=config)
+
+
+class TestRequestScheduler:
+    @pytest.mark.asyncio
+    async def test_request_returns_response(self, factory, tracker, datalogger):
+        scheduler = create_scheduler(tracker, datalogger)
+
+        task = asyncio.create_task(scheduler.request(factory.get_config_request(SERIAL, 30)))
+        await asyncio.sleep(0)
+        datalogger.respond(tracker, datalogger.received[0])
+
+        assert (await task).value == "30"
+        assert tracker.pending == 0
+        assert scheduler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_limits_requests_in_flight(self, factory, tracker, datalogger):
+        scheduler = create_scheduler(tracker, datalogger, max_in_flight=2)
+
+        tasks = [
+            asyncio.create_task(scheduler.request(factory.get_config_request(SERIAL, register)))
+            for register in (1, 2, 3)
+        ]
+        await asyncio.sleep(0)
+
+        assert [r.register_start for r in datalogger.received] == [1, 2]
+        assert scheduler.waiting == 1
+
+        datalogger.respond(tracker, datalogger.received[0])
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert [r.register_start for r in datalogger.received] == [1, 2, 3]
+
+        for request in datalogger.received[1:]:
+            datalogger.respond(tracker, request)
+        assert [(await task).value for task in tasks] == ["1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_waiting_requests_are_sent_by_priority(self, factory, tracker, datalogger):
+        scheduler = create_scheduler(tracker, datalogger)
+        submissions = [
+            (1, RequestPriority.NORMAL),
+            (2, RequestPriority.LOW),
+            (3, RequestPriority.NORMAL),
+            (4, RequestPriority.HIGH),
+        ]
+
+        tasks = []
+        for register, priority in submissions:
+            request = factory.get_config_request(SERIAL, register)
+            tasks.append(asyncio.create_task(scheduler.request(request, priority)))
+        await asyncio.sleep(0)
+
+        while len(datalogger.received) < len(submissions):
+            datalogger.respond(tracker, datalogger.received[-1])
+            for _ in range(3):
+                await asyncio.sleep(0)
+        datalogger.respond(tracker, datalogger.received[-1])
+        await asyncio.gather(*tasks)
+
+        assert [r.register_start for r in datalogger.received] == [1, 4, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_timeout_evicts_tracker_entry_and_frees_slot(self, factory, tracker, datalogger):
+        scheduler = create_scheduler(tracker, datalogger, request_timeout=0.01)
+
+        with pytest.raises(TimeoutError):
+            await scheduler.request(factory.get_config_request(SERIAL, 30))
+
+        assert tracker.pending == 0
+        assert scheduler.in_flight == 0
+
+        # A late response is ignored
+        datalogger.respond(tracker, datalogger.received[0])
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_evicts_tracker_entry(self, factory, tracker, datalogger):
+        scheduler = create_scheduler(tracker, datalogger)
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await scheduler.request(factory.get_config_request(SERIAL, 30))
+
+        assert tracker.pending == 0
+        assert scheduler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiting_request_is_never_sent(self, factory, tracker, datalogger):
+        scheduler = create_scheduler(tracker, datalogger)
+        first = asyncio.create_task(scheduler.request(factory.get_config_request(SERIAL, 1)))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TimeoutError):
+            await scheduler.request(factory.get_config_request(SERIAL, 2), timeout=0.01)
+
+        datalogger.respond(tracker, datalogger.received[0])
+        await first
+        assert [r.register_start for r in datalogger.received] == [1]
+        assert scheduler.in_flight == 0
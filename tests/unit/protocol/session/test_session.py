@@ -0,0 +1,189 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shine2mqtt.domain.events.bus import DomainEventBus
+from shine2mqtt.domain.events.events import (
+    DataloggerAnnouncedEvent,
+    InverterBacklogDrainedEvent,
+    InverterHistoryRecordedEvent,
+    InverterStateUpdatedEvent,
+)
+from shine2mqtt.domain.interfaces.metadata import DataloggerMetadataStore
+from shine2mqtt.domain.models.config import ConfigResult
+from shine2mqtt.domain.models.datalogger import DataLogger
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.session.config import ProtocolSessionConfig
+from shine2mqtt.protocol.session.session import ProtocolSession
+from shine2mqtt.protocol.session.state import ServerProtocolSessionState
+from shine2mqtt.protocol.settings.constants import (
+    DATALOGGER_HW_VERSION_REGISTER,
+    DATALOGGER_IP_ADDRESS_REGISTER,
+    DATALOGGER_MAC_ADDRESS_REGISTER,
+    DATALOGGER_SW_VERSION_REGISTER,
+)
+from tests.utils.loader import CapturedFrameLoader
+
+buffered_data_frames, _, _ = CapturedFrameLoader.load("buffered_data_message")
+data_frames, _, _ = CapturedFrameLoader.load("data_message")
+
+CACHED_DATALOGGER = DataLogger(
+    serial="XGDABCDEFG",
+    protocol_id=6,
+    unit_id=1,
+    sw_version="3.1.0.0",
+    hw_version="2.0",
+    ip_address="192.168.1.10",
+    mac_address="00:11:22:33:44:55",
+)
+
+
+def create_session(store, bus, config: dict[int, str]) -> ProtocolSession:
+    session = ProtocolSession(
+        transport=MagicMock(),
+        state=ServerProtocolSessionState(datalogger=CACHED_DATALOGGER, inverter=MagicMock()),
+        factory=MagicMock(),
+        encoder=MagicMock(),
+        decoder=MagicMock(),
+        domain_events=bus,
+        metadata_store=store,
+        refresh_datalogger=True,
+    )
+    session.get_config = AsyncMock(
+        side_effect=lambda register: ConfigResult(register, config[register], b"")
+    )
+    session.set_config = AsyncMock(return_value=True)
+    return session
+
+
+def datalogger_config(ip_address: str) -> dict[int, str]:
+    return {
+        DATALOGGER_SW_VERSION_REGISTER: "3.1.0.0",
+        DATALOGGER_HW_VERSION_REGISTER: "2.0",
+        DATALOGGER_IP_ADDRESS_REGISTER: ip_address,
+        DATALOGGER_MAC_ADDRESS_REGISTER: "00:11:22:33:44:55",
+    }
+
+
+class TestProtocolSessionRefreshDatalogger:
+    @pytest.mark.asyncio
+    async def test_changed_config_is_stored_and_announced(self):
+        store = MagicMock(spec=DataloggerMetadataStore)
+        bus = DomainEventBus()
+        events = bus.subscribe("test")
+        session = create_session(store, bus, datalogger_config("192.168.1.11"))
+
+        await session._refresh_datalogger()
+
+        assert session.datalogger.ip_address == "192.168.1.11"
+        store.put.assert_called_once_with(session.datalogger)
+        event = events.get_nowait()
+        assert isinstance(event, DataloggerAnnouncedEvent)
+        assert event.datalogger.ip_address == "192.168.1.11"
+        session.set_config.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_config_is_not_announced(self):
+        store = MagicMock(spec=DataloggerMetadataStore)
+        bus = DomainEventBus()
+        events = bus.subscribe("test")
+        session = create_session(store, bus, datalogger_config("192.168.1.10"))
+
+        await session._refresh_datalogger()
+
+        assert session.datalogger == CACHED_DATALOGGER
+        store.put.assert_not_called()
+        assert events.empty()
+
+
+class TestProtocolSessionExpectResponse:
+    @pytest.mark.asyncio
+    async def test_unanswered_request_is_discarded_after_the_request_timeout(self):
+        session = ProtocolSession(
+            transport=MagicMock(),
+            state=ServerProtocolSessionState(datalogger=CACHED_DATALOGGER, inverter=MagicMock()),
+            factory=MagicMock(),
+            encoder=MagicMock(),
+            decoder=MagicMock(),
+            domain_events=DomainEventBus(),
+            config=ProtocolSessionConfig(request_timeout=0.01),
+        )
+
+        response = session.expect_response(MagicMock())
+        assert session._tracker.pending == 1
+
+        with pytest.raises(asyncio.CancelledError):
+            await response
+        assert session._tracker.pending == 0
+
+
+class TestProtocolSessionBufferedData:
+    @pytest.fixture
+    def buffered_data(self):
+        return FrameFactory.server_decoder().decode(buffered_data_frames[0])
+
+    @pytest.fixture
+    def live_data(self):
+        return FrameFactory.server_decoder().decode(data_frames[0])
+
+    async def run_session(self, bus: DomainEventBus, messages: list, batch_size: int) -> list:
+        session = ProtocolSession(
+            transport=MagicMock(),
+            state=ServerProtocolSessionState(datalogger=CACHED_DATALOGGER, inverter=MagicMock()),
+            factory=MagicMock(),
+            encoder=MagicMock(),
+            decoder=MagicMock(),
+            domain_events=bus,
+            config=ProtocolSessionConfig(history_batch_size=batch_size),
+        )
+        written = []
+        session._write_message = AsyncMock(side_effect=written.append)
+        session._read_message = AsyncMock(side_effect=[*messages, ConnectionResetError()])
+
+        with pytest.raises(ConnectionResetError):
+            await session.run()
+        return written
+
+    def published(self, events) -> list:
+        published = []
+        while not events.empty():
+            published.append(events.get_nowait())
+        return published
+
+    @pytest.mark.asyncio
+    async def test_buffered_readings_are_published_as_history_in_batches(
+        self, buffered_data, live_data
+    ):
+        bus = DomainEventBus()
+        events = bus.subscribe("test")
+
+        written = await self.run_session(bus, [buffered_data] * 3 + [live_data], batch_size=2)
+
+        # Every buffered reading is acknowledged
+        assert len(written) == 4
+        published = self.published(events)
+        assert [type(event) for event in published] == [
+            DataloggerAnnouncedEvent,
+            InverterHistoryRecordedEvent,
+            InverterHistoryRecordedEvent,
+            InverterBacklogDrainedEvent,
+            InverterStateUpdatedEvent,
+        ]
+        assert [len(event.readings) for event in published[1:3]] == [2, 1]
+        assert published[1].readings[0].timestamp == buffered_data.timestamp
+        assert published[3].readings == 3
+
+    @pytest.mark.asyncio
+    async def test_pending_history_is_published_when_the_session_ends(self, buffered_data):
+        bus = DomainEventBus()
+        events = bus.subscribe("test")
+
+        await self.run_session(bus, [buffered_data], batch_size=10)
+
+        published = self.published(events)
+        assert [type(event) for event in published] == [
+            DataloggerAnnouncedEvent,
+            InverterHistoryRecordedEvent,
+            InverterBacklogDrainedEvent,
+        ]
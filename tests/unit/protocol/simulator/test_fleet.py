@@ -0,0 +1,90 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from shine2mqtt.protocol.frame.constants import HEADER_LENGTH
+from shine2mqtt.protocol.frame.decoder import FrameDecoder
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.frame.header.header import FunctionCode
+from shine2mqtt.protocol.messages.ack.ack import GrowattAckMessage
+from shine2mqtt.protocol.simulator.config import SimulatedClientConfig
+from shine2mqtt.protocol.simulator.factory import ClientProtocolSessionFactory
+from shine2mqtt.protocol.simulator.fleet import SimulatedFleet
+from shine2mqtt.protocol.simulator.generator import FrameGenerator
+from shine2mqtt.util.clock import MonotonicClockService
+
+
+class FakeServer:
+    """Records the frames per datalogger serial and acknowledges every ANNOUNCE and
+    BUFFERED_DATA."""
+
+    def __init__(self):
+        self.decoder = FrameFactory.server_decoder()
+        self.encoder = FrameFactory.encoder()
+        self.received: dict[str, list[FunctionCode]] = defaultdict(list)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                header = await reader.readexactly(HEADER_LENGTH)
+                payload = await reader.readexactly(FrameDecoder.extract_payload_length(header))
+                message = self.decoder.decode(header + payload)
+                function_code = message.header.function_code
+                self.received[message.datalogger_serial].append(function_code)
+                if function_code in (FunctionCode.ANNOUNCE, FunctionCode.BUFFERED_DATA):
+                    ack = GrowattAckMessage(header=message.header, ack=True)
+                    writer.write(self.encoder.encode(ack))
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+
+async def run_fleet(fake_server: FakeServer, **config_values) -> SimulatedFleet:
+    server = await asyncio.start_server(fake_server.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    config = SimulatedClientConfig(
+        server_host="127.0.0.1",
+        server_port=port,
+        data_interval=60,
+        ping_interval=60,
+        **config_values,
+    )
+    clock = MonotonicClockService()
+    factory = ClientProtocolSessionFactory(
+        decoder=FrameFactory.client_decoder(),
+        config=config,
+        clock=clock,
+        generator=FrameGenerator(encoder=FrameFactory.encoder()),
+    )
+    fleet = SimulatedFleet(factory, config, clock)
+
+    task = asyncio.create_task(fleet.run())
+    await asyncio.sleep(0.5)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    server.close()
+    await server.wait_closed()
+    return fleet
+
+
+class TestSimulatedFleet:
+    @pytest.mark.asyncio
+    async def test_dataloggers_announce_and_send_with_unique_serials(self):
+        fake_server = FakeServer()
+        fleet = await run_fleet(fake_server, loggers=5, ramp_up=0.1)
+
+        serials = {datalogger.serial for datalogger in fleet.dataloggers}
+        assert len(serials) == 5
+        assert fake_server.received.keys() == serials
+        for function_codes in fake_server.received.values():
+            assert function_codes == [FunctionCode.ANNOUNCE, FunctionCode.DATA, FunctionCode.PING]
+
+    @pytest.mark.asyncio
+    async def test_dataloggers_send_buffered_data_backlog(self):
+        fake_server = FakeServer()
+        await run_fleet(fake_server, loggers=2, buffered_data=3)
+
+        assert len(fake_server.received) == 2
+        for function_codes in fake_server.received.values():
+            assert function_codes[:2] == [FunctionCode.ANNOUNCE, FunctionCode.DATA]
+            assert function_codes.count(FunctionCode.BUFFERED_DATA) == 3
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from shine2mqtt.protocol.frame.factory import FrameFactory
+from shine2mqtt.protocol.frame.header.header import FunctionCode
+from shine2mqtt.protocol.messages.data.data import GrowattBufferedDataMessage, InverterStatus
+from shine2mqtt.protocol.simulator.generator import FrameGenerator
+from shine2mqtt.util.clock import VirtualClockService
+
+
+class TestFrameGenerator:
+    def test_data_frames_carry_clock_wall_time(self):
+        clock = VirtualClockService(epoch=datetime(2026, 6, 21, 12, 0, 0))
+        generator = FrameGenerator(encoder=FrameFactory.encoder(), clock=clock)
+        decoder = FrameFactory.server_decoder()
+
+        first = decoder.decode(generator.generate_frame(1, FunctionCode.DATA, "XGD0000001"))
+        clock.advance(300.0)
+        second = decoder.decode(generator.generate_frame(2, FunctionCode.DATA, "XGD0000001"))
+
+        assert first.datalogger_serial == "XGD0000001"
+        assert first.timestamp == datetime(2026, 6, 21, 12, 0, 0)
+        assert second.timestamp == datetime(2026, 6, 21, 12, 5, 0)
+
+    def test_data_frames_carry_synthetic_values_per_inverter(self):
+        clock = VirtualClockService(epoch=datetime(2026, 6, 21, 13, 0, 0))
+        generator = FrameGenerator(encoder=FrameFactory.encoder(), clock=clock)
+        decoder = FrameFactory.server_decoder()
+
+        first = decoder.decode(generator.generate_frame(1, FunctionCode.DATA, "XGD0000001"))
+        second = decoder.decode(generator.generate_frame(1, FunctionCode.DATA, "XGD0000002"))
+
+        assert first.inverter_serial == "MLG0000001"
+        assert second.inverter_serial == "MLG0000002"
+        assert first.inverter_status is InverterStatus.NORMAL
+        assert first.power_ac > 0
+        assert first.power_ac != second.power_ac
+
+    def test_buffered_data_frame_at_timestamp(self):
+        generator = FrameGenerator(encoder=FrameFactory.encoder())
+        decoder = FrameFactory.server_decoder()
+
+        frame = generator.generate_buffered_data_frame(
+            7, "XGD0000001", timestamp=datetime(2026, 6, 21, 11, 55, 0)
+        )
+        message = decoder.decode(frame)
+
+        assert isinstance(message, GrowattBufferedDataMessage)
+        assert message.header.transaction_id == 7
+        assert message.datalogger_serial == "XGD0000001"
+        assert message.timestamp == datetime(2026, 6, 21, 11, 55, 0)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
@@ -19,6 +20,7 @@ class TestClientProtocolSession:
     def mock_session_state(self):
         state = Mock()
         state.is_announced.return_value = False
+        state.is_buffered_data_pending.return_value = False
         state.get_last_send.return_value = 0.0
         state.get_next_transaction_id.return_value = 1
         return state
@@ -27,12 +29,14 @@ class TestClientProtocolSession:
     def stub_clock(self):
         clock = Mock()
         clock.now.return_value = 0.0
+        clock.wall_time.return_value = datetime(2026, 6, 21, 12, 0, 0)
         return clock
 
     @pytest.fixture
     def mock_generator(self):
         generator = Mock()
         generator.generate_frame.return_value = b"test_frame"
+        generator.generate_buffered_data_frame.return_value = b"buffered_frame"
         return generator
 
     @pytest.fixture
@@ -106,7 +110,6 @@ class TestClientProtocolSession:
     @pytest.mark.parametrize(
         "function_code",
         [
-            FunctionCode.BUFFERED_DATA,
             FunctionCode.GET_CONFIG,
             FunctionCode.SET_CONFIG,
         ],
@@ -118,6 +121,35 @@ class TestClientProtocolSession:
 
         assert result is None
 
+    def test_get_send_message_frame_buffered_data_oldest_first(
+        self, session: ClientProtocolSession, mock_session_state: Mock, mock_generator: Mock
+    ):
+        mock_session_state.take_buffered_data.return_value = 2
+        action = SendMessageAction(function_code=FunctionCode.BUFFERED_DATA)
+
+        result = session.get_send_message_frame(action)
+
+        assert result == b"buffered_frame"
+        # Three data intervals of 300 seconds before now, two more frames follow
+        mock_generator.generate_buffered_data_frame.assert_called_once_with(
+            transaction_id=1,
+            datalogger_serial=mock_session_state.datalogger_serial,
+            timestamp=datetime(2026, 6, 21, 11, 45, 0),
+        )
+
+    def test_buffered_data_pending_is_sent_now(
+        self, session: ClientProtocolSession, mock_session_state: Mock, stub_clock: Mock
+    ):
+        mock_session_state.is_announced.return_value = True
+        mock_session_state.is_buffered_data_pending.return_value = True
+        mock_session_state.get_last_send.return_value = 0.0
+        stub_clock.now.return_value = 10.0
+
+        actions = session.get_pending_actions()
+
+        assert actions == [SendMessageAction(FunctionCode.BUFFERED_DATA)]
+        assert session.get_next_send_time() == 10.0
+
     @pytest.mark.parametrize(
         "announced,last_announced_send,last_data_send,last_ping_send,current_time,expected_function_codes",
         [
@@ -162,3 +194,40 @@ class TestClientProtocolSession:
         expected_actions = [SendMessageAction(fc) for fc in expected_function_codes]
 
         assert actions == expected_actions
+
+    @pytest.mark.parametrize(
+        "announced,last_announced_send,last_data_send,last_ping_send,current_time,expected",
+        [
+            # NOT announced, never sent -> now
+            (False, None, None, None, 10.0, 10.0),
+            # NOT announced -> next ANNOUNCE
+            (False, 5.0, None, None, 10.0, 65.0),
+            # announced, DATA never sent -> now
+            (True, 0.0, None, 0.0, 10.0, 10.0),
+            # announced -> first of next DATA and PING
+            (True, 0.0, 100.0, 50.0, 120.0, 170.0),
+            (True, 0.0, 100.0, 300.0, 320.0, 400.0),
+        ],
+    )
+    def test_get_next_send_time(
+        self,
+        session: ClientProtocolSession,
+        mock_session_state: Mock,
+        stub_clock: Mock,
+        announced,
+        last_announced_send,
+        last_data_send,
+        last_ping_send,
+        current_time,
+        expected,
+    ):
+        mock_session_state.is_announced.return_value = announced
+        last_send = {
+            FunctionCode.ANNOUNCE: last_announced_send,
+            FunctionCode.DATA: last_data_send,
+            FunctionCode.PING: last_ping_send,
+        }
+        mock_session_state.get_last_send.side_effect = lambda fc: last_send[fc]
+        stub_clock.now.return_value = current_time
+
+        assert session.get_next_send_time() == expected
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from shine2mqtt.protocol.messages.data.data import InverterStatus
+from shine2mqtt.protocol.simulator.config import SolarConfig
+from shine2mqtt.protocol.simulator.solar import SolarInverter
+
+
+class TestSolarInverter:
+    def test_waits_at_night_and_produces_at_noon(self):
+        inverter = SolarInverter("MLG0000001", SolarConfig(cloudiness=0.0))
+
+        night = inverter.sample(datetime(2026, 6, 21, 2, 0, 0))
+        noon = inverter.sample(datetime(2026, 6, 21, 13, 0, 0))
+
+        assert night["inverter_status"] == InverterStatus.WAITING.value
+        assert night["power_ac"] == 0.0
+        assert night["voltage_dc_1"] == 0.0
+        assert noon["inverter_status"] == InverterStatus.NORMAL.value
+        assert 0.5 * inverter.peak_power < noon["power_dc"] < inverter.peak_power
+        assert noon["power_ac"] == noon["power_dc"] * inverter.efficiency
+        assert noon["power_dc_1"] + noon["power_dc_2"] == noon["power_dc"]
+
+    def test_summer_days_produce_more_than_winter_days(self):
+        inverter = SolarInverter("MLG0000001", SolarConfig(cloudiness=0.0))
+
+        summer = inverter.sample(datetime(2026, 6, 21, 23, 59, 0))["energy_ac_today"]
+        winter = inverter.sample(datetime(2026, 12, 21, 23, 59, 0))["energy_ac_today"]
+
+        assert summer > 2 * winter > 0
+
+    def test_counters_do_not_depend_on_sample_order(self):
+        start = datetime(2026, 6, 20, 0, 0, 0)
+        timestamps = [start + timedelta(minutes=minutes) for minutes in range(0, 3 * 1440, 45)]
+
+        inverter = SolarInverter("MLG0000001", SolarConfig())
+        samples = [inverter.sample(timestamp) for timestamp in timestamps]
+        # Same first sampled day, then a backlog from the newest sample back
+        same_inverter = SolarInverter("MLG0000001", SolarConfig())
+        same_inverter.sample(start)
+        backlog = [same_inverter.sample(timestamp) for timestamp in reversed(timestamps)]
+
+        for sample, backlog_sample in zip(samples, reversed(backlog), strict=True):
+            for name in ("energy_ac_today", "energy_ac_total", "total_run_time"):
+                assert backlog_sample[name] == pytest.approx(sample[name])
+
+        totals = [sample["energy_ac_total"] for sample in samples]
+        assert totals == sorted(totals)
+        run_times = [sample["total_run_time"] for sample in samples]
+        assert run_times == sorted(run_times)
+
+    def test_backlog_before_the_first_sampled_day_counts_up_to_it(self):
+        inverter = SolarInverter("MLG0000001", SolarConfig())
+
+        today = inverter.sample(datetime(2026, 6, 21, 12, 0, 0))
+        yesterday = inverter.sample(datetime(2026, 6, 20, 12, 0, 0))
+
+        assert yesterday["energy_ac_total"] < today["energy_ac_total"]
+        assert yesterday["total_run_time"] < today["total_run_time"]
+
+    def test_energy_today_resets_at_midnight(self):
+        inverter = SolarInverter("MLG0000001", SolarConfig())
+
+        evening = inverter.sample(datetime(2026, 6, 21, 23, 59, 0))
+        midnight = inverter.sample(datetime(2026, 6, 22, 0, 0, 0))
+
+        assert evening["energy_ac_today"] > 0
+        assert midnight["energy_ac_today"] == 0.0
+        assert midnight["energy_ac_total"] > evening["energy_ac_total"] - 1e-6
+
+    def test_serial_determines_the_inverter(self):
+        first = SolarInverter("MLG0000001", SolarConfig())
+        same = SolarInverter("MLG0000001", SolarConfig())
+        other = SolarInverter("MLG0000002", SolarConfig())
+
+        assert first.peak_power == same.peak_power
+        assert first.peak_power != other.peak_power
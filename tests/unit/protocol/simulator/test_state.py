@@ -104,3 +104,20 @@ class TestClientProtocolSessionState:
         state.set_incoming_transaction_id(header)
 
         assert state.get_next_transaction_id(FunctionCode.PING) == 43
+
+    def test_buffered_data_waits_for_announce_and_ack(self, ack_message):
+        state = ClientProtocolSessionState(
+            protocol_id=1, unit_id=1, datalogger_serial="ABC1234567", buffered_data_backlog=2
+        )
+        assert state.is_buffered_data_pending() is False
+
+        state.announce(ack_message)
+        assert state.is_buffered_data_pending() is True
+
+        assert state.take_buffered_data() == 1
+        assert state.is_buffered_data_pending() is False
+
+        state.acknowledge_buffered_data(ack_message)
+        assert state.take_buffered_data() == 0
+        state.acknowledge_buffered_data(ack_message)
+        assert state.is_buffered_data_pending() is False
@@ -1,9 +1,16 @@
 import time
+from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
-from shine2mqtt.util.clock import MonotonicClockService, has_interval_elapsed
+from shine2mqtt.util.clock import (
+    ClockConfig,
+    MonotonicClockService,
+    VirtualClockService,
+    create_clock,
+    has_interval_elapsed,
+)
 
 
 class TestMonotonicClockService:
@@ -26,6 +33,46 @@ class TestMonotonicClockService:
         assert second > first
 
 
+class TestVirtualClockService:
+    def test_stepped_clock_only_moves_when_advanced(self):
+        clock = VirtualClockService(epoch=datetime(2026, 6, 21, 12))
+        start = clock.now()
+        time.sleep(0.001)
+
+        assert clock.now() == start
+
+        clock.advance(90.0)
+
+        assert clock.now() == start + 90.0
+        assert clock.wall_time() == datetime(2026, 6, 21, 12, 1, 30)
+
+    def test_speed_scales_real_time(self):
+        with patch("time.monotonic", return_value=100.0):
+            clock = VirtualClockService(speed=60.0, epoch=datetime(2026, 6, 21, 12))
+        with patch("time.monotonic", return_value=102.0):
+            assert clock.now() == 220.0
+            assert clock.wall_time() == datetime(2026, 6, 21, 12, 2)
+
+    def test_speed_clock_can_not_be_advanced(self):
+        with pytest.raises(RuntimeError):
+            VirtualClockService(speed=2.0).advance(1.0)
+
+
+@pytest.mark.parametrize(
+    "config,expected_type,speed",
+    [
+        (ClockConfig(), MonotonicClockService, None),
+        (ClockConfig(speed=60.0), VirtualClockService, 60.0),
+        (ClockConfig(speed=60.0, step=True), VirtualClockService, None),
+    ],
+)
+def test_create_clock(config, expected_type, speed):
+    clock = create_clock(config)
+
+    assert type(clock) is expected_type
+    assert getattr(clock, "speed", None) == speed
+
+
 @pytest.mark.parametrize(
     "now,last_time,interval,expected",
     [
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from shine2mqtt.util.clock import MonotonicClockService, VirtualClockService
+from shine2mqtt.util.event_loop import VirtualTimeEventLoop, create_loop_factory
+
+
+async def echo_after_sleep(delay: float) -> bytes:
+    async def echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.write(await reader.readexactly(4))
+        writer.close()
+
+    server = await asyncio.start_server(echo, "127.0.0.1", 0)
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+    await asyncio.sleep(delay)
+    writer.write(b"ping")
+    response = await asyncio.wait_for(reader.readexactly(4), timeout=1.0)
+    writer.close()
+    server.close()
+    return response
+
+
+class TestVirtualTimeEventLoop:
+    def test_stepped_clock_skips_idle_time(self):
+        clock = VirtualClockService()
+        start = clock.now()
+        real_start = time.monotonic()
+
+        response = asyncio.run(
+            echo_after_sleep(7 * 24 * 3600), loop_factory=create_loop_factory(clock)
+        )
+
+        assert response == b"ping"
+        assert clock.now() - start >= 7 * 24 * 3600
+        assert time.monotonic() - real_start < 5
+
+    def test_stepped_clock_holds_while_executor_jobs_run(self):
+        clock = VirtualClockService()
+
+        async def blocking_call() -> None:
+            loop = asyncio.get_running_loop()
+            # A step would jump past the timeout before the thread is done
+            await asyncio.wait_for(loop.run_in_executor(None, time.sleep, 0.2), timeout=1.0)
+
+        asyncio.run(blocking_call(), loop_factory=create_loop_factory(clock))
+
+    def test_speed_scales_timers(self):
+        clock = VirtualClockService(speed=1000.0)
+        real_start = time.monotonic()
+
+        response = asyncio.run(echo_after_sleep(100), loop_factory=create_loop_factory(clock))
+
+        assert response == b"ping"
+        assert 0.1 <= time.monotonic() - real_start < 5
+
+    def test_loop_time_is_clock_time(self):
+        clock = VirtualClockService()
+        loop = VirtualTimeEventLoop(clock)
+        try:
+            clock.advance(10.0)
+            assert loop.time() == clock.now()
+        finally:
+            loop.close()
+
+    def test_default_loop_for_real_clock(self):
+        assert create_loop_factory(MonotonicClockService()) is None
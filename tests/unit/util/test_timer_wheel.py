@@ -0,0 +1,68 @@
+from shine2mqtt.util.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    def test_expires_timers_up_to_now_in_deadline_order(self):
+        wheel = TimerWheel[str](start=0.0, tick=1.0, slots=8)
+        wheel.schedule(3.0, "c")
+        wheel.schedule(1.5, "b")
+        wheel.schedule(1.0, "a")
+
+        assert wheel.advance(0.5) == []
+        assert wheel.advance(2.0) == ["a", "b"]
+        assert wheel.advance(3.0) == ["c"]
+        assert wheel.advance(10.0) == []
+
+    def test_expires_within_tick_at_deadline(self):
+        wheel = TimerWheel[str](start=0.0, tick=1.0, slots=8)
+        wheel.schedule(1.2, "a")
+        wheel.schedule(1.7, "b")
+
+        assert wheel.advance(1.1) == []
+        assert wheel.advance(1.5) == ["a"]
+        assert wheel.advance(1.7) == ["b"]
+
+    def test_deadlines_beyond_one_revolution(self):
+        wheel = TimerWheel[str](start=0.0, tick=1.0, slots=8)
+        wheel.schedule(3.0, "near")
+        wheel.schedule(11.0, "far")
+
+        assert wheel.advance(5.0) == ["near"]
+        assert wheel.advance(10.0) == []
+        assert wheel.advance(11.0) == ["far"]
+
+    def test_jump_over_multiple_revolutions(self):
+        wheel = TimerWheel[int](start=0.0, tick=1.0, slots=8)
+        for deadline in (30, 4, 17, 100):
+            wheel.schedule(deadline, deadline)
+
+        assert wheel.advance(50.0) == [4, 17, 30]
+        assert wheel.advance(100.0) == [100]
+
+    def test_past_deadline_expires_on_next_advance(self):
+        wheel = TimerWheel[str](start=10.0, tick=1.0, slots=8)
+        wheel.advance(12.0)
+        wheel.schedule(5.0, "late")
+
+        assert wheel.advance(13.0) == ["late"]
+
+    def test_cancelled_timer_does_not_expire(self):
+        wheel = TimerWheel[str](start=0.0, tick=1.0, slots=8)
+        wheel.schedule(2.0, "a").cancel()
+        wheel.schedule(2.0, "b")
+
+        assert wheel.advance(2.0) == ["b"]
+
+    def test_next_deadline(self):
+        wheel = TimerWheel[str](start=0.0, tick=1.0, slots=8)
+        assert wheel.next_deadline() is None
+
+        wheel.schedule(20.5, "far")
+        assert wheel.next_deadline() == 20.5
+
+        wheel.schedule(3.5, "near")
+        wheel.schedule(3.2, "cancelled").cancel()
+        assert wheel.next_deadline() == 3.5
+
+        wheel.advance(4.0)
+        assert wheel.next_deadline() == 20.5